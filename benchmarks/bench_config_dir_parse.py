@@ -0,0 +1,78 @@
+"""Benchmark parsing a directory tree of config files serially vs in a process pool.
+
+Usage
+-----
+python benchmarks/bench_config_dir_parse.py [--files 300] [--steps-per-file 20]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import yaml
+
+from ploigos_step_runner.config import Config
+from ploigos_step_runner.utils import file as file_utils
+
+
+def write_synthetic_config_tree(root_dir, num_files, steps_per_file):
+    """Writes a tree of config files, each defining its own steps so none conflict."""
+    for file_index in range(num_files):
+        sub_dir = os.path.join(root_dir, f"team-{file_index % 10}")
+        os.makedirs(sub_dir, exist_ok=True)
+
+        steps = {}
+        for step_index in range(steps_per_file):
+            steps[f"step-{file_index}-{step_index}"] = [{
+                'implementer': 'foo',
+                'config': {
+                    f'key-{key_index}': f'value-{file_index}-{step_index}-{key_index}'
+                    for key_index in range(20)
+                },
+                'environment-config': {
+                    env: {'url': f'https://{env}.example.com/{file_index}/{step_index}'}
+                    for env in ['DEV', 'TEST', 'PROD']
+                }
+            }]
+
+        with open(os.path.join(sub_dir, f"config-{file_index}.yml"), 'w', encoding='utf-8') as out:
+            yaml.safe_dump({Config.CONFIG_KEY: steps}, out)
+
+
+def time_add_config(config_dir):
+    """Returns seconds taken to load the given config directory."""
+    start = time.perf_counter()
+    Config(config_dir)
+    return time.perf_counter() - start
+
+
+def main():
+    """Runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--files', type=int, default=300)
+    parser.add_argument('--steps-per-file', type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        write_synthetic_config_tree(config_dir, args.files, args.steps_per_file)
+
+        # force serial parsing by raising the parallel threshold above the number of files
+        original_min_files = file_utils.PARALLEL_PARSE_MIN_FILES
+        file_utils.PARALLEL_PARSE_MIN_FILES = args.files + 1
+        try:
+            serial = time_add_config(config_dir)
+        finally:
+            file_utils.PARALLEL_PARSE_MIN_FILES = original_min_files
+
+        parallel = time_add_config(config_dir)
+
+    print(f"files:    {args.files}")
+    print(f"cpus:     {os.cpu_count()}")
+    print(f"serial:   {serial:.2f}s")
+    print(f"parallel: {parallel:.2f}s")
+    print(f"speedup:  {serial / parallel:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""Benchmark TextIOSelectiveObfuscator throughput against the previous one pattern per target
+implementation.
+
+Usage
+-----
+python benchmarks/bench_obfuscation.py [--targets 30] [--megabytes 10] [--chunk-size 200]
+"""
+
+import argparse
+import io
+import random
+import re
+import string
+import time
+
+# import the config package first to avoid the circular import through decryption_utils
+import ploigos_step_runner.config  # pylint: disable=unused-import
+from ploigos_step_runner.utils.io import TextIOSelectiveObfuscator
+
+
+class LegacyObfuscator:
+    """The previous implementation, one compiled pattern per target applied one after another
+    to every write."""
+
+    def __init__(self, parent_stream):
+        self.parent_stream = parent_stream
+        self.patterns = []
+
+    def add_obfuscation_targets(self, targets):
+        """Compiles one pattern per target."""
+        for target in targets:
+            target_pattern = re.escape(re.sub(r'\s+', ' ', target).strip())
+            target_pattern = re.sub(r'\\ ', r'.*', target_pattern)
+            self.patterns.append(re.compile(target_pattern, re.DOTALL))
+
+    def write(self, given):
+        """Applies every pattern to the given text."""
+        for pattern in self.patterns:
+            given = pattern.sub(lambda match: '*' * len(match.group()), given)
+        return self.parent_stream.write(given)
+
+    def close(self):
+        """Nothing to do."""
+
+
+def random_word(min_length, max_length):
+    """Returns a random alphanumeric word."""
+    return ''.join(
+        random.choice(string.ascii_letters + string.digits)
+        for _ in range(random.randint(min_length, max_length))
+    )
+
+
+def create_chunks(targets, megabytes, chunk_size):
+    """Creates lines of log like output, split into chunks, with the occasional secret."""
+    lines = []
+    size = 0
+    while size < megabytes * 1024 * 1024:
+        words = [random_word(2, 10) for _ in range(random.randint(5, 15))]
+        if random.random() < 0.01:
+            words.insert(random.randint(0, len(words)), random.choice(targets))
+        line = ' '.join(words) + '\n'
+        lines.append(line)
+        size += len(line)
+
+    text = ''.join(lines)
+    return [text[index:index + chunk_size] for index in range(0, len(text), chunk_size)], size
+
+
+def time_writes(obfuscator, chunks):
+    """Returns seconds taken to write all of the chunks and the written output."""
+    start = time.perf_counter()
+    for chunk in chunks:
+        obfuscator.write(chunk)
+    obfuscator.close()
+    return time.perf_counter() - start
+
+
+def main():
+    """Runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--targets', type=int, default=30)
+    parser.add_argument('--megabytes', type=int, default=10)
+    parser.add_argument('--chunk-size', type=int, default=200)
+    args = parser.parse_args()
+
+    random.seed(42)
+    targets = [random_word(12, 40) for _ in range(args.targets)]
+    chunks, size = create_chunks(targets, args.megabytes, args.chunk_size)
+    megabytes = size / (1024 * 1024)
+
+    for name, create_obfuscator in [
+        ('one pattern per target', LegacyObfuscator),
+        ('current', lambda out: TextIOSelectiveObfuscator(out, False))
+    ]:
+        out = io.StringIO()
+        obfuscator = create_obfuscator(out)
+        obfuscator.add_obfuscation_targets(targets)
+
+        seconds = time_writes(obfuscator, chunks)
+        leaked = sum(out.getvalue().count(target) for target in targets)
+        print(
+            f"{name:>24}: {megabytes / seconds:8.2f} MB/s"
+            f" ({megabytes:.1f} MB in {seconds:.2f}s, {leaked} targets not obfuscated)"
+        )
+
+
+if __name__ == '__main__':
+    main()
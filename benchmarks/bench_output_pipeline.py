@@ -0,0 +1,82 @@
+"""Benchmark the path command output takes from an sh callback through the step indenting
+and obfuscating streams, flushing every line vs buffering batches of lines.
+
+Usage
+-----
+python benchmarks/bench_output_pipeline.py [--lines 200000] [--targets 10]
+"""
+
+import argparse
+import os
+import random
+import string
+import time
+
+# import the config package first to avoid the circular import through decryption_utils
+import ploigos_step_runner.config  # pylint: disable=unused-import
+from ploigos_step_runner.utils.io import (
+    DEFAULT_FLUSH_INTERVAL, TextIOIndenter, TextIOLineBuffer, TextIOSelectiveObfuscator,
+    create_sh_redirect_to_multiple_streams_fn_callback)
+
+
+def random_word(min_length, max_length):
+    """Returns a random alphanumeric word."""
+    return ''.join(
+        random.choice(string.ascii_letters + string.digits)
+        for _ in range(random.randint(min_length, max_length))
+    )
+
+
+def create_lines(num_lines):
+    """Creates maven like output lines."""
+    return [
+        f"[INFO] Downloaded from central: https://repo.example.com/{random_word(5, 30)}"
+        f"/{random_word(5, 20)}.jar ({random.randint(1, 999)} kB at 1.2 MB/s)\n"
+        for _ in range(num_lines)
+    ]
+
+
+def time_pipeline(lines, targets, buffered, flush_interval):
+    """Returns seconds taken to send all the lines through the output pipeline."""
+    with open(os.devnull, 'w', encoding='utf-8') as devnull, \
+            open(os.devnull, 'w', encoding='utf-8') as output_file:
+        obfuscated = TextIOSelectiveObfuscator(devnull)
+        obfuscated.add_obfuscation_targets(targets)
+        step_stdout = TextIOIndenter(obfuscated, indent_level=2)
+        if buffered:
+            step_stdout = TextIOLineBuffer(step_stdout)
+
+        callback = create_sh_redirect_to_multiple_streams_fn_callback(
+            [step_stdout, output_file],
+            flush_interval=flush_interval
+        )
+
+        start = time.perf_counter()
+        for line in lines:
+            callback(line)
+        step_stdout.flush()
+        obfuscated.close()
+        return time.perf_counter() - start
+
+
+def main():
+    """Runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--lines', type=int, default=200000)
+    parser.add_argument('--targets', type=int, default=10)
+    args = parser.parse_args()
+
+    random.seed(42)
+    targets = [random_word(12, 40) for _ in range(args.targets)]
+    lines = create_lines(args.lines)
+
+    for name, buffered, flush_interval in [
+        ('flush every line', False, 0),
+        ('buffered line batches', True, DEFAULT_FLUSH_INTERVAL)
+    ]:
+        seconds = time_pipeline(lines, targets, buffered, flush_interval)
+        print(f"{name:>24}: {len(lines) / seconds:10.0f} lines/s ({seconds:.2f}s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""Benchmark querying a multi-MB effective pom many times, re-parsing it for every query vs
+parsing it once with the parsed document cache, and reading only the root element of the
+effective pom vs parsing all of it.
+
+Usage
+-----
+python benchmarks/bench_xml_parse.py [--plugins 2000] [--queries 20]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from xml.etree import ElementTree
+
+from ploigos_step_runner.utils.xml import (XML_DOCUMENT_CACHE,
+                                           get_xml_element_by_path,
+                                           get_xml_root_element)
+
+
+def write_synthetic_effective_pom(pom_file_path, num_plugins):
+    """Writes an effective pom with the given number of configured build plugins."""
+    with open(pom_file_path, 'w', encoding='utf-8') as pom_file:
+        pom_file.write(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<project xmlns="http://maven.apache.org/POM/4.0.0">\n'
+            '  <groupId>com.example</groupId>\n'
+            '  <artifactId>mock-app</artifactId>\n'
+            '  <version>1.0.0</version>\n'
+            '  <build>\n'
+            '    <plugins>\n'
+        )
+        for plugin_index in range(num_plugins):
+            pom_file.write(
+                '      <plugin>\n'
+                '        <groupId>com.example.plugins</groupId>\n'
+                f'        <artifactId>mock-plugin-{plugin_index}</artifactId>\n'
+                '        <version>1.0.0</version>\n'
+                '        <configuration>\n'
+            )
+            for config_index in range(20):
+                pom_file.write(
+                    f'          <mockConfig{config_index}>'
+                    f'${{project.build.directory}}/mock-{plugin_index}-{config_index}'
+                    f'</mockConfig{config_index}>\n'
+                )
+            pom_file.write(
+                '        </configuration>\n'
+                '      </plugin>\n'
+            )
+        pom_file.write(
+            '    </plugins>\n'
+            '  </build>\n'
+            '</project>\n'
+        )
+
+
+def time_queries(pom_file_path, num_queries, cached):
+    """Returns seconds taken to query the given pom the given number of times."""
+    XML_DOCUMENT_CACHE.clear()
+    start = time.perf_counter()
+    for query_index in range(num_queries):
+        if not cached:
+            XML_DOCUMENT_CACHE.clear()
+        get_xml_element_by_path(
+            pom_file_path,
+            f'./mvn:build/mvn:plugins/mvn:plugin[mvn:artifactId="mock-plugin-{query_index}"]',
+            default_namespace='mvn'
+        )
+    return time.perf_counter() - start
+
+
+def time_root(pom_file_path, num_queries, root_only):
+    """Returns seconds taken to get the root element of the given pom the given number of times."""
+    start = time.perf_counter()
+    for _ in range(num_queries):
+        if root_only:
+            get_xml_root_element(pom_file_path)
+        else:
+            ElementTree.parse(pom_file_path).getroot()
+    return time.perf_counter() - start
+
+
+def main():
+    """Runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--plugins', type=int, default=2000)
+    parser.add_argument('--queries', type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pom_dir:
+        pom_file_path = os.path.join(pom_dir, 'effective-pom.xml')
+        write_synthetic_effective_pom(pom_file_path, args.plugins)
+
+        uncached = time_queries(pom_file_path, args.queries, cached=False)
+        cached = time_queries(pom_file_path, args.queries, cached=True)
+        full_parse = time_root(pom_file_path, args.queries, root_only=False)
+        root_only = time_root(pom_file_path, args.queries, root_only=True)
+
+        print(f"pom size:             {os.path.getsize(pom_file_path) / (1024 * 1024):.1f}MB")
+        print(f"queries:              {args.queries}")
+        print(f"parse every query:    {uncached:.3f}s")
+        print(f"parse once, cached:   {cached:.3f}s")
+        print(f"speedup:              {uncached / cached:.1f}x")
+        print(f"root by full parse:   {full_parse:.3f}s")
+        print(f"root only:            {root_only:.3f}s")
+        print(f"speedup:              {full_parse / root_only:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,6 +3,14 @@
 """
 Ploigos step runner entry point.
 
+Usage
+-----
+psr -s STEP [-e ENVIRONMENT] [-c CONFIG [CONFIG ...]] [--step-config KEY=VALUE [KEY=VALUE ...]]
+    run a workflow step
+psr config compile [-c CONFIG [CONFIG ...]] -o BUNDLE
+    parse, validate, and merge configuration into a single config bundle
+    that can be given as the -c/--config of later runs
+
 Exit Codes
 ----------
 101
@@ -16,10 +24,11 @@ Exit Codes
 """
 
 import argparse
+import atexit
 import os.path
 import sys
 import traceback
-from contextlib import redirect_stderr, redirect_stdout
+from contextlib import closing, redirect_stderr, redirect_stdout
 
 from ploigos_step_runner.config import Config
 from ploigos_step_runner.decryption_utils import DecryptionUtils
@@ -60,10 +69,97 @@ class ParseKeyValueArge(argparse.Action):  # pylint: disable=too-few-public-meth
         setattr(namespace, self.dest, key_value_dict)
 
 
+def load_config(config_paths):
+    """Validates the given -c/--config arguments and loads them as a Config.
+
+    Exits with 101 if any of the given paths does not exist or is empty
+    and with 102 if the given configuration is invalid.
+
+    Parameters
+    ----------
+    config_paths : list of str
+        Configuration files, directories, or config bundles.
+
+    Returns
+    -------
+    Config
+        Configuration loaded from the given paths.
+    """
+    for config_file in config_paths:
+        if not os.path.exists(config_file) or os.stat(config_file).st_size == 0:
+            print_error('specified -c/--config must exist and not be empty')
+            sys.exit(101)
+
+    try:
+        config = Config(config_paths)
+    except (ValueError, AssertionError) as error:
+        print_error(f"specified -c/--config is invalid configuration: {error}")
+        sys.exit(102)
+
+    return config
+
+
+def config_main(argv):
+    """Entry point for the Ploigos step runner 'config' commands.
+
+    Parameters
+    ----------
+    argv : list of str
+        Arguments after 'config'.
+    """
+    parser = argparse.ArgumentParser(
+        prog='psr config',
+        description='Ploigos Step Runner (psr) configuration commands'
+    )
+    subparsers = parser.add_subparsers(dest='config_command', required=True)
+    compile_parser = subparsers.add_parser(
+        'compile',
+        help='Parse, validate, and merge configuration into a single config bundle' \
+            ' that can be given as the -c/--config of later runs.'
+    )
+    compile_parser.add_argument(
+        '-c',
+        '--config',
+        required=False,
+        default=["psr.yaml"],
+        nargs='+',
+        help='Workflow configuration files, or directories containing files, in yml or json'
+    )
+    compile_parser.add_argument(
+        '-o',
+        '--output',
+        required=True,
+        help='Path to write the compiled config bundle to.'
+    )
+    args = parser.parse_args(argv)
+
+    obfuscated_stdout = TextIOSelectiveObfuscator(sys.stdout)
+    obfuscated_stderr = TextIOSelectiveObfuscator(sys.stderr)
+    DecryptionUtils.register_obfuscation_stream(obfuscated_stdout)
+    DecryptionUtils.register_obfuscation_stream(obfuscated_stderr)
+
+    # NOTE: closing the obfuscated streams writes out any text they are still holding back
+    with redirect_stdout(obfuscated_stdout), redirect_stderr(obfuscated_stderr), \
+            closing(obfuscated_stdout), closing(obfuscated_stderr):
+        config = load_config(args.config)
+        config.write_bundle(args.output)
+        print(f"Compiled config bundle: {args.output}")
+
+
 def main(argv=None):
     """Main entry point for Ploigos step runner.
     """
-    parser = argparse.ArgumentParser(description='Ploigos Step Runner (psr)')
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if argv[:1] == ['config']:
+        config_main(argv[1:])
+        return
+
+    parser = argparse.ArgumentParser(
+        description='Ploigos Step Runner (psr)',
+        epilog="Use 'psr config compile -h' for help compiling configuration into a bundle."
+    )
     parser.add_argument(
         '-s',
         '--step',
@@ -93,23 +189,18 @@ def main(argv=None):
     )
     args = parser.parse_args(argv)
 
+    # don't keep decrypted values around any longer then needed
+    atexit.register(DecryptionUtils.clear_decryption_cache)
+
     obfuscated_stdout = TextIOSelectiveObfuscator(sys.stdout)
     obfuscated_stderr = TextIOSelectiveObfuscator(sys.stderr)
     DecryptionUtils.register_obfuscation_stream(obfuscated_stdout)
     DecryptionUtils.register_obfuscation_stream(obfuscated_stderr)
 
-    with redirect_stdout(obfuscated_stdout), redirect_stderr(obfuscated_stderr):
-        # validate args
-        for config_file in args.config:
-            if not os.path.exists(config_file) or os.stat(config_file).st_size == 0:
-                print_error('specified -c/--config must exist and not be empty')
-                sys.exit(101)
-
-        try:
-            config = Config(args.config)
-        except (ValueError, AssertionError) as error:
-            print_error(f"specified -c/--config is invalid configuration: {error}")
-            sys.exit(102)
+    # NOTE: closing the obfuscated streams writes out any text they are still holding back
+    with redirect_stdout(obfuscated_stdout), redirect_stderr(obfuscated_stderr), \
+            closing(obfuscated_stdout), closing(obfuscated_stderr):
+        config = load_config(args.config)
 
         config.set_step_config_overrides(args.step, args.step_config)
         # it is VERY important that the working dir be an absolute path because some
@@ -4,13 +4,17 @@
 import copy
 import glob
 import os.path
+import pickle
+from contextlib import closing
 
 from ploigos_step_runner.utils.strutils import strtobool
 from ploigos_step_runner.config.config_value import ConfigValue
 from ploigos_step_runner.config.step_config import StepConfig
 from ploigos_step_runner.decryption_utils import DecryptionUtils
 from ploigos_step_runner.utils.dict import deep_merge
-from ploigos_step_runner.utils.file import parse_yaml_or_json_file
+from ploigos_step_runner.utils.file import (create_parent_dir,
+                                            parse_yaml_or_json_file,
+                                            parse_yaml_or_json_files)
 
 
 class Config:
@@ -25,6 +29,7 @@ class Config:
         or a string that is a path to a directory containing one or more
         files that are valid YAML or JSON files that are valid
         configurations,
+        or a string that is a path to a config bundle written by `write_bundle`,
         or a list of any of the former.
 
     Attributes
@@ -32,6 +37,7 @@ class Config:
     __global_defaults : dict
     __global_environment_defaults : dict
     __step_configs : dict of str (step names) to StepConfig
+    __decryptor_definitions : list of dict
 
     Raises
     ------
@@ -53,10 +59,14 @@ class Config:
     CONFIG_KEY_DECRYPTOR_IMPLEMENTER = 'implementer'
     CONFIG_KEY_DECRYPTOR_CONFIG = 'config'
 
+    BUNDLE_MAGIC = b'PSR-CONFIG-BUNDLE\n'
+    BUNDLE_FORMAT_VERSION = 1
+
     def __init__(self, config=None):
         self.__global_defaults = {}
         self.__global_environment_defaults = {}
         self.__step_configs = {}
+        self.__decryptor_definitions = []
 
         if config is not None:
             self.add_config(config)
@@ -170,6 +180,7 @@ class Config:
             or a string that is a path to a directory containing one or more
             files that are valid YAML or JSON files that are valid
             configurations,
+            or a string that is a path to a config bundle written by `write_bundle`,
             or a list of any of the former.
 
         Raises
@@ -188,21 +199,12 @@ class Config:
                 self.add_config(_config)
         elif isinstance(config, str):
             if os.path.isfile(config):
-                self.__add_config_file(config)
+                if Config.is_bundle_file(config):
+                    self.__add_bundle_file(config)
+                else:
+                    self.__add_config_file(config)
             elif os.path.isdir(config):
-                # for each recursively found file in the directory add the config file
-                config_dir_files = glob.glob(config + '/**', recursive=True)
-                found_nested_file = False
-                for config_dir_file in config_dir_files:
-                    if os.path.isfile(config_dir_file):
-                        found_nested_file = True
-                        self.__add_config_file(config_dir_file)
-
-                if not found_nested_file:
-                    raise ValueError(
-                        f"Given config string ({config}) is a directory" +
-                        " with no recursive children files."
-                    )
+                self.__add_config_dir(config)
             else:
                 raise ValueError(
                     f"Given config string ({config}) is not a valid path."
@@ -213,6 +215,70 @@ class Config:
                 "not a dictionary, string, or list of former."
             )
 
+    def write_bundle(self, bundle_path):
+        """Writes this Config as a pre-merged and pre-validated binary config bundle.
+
+        Notes
+        -----
+        The bundle contains the global defaults, global environment defaults, step and
+        sub step configurations, and decryptor definitions. Any encrypted values are
+        written still encrypted, as they were given, and are decrypted as normal when the
+        bundle is loaded and the values are used, therefor the config files the encrypted
+        values came from must still exist wherever the bundle is loaded.
+
+        Step configuration overrides are not written to the bundle since they are
+        given per step run.
+
+        Parameters
+        ----------
+        bundle_path : str
+            Path to write the config bundle to.
+        """
+        step_configs = {}
+        for step_name, step_config in self.step_configs.items():
+            step_configs[step_name] = [
+                {
+                    Config.CONFIG_KEY_SUB_STEP_NAME: sub_step.sub_step_name,
+                    Config.CONFIG_KEY_STEP_IMPLEMENTER: sub_step.sub_step_implementer_name,
+                    Config.CONFIG_KEY_SUB_STEP_CONFIG: sub_step.sub_step_config,
+                    Config.CONFIG_KEY_SUB_STEP_ENVIRONMENT_CONFIG: sub_step.sub_step_env_config,
+                    Config.CONFIG_KEY_CONTINUE_SUB_STEPS_ON_FAILURE:
+                        sub_step.sub_step_contine_sub_steps_on_failure
+                }
+                for sub_step in step_config.sub_steps
+            ]
+
+        bundle = {
+            'version': Config.BUNDLE_FORMAT_VERSION,
+            Config.CONFIG_KEY_GLOBAL_DEFAULTS: self.__global_defaults,
+            Config.CONFIG_KEY_GLOBAL_ENVIRONMENT_DEFAULTS: self.__global_environment_defaults,
+            Config.CONFIG_KEY_DECRYPTORS: self.__decryptor_definitions,
+            'steps': step_configs
+        }
+
+        create_parent_dir(bundle_path)
+        with open(bundle_path, 'wb') as bundle_file:
+            bundle_file.write(Config.BUNDLE_MAGIC)
+            pickle.dump(bundle, bundle_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def is_bundle_file(config_file):
+        """Determines if a given file is a config bundle written by `write_bundle`.
+
+        Parameters
+        ----------
+        config_file : str (file path)
+            Path to file to check.
+
+        Returns
+        -------
+        bool
+            True if the given file is a config bundle.
+            False otherwise.
+        """
+        with open(config_file, 'rb') as possible_bundle_file:
+            return possible_bundle_file.read(len(Config.BUNDLE_MAGIC)) == Config.BUNDLE_MAGIC
+
     def set_step_config_overrides(self, step_name, step_config_overrides):
         """Sets configuration overrides for all sub steps of a given step.
 
@@ -234,6 +300,51 @@ class Config:
 
         self.step_configs[step_name].step_config_overrides = step_config_overrides
 
+    def __add_config_dir(self, config_dir):
+        """Adds all of the JSON or YAML files found recursively in a given directory
+        as config to this Config.
+
+        Parameters
+        ----------
+        config_dir : str (directory path)
+            Path to a directory containing one or more files that are valid YAML or JSON
+            files that are valid configurations.
+
+        Raises
+        ------
+        ValueError
+            If the given directory has no recursive children files.
+            If can not parse any of the found files as YAML or JSON
+            If the config parsed from any of the found files conflicts with existing config.
+        AssertionError
+            If dictionary parsed from any of the found files is not a valid config.
+        """
+        # for each recursively found file in the directory add the config file
+        config_dir_files = [
+            config_dir_file
+            for config_dir_file in glob.glob(config_dir + '/**', recursive=True)
+            if os.path.isfile(config_dir_file)
+        ]
+
+        if not config_dir_files:
+            raise ValueError(
+                f"Given config string ({config_dir}) is a directory" +
+                " with no recursive children files."
+            )
+
+        # NOTE: files are parsed concurrently but are added in the order they were found
+        #       so that merge order, and therefor any merge conflicts, are deterministic
+        with closing(parse_yaml_or_json_files(config_dir_files)) as parsed_config_files:
+            for config_dir_file in config_dir_files:
+                try:
+                    parsed_config_file = next(parsed_config_files)
+                except ValueError as error:
+                    raise ValueError(
+                        f"Error parsing config file ({config_dir_file}) as json or yaml"
+                    ) from error
+
+                self.__add_parsed_config_file(config_dir_file, parsed_config_file)
+
     def __add_config_file(self, config_file):
         """Adds a JSON or YAML file as config to this Config.
 
@@ -247,6 +358,7 @@ class Config:
         ------
         ValueError
             If can not parse given file as YAML or JSON
+            If the config parsed from the given file conflicts with existing config.
         AssertionError
             If dictionary parsed from given YAML or JSON file is not a valid config.
         """
@@ -258,6 +370,26 @@ class Config:
                 f"Error parsing config file ({config_file}) as json or yaml"
             ) from error
 
+        self.__add_parsed_config_file(config_file, parsed_config_file)
+
+    def __add_parsed_config_file(self, config_file, parsed_config_file):
+        """Adds the already parsed contents of a JSON or YAML file as config to this Config.
+
+        Parameters
+        ----------
+        config_file : str (file path)
+            Path to the YAML or JSON file the given parsed config came from.
+        parsed_config_file : dict
+            Dictionary parsed from the given config file to validate as a
+            configuration and add to this Config.
+
+        Raises
+        ------
+        ValueError
+            If the config parsed from the given file conflicts with existing config.
+        AssertionError
+            If dictionary parsed from given YAML or JSON file is not a valid config.
+        """
         # add the config parsed from file
         try:
             self.__add_config_dict(parsed_config_file, config_file)
@@ -265,6 +397,71 @@ class Config:
             raise AssertionError(
                 f"Failed to add parsed configuration file ({config_file}): {error}"
             ) from error
+        except ValueError as error:
+            raise ValueError(
+                f"Failed to add parsed configuration file ({config_file}): {error}"
+            ) from error
+
+    def __add_bundle_file(self, bundle_file_path):
+        """Adds a config bundle written by `write_bundle` to this Config.
+
+        Notes
+        -----
+        The bundle was already parsed and validated when it was written so this only
+        merges it in and registers its decryptors.
+
+        WARNING: bundles are unpickled, only load bundles written by a trusted source.
+
+        Parameters
+        ----------
+        bundle_file_path : str (file path)
+            Path to config bundle to add to this Config.
+
+        Raises
+        ------
+        ValueError
+            If the given bundle can not be loaded or is of an unsupported format version.
+            If the bundle conflicts with existing config.
+        """
+        try:
+            with open(bundle_file_path, 'rb') as bundle_file:
+                bundle_file.seek(len(Config.BUNDLE_MAGIC))
+                bundle = pickle.load(bundle_file) # nosec - bundles are written by psr itself
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError) as error:
+            raise ValueError(
+                f"Error loading config bundle ({bundle_file_path}): {error}"
+            ) from error
+
+        if not isinstance(bundle, dict) or bundle.get('version') != Config.BUNDLE_FORMAT_VERSION:
+            raise ValueError(
+                f"Config bundle ({bundle_file_path}) is not of supported format version" +
+                f" ({Config.BUNDLE_FORMAT_VERSION}), recompile it with this version of psr."
+            )
+
+        try:
+            Config.parse_and_register_decryptors_definitions(bundle[Config.CONFIG_KEY_DECRYPTORS])
+            self.__decryptor_definitions += bundle[Config.CONFIG_KEY_DECRYPTORS]
+
+            self.__merge_global_defaults(bundle[Config.CONFIG_KEY_GLOBAL_DEFAULTS])
+            for env, env_config in bundle[Config.CONFIG_KEY_GLOBAL_ENVIRONMENT_DEFAULTS].items():
+                self.__merge_global_environment_defaults(env, env_config)
+
+            for step_name, sub_steps in bundle['steps'].items():
+                for sub_step in sub_steps:
+                    self.add_or_update_step_config(
+                        step_name=step_name,
+                        sub_step_name=sub_step[Config.CONFIG_KEY_SUB_STEP_NAME],
+                        sub_step_implementer_name=sub_step[Config.CONFIG_KEY_STEP_IMPLEMENTER],
+                        sub_step_config_dict=sub_step[Config.CONFIG_KEY_SUB_STEP_CONFIG],
+                        sub_step_env_config=sub_step[Config.CONFIG_KEY_SUB_STEP_ENVIRONMENT_CONFIG],
+                        sub_step_contine_sub_steps_on_failure=sub_step[
+                            Config.CONFIG_KEY_CONTINUE_SUB_STEPS_ON_FAILURE
+                        ]
+                    )
+        except ValueError as error:
+            raise ValueError(
+                f"Failed to add config bundle ({bundle_file_path}): {error}"
+            ) from error
 
     def __add_config_dict(self, config_dict, source_file_path=None): # pylint: disable=too-many-locals, too-many-branches, too-many-statements
         """Add a configuration dictionary to the list of configuration dictionaries.
@@ -318,34 +515,14 @@ class Config:
             # else if global env defaults key
             # else assume step config
             if key == Config.CONFIG_KEY_GLOBAL_DEFAULTS:
-                try:
-                    self.__global_defaults = deep_merge(
-                        copy.deepcopy(self.__global_defaults),
-                        copy.deepcopy(value)
-                    )
-                except ValueError as error:
-                    raise ValueError(
-                        f"Error merging global defaults: {error}"
-                    ) from error
+                self.__merge_global_defaults(value)
             elif key == Config.CONFIG_KEY_GLOBAL_ENVIRONMENT_DEFAULTS:
                 for env, env_config in value.items():
-                    if env not in self.__global_environment_defaults:
-                        self.__global_environment_defaults[env] = {
-                            Config.CONFIG_KEY_ENVIRONMENT_NAME: env
-                        }
-
-                    try:
-                        self.__global_environment_defaults[env] = deep_merge(
-                            copy.deepcopy(self.__global_environment_defaults[env]),
-                            copy.deepcopy(env_config)
-                        )
-                    except ValueError as error:
-                        raise ValueError(
-                            f"Error merging global environment ({env}) defaults: {error}"
-                        ) from error
+                    self.__merge_global_environment_defaults(env, env_config)
             elif key == Config.CONFIG_KEY_DECRYPTORS:
                 config_decryptor_definitions = ConfigValue.convert_leaves_to_values(value)
                 Config.parse_and_register_decryptors_definitions(config_decryptor_definitions)
+                self.__decryptor_definitions += copy.deepcopy(config_decryptor_definitions)
             else:
                 step_name = key
                 step_config = value
@@ -414,6 +591,100 @@ class Config:
                         sub_step_contine_sub_steps_on_failure=sub_step_contine_sub_steps_on_failure
                     )
 
+    def __merge_global_defaults(self, global_defaults):
+        """Deep merges the given global defaults into the existing global defaults.
+
+        Parameters
+        ----------
+        global_defaults : dict
+            Global defaults, with ConfigValue leaves, to merge into the existing global defaults.
+
+        Raises
+        ------
+        ValueError
+            If duplicative leaf keys when merging global defaults
+        """
+        try:
+            self.__global_defaults = deep_merge(
+                copy.deepcopy(self.__global_defaults),
+                copy.deepcopy(global_defaults)
+            )
+        except ValueError as error:
+            raise ValueError(
+                f"Error merging global defaults: {error}" +
+                Config.__get_merge_conflict_source_message(self.__global_defaults, global_defaults)
+            ) from error
+
+    def __merge_global_environment_defaults(self, env, env_config):
+        """Deep merges the given global environment defaults for a given environment into the
+        existing global environment defaults for that environment.
+
+        Parameters
+        ----------
+        env : str
+            Environment the given global environment defaults are for.
+        env_config : dict
+            Global environment defaults, with ConfigValue leaves, to merge into the
+            existing global environment defaults for the given environment.
+
+        Raises
+        ------
+        ValueError
+            If duplicative leaf keys when merging global env defaults
+        """
+        if env not in self.__global_environment_defaults:
+            self.__global_environment_defaults[env] = {
+                Config.CONFIG_KEY_ENVIRONMENT_NAME: env
+            }
+
+        try:
+            self.__global_environment_defaults[env] = deep_merge(
+                copy.deepcopy(self.__global_environment_defaults[env]),
+                copy.deepcopy(env_config)
+            )
+        except ValueError as error:
+            raise ValueError(
+                f"Error merging global environment ({env}) defaults: {error}" +
+                Config.__get_merge_conflict_source_message(
+                    self.__global_environment_defaults[env],
+                    env_config
+                )
+            ) from error
+
+    @staticmethod
+    def __get_merge_conflict_source_message(dest, source):
+        """Gets a message naming the config file that the existing value of the first leaf
+        that conflicts between two to be merged configuration dictionaries came from.
+
+        Parameters
+        ----------
+        dest : dict
+            Existing configuration dictionary, with ConfigValue leaves, being merged into.
+        source : dict
+            New configuration dictionary, with ConfigValue leaves, being merged.
+
+        Returns
+        -------
+        str
+            Message naming the config file the existing conflicting value came from,
+            or empty string if there is no conflict or the existing value did not come from a file.
+        """
+        for key in source:
+            if key not in dest:
+                continue
+
+            if isinstance(dest[key], dict) and isinstance(source[key], dict):
+                message = Config.__get_merge_conflict_source_message(dest[key], source[key])
+                if message:
+                    return message
+            elif dest[key] != source[key]:
+                if isinstance(dest[key], ConfigValue) and \
+                        isinstance(dest[key].parent_source, str):
+                    return f" (conflicts with config file: {dest[key].parent_source})"
+                return ""
+
+        return ""
+
     @staticmethod
     def parse_and_register_decryptors_definitions(decryptors_definitions):
         """Parse decryptor definitions from a list and then register them with the DecryptionUtils.
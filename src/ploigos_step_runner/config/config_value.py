@@ -104,6 +104,51 @@ class ConfigValue:
         """
         return copy.deepcopy(self.__parent_source)
 
+    @property
+    def parent_source_key(self):
+        """Get a key identifying the source that this configuration value came from,
+        without copying the source.
+
+        Returns
+        -------
+        str file path or int
+            Path to the YML or JSON file that this value is found in or
+            the id of the dict that this value is found in.
+        """
+        if isinstance(self.__parent_source, str):
+            return self.__parent_source
+
+        return id(self.__parent_source)
+
+    def __deepcopy__(self, memo):
+        """Deep copy of this object.
+
+        Notes
+        -----
+        The parent source is shared with the copy rather than copied, since it is never modified
+        and only ever given out as a copy, see parent_source. So copying config made up of
+        ConfigValues does not copy the whole source for every value, and the copies keep the
+        same parent_source_key.
+
+        Parameters
+        ----------
+        memo : dict
+            Objects already copied by the current deep copy.
+
+        Returns
+        -------
+        ConfigValue
+            Copy of this object.
+        """
+        config_value = type(self)(
+            value=copy.deepcopy(self.__value, memo),
+            parent_source=self.__parent_source,
+            path_parts=copy.deepcopy(self.__path_parts, memo)
+        )
+        memo[id(self)] = config_value
+
+        return config_value
+
     def __eq__(self, other):
         """Equality for this object.
 
@@ -236,3 +281,38 @@ class ConfigValue:
             return values.value
         else:
             return values
+
+    @staticmethod
+    def get_config_value_leaves(values):
+        """Recursively collects all of the leaves of type ConfigValue.
+
+        Parameters
+        ----------
+        values : dict, list, ConfigValue, or obj
+            A collection where the leaves contain ConfigValue to collect.
+
+        Returns
+        -------
+        list of ConfigValue
+            All of the ConfigValue leaves of the given values, in the order found.
+
+        See Also
+        --------
+        ConfigValue.convert_leaves_to_values
+        """
+        if isinstance(values, dict): # pylint: disable=no-else-return
+            leaves = []
+            for child_value in values.values():
+                leaves += ConfigValue.get_config_value_leaves(child_value)
+
+            return leaves
+        elif isinstance(values, (list, tuple)):
+            leaves = []
+            for child_value in values:
+                leaves += ConfigValue.get_config_value_leaves(child_value)
+
+            return leaves
+        elif isinstance(values, ConfigValue):
+            return [values]
+        else:
+            return []
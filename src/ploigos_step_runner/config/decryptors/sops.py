@@ -10,6 +10,7 @@ import json
 import os.path
 import re
 import sys
+import threading
 import sh
 
 from ploigos_step_runner.config.config_value_decryptor import ConfigValueDecryptor
@@ -21,6 +22,11 @@ class SOPS(ConfigValueDecryptor):
     ----------
     additional_sops_args : list
         Additional arguments to pass to the SOPS command
+    batch_decrypt : bool, optional
+        True to decrypt each whole parent source once, on first use, and then answer all
+        decryptions of values from that same source by looking up the value in the decrypted
+        source kept in memory for the life of this decryptor.
+        False to invoke SOPS to extract and decrypt each value individually.
 
     Also See
     --------
@@ -29,8 +35,12 @@ class SOPS(ConfigValueDecryptor):
 
     SOPS_ENCRYPTED_VALUE_REGEX = r'^ENC\[.*\]$'
 
-    def __init__(self, additional_sops_args=None):
+    def __init__(self, additional_sops_args=None, batch_decrypt=False):
         self.__additional_sops_args = additional_sops_args
+        self.__batch_decrypt = batch_decrypt
+        self.__decrypted_sources = {}
+        self.__decrypted_sources_locks = {}
+        self.__decrypted_sources_locks_lock = threading.Lock()
 
         if not self.__additional_sops_args:
             self.__additional_sops_args = []
@@ -78,10 +88,9 @@ class SOPS(ConfigValueDecryptor):
             If given config_value#parent_source is of type string but is not a path to a file
                 that exists
             If config_value#parent_source is not of type dict or str
+            If batch decrypting and the path of the given config value does not exist in
+                its decrypted parent source
         """
-        decrypted_value = None
-        sops_path = SOPS.get_sops_value_path(config_value)
-
         # if source is a string assume it is a file path and decrypt from that
         # else if source is a dict then dump to json and decrypt from that
         # else error
@@ -108,25 +117,118 @@ class SOPS(ConfigValueDecryptor):
                 f"is expected to be of type dict or str but is of type: {type(parent_source)}"
             )
 
+        if self.__batch_decrypt:
+            # NOTE: for dict sources the json dump is the identity of the source
+            decrypted_source_key = target_file if stdin is None else stdin
+
+            # NOTE: lock per source so concurrent decryptions of values from the same source
+            #       wait on the one sops run rather then each running sops
+            with self.__decrypted_sources_locks_lock:
+                decrypted_source_lock = self.__decrypted_sources_locks.setdefault(
+                    decrypted_source_key,
+                    threading.Lock()
+                )
+            with decrypted_source_lock:
+                if decrypted_source_key not in self.__decrypted_sources:
+                    self.__decrypted_sources[decrypted_source_key] = json.loads(self.__run_sops(
+                        config_value,
+                        ['--decrypt', '--output-type=json', input_type_arg, target_file],
+                        stdin
+                    ))
+
+            decrypted_value = SOPS.__get_decrypted_source_value(
+                config_value,
+                self.__decrypted_sources[decrypted_source_key]
+            )
+        else:
+            sops_path = SOPS.get_sops_value_path(config_value)
+            decrypted_value = self.__run_sops(
+                config_value,
+                ['--decrypt', f'--extract={sops_path}', input_type_arg, target_file],
+                stdin
+            )
+
+        return decrypted_value
+
+    def __run_sops(self, config_value, sops_args, stdin):
+        """Runs sops with the given arguments plus any additional sops arguments.
+
+        Parameters
+        ----------
+        config_value : ConfigValue
+            ConfigValue sops is being run to decrypt, for error messages.
+        sops_args : list
+            Arguments to pass to sops.
+        stdin : str or None
+            Input to pass to sops on stdin.
+
+        Returns
+        -------
+        str
+            Standard out of the sops command.
+
+        Raises
+        ------
+        RuntimeError
+            If error attempting to run 'sops' command
+        """
         try:
             # use sops to decrypt the value
             out = StringIO()
             sh.sops( # pylint: disable=no-member
-                '--decrypt',
-                f'--extract={sops_path}',
-                input_type_arg,
-                target_file,
+                *sops_args,
                 _in=stdin,
                 _out=out,
                 _err=sys.stderr,
                 *self.__additional_sops_args
             )
-            decrypted_value = out.getvalue()
         except sh.ErrorReturnCode as error:
             raise RuntimeError(
                 f"Error invoking sops when trying to decrypt config value ({config_value}): {error}"
             ) from error
 
+        return out.getvalue()
+
+    @staticmethod
+    def __get_decrypted_source_value(config_value, decrypted_source):
+        """Gets the decrypted value for a given ConfigValue from its decrypted parent source.
+
+        Notes
+        -----
+        Non string values are returned serialized as JSON to match what
+        `sops --extract` returns for them.
+
+        Parameters
+        ----------
+        config_value : ConfigValue
+            ConfigValue to get the decrypted value for.
+        decrypted_source : dict
+            Decrypted parent source of the given ConfigValue.
+
+        Returns
+        -------
+        str
+            Decrypted value of the ConfigValue.
+
+        Raises
+        ------
+        ValueError
+            If the path of the given ConfigValue does not exist in the decrypted source.
+        """
+        decrypted_value = decrypted_source
+        try:
+            for path_part in config_value.path_parts:
+                decrypted_value = decrypted_value[path_part]
+        except (KeyError, IndexError, TypeError) as error:
+            raise ValueError(
+                f"Given config value ({config_value}) path" +
+                f" ({SOPS.get_sops_value_path(config_value)})" +
+                " does not exist in its decrypted parent source"
+            ) from error
+
+        if not isinstance(decrypted_value, str):
+            decrypted_value = json.dumps(decrypted_value)
+
         return decrypted_value
 
     @staticmethod
@@ -1,6 +1,9 @@
 """Shared utilities for doing decryption.
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 from ploigos_step_runner.exceptions import StepRunnerException
 from ploigos_step_runner.utils.io import TextIOSelectiveObfuscator
 from ploigos_step_runner.utils.reflection import import_and_get_class
@@ -12,6 +15,9 @@ class DecryptionUtils:
     Any values that are decrypted are added to the given list of TextIOSelectiveObfuscator
     of strings to obfuscate.
 
+    Decrypted values are cached, in memory only, for the life of the process so that
+    accessing the same encrypted ConfigValue multiple times only decrypts it once.
+
     Attributes
     ----------
     __obfuscation_streams : list of TextIOSelectiveObfuscator
@@ -19,12 +25,28 @@ class DecryptionUtils:
         on those streams.
     __config_value_decryptors : list of ConfigValueDecryptor
         ConfigValueDecryptors that can be used to decrypt given ConfigValue.
+    __decryption_cache : dict
+        Decrypted values keyed by the source, path, and raw value of the ConfigValue
+        they were decrypted from.
+    __decryption_cache_sources : dict
+        A ConfigValue from each source, that is not a file path, of the ConfigValues in the
+        decryption cache by the id of the source, keeping the source alive so the ids in the
+        decryption cache keys are never reused by other sources.
+    __decryption_count : int
+        Number of times a ConfigValue was actually decrypted by a ConfigValueDecryptor.
+    __decryption_cache_hit_count : int
+        Number of times a decrypted value was served from the decryption cache.
     """
 
     __DEFAULT_DECRYPTORS_MODULE = 'ploigos_step_runner.config.decryptors'
 
     __obfuscation_streams = []
     __config_value_decryptors = []
+    __decryption_cache = {}
+    __decryption_cache_sources = {}
+    __decryption_count = 0
+    __decryption_cache_hit_count = 0
+    __decryption_cache_lock = threading.Lock()
 
     @staticmethod
     def register_obfuscation_stream(obfuscator_stream):
@@ -41,7 +63,12 @@ class DecryptionUtils:
             If given obfuscator_stream is not a type of TextIOSelectiveObfuscator
         """
         assert isinstance(obfuscator_stream, TextIOSelectiveObfuscator)
-        DecryptionUtils.__obfuscation_streams.append(obfuscator_stream)
+        with DecryptionUtils.__decryption_cache_lock:
+            DecryptionUtils.__obfuscation_streams.append(obfuscator_stream)
+
+            # be sure anything already decrypted is obfuscated on the new stream as well
+            for decrypted_value in DecryptionUtils.__decryption_cache.values():
+                obfuscator_stream.add_obfuscation_targets(decrypted_value)
 
     @staticmethod
     def register_config_value_decryptor(config_value_decryptor):
@@ -61,6 +88,9 @@ class DecryptionUtils:
         assert isinstance(config_value_decryptor, ConfigValueDecryptor)
         DecryptionUtils.__config_value_decryptors.append(config_value_decryptor)
 
+        # the new decryptor could change how values decrypt, so forget what was decrypted before
+        DecryptionUtils.clear_decryption_cache()
+
     @staticmethod
     def create_and_register_config_value_decryptor(
         config_value_decryptor_implementer_name,
@@ -106,6 +136,11 @@ class DecryptionUtils:
         """If possible decrypt the given ConfigValue using one of the
         registered ConfigValueDecryptors.
 
+        Notes
+        -----
+        If the given ConfigValue has already been decrypted by this process then
+        the cached decrypted value is returned rather then decrypting it again.
+
         Parameters
         ----------
         config_value : ConfigValue
@@ -123,13 +158,124 @@ class DecryptionUtils:
         decrypted_value = None
         for config_value_decryptor in DecryptionUtils.__config_value_decryptors:
             if config_value_decryptor.can_decrypt(config_value):
+                cache_key = DecryptionUtils.__get_decryption_cache_key(config_value)
+                with DecryptionUtils.__decryption_cache_lock:
+                    if cache_key in DecryptionUtils.__decryption_cache:
+                        # NOTE: no need to add obfuscation targets again, done before caching
+                        DecryptionUtils.__decryption_cache_hit_count += 1
+                        return DecryptionUtils.__decryption_cache[cache_key]
+
                 decrypted_value = config_value_decryptor.decrypt(config_value)
+                with DecryptionUtils.__decryption_cache_lock:
+                    DecryptionUtils.__decryption_count += 1
+                    if decrypted_value is not None:
+                        # NOTE: obfuscate before caching so no other thread can get the value
+                        #       from the cache before it is obfuscated
+                        DecryptionUtils.__add_obfuscation_targets(decrypted_value)
+                        DecryptionUtils.__decryption_cache[cache_key] = decrypted_value
+                        if not isinstance(cache_key[0], str):
+                            DecryptionUtils.__decryption_cache_sources[cache_key[0]] = \
+                                config_value
                 break
 
-        DecryptionUtils.__add_obfuscation_targets(decrypted_value)
-
         return decrypted_value
 
+    @staticmethod
+    def decrypt_all(config_values, max_workers=None):
+        """Concurrently decrypts all of the given ConfigValues that can be decrypted by one of
+        the registered ConfigValueDecryptors and have not already been decrypted.
+
+        Notes
+        -----
+        The decrypted values are cached and registered as obfuscation targets, so that
+        later accessing the value of any of the given ConfigValues does not block on decryption.
+
+        Parameters
+        ----------
+        config_values : list of ConfigValue
+            ConfigValues to decrypt if possible.
+        max_workers : int, optional
+            Maximum number of ConfigValues to decrypt at once.
+
+        Raises
+        ------
+        Any error raised by a ConfigValueDecryptor while decrypting any of the given ConfigValues.
+        """
+        to_decrypt = {}
+        for config_value in config_values:
+            if any(
+                config_value_decryptor.can_decrypt(config_value)
+                for config_value_decryptor in DecryptionUtils.__config_value_decryptors
+            ):
+                cache_key = DecryptionUtils.__get_decryption_cache_key(config_value)
+                with DecryptionUtils.__decryption_cache_lock:
+                    already_decrypted = cache_key in DecryptionUtils.__decryption_cache
+                if not already_decrypted:
+                    to_decrypt.setdefault(cache_key, config_value)
+
+        if not to_decrypt:
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # NOTE: consume the results so that any decryption errors are raised
+            list(executor.map(DecryptionUtils.decrypt, to_decrypt.values()))
+
+    @staticmethod
+    def get_decryption_counts():
+        """Gets the number of ConfigValue decryptions and decryption cache hits
+        for this process so far.
+
+        Returns
+        -------
+        dict
+            'decryptions' - number of times a ConfigValue was decrypted by a ConfigValueDecryptor
+            'cache-hits' - number of times a decrypted value was served from the decryption cache
+        """
+        return {
+            'decryptions': DecryptionUtils.__decryption_count,
+            'cache-hits': DecryptionUtils.__decryption_cache_hit_count
+        }
+
+    @staticmethod
+    def clear_decryption_cache():
+        """Forgets all cached decrypted values.
+
+        Notes
+        -----
+        Python strings are immutable so the decrypted values can not be zeroed in place,
+        this drops the cache references to them so they can be garbage collected.
+        Values already registered as obfuscation targets are unaffected.
+        """
+        with DecryptionUtils.__decryption_cache_lock:
+            DecryptionUtils.__decryption_cache.clear()
+            DecryptionUtils.__decryption_cache_sources.clear()
+
+    @staticmethod
+    def __get_decryption_cache_key(config_value):
+        """Gets the key to cache the decrypted value of a given ConfigValue under.
+
+        Parameters
+        ----------
+        config_value : ConfigValue
+            ConfigValue to get the decryption cache key for.
+
+        Notes
+        -----
+        Sources that are not file paths, EX: config dicts, are keyed by their id rather then
+        their content so getting the key does not cost more the bigger the config is.
+        The raw value in the key still makes a changed value at the same path a cache miss.
+
+        Returns
+        -------
+        tuple
+            Key made up of the source, path, and raw value of the given ConfigValue.
+        """
+        return (
+            config_value.parent_source_key,
+            tuple(config_value.path_parts),
+            repr(config_value.raw_value)
+        )
+
     @staticmethod
     def __add_obfuscation_targets(targets):
         if targets is not None:
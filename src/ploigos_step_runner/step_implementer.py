@@ -26,6 +26,17 @@ Configuration Key       | Required? | Default | Description
   value: /path/to/something/important_dir <br/>\
 - name: mock-file <br/>\
   value: /path/to/cool/file.xml</pre>
+`pre-decrypt-config-values` | No    | `False` | If `True`, before running the step, \
+                                                concurrently decrypt all of the encrypted values in \
+                                                the runtime step configuration so the step does not \
+                                                block on decrypting them one at a time.
+`pre-decrypt-max-workers`   | No    | `8`     | Maximum number of values to decrypt at once \
+                                                when `pre-decrypt-config-values` is `True`.
+`output-compression`    | No        | `None`  | Compression, `gzip` or `xz`, to write the output \
+                                                of the tools the step runs with, as it is written. \
+                                                Artifacts for the output files point at the \
+                                                compressed files. Read them with \
+                                                `ploigos_step_runner.utils.file.read_output_file`.
 """# pylint: disable=line-too-long
 import json
 import os
@@ -37,8 +48,12 @@ from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 
 from ploigos_step_runner.config.config_value import ConfigValue
+from ploigos_step_runner.decryption_utils import DecryptionUtils
 from ploigos_step_runner.results import StepResult
-from ploigos_step_runner.utils.io import TextIOIndenter
+from ploigos_step_runner.utils.file import (
+    get_output_file_compression_extension, open_output_file)
+from ploigos_step_runner.utils.io import TextIOIndenter, TextIOLineBuffer
+from ploigos_step_runner.utils.strutils import strtobool
 
 
 class DefaultSteps:  # pylint: disable=too-few-public-methods
@@ -89,6 +104,7 @@ class StepImplementer(ABC):  # pylint: disable=too-many-instance-attributes
 
     __TITLE_LENGTH = 80
     __INDENT_SIZE   = 4
+    __DEFAULT_PRE_DECRYPT_MAX_WORKERS = 8
 
     def __init__(  # pylint: disable=too-many-arguments
         self,
@@ -198,6 +214,16 @@ class StepImplementer(ABC):  # pylint: disable=too-many-instance-attributes
         os.makedirs(work_dir_path_step, exist_ok=True)
         return work_dir_path_step
 
+    @property
+    def parent_work_dir_path(self):
+        """Get the OS path to the working folder shared by all of the steps of the workflow.
+
+        Returns
+        -------
+        str
+            OS path to the working folder the step working folders are in.
+        """
+        return self.__parent_work_dir_path
 
     @property
     def step_name(self):
@@ -318,6 +344,10 @@ class StepImplementer(ABC):  # pylint: disable=too-many-instance-attributes
         StepImplementer.__print_section_title(
             f"Step Start - {self.step_name} ({self.sub_step_name})"
         )
+        start_decryption_counts = DecryptionUtils.get_decryption_counts()
+
+        # NOTE: do this before printing anything so all decrypted values are obfuscated
+        self.__pre_decrypt_config_values()
 
         # print information about the configuration
         StepImplementer.__print_section_title(
@@ -368,12 +398,20 @@ class StepImplementer(ABC):  # pylint: disable=too-many-instance-attributes
                 div_char="-",
                 indent=1
             )
-            indented_stdout = TextIOIndenter(parent_stream=sys.stdout, indent_level=2)
-            indented_stderr = TextIOIndenter(parent_stream=sys.stderr, indent_level=2)
+            # NOTE: buffer output into batches of lines so that chatty commands run by the step
+            #       do not have to have every line they write indented and obfuscated on its own
+            indented_stdout = TextIOLineBuffer(
+                TextIOIndenter(parent_stream=sys.stdout, indent_level=2)
+            )
+            indented_stderr = TextIOLineBuffer(
+                TextIOIndenter(parent_stream=sys.stderr, indent_level=2)
+            )
             with redirect_stdout(indented_stdout), redirect_stderr(indented_stderr):
-                step_result = self._run_step()
-                sys.stdout.flush()
-                sys.stderr.flush()
+                try:
+                    step_result = self._run_step()
+                finally:
+                    sys.stdout.flush()
+                    sys.stderr.flush()
 
             # add any additional artifacts
             self.__add_additional_artifacts_to_step_result(step_result=step_result)
@@ -396,6 +434,13 @@ class StepImplementer(ABC):  # pylint: disable=too-many-instance-attributes
         StepImplementer.__print_data('Message', step_result.message)
         StepImplementer.__print_data('Artifacts', step_result.artifacts_dicts)
         StepImplementer.__print_data('Evidence', step_result.evidence_dicts)
+        StepImplementer.__print_data(
+            'Config Value Decryptions',
+            {
+                name: count - start_decryption_counts[name]
+                for name, count in DecryptionUtils.get_decryption_counts().items()
+            }
+        )
 
         StepImplementer.__print_section_title(f'Step End - {self.step_name} ({self.sub_step_name})')
         return step_result
@@ -642,6 +687,59 @@ class StepImplementer(ABC):  # pylint: disable=too-many-instance-attributes
                 file.write(contents)
         return file_path
 
+    def write_working_output_file(self, filename):
+        """Create an empty file in working directory for this step to write the output of a tool to.
+
+        If `output-compression` is configured the file is given the extension for that compression
+        and is written compressed by opening it with `ploigos_step_runner.utils.file.open_output_file`.
+
+        Parameters
+        ----------
+        filename : str
+            File name to create, before any compression extension is added.
+
+        Returns
+        -------
+        str
+            Return a string to the file path
+        """
+        output_compression_extension = get_output_file_compression_extension(
+            self.get_value('output-compression')
+        )
+        file_path = self.write_working_file(f"{filename}{output_compression_extension}")
+
+        # NOTE: an empty file is not a valid compressed file, so write an empty compressed stream
+        if output_compression_extension:
+            with open_output_file(file_path, 'w'):
+                pass
+
+        return file_path
+
+    def __pre_decrypt_config_values(self):
+        """If enabled, concurrently decrypts all of the encrypted values in the
+        runtime step configuration.
+
+        See Also
+        --------
+        DecryptionUtils.decrypt_all
+        """
+        pre_decrypt_config_values = self.get_value('pre-decrypt-config-values')
+        if isinstance(pre_decrypt_config_values, str):
+            pre_decrypt_config_values = bool(strtobool(pre_decrypt_config_values))
+        if not pre_decrypt_config_values:
+            return
+
+        max_workers = self.get_value('pre-decrypt-max-workers')
+        if max_workers is None:
+            max_workers = StepImplementer.__DEFAULT_PRE_DECRYPT_MAX_WORKERS
+
+        DecryptionUtils.decrypt_all(
+            config_values=ConfigValue.get_config_value_leaves(
+                self.get_copy_of_runtime_step_config()
+            ),
+            max_workers=int(max_workers)
+        )
+
     def __add_additional_artifacts_to_step_result(self, step_result):
         """Adds user supplied additional artifacts to step result if given.
 
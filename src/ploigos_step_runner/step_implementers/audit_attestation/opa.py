@@ -24,13 +24,12 @@ Result Artifact Key | Description
 """
 
 import sys
-from io import StringIO
 import sh
 from ploigos_step_runner.step_implementer import StepImplementer
 from ploigos_step_runner.results import StepResult
 from ploigos_step_runner.utils.file import download_source_to_destination
 from ploigos_step_runner.utils.io import \
-    create_sh_redirect_to_multiple_streams_fn_callback
+    TextIORingBuffer, create_sh_redirect_to_multiple_streams_fn_callback
 
 
 DEFAULT_CONFIG = {}
@@ -121,7 +120,8 @@ class OpenPolicyAgent(StepImplementer):  # pylint: disable=too-few-public-method
             1 means the query failed.
         """
 
-        opa_attestation_stdout_result = StringIO()
+        # NOTE: the full output goes to stdout, only keep the end of it for the error message
+        opa_attestation_stdout_result = TextIORingBuffer()
         opa_attestation_stdout_callback = create_sh_redirect_to_multiple_streams_fn_callback([
             sys.stdout,
             opa_attestation_stdout_result
@@ -137,12 +137,15 @@ class OpenPolicyAgent(StepImplementer):  # pylint: disable=too-few-public-method
                 workflow_policy_file_path,
                 workflow_policy_query,
                 _out=opa_attestation_stdout_callback,
-                _err_to_out=True,
-                _tee='out'
+                _err_to_out=True
             )
 
         except sh.ErrorReturnCode as error:
-            return f"Error evaluating query against data:  {error}", 1
+            error_message = f"Error evaluating query against data:  {error}"
+            opa_attestation_stdout = opa_attestation_stdout_result.getvalue()
+            if opa_attestation_stdout:
+                error_message += f"\nOutput:\n{opa_attestation_stdout}"
+            return error_message, 1
 
         return 'Audit was successful', 0
 
@@ -18,7 +18,9 @@ Configuration Key             | Required? | Default           | Description
 `containers-config-auth-file` | No        |                   | Path to the container registry authentication \
                                                                 file to use for container registry authentication. \
                                                                 If one is not provided one will be created in the \
-                                                                working directory.
+                                                                working directory shared by all steps of the workflow \
+                                                                using `container-registries`, where registries already logged into by \
+                                                                other steps are not logged into again.
 `[container-image-tag, \
   container-image-version]`   | Yes       |                   | Container image tag to use when building the container image.
 `organization`                | Yes       |                   | Used in built container image tag
@@ -49,7 +51,8 @@ from ploigos_step_runner.step_implementer import StepImplementer
 from ploigos_step_runner.results import StepResult
 from ploigos_step_runner.utils.containers import (
     add_container_build_step_result_artifacts, container_registries_login,
-    determine_container_image_address_info, get_container_image_digest)
+    determine_container_image_address_info, get_container_image_digest,
+    get_local_container_image_digest)
 
 DEFAULT_CONFIG = {
     # Image specification file name
@@ -171,7 +174,7 @@ class Buildah(StepImplementer):
             containers_config_auth_file = self.get_value('containers-config-auth-file')
             if not containers_config_auth_file:
                 containers_config_auth_file = os.path.join(
-                    self.work_dir_path,
+                    self.parent_work_dir_path,
                     'container-auth.json'
                 )
             container_registries_login(
@@ -179,14 +182,18 @@ class Buildah(StepImplementer):
                 containers_config_auth_file=containers_config_auth_file,
                 containers_config_tls_verify=tls_verify
             )
+            container_image_id_file = os.path.join(self.work_dir_path, 'container-image-id')
 
             # perform build
+            # NOTE: have buildah write the built image ID so its digest can be looked up
+            #       without another buildah pull and inspect
             sh.buildah.bud(  # pylint: disable=no-member
                 '--format=' + self.get_value('format'),
                 '--tls-verify=' + str(tls_verify).lower(),
                 '--layers', '-f', image_spec_file,
                 '-t', container_image_build_address,
                 '--authfile', containers_config_auth_file,
+                '--iidfile', container_image_id_file,
                 self.get_value('context'),
                 _out=sys.stdout,
                 _err=sys.stderr,
@@ -203,9 +210,14 @@ class Buildah(StepImplementer):
         if step_result.success:
             try:
                 print("Get container image digest")
-                container_image_digest = get_container_image_digest(
-                    container_image_address=container_image_build_address
+                container_image_digest = get_local_container_image_digest(
+                    container_image_address=container_image_build_address,
+                    container_image_id_file=container_image_id_file
                 )
+                if not container_image_digest:
+                    container_image_digest = get_container_image_digest(
+                        container_image_address=container_image_build_address
+                    )
             except RuntimeError as error:
                 step_result.success = False
                 step_result.message = f"Error getting built container image digest: {error}"
@@ -26,9 +26,19 @@ Configuration Key            | Required? | Default     | Description
                                                          that would be a waist of time, and also \
                                                          that a previous step ran `package` \
                                                          and `push-artifacts` steps.
+`maven-command`              | No        | `'auto'`    | Maven command to run, EX: `mvn` or `mvnd`. \
+                                                         `auto` to run `mvnd` if installed, else `mvn`.
+`maven-threads`              | No        | `'1C'`      | Threads to build modules with in parallel (`-T`), \
+                                                         EX: `4`, or `1C` for one per CPU core.
 `maven-servers`              | No        |             | Dictionary of dictionaries of id, username, password
 `maven-repositories`         | No        |             | Dictionary of dictionaries of id, url, snapshots, releases
 `maven-mirrors`              | No        |             | Dictionary of dictionaries of id, url, mirror_of
+`maven-local-repository`     | No        |             | Path to the maven local repository, EX: one shared by \
+                                                         all of the steps of the workflow. \
+                                                         Sharing it between steps running at the same time \
+                                                         requires Maven 3.9 or newer.
+`maven-prewarm-local-repository` | No    | `False`     | `True` to run `dependency:go-offline` once for each set of \
+                                                         dependencies to fill the `maven-local-repository`.
 `[container-image-tag, \
   container-image-version]`  | Yes       |             | Container image tag to use when building the container image
 `organization`               | Yes       |             | Used in built container image tag
@@ -55,7 +65,8 @@ from ploigos_step_runner.step_implementers.shared.maven_generic import \
     MavenGeneric
 from ploigos_step_runner.utils.containers import (
     add_container_build_step_result_artifacts,
-    determine_container_image_address_info, get_container_image_digest)
+    determine_container_image_address_info, get_container_image_digest,
+    get_local_container_image_digest)
 
 DEFAULT_CONFIG = {
     'maven-additional-arguments': [
@@ -143,7 +154,7 @@ class MavenJKubeK8sBuild(MavenGeneric):
             )
 
         # build the container image
-        mvn_jkube_output_file_path = self.write_working_file('mvn_k8s_build_output.txt')
+        mvn_jkube_output_file_path = self.write_working_output_file('mvn_k8s_build_output.txt')
         try:
             # execute maven step (params come from config)
             print("Build container image with Maven Jkube kubernetes plugin")
@@ -170,9 +181,13 @@ class MavenJKubeK8sBuild(MavenGeneric):
         if step_result.success:
             try:
                 print("Get container image digest")
-                container_image_digest = get_container_image_digest(
+                container_image_digest = get_local_container_image_digest(
                     container_image_address=container_image_build_address
                 )
+                if not container_image_digest:
+                    container_image_digest = get_container_image_digest(
+                        container_image_address=container_image_build_address
+                    )
             except RuntimeError as error:
                 step_result.success = False
                 step_result.message = f"Error getting built container image digest: {error}"
@@ -26,7 +26,9 @@ Configuration Key             | Required? | Default | Description
 `containers-config-auth-file` | False     |         | Path to the container registry authentication \
                                                       file to use for container registry authentication. \
                                                       If one is not provided one will be created in the \
-                                                      working directory.
+                                                      working directory shared by all steps of the workflow \
+                                                      using `container-registries`, where registries already logged into by \
+                                                      other steps are not logged into again.
 `container-registries`        | False     |         | Hash of container registries to authenticate with.
 
 
@@ -158,7 +160,7 @@ class SourceToImage(StepImplementer):
             containers_config_auth_file = self.get_value('containers-config-auth-file')
             if not containers_config_auth_file:
                 containers_config_auth_file = os.path.join(
-                    self.work_dir_path,
+                    self.parent_work_dir_path,
                     'container-auth.json'
                 )
             try:
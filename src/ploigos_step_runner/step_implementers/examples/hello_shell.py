@@ -76,7 +76,7 @@ class HelloShell(StepImplementer):
 
         try:
             # Log STDOUT and STDERR to this file
-            output_file_path = self.write_working_file('greeting-output.txt')
+            output_file_path = self.write_working_output_file('greeting-output.txt')
 
             # Run the command
             Shell().run(
@@ -25,9 +25,9 @@ Result Artifact Key                     | Description
 """# pylint: disable=line-too-long
 
 import os.path
-import xml.etree.ElementTree as ET
 from ploigos_step_runner.results import StepResult
 from ploigos_step_runner.step_implementer import StepImplementer
+from ploigos_step_runner.utils.xml import parse_xml_file
 
 DEFAULT_CONFIG = {
     'csproj-version-tag': 'Version'
@@ -115,8 +115,7 @@ class DotnetGenerateMetadata(StepImplementer):
         project_version = None
 
         # Parse csproj file for a Version tag
-        tree = ET.parse(xml_file)
-        root = tree.getroot()
+        root = parse_xml_file(xml_file)
         for child in root.iter():
             if child.tag == xml_tag:
                 project_version = child.text
@@ -33,6 +33,8 @@ from ploigos_step_runner.results import StepResult
 from ploigos_step_runner.exceptions import StepRunnerException
 from ploigos_step_runner.step_implementers.shared import MavenGeneric
 from ploigos_step_runner.utils.maven import run_maven
+from ploigos_step_runner.utils.pom_resolver import (MavenPomResolver,
+                                                    UnresolvablePomError)
 
 DEFAULT_CONFIG = {
     'pom-file': 'pom.xml',
@@ -139,13 +141,28 @@ class Maven(MavenGeneric):
     def __get_project_version(self, step_result):
         """Get the project version
 
+        Notes
+        -----
+        The version is read by resolving the pom in process when possible and only falls back to
+        running maven when the pom uses constructs that can not be resolved in process.
+        See MavenPomResolver.
+
         Parameters
         ---------
         step_result : StepResult
             Step result to add step results to.
         """
+        try:
+            project_version = MavenPomResolver(self.get_value('maven-local-repository')).resolve(
+                self.get_value('pom-file')
+            ).properties.get('project.version')
+            if project_version and '${' not in project_version:
+                return project_version
+        except UnresolvablePomError:
+            pass
+
         project_version = None
-        mvn_evaluate_project_version_file_path = self.write_working_file(
+        mvn_evaluate_project_version_file_path = self.write_working_output_file(
             'mvn_evaluate_project_version.txt'
         )
         try:
@@ -161,7 +178,8 @@ class Maven(MavenGeneric):
                     '--batch-mode',
                     '-q',
                     '-DforceStdout'
-                ]
+                ],
+                maven_command=self.maven_command
             )
         except StepRunnerException as error:
             step_result.success = False
@@ -180,7 +198,7 @@ class Maven(MavenGeneric):
         step_result : StepResult
             Step result to add step results to.
         """
-        mvn_auto_increment_version_output_file_path = self.write_working_file(
+        mvn_auto_increment_version_output_file_path = self.write_working_output_file(
             'mvn_versions_set_output.txt'
         )
         try:
@@ -215,7 +233,8 @@ class Maven(MavenGeneric):
                     'versions:set',
                     'versions:commit'
                 ],
-                additional_arguments=additional_arguments
+                additional_arguments=additional_arguments,
+                maven_command=self.maven_command
             )
         except StepRunnerException as error:
             raise StepRunnerException(f"Error running maven to auto increment version segment"
@@ -55,7 +55,7 @@ class DotnetPackage(StepImplementer):
         args += [csproj_file]                        # [<PROJECT | SOLUTION>]
 
         # STDOUT goes here
-        output_file_path = self.write_working_file('dotnet_publish_output.txt')
+        output_file_path = self.write_working_output_file('dotnet_publish_output.txt')
 
         # Run the command
         Shell().run(
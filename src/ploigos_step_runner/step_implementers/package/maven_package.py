@@ -29,12 +29,25 @@ Configuration Key            | Required? | Default | Description
                                                    | List of additional arguments to use. \
                                                      Skipping tests by default because assuming \
                                                      a previous step already ran them.
+`maven-command`              | No        | `'auto'` | Maven command to run, EX: `mvn` or `mvnd`. \
+                                                      `auto` to run `mvnd` if installed, else `mvn`.
+`maven-threads`              | No        | `'1C'`  | Threads to build modules with in \
+                                                     parallel (`-T`), EX: `4`, \
+                                                     or `1C` for one per CPU core.
 `maven-servers`              | No        |         | Dictionary of dictionaries of \
                                                      id, username, password
 `maven-repositories`         | No        |         | Dictionary of dictionaries of \
                                                      id, url, snapshots, releases
 `maven-mirrors`              | No        |         | Dictionary of dictionaries of \
                                                      id, url, mirror_of
+`maven-local-repository`     | No        |         | Path to the maven local repository, \
+                                                     EX: one shared by all of the steps \
+                                                     of the workflow. \
+                                                     Sharing it between steps running at \
+                                                     the same time requires Maven 3.9 or newer.
+`maven-prewarm-local-repository` | No    | `False` | `True` to run `dependency:go-offline` \
+                                                     once for each set of dependencies to \
+                                                     fill the `maven-local-repository`.
 `artifact-extensions`        | Yes       | `["jar", "war", "ear"]` \
                                             | Extensions to look for in the `artifact-parent-dir` \
                                               for built artifacts.
@@ -144,7 +157,7 @@ class MavenPackage(MavenGeneric):
         artifact_parent_dir = self.get_value('artifact-parent-dir')
 
         # package the artifacts
-        mvn_output_file_path = self.write_working_file('mvn_output.txt')
+        mvn_output_file_path = self.write_working_output_file('mvn_output.txt')
         try:
             # execute maven step (params come from config)
             self._run_maven_step(
@@ -45,7 +45,7 @@ class NpmPackage(NpmGeneric):
         """
         step_result = StepResult.from_step_implementer(self)
 
-        npm_output_file_path = self.write_working_file('npm_package_output.txt')
+        npm_output_file_path = self.write_working_output_file('npm_package_output.txt')
         try:
             self._run_npm_step(
                 npm_output_file_path=npm_output_file_path
@@ -30,12 +30,25 @@ Configuration Key            | Required? | Default | Description
                                                      that would be a waist of time, and also \
                                                      that a previous step ran `package` \
                                                      and `push-artifacts` steps.
+`maven-command`              | No        | `'auto'` | Maven command to run, EX: `mvn` or `mvnd`. \
+                                                      `auto` to run `mvnd` if installed, else `mvn`.
+`maven-threads`              | No        | `'1C'`  | Threads to build modules with in \
+                                                     parallel (`-T`), EX: `4`, \
+                                                     or `1C` for one per CPU core.
 `maven-servers`              | No        |         | Dictionary of dictionaries of \
                                                      id, username, password
 `maven-repositories`         | No        |         | Dictionary of dictionaries of \
                                                      id, url, snapshots, releases
 `maven-mirrors`              | No        |         | Dictionary of dictionaries of \
                                                      id, url, mirror_of
+`maven-local-repository`     | No        |         | Path to the maven local repository, \
+                                                     EX: one shared by all of the steps \
+                                                     of the workflow. \
+                                                     Sharing it between steps running at \
+                                                     the same time requires Maven 3.9 or newer.
+`maven-prewarm-local-repository` | No    | `False` | `True` to run `dependency:go-offline` \
+                                                     once for each set of dependencies to \
+                                                     fill the `maven-local-repository`.
 `version`                      | Yes     |         | version to push
 `maven-push-artifact-repo-url` | yes     |         | id for the maven servers and mirrors
 `maven-push-artifact-repo-id`  | Yes     |         | url for the maven servers and mirrors
@@ -137,8 +150,12 @@ class MavenDeploy(MavenGeneric):
         version = self.get_value('version')
 
         # push the artifacts
-        mvn_update_version_output_file_path = self.write_working_file('mvn_versions_set_output.txt')
-        mvn_push_artifacts_output_file_path = self.write_working_file('mvn_deploy_output.txt')
+        mvn_update_version_output_file_path = self.write_working_output_file(
+            'mvn_versions_set_output.txt'
+        )
+        mvn_push_artifacts_output_file_path = self.write_working_output_file(
+            'mvn_deploy_output.txt'
+        )
         try:
             # update the version before pushing
             # NOTE 1: we know this is weird. But the version in the pom isn't necessarily
@@ -158,7 +175,8 @@ class MavenDeploy(MavenGeneric):
                 phases_and_goals=['versions:set'],
                 additional_arguments=[
                     f'-DnewVersion={version}'
-                ]
+                ],
+                maven_command=self.maven_command
             )
 
             # execute maven step (params come from config)
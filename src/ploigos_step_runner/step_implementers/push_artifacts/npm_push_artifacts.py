@@ -113,7 +113,7 @@ class NpmPushArtifacts(NpmGeneric):
 
     def _execute_npm_publish(self):
         self._run_npm_step(
-            npm_output_file_path=self.write_working_file('npm_publish_output.txt'),
+            npm_output_file_path=self.write_working_output_file('npm_publish_output.txt'),
             step_implementer_additional_envs=self._generate_npm_env_args()
         )
 
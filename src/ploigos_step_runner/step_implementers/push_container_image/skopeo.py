@@ -21,18 +21,30 @@ Configuration Key                      | Required? | Default               | Des
   container-image-registry-type]`      | Yes       | 'docker://'           | Container repository type for the push image source. \
                                                                              See https://github.com/containers/skopeo for valid options.
 `[container-image-push-registry, \
-  destination-url]`                    | Yes       |                       | Container image repository destination to push image to. <br/> \
-                                                                             Should not include the repository type.
+  destination-url]`                    | Yes       |                       | Container image repository destination, or list of destinations, to push image to. <br/> \
+                                                                             Should not include the repository type. <br/> \
+                                                                             Every destination is pushed to at the same time.
 `[container-image-push-repository, \
   container-image-repository]`         | Yes       |                       | Container image repository to push the container image to.
 `[container-image-push-tag, \
   container-image-tag, \
-  container-image-version]`            | Yes       |                       | Container image tag to push the container image with.
+  container-image-version]`            | Yes       |                       | Container image tag, or list of tags, to push the container image with.
+`container-image-push-additional-tags` | No        |                       | More container image tags to push the container image with, EX: `latest`. <br/> \
+                                                                             The image is copied with the first tag, the other tags are added \
+                                                                             with the registry API without uploading any layers again.
+`container-image-push-max-workers-per-registry` \
+                                       | Yes       | `2`                   | Most tags to add at the same time to each destination.
+`container-image-push-skip-existing`   | Yes       | `True`                | Whether to skip copying the image to a destination whose tag already has \
+                                                                             the same image, known by comparing the manifest digests of the source and \
+                                                                             destination, or the digest the image was pushed with before. <br/> \
+                                                                             All of the result artifacts are still given for skipped destinations.
 `dest-tls-verify`                      | Yes       | `True`                | Whether to verify TLS when pushing destination image.
 `containers-config-auth-file`          | No        |                       | Path to the container registry authentication file \
                                                                              to use for container registry authentication. \
                                                                              If one is not provided one will be created in the \
-                                                                             working directory using `container-registries`.
+                                                                             working directory shared by all steps of the workflow \
+                                                                             using `container-registries`, where registries already logged into by \
+                                                                             other steps are not logged into again.
 `container-registries`                 | False     |         |             | Hash of container registries to authenticate with.
 
 
@@ -50,26 +62,42 @@ Result Artifact Key                       | Description
 `container-image-short-address-by-tag`    | Pushed container image short address (no registry) by tag.
 `container-image-address-by-digest`       | Pushed container image address by digest.
 `container-image-short-address-by-digest` | Pushed container image short address (no registry) by digest.
+`container-image-push-destinations`       | Every destination the container image was pushed to, with its \
+                                            registry, repository, tags, digest, addresses by tag, and address by digest. <br/> \
+                                            The other artifacts are for the first destination and tag.
 """ # pylint: disable=line-too-long
 
+import json
 import os
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 import sh
 from ploigos_step_runner.utils.strutils import strtobool
 from ploigos_step_runner.step_implementer import StepImplementer
 from ploigos_step_runner.results import StepResult
-from ploigos_step_runner.utils.containers import (container_registries_login,
-                                                  get_container_image_digest)
+from ploigos_step_runner.utils.container_registry import (
+    ContainerRegistryClient, get_container_image_registry_digest)
+from ploigos_step_runner.utils.containers import (
+    container_registries_login, get_container_image_digest,
+    get_container_image_manifest_digest)
 
 DEFAULT_CONFIG = {
     'src-tls-verify': True,
     'dest-tls-verify': True,
     'container-image-pull-registry-type': 'containers-storage:',
     'container-image-push-registry-type': 'docker://',
-    'container-image-push-tag': 'latest'
+    'container-image-push-tag': 'latest',
+    'container-image-push-max-workers-per-registry': 2,
+    'container-image-push-skip-existing': True
 }
 
+# records, by source image digest and destination, of the digests images were pushed with,
+# for recognizing images already pushed when skopeo changed the manifest while copying,
+# EX: compressing the layers of an image from local containers-storage
+PUSH_RECORDS_FILE_NAME = 'container-image-push-records.json'
+
 REQUIRED_CONFIG_OR_PREVIOUS_STEP_RESULT_ARTIFACT_KEYS = [
     ['container-image-pull-registry-type', 'container-image-registry-type'],
     ['container-image-pull-address', 'container-image-build-address'],
@@ -117,7 +145,7 @@ class Skopeo(StepImplementer):
         """
         return REQUIRED_CONFIG_OR_PREVIOUS_STEP_RESULT_ARTIFACT_KEYS
 
-    def _run_step(self): # pylint: disable=too-many-locals
+    def _run_step(self): # pylint: disable=too-many-locals,too-many-statements,too-many-branches
         """Runs the step implemented by this StepImplementer.
 
         Returns
@@ -145,58 +173,106 @@ class Skopeo(StepImplementer):
             'container-image-push-registry-type',
             'container-image-registry-type'
         ])
-        container_image_push_registry = self.get_value([
+        container_image_push_registries = Skopeo.__to_unique_list(self.get_value([
             'container-image-push-registry',
             'destination-url'
-        ])
+        ]))
         container_image_push_repository = self.get_value([
             'container-image-push-repository',
             'container-image-repository'
         ])
-        container_image_push_tag = self.get_value([
-            'container-image-push-tag',
-            'container-image-tag',
-            'container-image-version'
-        ])
+        container_image_push_tags = Skopeo.__to_unique_list(
+            Skopeo.__to_unique_list(self.get_value([
+                'container-image-push-tag',
+                'container-image-tag',
+                'container-image-version'
+            ])) + Skopeo.__to_unique_list(self.get_value('container-image-push-additional-tags'))
+        )
         dest_tls_verify = self.get_value('dest-tls-verify')
         if isinstance(dest_tls_verify, str):
             dest_tls_verify = bool(strtobool(dest_tls_verify))
+
+        # the first destination and tag are the ones reported by the single value artifacts
+        container_image_push_registry = container_image_push_registries[0]
+        container_image_push_tag = container_image_push_tags[0]
         container_image_push_short_address = \
             f"{container_image_push_repository}:{container_image_push_tag}"
         container_image_push_address_by_tag = f"{container_image_push_registry}" \
            f"/{container_image_push_short_address}"
 
-        try:
-            # login to any provider container registries
-            # NOTE: important to specify the auth file because depending on the context this is
-            #       being run in python process may not have permissions to default location
-            containers_config_auth_file = self.get_value('containers-config-auth-file')
-            if not containers_config_auth_file:
-                containers_config_auth_file = os.path.join(
-                    self.work_dir_path,
-                    'container-auth.json'
-                )
-            container_registries_login(
-                registries=self.get_value('container-registries'),
-                containers_config_auth_file=containers_config_auth_file,
-                containers_config_tls_verify=dest_tls_verify
+        # login to any provider container registries
+        # NOTE: important to specify the auth file because depending on the context this is
+        #       being run in python process may not have permissions to default location
+        containers_config_auth_file = self.get_value('containers-config-auth-file')
+        if not containers_config_auth_file:
+            containers_config_auth_file = os.path.join(
+                self.parent_work_dir_path,
+                'container-auth.json'
             )
+        container_registries_login(
+            registries=self.get_value('container-registries'),
+            containers_config_auth_file=containers_config_auth_file,
+            containers_config_tls_verify=dest_tls_verify
+        )
 
-            # push image
-            sh.skopeo.copy( # pylint: disable=no-member
-                f"--src-tls-verify={str(source_tls_verify).lower()}",
-                f"--dest-tls-verify={str(dest_tls_verify).lower()}",
-                f"--authfile={containers_config_auth_file}",
-                f'{pull_registry_type}{container_image_pull_address}',
-                f'{push_registry_type}{container_image_push_address_by_tag}',
-                _out=sys.stdout,
-                _err=sys.stderr,
-                _tee='err'
+        # push image to every destination at once
+        # get the source image digest to recognize destinations that already have the image
+        source_digest = None
+        if self.get_value('container-image-push-skip-existing'):
+            source_digest = Skopeo.__get_source_digest(
+                pull_registry_type=pull_registry_type,
+                container_image_pull_address=container_image_pull_address,
+                source_tls_verify=source_tls_verify,
+                containers_config_auth_file=containers_config_auth_file
             )
-        except sh.ErrorReturnCode as error:
-            step_result.success = False
-            step_result.message = f'Error pushing container image ({container_image_pull_address}) ' \
-                f' to tag ({container_image_push_address_by_tag}) using skopeo: {error}'
+        push_records_file_path = os.path.join(self.parent_work_dir_path, PUSH_RECORDS_FILE_NAME)
+        push_records = Skopeo.__read_push_records(push_records_file_path) if source_digest else {}
+
+        push_to_registry_kwargs = {
+            'source_digest': source_digest,
+            'push_records': push_records,
+            'pull_registry_type': pull_registry_type,
+            'container_image_pull_address': container_image_pull_address,
+            'source_tls_verify': source_tls_verify,
+            'push_registry_type': push_registry_type,
+            'container_image_push_repository': container_image_push_repository,
+            'container_image_push_tags': container_image_push_tags,
+            'dest_tls_verify': dest_tls_verify,
+            'containers_config_auth_file': containers_config_auth_file,
+            'max_workers': self.get_value('container-image-push-max-workers-per-registry')
+        }
+        with ThreadPoolExecutor(max_workers=len(container_image_push_registries)) as executor:
+            destinations = list(executor.map(
+                lambda registry: Skopeo.__push_to_registry(
+                    container_image_push_registry=registry,
+                    **push_to_registry_kwargs
+                ),
+                container_image_push_registries
+            ))
+
+        push_messages = []
+        for destination in destinations:
+            if destination['skipped']:
+                push_messages.append(
+                    f"Push of container image ({container_image_pull_address}) to"
+                    f" ({destination['registry']}/{container_image_push_short_address})"
+                    " skipped: already present"
+                )
+            if destination['error']:
+                step_result.success = False
+                push_messages.append(destination['error'])
+        if push_messages:
+            step_result.message = '\n'.join(push_messages)
+
+        # remember what was pushed so re-runs can skip it
+        if source_digest:
+            for destination in destinations:
+                if destination['digest'] and not destination['skipped']:
+                    push_records[Skopeo.__get_push_record_key(
+                        source_digest,
+                        f"{destination['registry']}/{container_image_push_short_address}"
+                    )] = destination['digest']
+            Skopeo.__write_push_records(push_records_file_path, push_records)
 
         # add address part artifacts
         step_result.add_artifact(
@@ -228,36 +304,281 @@ class Skopeo(StepImplementer):
         )
 
         # add address by digest artifacts
-        if step_result.success:
+        if destinations[0]['digest']:
+            container_image_digest = destinations[0]['digest']
+            container_image_short_address_by_digest = \
+                f"{container_image_push_repository}@{container_image_digest}"
+            container_image_address_by_digest = \
+                f"{container_image_push_registry}/{container_image_short_address_by_digest}"
+
+            step_result.add_artifact(
+                name='container-image-push-digest',
+                value=container_image_digest,
+                description='Container image digest container image was pushed to.'
+            )
+            step_result.add_artifact(
+                name='container-image-address-by-digest',
+                value=container_image_address_by_digest,
+                description='Pushed container image address by digest.'
+            )
+            step_result.add_artifact(
+                name='container-image-short-address-by-digest',
+                value=container_image_short_address_by_digest,
+                description='Pushed container image short address (no registry) by digest.'
+            )
+
+        # add every destination's artifacts
+        pushed_destinations = [
+            {
+                'registry': destination['registry'],
+                'repository': container_image_push_repository,
+                'tags': container_image_push_tags,
+                'digest': destination['digest'],
+                'addresses-by-tag': [
+                    f"{destination['registry']}/{container_image_push_repository}:{tag}"
+                    for tag in container_image_push_tags
+                ],
+                'address-by-digest': f"{destination['registry']}" \
+                    f"/{container_image_push_repository}@{destination['digest']}"
+            }
+            for destination in destinations if destination['digest']
+        ]
+        if pushed_destinations:
+            step_result.add_artifact(
+                name='container-image-push-destinations',
+                value=pushed_destinations,
+                description='Every registry the container image was pushed to,'
+                    ' with its tags and digest in that registry.'
+            )
+
+        return step_result
+
+    @staticmethod
+    def __push_to_registry( # pylint: disable=too-many-arguments,too-many-locals,too-many-branches
+        source_digest,
+        push_records,
+        pull_registry_type,
+        container_image_pull_address,
+        source_tls_verify,
+        push_registry_type,
+        container_image_push_registry,
+        container_image_push_repository,
+        container_image_push_tags,
+        dest_tls_verify,
+        containers_config_auth_file,
+        max_workers
+    ):
+        """Pushes the container image to one registry with every given tag.
+
+        The image is copied with skopeo once, with the first tag, unless the first tag already
+        has the image, known by the source digest. The other tags are then added with the registry
+        API by putting the same manifest at each of them, at most `max_workers` at a time,
+        so no layers are uploaded again.
+
+        Returns
+        -------
+        dict
+            'registry' - registry the container image was pushed to
+            'digest' - digest of the pushed container image or None if error
+            'skipped' - True if the copy was skipped because the image was already there
+            'error' - error message or None if pushed with every tag
+        """
+        destination = {
+            'registry': container_image_push_registry,
+            'digest': None,
+            'skipped': False,
+            'error': None
+        }
+        container_image_push_address = \
+            f"{container_image_push_registry}/{container_image_push_repository}"
+        container_image_push_address_by_tag = \
+            f"{container_image_push_address}:{container_image_push_tags[0]}"
+
+        def skopeo_copy(container_image_push_tag):
+            sh.skopeo.copy( # pylint: disable=no-member
+                f"--src-tls-verify={str(source_tls_verify).lower()}",
+                f"--dest-tls-verify={str(dest_tls_verify).lower()}",
+                f"--authfile={containers_config_auth_file}",
+                f'{pull_registry_type}{container_image_pull_address}',
+                f'{push_registry_type}{container_image_push_address}:{container_image_push_tag}',
+                _out=sys.stdout,
+                _err=sys.stderr,
+                _tee='err'
+            )
+
+        registry_client = None
+        if push_registry_type == 'docker://':
+            registry_client = ContainerRegistryClient(
+                containers_config_auth_file=containers_config_auth_file,
+                tls_verify=dest_tls_verify
+            )
+
+        # skip the push if the destination already has the image
+        if source_digest:
             try:
-                print("Get pushed container image digest")
-                container_image_digest = get_container_image_digest(
-                    container_image_address=container_image_push_address_by_tag,
-                    containers_config_auth_file=containers_config_auth_file
+                if registry_client:
+                    destination_digest = registry_client.get_manifest_digest(
+                        container_image_push_registry,
+                        container_image_push_repository,
+                        container_image_push_tags[0]
+                    )
+                else:
+                    destination_digest = get_container_image_manifest_digest(
+                        container_image_address= \
+                            f"{push_registry_type}{container_image_push_address_by_tag}",
+                        containers_config_auth_file=containers_config_auth_file,
+                        tls_verify=dest_tls_verify
+                    )
+            except RuntimeError:
+                # not there yet
+                destination_digest = None
+
+            if destination_digest and destination_digest in [
+                source_digest,
+                push_records.get(Skopeo.__get_push_record_key(
+                    source_digest,
+                    container_image_push_address_by_tag
+                ))
+            ]:
+                print(
+                    f"Container image ({container_image_push_address_by_tag}) already has"
+                    f" digest ({destination_digest}), skip pushing it"
                 )
+                destination['digest'] = destination_digest
+                destination['skipped'] = True
+
+        # push image
+        if not destination['skipped']:
+            try:
+                skopeo_copy(container_image_push_tags[0])
+            except sh.ErrorReturnCode as error:
+                destination['error'] = \
+                    f'Error pushing container image ({container_image_pull_address}) ' \
+                    f' to tag ({container_image_push_address_by_tag}) using skopeo: {error}'
+                return destination
+
+        # add the other tags
+        if len(container_image_push_tags) > 1:
+            try:
+                if registry_client:
+                    manifest, media_type = registry_client.get_manifest(
+                        container_image_push_registry,
+                        container_image_push_repository,
+                        container_image_push_tags[0]
+                    )
+
+                    def tag_fn(container_image_push_tag):
+                        registry_client.put_manifest(
+                            container_image_push_registry,
+                            container_image_push_repository,
+                            container_image_push_tag,
+                            manifest,
+                            media_type
+                        )
+                else:
+                    tag_fn = skopeo_copy
 
-                container_image_short_address_by_digest = \
-                    f"{container_image_push_repository}@{container_image_digest}"
-                container_image_address_by_digest = \
-                    f"{container_image_push_registry}/{container_image_short_address_by_digest}"
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    # NOTE: consume the results so that any tagging errors are raised
+                    list(executor.map(tag_fn, container_image_push_tags[1:]))
+            except (RuntimeError, sh.ErrorReturnCode) as error:
+                destination['error'] = \
+                    f"Error tagging pushed container image ({container_image_push_address_by_tag})" \
+                    f" with additional tags ({', '.join(container_image_push_tags[1:])}): {error}"
+                return destination
 
-                step_result.add_artifact(
-                    name='container-image-push-digest',
-                    value=container_image_digest,
-                    description='Container image digest container image was pushed to.'
+        # get image digest
+        if destination['skipped']:
+            return destination
+        try:
+            print(f"Get pushed container image ({container_image_push_address_by_tag}) digest")
+            if registry_client:
+                # ask the registry for just the digest rather than pulling the image back
+                destination['digest'] = get_container_image_registry_digest(
+                    container_image_address=container_image_push_address_by_tag,
+                    containers_config_auth_file=containers_config_auth_file,
+                    tls_verify=dest_tls_verify
                 )
-                step_result.add_artifact(
-                    name='container-image-address-by-digest',
-                    value=container_image_address_by_digest,
-                    description='Pushed container image address by digest.'
+            else:
+                destination['digest'] = get_container_image_digest(
+                    container_image_address=container_image_push_address_by_tag,
+                    containers_config_auth_file=containers_config_auth_file
                 )
-                step_result.add_artifact(
-                    name='container-image-short-address-by-digest',
-                    value=container_image_short_address_by_digest,
-                    description='Pushed container image short address (no registry) by digest.'
+        except RuntimeError as error:
+            destination['error'] = f"Error getting pushed container image digest: {error}"
+
+        return destination
+
+    @staticmethod
+    def __get_source_digest(
+        pull_registry_type,
+        container_image_pull_address,
+        source_tls_verify,
+        containers_config_auth_file
+    ):
+        """Gets the digest of the image to push, or None if it can not be gotten,
+        in which case the image is always pushed.
+        """
+        try:
+            if pull_registry_type == 'docker://':
+                return get_container_image_registry_digest(
+                    container_image_address=container_image_pull_address,
+                    containers_config_auth_file=containers_config_auth_file,
+                    tls_verify=source_tls_verify
                 )
-            except RuntimeError as error:
-                step_result.success = False
-                step_result.message = f"Error getting pushed container image digest: {error}"
 
-        return step_result
+            return get_container_image_manifest_digest(
+                container_image_address=f"{pull_registry_type}{container_image_pull_address}",
+                containers_config_auth_file=containers_config_auth_file,
+                tls_verify=source_tls_verify
+            )
+        except RuntimeError as error:
+            print(
+                f"WARNING: could not get digest of container image"
+                f" ({container_image_pull_address}) to push, will push it without checking"
+                f" if it is already pushed: {error}"
+            )
+            return None
+
+    @staticmethod
+    def __get_push_record_key(source_digest, container_image_push_address_by_tag):
+        return f"{source_digest} {container_image_push_address_by_tag}"
+
+    @staticmethod
+    def __read_push_records(push_records_file_path):
+        try:
+            with open(push_records_file_path, 'r', encoding='utf-8') as push_records_file:
+                push_records = json.load(push_records_file)
+        except (OSError, ValueError):
+            return {}
+
+        return push_records if isinstance(push_records, dict) else {}
+
+    @staticmethod
+    def __write_push_records(push_records_file_path, push_records):
+        # NOTE: write to a temporary file and replace so readers never see a partial file
+        os.makedirs(os.path.dirname(os.path.abspath(push_records_file_path)), exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            'w',
+            encoding='utf-8',
+            dir=os.path.dirname(os.path.abspath(push_records_file_path)),
+            delete=False
+        ) as push_records_file:
+            json.dump(push_records, push_records_file, indent=2)
+        os.replace(push_records_file.name, push_records_file_path)
+
+    @staticmethod
+    def __to_unique_list(value):
+        """Gets the given value, or list of values, as a list without duplicates or empty values.
+        """
+        if not value:
+            return []
+        if isinstance(value, (str, int, float)):
+            value = [value]
+
+        unique_values = []
+        for item in value:
+            item = str(item)
+            if item and item not in unique_values:
+                unique_values.append(item)
+        return unique_values
@@ -57,10 +57,12 @@ import os
 import pprint
 import re
 import shutil
+import zipfile
 
 from ploigos_step_runner.step_implementer import StepImplementer
 from ploigos_step_runner.results import StepResult
-from ploigos_step_runner.utils.file import upload_file
+from ploigos_step_runner.utils.file import (OUTPUT_FILE_COMPRESSION_EXTENSIONS,
+                                            get_file_extension, upload_file)
 
 DEFAULT_CONFIG = {
     'results-archive-format': 'zip',
@@ -70,6 +72,11 @@ DEFAULT_CONFIG = {
     ]
 }
 
+# files that are already compressed are stored in zip archives as is rather then compressed again
+COMPRESSED_FILE_EXTENSIONS = list(OUTPUT_FILE_COMPRESSION_EXTENSIONS.values()) + [
+    '.bz2', '.tgz', '.zip', '.jar', '.war', '.ear'
+]
+
 REQUIRED_CONFIG_OR_PREVIOUS_STEP_RESULT_ARTIFACT_KEYS = [
     'organization',
     'application-name',
@@ -268,10 +275,17 @@ class ResultArtifactsArchive(StepImplementer):
 
         # make the archive if there was anyting to archive
         archive_base_name = os.path.join(results_archive_root_dir_path, result_archive_name)
-        if os.path.exists(archive_base_name):
+        results_archive_format = self.get_value('results-archive-format')
+        if os.path.exists(archive_base_name) and results_archive_format == 'zip':
+            results_artifacts_archive = ResultArtifactsArchive.__make_zip_archive(
+                base_name=archive_base_name,
+                root_dir=results_archive_root_dir_path,
+                base_dir=result_archive_name
+            )
+        elif os.path.exists(archive_base_name):
             results_artifacts_archive = shutil.make_archive(
                 base_name=archive_base_name,
-                format=self.get_value('results-archive-format'),
+                format=results_archive_format,
                 root_dir=results_archive_root_dir_path,
                 base_dir=result_archive_name
             )
@@ -280,6 +294,46 @@ class ResultArtifactsArchive(StepImplementer):
 
         return results_artifacts_archive
 
+    @staticmethod
+    def __make_zip_archive(base_name, root_dir, base_dir):
+        """Makes a zip archive the same as `shutil.make_archive` would, except that files that are
+        already compressed, such as compressed tool output files, are stored rather then
+        compressed again.
+
+        Parameters
+        ----------
+        base_name : str
+            Path to the archive to create, without the .zip extension.
+        root_dir : str
+            Directory the paths in the archive are relative to.
+        base_dir : str
+            Directory, relative to root_dir, to archive.
+
+        Returns
+        -------
+        str
+            Path to the created archive.
+        """
+        zip_file_path = f"{base_name}.zip"
+        with zipfile.ZipFile(zip_file_path, 'w', compression=zipfile.ZIP_DEFLATED) as zip_file:
+            for dir_path, dir_names, file_names in os.walk(os.path.join(root_dir, base_dir)):
+                dir_names.sort()
+                archive_dir_path = os.path.relpath(dir_path, root_dir)
+                zip_file.write(dir_path, archive_dir_path)
+
+                for file_name in sorted(file_names):
+                    compress_type = None
+                    if get_file_extension(file_name) in COMPRESSED_FILE_EXTENSIONS:
+                        compress_type = zipfile.ZIP_STORED
+
+                    zip_file.write(
+                        os.path.join(dir_path, file_name),
+                        os.path.join(archive_dir_path, file_name),
+                        compress_type=compress_type
+                    )
+
+        return zip_file_path
+
     @staticmethod
     def __basename_of_dir(absolute_path):
         """
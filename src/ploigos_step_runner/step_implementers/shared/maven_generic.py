@@ -19,29 +19,62 @@ Configuration Key            | Required? | Default | Description
                             `False` to have the transfer progress printed.\
                             See https://maven.apache.org/ref/current/maven-embedder/cli.html
 `maven-additional-arguments` | No        | `[]`    | List of additional arguments to use.
+`maven-command`              | No        | `'auto'` | \
+                            Maven command to run, EX: `mvn` or `mvnd`. \
+                            `auto` to run the maven daemon (`mvnd`) if installed, else `mvn`. \
+                            Falls back to `mvn` if the given command is not installed.
+`maven-threads`              | No        | `'1C'`  | \
+                            Threads to build modules with in parallel (`-T`), \
+                            EX: `4`, or `1C` for one per CPU core. \
+                            `None` to not give maven `-T`.
 `maven-servers`              | No        |         | Dictionary of dictionaries of id, username, password
 `maven-repositories`         | No        |         | Dictionary of dictionaries of id, url, snapshots, releases
 `maven-mirrors`              | No        |         | Dictionary of dictionaries of id, url, mirror_of
+`maven-local-repository`     | No        |         | \
+                            Path to the maven local repository, EX: a directory in a workspace shared \
+                            by all of the steps of the workflow, so artifacts are only downloaded once. \
+                            Maven is told to lock artifacts while writing them so steps can safely \
+                            share it at the same time, which requires Maven 3.9 or newer, \
+                            older versions ignore the locking and must not share it at once. \
+                            If not given maven uses `~/.m2/repository`.
+`maven-prewarm-local-repository` | No    | `False` | \
+                            `True` to run `dependency:go-offline` before running maven, once for \
+                            each set of dependencies of the effective pom, to fill the \
+                            `maven-local-repository` once rather then in every step. \
+                            Ignored if no `maven-local-repository` is given.
 """# pylint: disable=line-too-long
 
+import fcntl
 import os
+from xml.etree import ElementTree
 
 from ploigos_step_runner.results import StepResult
 from ploigos_step_runner.exceptions import StepRunnerException
 from ploigos_step_runner.config.config_value import ConfigValue
 from ploigos_step_runner.step_implementer import StepImplementer
-from ploigos_step_runner.utils.maven import (generate_maven_settings,
-                                            run_maven, write_effective_pom)
-from ploigos_step_runner.utils.xml import get_xml_element_by_path
+from ploigos_step_runner.utils.maven import (
+    generate_maven_settings, get_effective_pom, get_effective_pom_dependencies_hash,
+    resolve_maven_command, run_maven)
+from ploigos_step_runner.utils.pom import MavenPom
 
 DEFAULT_CONFIG = {
     'pom-file': 'pom.xml',
     'tls-verify': True,
     'maven-profiles': [],
     'maven-additional-arguments': [],
-    'maven-no-transfer-progress': True
+    'maven-no-transfer-progress': True,
+    'maven-command': 'auto',
+    'maven-threads': '1C',
+    'maven-prewarm-local-repository': False
 }
 
+# name of the directory in the workflow working directory to cache effective poms in
+MAVEN_EFFECTIVE_POM_CACHE_DIR_NAME = 'maven-effective-pom-cache'
+
+# name of the directory in the maven local repository to record which sets of dependencies
+# the local repository has been pre-warmed with
+MAVEN_LOCAL_REPOSITORY_PREWARM_DIR_NAME = '.ploigos-prewarm'
+
 REQUIRED_CONFIG_OR_PREVIOUS_STEP_RESULT_ARTIFACT_KEYS = [
     'pom-file',
     'maven-phases-and-goals'
@@ -60,6 +93,7 @@ class MavenGeneric(StepImplementer):
         maven_phases_and_goals=None
     ):
         self.__maven_settings_file = None
+        self.__maven_command = None
         self.__maven_phases_and_goals = maven_phases_and_goals
 
         super().__init__(
@@ -163,33 +197,70 @@ class MavenGeneric(StepImplementer):
                 working_dir=self.work_dir_path,
                 maven_servers=maven_servers,
                 maven_repositories=maven_repositories,
-                maven_mirrors=maven_mirrors
+                maven_mirrors=maven_mirrors,
+                local_repository=self.get_value('maven-local-repository')
             )
 
         return self.__maven_settings_file
 
+    @property
+    def maven_command(self):
+        """Gets the maven command for this step to run, resolved from the 'maven-command' value
+        once so the path is only searched, and any warning printed, once per step.
+
+        See Also
+        --------
+        resolve_maven_command
+        """
+
+        if not self.__maven_command:
+            self.__maven_command = resolve_maven_command(self.get_value('maven-command'))
+
+        return self.__maven_command
+
+    @property
+    def maven_effective_pom_cache_dir_path(self):
+        """Gets the directory, shared by all of the steps of the workflow, that effective poms
+        are cached in by their inputs.
+
+        Returns
+        -------
+        str
+            Path to the effective pom cache directory.
+        """
+        return os.path.join(self.parent_work_dir_path, MAVEN_EFFECTIVE_POM_CACHE_DIR_NAME)
+
     def _get_effective_pom(self):
         """Writes the effective pom to a file and returns the path.
 
+        Notes
+        -----
+        The effective pom is cached for the whole workflow, so it is only generated again once
+        the pom, any of its local parent or module poms, the profiles, or the maven settings
+        change.
+
         Returns
         -------
         str
             Path to the written effective pom generated from the 'pom-file' value.
         """
-        effective_pom_path = os.path.join(self.work_dir_path, 'effective-pom.xml')
-
-        if not os.path.exists(effective_pom_path):
-            write_effective_pom(
-                pom_file_path=self.get_value('pom-file'),
-                output_path=effective_pom_path,
-                profiles=self.get_value('maven-profiles')
-            )
-
-        return effective_pom_path
+        return get_effective_pom(
+            work_dir_path=self.work_dir_path,
+            pom_file=self.get_value('pom-file'),
+            profiles=self.get_value('maven-profiles'),
+            settings_file=self.maven_settings_file,
+            cache_dir_path=self.maven_effective_pom_cache_dir_path,
+            maven_command=self.maven_command
+        )
 
     def _get_effective_pom_element(self, element_path):
         """Get an XML element from the effective pom.
 
+        Notes
+        -----
+        The effective pom is only parsed once no matter how many elements are gotten from it.
+        See MavenPom.load.
+
         Parameters
         ----------
         element_path : str
@@ -200,11 +271,69 @@ class MavenGeneric(StepImplementer):
         str
             Value of the element from the effective pom.
         """
-        return get_xml_element_by_path(
-            self._get_effective_pom(),
-            element_path,
-            default_namespace='mvn'
-        )
+        return MavenPom.load(self._get_effective_pom()).find(element_path)
+
+    def _prewarm_maven_local_repository(self):
+        """Runs `dependency:go-offline` to fill the maven local repository with the artifacts the
+        project needs, if configured to and not already done for the current set of dependencies
+        of the effective pom.
+
+        Notes
+        -----
+        Steps pre-warming the same local repository at the same time wait on a file lock for the
+        set of dependencies, so maven only runs once for it.
+
+        Failing to pre-warm does not fail the step, since maven downloads anything missing from
+        the local repository as it runs.
+        """
+        local_repository = self.get_value('maven-local-repository')
+        if not (local_repository and self.get_value('maven-prewarm-local-repository')):
+            return
+
+        try:
+            dependencies_hash = get_effective_pom_dependencies_hash(self._get_effective_pom())
+            prewarm_dir_path = os.path.join(
+                os.path.abspath(local_repository),
+                MAVEN_LOCAL_REPOSITORY_PREWARM_DIR_NAME
+            )
+            prewarmed_marker_path = os.path.join(prewarm_dir_path, dependencies_hash)
+            if os.path.exists(prewarmed_marker_path):
+                return
+
+            os.makedirs(prewarm_dir_path, exist_ok=True)
+            with open(prewarmed_marker_path + '.lock', 'w', encoding='utf-8') as prewarm_lock:
+                fcntl.flock(prewarm_lock, fcntl.LOCK_EX)
+
+                # we are locked
+                try:
+                    # another step may have pre-warmed while this one waited on the lock
+                    if os.path.exists(prewarmed_marker_path):
+                        return
+
+                    print(f"Pre-warm maven local repository ({local_repository})")
+                    run_maven(
+                        mvn_output_file_path=self.write_working_output_file(
+                            'mvn_dependency_go_offline_output.txt'
+                        ),
+                        phases_and_goals=['dependency:go-offline'],
+                        pom_file=self.get_value('pom-file'),
+                        tls_verify=self.get_value('tls-verify'),
+                        profiles=self.get_value('maven-profiles'),
+                        no_transfer_progress=self.get_value('maven-no-transfer-progress'),
+                        settings_file=self.maven_settings_file,
+                        maven_command=self.maven_command,
+                        threads=self.get_value('maven-threads')
+                    )
+
+                    with open(prewarmed_marker_path, 'w', encoding='utf-8') as prewarmed_marker:
+                        prewarmed_marker.write(self.get_value('pom-file'))
+                finally:
+                    fcntl.flock(prewarm_lock, fcntl.LOCK_UN)
+        except (StepRunnerException, OSError, ElementTree.ParseError) as error:
+            print(
+                "WARNING: Error pre-warming maven local repository, maven will download"
+                f" any missing dependencies as it runs: {error}"
+            )
 
     def _run_maven_step(
         self,
@@ -213,6 +342,11 @@ class MavenGeneric(StepImplementer):
     ):
         """Runs maven using the configuration given to this step runner.
 
+        Notes
+        -----
+        Pre-warms the maven local repository first if configured to.
+        See _prewarm_maven_local_repository.
+
         Parameters
         ----------
         mvn_output_file_path : str
@@ -239,6 +373,8 @@ class MavenGeneric(StepImplementer):
         else:
             additional_arguments = self.get_value('maven-additional-arguments')
 
+        self._prewarm_maven_local_repository()
+
         run_maven(
             mvn_output_file_path=mvn_output_file_path,
             phases_and_goals=phases_and_goals,
@@ -247,7 +383,9 @@ class MavenGeneric(StepImplementer):
             tls_verify=tls_verify,
             profiles=profiles,
             no_transfer_progress=no_transfer_progress,
-            settings_file=self.maven_settings_file
+            settings_file=self.maven_settings_file,
+            maven_command=self.maven_command,
+            threads=self.get_value('maven-threads')
         )
 
     def _run_step(self): # pylint: disable=too-many-locals
@@ -261,7 +399,7 @@ class MavenGeneric(StepImplementer):
         step_result = StepResult.from_step_implementer(self)
 
         # package the artifacts
-        mvn_output_file_path = self.write_working_file('mvn_output.txt')
+        mvn_output_file_path = self.write_working_output_file('mvn_output.txt')
         try:
             # execute maven step (params come from config)
             self._run_maven_step(
@@ -15,15 +15,55 @@ Configuration Key            | Required? | Default     | Description
 `tls-verify`                 | No        | `True`      | Disables TLS Verification if set to False
 `maven-phases-and-goals`     | Yes       |             | List of maven phases and/or goals to execute.
 `maven-profiles`             | No        | `[]`        | List of maven profiles to use.
+`test-reports-max-workers`   | No        |             | Maximum number of processes to read test reports with. \
+                                                         Default is the number of CPUs.
+`test-reports-test-case-index` | No      | `False`     | `True` to index every test case in the test reports, \
+                                                         which means reading all of every report rather than \
+                                                         just the totals on its root element.
+`test-reports-cache`         | No        | `True`      | `True` to cache the results read from each test report, \
+                                                         by its path, size, and modification time, in the working \
+                                                         directory shared by all steps, so only new or changed \
+                                                         test reports are read again.
+
+Result Artifacts
+----------------
+Results artifacts output by this step.
+
+Result Artifact Key | Description
+--------------------|------------
+`test-case-index`   | Path to gzip compressed JSON list of every test case with its class, name, \
+                      time, status, and truncated failure message. \
+                      Only if `test-reports-test-case-index` is `True`.
+
+Result Evidence
+---------------
+Results evidence output by this step.
+
+Result Evidence Key | Description
+--------------------|------------
+`time`              | Total time of all of the tests.
+`tests`             | Total number of tests.
+`failures`          | Total number of failed tests.
+`errors`            | Total number of tests in error.
+`skipped`           | Total number of skipped tests.
+`slowest-tests`     | Slowest test cases, slowest first. Only if `test-reports-test-case-index` is `True`.
+`failed-tests`      | Failed and errored test cases. Only if `test-reports-test-case-index` is `True`.
 """# pylint: disable=line-too-long
 
 import os
 import glob
+import json
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from xml.etree import ElementTree
 
 from ploigos_step_runner.exceptions import StepRunnerException
+from ploigos_step_runner.utils.file import open_output_file
 from ploigos_step_runner.utils.maven import \
     get_plugin_configuration_absolute_path_values
-from ploigos_step_runner.utils.xml import get_xml_element_if_present
+from ploigos_step_runner.utils.pom import get_local_name
+from ploigos_step_runner.utils.xml import get_xml_root_element
 
 
 class MavenTestReportingMixin:
@@ -41,6 +81,21 @@ class MavenTestReportingMixin:
     TESTSUITE_EVIDENCE_ATTRIBUTES_REQUIRED = ["time", "tests", "failures"]
     TESTSUITE_EVIDENCE_ELEMENTS = ["testsuites", "testsuite"]
 
+    # below this many test reports the cost of starting worker processes outweighs
+    # the cost of reading the reports
+    TEST_REPORTS_PARALLEL_MIN_FILES = 256
+
+    TEST_CASE_INDEX_FILE_NAME = 'test-case-index.json.gz'
+    TEST_CASE_STATUS_ELEMENTS = ["failure", "error", "skipped"]
+    TEST_CASE_FAILURE_STATUSES = ["failure", "error"]
+    TEST_CASE_FAILURE_MESSAGE_MAX_LENGTH = 500
+    TEST_CASE_SLOWEST_COUNT = 10
+
+    TEST_REPORT_CACHE_FILE_NAME = 'test-report-cache.json'
+    TEST_REPORT_CACHE_VERSION = 1
+    # test reports modified more recently than this are not cached, see _save_test_report_cache
+    TEST_REPORT_CACHE_MIN_AGE_NS = 2 * 1000000000
+
     def _attempt_get_test_report_directory(
         self,
         plugin_name,
@@ -88,7 +143,11 @@ class MavenTestReportingMixin:
                 pom_file=self.get_value('pom-file'),
                 profiles=self.get_value('maven-profiles'),
                 phases_and_goals=self.maven_phases_and_goals,
-                require_phase_execution_config=require_phase_execution_config
+                require_phase_execution_config=require_phase_execution_config,
+                settings_file=self.maven_settings_file,
+                effective_pom_cache_dir_path=self.maven_effective_pom_cache_dir_path,
+                local_repository_path=self.get_value('maven-local-repository'),
+                maven_command=self.maven_command
             )
 
             # if found at least one test report dir
@@ -127,7 +186,10 @@ class MavenTestReportingMixin:
     @staticmethod
     def _gather_evidence_from_test_report_directory_testsuite_elements(
         step_result,
-        test_report_dirs
+        test_report_dirs,
+        max_workers=None,
+        test_case_index_path=None,
+        cache_file_path=None
     ):
         """Given a test report directory containing XML files with 'testsuite' xml elements
         collects evidence from those files and elements.
@@ -138,6 +200,14 @@ class MavenTestReportingMixin:
             StepResult to add the evidence to.
         test_report_dirs : str or [str]
             Directory(s) to search for 'testsuite' xml elements in to collect evidence from.
+        max_workers : int or str, optional
+            Maximum number of worker processes to read the test reports with.
+            If not given defaults to the number of CPUs on the machine.
+        test_case_index_path : str, optional
+            If given, path to write an index of every test case in the test reports to,
+            which is added as an artifact, along with evidence of the slowest and failed tests.
+        cache_file_path : str, optional
+            If given, path to the file to cache the results read from each test report in.
         """
 
         # standardize input
@@ -145,8 +215,12 @@ class MavenTestReportingMixin:
             test_report_dirs = [test_report_dirs]
 
          # gather evidence
+        test_cases = [] if test_case_index_path else None
         report_results, collection_warnings = MavenTestReportingMixin._collect_report_results(
-            test_report_dirs=test_report_dirs
+            test_report_dirs=test_report_dirs,
+            max_workers=max_workers,
+            test_cases=test_cases,
+            cache_file_path=cache_file_path
         )
 
         # Add the test results to the evidence
@@ -171,13 +245,147 @@ class MavenTestReportingMixin:
         for warning in collection_warnings:
             step_result.message += f"\n{warning}"
 
+        if test_case_index_path:
+            MavenTestReportingMixin._add_test_case_index(
+                step_result=step_result,
+                test_cases=test_cases,
+                test_case_index_path=test_case_index_path
+            )
+
     @staticmethod
-    def _collect_report_results(
-        test_report_dirs
+    def _add_test_case_index(step_result, test_cases, test_case_index_path):
+        """Writes the given test cases to a compressed JSON index, adds it as an artifact,
+        and adds the slowest and failed test cases as evidence.
+
+        Parameters
+        ----------
+        step_result : StepResult
+            StepResult to add the artifact and evidence to.
+        test_cases : [dict]
+            Test cases read from the test reports.
+        test_case_index_path : str
+            Path to write the index to.
+        """
+        os.makedirs(os.path.dirname(test_case_index_path), exist_ok=True)
+        with open_output_file(test_case_index_path, 'w') as test_case_index_file:
+            json.dump(test_cases, test_case_index_file)
+
+        step_result.add_artifact(
+            name='test-case-index',
+            value=test_case_index_path,
+            description='Index of every test case in the test reports.'
+        )
+
+        timed_test_cases = [
+            test_case for test_case in test_cases if test_case['time'] is not None
+        ]
+        step_result.add_evidence(
+            name='slowest-tests',
+            value=[
+                {
+                    'classname': test_case['classname'],
+                    'name': test_case['name'],
+                    'time': test_case['time']
+                }
+                for test_case in sorted(
+                    timed_test_cases,
+                    key=lambda test_case: test_case['time'],
+                    reverse=True
+                )[:MavenTestReportingMixin.TEST_CASE_SLOWEST_COUNT]
+            ],
+            description='Slowest test cases, slowest first.'
+        )
+        step_result.add_evidence(
+            name='failed-tests',
+            value=[
+                {
+                    'classname': test_case['classname'],
+                    'name': test_case['name'],
+                    'status': test_case['status'],
+                    'message': test_case['message']
+                }
+                for test_case in test_cases
+                if test_case['status'] in MavenTestReportingMixin.TEST_CASE_FAILURE_STATUSES
+            ],
+            description='Failed and errored test cases.'
+        )
+
+    def _get_test_case_index_path(self):
+        """Gets the path to write the test case index to, if configured to index test cases.
+
+        Returns
+        -------
+        str or None
+            Path in the step's working directory to write the test case index to,
+            or None if `test-reports-test-case-index` is not enabled.
+        """
+        if not self.get_value('test-reports-test-case-index'):
+            return None
+
+        return os.path.join(
+            self.work_dir_path,
+            MavenTestReportingMixin.TEST_CASE_INDEX_FILE_NAME
+        )
+
+    def _get_test_report_cache_file_path(self):
+        """Gets the path of the file, shared by all of the steps of the workflow, to cache the
+        results read from test reports in, if configured to cache them.
+
+        Returns
+        -------
+        str or None
+            Path to the test report cache file,
+            or None if `test-reports-cache` is not enabled.
+        """
+        if not self.get_value('test-reports-cache'):
+            return None
+
+        return os.path.join(
+            self.parent_work_dir_path,
+            MavenTestReportingMixin.TEST_REPORT_CACHE_FILE_NAME
+        )
+
+    @staticmethod
+    def _collect_report_results( # pylint: disable=too-many-locals
+        test_report_dirs,
+        max_workers=None,
+        test_cases=None,
+        cache_file_path=None
     ):
-        report_results = {}
-        warnings = []
+        """Sums the evidence attributes of all of the test reports in the given directories.
+
+        Notes
+        -----
+        If there are enough test reports to be worth it they are read in a pool of worker
+        processes. Warnings are returned in the same order as if the reports were read one
+        after another.
+
+        If given a cache file, the totals read from each test report are cached in it by the
+        path, size, and modification time of the report, so only new or changed test reports
+        are read again, EX: when a step is re-run or several steps read the same reports.
+
+        Parameters
+        ----------
+        test_report_dirs : [str]
+            Directories to read the test reports in, or paths to individual test reports.
+        max_workers : int or str, optional
+            Maximum number of worker processes to read the test reports with.
+            If not given defaults to the number of CPUs on the machine.
+            If 1 then the test reports are read one after another in the current process.
+        test_cases : list, optional
+            If given, all of each test report is read and every test case in them is
+            appended to this list, in report order.
+            Otherwise only the root element of each test report is read.
+        cache_file_path : str, optional
+            Path to the file to cache the results of each test report in.
+            If not given the results are not cached.
 
+        Returns
+        -------
+        (dict, [str])
+            Sum of each of TESTSUITE_EVIDENCE_ATTRIBUTES found across the test reports,
+            and any warnings about test reports or attributes that could not be read.
+        """
         # collect all the xml file paths
         xml_files = []
         for xml_file_path in test_report_dirs:
@@ -186,15 +394,134 @@ class MavenTestReportingMixin:
             elif os.path.isfile(xml_file_path):
                 xml_files += [xml_file_path]
 
-        # Iterate over each file that contains test results
-        for file in xml_files:
-            element = MavenTestReportingMixin._read_evidence_element(file)
+        index_test_cases = test_cases is not None
+
+        # get the results of the test reports that have not changed since they were cached
+        report_file_results = {}
+        report_file_stats = {}
+        cache = {}
+        if cache_file_path:
+            cache = MavenTestReportingMixin._load_test_report_cache(cache_file_path)
+            for xml_file in xml_files:
+                xml_file_stat = os.stat(xml_file)
+                report_file_stats[xml_file] = (xml_file_stat.st_size, xml_file_stat.st_mtime_ns)
+                cache_entry = cache.get(os.path.abspath(xml_file))
+                if cache_entry is not None \
+                        and (cache_entry['size'], cache_entry['mtime-ns']) \
+                            == report_file_stats[xml_file] \
+                        and (cache_entry['test-cases'] is not None or not index_test_cases):
+                    report_file_results[xml_file] = cache_entry
+
+        # read the rest
+        uncached_xml_files = [
+            xml_file for xml_file in xml_files if xml_file not in report_file_results
+        ]
+        report_file_results.update(zip(
+            uncached_xml_files,
+            MavenTestReportingMixin._read_report_files(
+                uncached_xml_files,
+                max_workers,
+                index_test_cases
+            )
+        ))
+
+        if cache_file_path:
+            MavenTestReportingMixin._save_test_report_cache(
+                cache_file_path=cache_file_path,
+                cache=cache,
+                report_file_results={
+                    xml_file: report_file_results[xml_file] for xml_file in uncached_xml_files
+                },
+                report_file_stats=report_file_stats
+            )
+
+        # Add up the totals across all files
+        report_results = {}
+        warnings = []
+        for xml_file in xml_files:
+            for attrib, attrib_value in report_file_results[xml_file]['results'].items():
+                report_results[attrib] = report_results.get(attrib, 0) + attrib_value
+            warnings += report_file_results[xml_file]['warnings']
+            if index_test_cases:
+                test_cases += report_file_results[xml_file]['test-cases']
 
-            # If this file does not have an element that contains evidence, warn but continue processing other files.
-            if element is None: # Elements that exist but have no child elements are falsy!
-                warnings += [f"WARNING: could not parse test results in file ({file}). Ignoring."]
-                continue
+        return report_results, warnings
+
+    @staticmethod
+    def _read_report_files(xml_files, max_workers, index_test_cases):
+        """Reads the given test reports, concurrently if there are enough of them to be worth it.
+
+        Parameters
+        ----------
+        xml_files : [str]
+            Paths to the test reports to read.
+        max_workers : int or str or None
+            Maximum number of worker processes to read the test reports with.
+            If None defaults to the number of CPUs on the machine.
+        index_test_cases : bool
+            True to read all of each test report and return its test cases.
+            False to only read the root element of each test report.
+
+        Returns
+        -------
+        [dict]
+            Results of each of the given test reports, in the same order as the given reports.
+            See _read_report_file.
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = int(max_workers)
+
+        if max_workers <= 1 or len(xml_files) < MavenTestReportingMixin.TEST_REPORTS_PARALLEL_MIN_FILES:
+            return [
+                MavenTestReportingMixin._read_report_file(xml_file, index_test_cases)
+                for xml_file in xml_files
+            ]
+
+        # hand out work in a few chunks per worker to keep the inter process overhead down
+        chunksize = max(1, len(xml_files) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                MavenTestReportingMixin._read_report_file,
+                xml_files,
+                [index_test_cases] * len(xml_files),
+                chunksize=chunksize
+            ))
+
+    @staticmethod
+    def _read_report_file(file, index_test_cases=False):
+        """Reads the evidence attributes, and optionally the test cases, of a test report.
+
+        Parameters
+        ----------
+        file : str
+            Path to the test report to read.
+        index_test_cases : bool, optional
+            True to read all of the test report and return its test cases.
+            False to only read the root element of the test report.
 
+        Returns
+        -------
+        dict
+            'results', the value of each of TESTSUITE_EVIDENCE_ATTRIBUTES on the root element,
+            'warnings', any warnings about the report or its attributes not being readable,
+            and 'test-cases', the test cases in the report if index_test_cases is True,
+            else None.
+        """
+        report_results = {}
+        warnings = []
+        test_cases = None
+
+        if index_test_cases:
+            element, test_cases = \
+                MavenTestReportingMixin._read_evidence_element_and_test_cases(file)
+        else:
+            element = MavenTestReportingMixin._read_evidence_element(file)
+
+        # If this file does not have an element that contains evidence, warn but continue processing other files.
+        if element is None: # Elements that exist but have no child elements are falsy!
+            warnings += [f"WARNING: could not parse test results in file ({file}). Ignoring."]
+        else:
             # Iterate over the XML attributes that are evidence
             for attrib in element.attrib:
                 if attrib in MavenTestReportingMixin.TESTSUITE_EVIDENCE_ATTRIBUTES: # Is this attribute evidence?
@@ -210,23 +537,213 @@ class MavenTestReportingMixin:
                             f" Value was '{element.attrib[attrib]}'. Ignoring."
                         ]
 
-                    # Add up the totals across all files
-                    if attrib in report_results:
-                        report_results[attrib] += attrib_value
-                    else:
-                        report_results[attrib] = attrib_value
+                    report_results[attrib] = attrib_value
 
-        return report_results, warnings
+        return {
+            'results': report_results,
+            'warnings': warnings,
+            'test-cases': test_cases
+        }
+
+    @staticmethod
+    def _load_test_report_cache(cache_file_path):
+        """Loads the cached results of test reports.
+
+        Parameters
+        ----------
+        cache_file_path : str
+            Path to the test report cache file.
+
+        Returns
+        -------
+        dict
+            Cached results of test reports by their absolute path, each with the 'size' and
+            'mtime-ns' of the report when it was read.
+            Empty if the cache file does not exist or can not be read.
+        """
+        try:
+            with open(cache_file_path, 'r', encoding='utf-8') as cache_file:
+                cache = json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(cache, dict) \
+                or cache.get('version') != MavenTestReportingMixin.TEST_REPORT_CACHE_VERSION:
+            return {}
+
+        return cache.get('reports', {})
+
+    @staticmethod
+    def _save_test_report_cache(cache_file_path, cache, report_file_results, report_file_stats):
+        """Saves the results of newly read test reports to the test report cache.
+
+        Notes
+        -----
+        Test reports modified less than TEST_REPORT_CACHE_MIN_AGE_NS ago are not cached since
+        they could be written again, without their size or modification time changing, within
+        the resolution of the file system's modification times.
+
+        The cache file is replaced rather than written in place, so steps reading it at the
+        same time never read part of a cache file. If steps save the cache at the same time the
+        last one wins and the reports only it read are read again next time.
+
+        Parameters
+        ----------
+        cache_file_path : str
+            Path to the test report cache file.
+        cache : dict
+            Cached test report results as loaded from the cache file.
+        report_file_results : dict
+            Results of the newly read test reports by their path.
+        report_file_stats : dict
+            Size and modification time of each test report, by their path,
+            from before they were read.
+        """
+        cache_max_mtime_ns = time.time_ns() - MavenTestReportingMixin.TEST_REPORT_CACHE_MIN_AGE_NS
+        for xml_file, file_results in report_file_results.items():
+            size, mtime_ns = report_file_stats[xml_file]
+            if mtime_ns <= cache_max_mtime_ns:
+                cache[os.path.abspath(xml_file)] = {
+                    **file_results,
+                    'size': size,
+                    'mtime-ns': mtime_ns
+                }
+
+        # forget test reports that no longer exist
+        cache = {
+            xml_file: cache_entry for xml_file, cache_entry in cache.items()
+            if os.path.exists(xml_file)
+        }
+
+        os.makedirs(os.path.dirname(cache_file_path), exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            'w',
+            encoding='utf-8',
+            dir=os.path.dirname(cache_file_path),
+            delete=False
+        ) as cache_file:
+            json.dump(
+                {'version': MavenTestReportingMixin.TEST_REPORT_CACHE_VERSION, 'reports': cache},
+                cache_file
+            )
+        os.replace(cache_file.name, cache_file_path)
 
     @staticmethod
     def _read_evidence_element(file):
-        # Check if the base xml element of the file has one of the element names that is allowed
-        for candidate in MavenTestReportingMixin.TESTSUITE_EVIDENCE_ELEMENTS:
-            element = get_xml_element_if_present(file, candidate)
-            if element is not None: # Elements that exist but have no child elements are falsy!
-                return element
+        """Reads the root element of the given test report if it is one of the
+        recognized evidence elements.
+
+        Notes
+        -----
+        Only the start of the root element is parsed, the rest of the file, which for large
+        test suites can be mostly test cases and their captured output, is never read.
+
+        Parameters
+        ----------
+        file : str
+            Path to the test report to read the evidence element from.
+
+        Returns
+        -------
+        xml.etree.ElementTree.Element or None
+            Root element of the test report, with its attributes but no children, if it is
+            one of TESTSUITE_EVIDENCE_ELEMENTS.
+            None if it is not or if the start of the file is not valid XML.
+        """
+        root = get_xml_root_element(file)
+        if root is not None \
+                and get_local_name(root) in MavenTestReportingMixin.TESTSUITE_EVIDENCE_ELEMENTS:
+            return root
+
         return None
 
+    @staticmethod
+    def _read_evidence_element_and_test_cases(file):
+        """Reads the root element of the given test report, if it is one of the recognized
+        evidence elements, and every test case in it, in one streaming pass.
+
+        Notes
+        -----
+        Test cases and captured output are discarded as they are read so memory use does not
+        grow with the size of the report. If the report is cut short, EX: by the test process
+        being killed, the test cases read before the end are still returned.
+
+        Parameters
+        ----------
+        file : str
+            Path to the test report to read.
+
+        Returns
+        -------
+        (xml.etree.ElementTree.Element or None, [dict])
+            Root element of the test report if it is one of TESTSUITE_EVIDENCE_ELEMENTS,
+            else None, and a dict of the classname, name, time, status, and message of each
+            of its test cases.
+        """
+        root = None
+        test_cases = []
+        try:
+            with open(file, 'rb') as report_file:
+                for event, element in ElementTree.iterparse(report_file, events=('start', 'end')):
+                    if root is None:
+                        if get_local_name(element) not in \
+                                MavenTestReportingMixin.TESTSUITE_EVIDENCE_ELEMENTS:
+                            return None, []
+                        root = element
+                    elif event == 'end':
+                        element_name = get_local_name(element)
+                        if element_name == 'testcase':
+                            test_cases.append(MavenTestReportingMixin._to_test_case(element))
+                            element.clear()
+                        elif element_name in ('system-out', 'system-err') \
+                                or (element_name == 'testsuite' and element is not root):
+                            element.clear()
+        except ElementTree.ParseError:
+            pass
+
+        return root, test_cases
+
+    @staticmethod
+    def _to_test_case(testcase_element):
+        """Summarizes a testcase element of a test report for the test case index.
+
+        Parameters
+        ----------
+        testcase_element : xml.etree.ElementTree.Element
+            testcase element to summarize.
+
+        Returns
+        -------
+        dict
+            classname, name, time, status, and, if it did not pass, truncated message
+            of the test case.
+            status is one of 'passed', 'failure', 'error', or 'skipped'.
+        """
+        status = 'passed'
+        message = None
+        for child in testcase_element:
+            child_name = get_local_name(child)
+            if child_name in MavenTestReportingMixin.TEST_CASE_STATUS_ELEMENTS:
+                status = child_name
+                message = child.get('message') or (child.text or '').strip() or None
+                if message:
+                    message = message[:MavenTestReportingMixin.TEST_CASE_FAILURE_MESSAGE_MAX_LENGTH]
+                break
+
+        test_case_time = None
+        try:
+            test_case_time = MavenTestReportingMixin._to_number(testcase_element.get('time', ''))
+        except ValueError:
+            pass
+
+        return {
+            'classname': testcase_element.get('classname'),
+            'name': testcase_element.get('name'),
+            'time': test_case_time,
+            'status': status,
+            'message': message
+        }
+
     @staticmethod
     def _to_number(string):
         if string.isnumeric():
@@ -202,7 +202,7 @@ class NpmGeneric(StepImplementer):
         step_result = StepResult.from_step_implementer(self)
 
         # package the artifacts
-        npm_output_file_path = self.write_working_file('npm_output.txt')
+        npm_output_file_path = self.write_working_output_file('npm_output.txt')
         try:
             # execute npm step (params come from config)
             self._run_npm_step(
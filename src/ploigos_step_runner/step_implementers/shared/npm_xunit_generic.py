@@ -12,6 +12,12 @@ Configuration Key            | Required? | Default    | Description
 -----------------------------|-----------|------------|------------
 `test-reports-dirs`          | Yes       |            | Location of test result files
 `test-reports-dir`           | Yes       |            | Alias for `test-reports-dirs`
+`test-reports-max-workers`   | No        |            | Maximum number of processes to read test reports with.
+                                                         Default is the number of CPUs.
+`test-reports-test-case-index` | No    | `False`     | `True` to index every test case in the test reports.
+                                                         Adds the `test-case-index` artifact and the `slowest-tests` and `failed-tests` evidence.
+`test-reports-cache`         | No        | `True`     | `True` to cache the results read from each test report by its path, size, and
+                                                         modification time, so only new or changed test reports are read again.
 `npm-test-script`            | Yes       |            | NPM script to run the test
 `target-host-env-var-name`   | No        |            | It is assumed that integration tests need to know a URL
                                                          endpoint to run the tests against,
@@ -28,6 +34,7 @@ Result Artifact Key | Description
 --------------------|------------
 `npm-output`        | Path to Stdout and Stderr from invoking NPM.
 `test-report`       | Directory containing the test reports generated from running this step.
+`test-case-index`   | Path to gzip compressed JSON index of every test case, if `test-reports-test-case-index` is `True`.
 """  # pylint: disable=line-too-long
 
 from ploigos_step_runner.exceptions import StepRunnerException
@@ -42,7 +49,9 @@ REQUIRED_CONFIG_OR_PREVIOUS_STEP_RESULT_ARTIFACT_KEYS = [
     'npm-test-script'
 ]
 
-DEFAULT_CONFIG = {}
+DEFAULT_CONFIG = {
+    'test-reports-cache': True
+}
 
 
 class NpmXunitGeneric(NpmGeneric, MavenTestReportingMixin):
@@ -124,7 +133,7 @@ class NpmXunitGeneric(NpmGeneric, MavenTestReportingMixin):
             target_host_url = self.get_value('target-host-url')
 
         # run the tests
-        npm_output_file_path = self.write_working_file('npm_output.txt')
+        npm_output_file_path = self.write_working_output_file('npm_output.txt')
         try:
             self.npm_args = ['run', self.get_value('npm-test-script')]
 
@@ -159,7 +168,10 @@ class NpmXunitGeneric(NpmGeneric, MavenTestReportingMixin):
             # gather test report evidence
             self._gather_evidence_from_test_report_directory_testsuite_elements(
                 step_result=step_result,
-                test_report_dirs=test_report_dirs
+                test_report_dirs=test_report_dirs,
+                max_workers=self.get_value('test-reports-max-workers'),
+                test_case_index_path=self._get_test_case_index_path(),
+                cache_file_path=self._get_test_report_cache_file_path()
             )
 
         # return result
@@ -64,10 +64,12 @@ from ploigos_step_runner.exceptions import StepRunnerException
 from ploigos_step_runner.step_implementer import StepImplementer
 from ploigos_step_runner.utils.containers import (create_container_from_image,
                                                   mount_container)
-from ploigos_step_runner.utils.file import \
-    download_and_decompress_source_to_destination
+from ploigos_step_runner.utils.file import (
+    download_and_decompress_source_to_destination, open_output_file)
 from ploigos_step_runner.utils.io import \
     create_sh_redirect_to_multiple_streams_fn_callback
+from ploigos_step_runner.utils.output_parsers import (BlockRegexOutputParser,
+                                                      LineRegexOutputParser)
 
 DEFAULT_CONFIG = {
     'oscap-fetch-remote-resources': True,
@@ -148,6 +150,8 @@ class OpenSCAPGeneric(StepImplementer):
         re.DOTALL
     )
     OSCAP_XCCDF_STDOUT_FAIL_PATTERN = re.compile(r'fail')
+    OSCAP_XCCDF_STDOUT_BLOCK_START_PATTERN = re.compile(r'Title')
+    OSCAP_XCCDF_STDOUT_BLOCK_END_PATTERN = re.compile(r'Result\s')
 
     # NOTE: oval output far less useful then xccdf output but it is all but given some content
     #       is only given in oval format and therefor supporting this is important
@@ -355,7 +359,7 @@ class OpenSCAPGeneric(StepImplementer):
             #
             # NOTE: run in the context of `buildah unshare` so that container does not
             #       need to be run in a privilaged mode
-            oscap_out_file_path = self.write_working_file(f'oscap-{oscap_eval_type}-out')
+            oscap_out_file_path = self.write_working_output_file(f'oscap-{oscap_eval_type}-out')
             oscap_xml_results_file_path = self.write_working_file(
                 f'oscap-{oscap_eval_type}-results.xml'
             )
@@ -555,36 +559,56 @@ class OpenSCAPGeneric(StepImplementer):
         if oscap_tailoring_file is not None:
             oscap_tailoring_file_flag = f"--tailoring-file={oscap_tailoring_file}"
 
+        # parse the oscap output as oscap writes it
+        # NOTE: oscap puts carrage returns (\r / ^M) in their output, the parser removes them
+        # NOTE: print the oscap output no matter the results
+        if oscap_eval_type == 'xccdf':
+            oscap_output_parser = BlockRegexOutputParser(
+                pattern=OpenSCAPGeneric.OSCAP_XCCDF_STDOUT_PATTERN,
+                block_start_pattern=OpenSCAPGeneric.OSCAP_XCCDF_STDOUT_BLOCK_START_PATTERN,
+                block_end_pattern=OpenSCAPGeneric.OSCAP_XCCDF_STDOUT_BLOCK_END_PATTERN,
+                line_consumer=print
+            )
+        else:
+            oscap_output_parser = LineRegexOutputParser(
+                pattern=OpenSCAPGeneric.OSCAP_OVAL_STDOUT_PATTERN,
+                line_consumer=print
+            )
+
         oscap_eval_success = None
-        oscap_eval_out_buff = StringIO()
-        oscap_eval_out = ""
         oscap_eval_fails = None
         oscap_failure_met_threshold = False
         try:
             oscap_chroot_command = buildah_unshare_command.bake("oscap-chroot")
-            with open(oscap_out_file_path, 'w', encoding='utf-8') as oscap_out_file:
+            with open_output_file(oscap_out_file_path, 'w') as oscap_out_file:
+                # NOTE: the oscap output can be large so only write it to the output file
+                #       and parse it as it is written rather then also keeping it all in memory
                 out_callback = create_sh_redirect_to_multiple_streams_fn_callback([
-                    oscap_eval_out_buff,
-                    oscap_out_file
+                    oscap_out_file,
+                    oscap_output_parser
                 ])
                 err_callback = create_sh_redirect_to_multiple_streams_fn_callback([
-                    oscap_eval_out_buff,
-                    oscap_out_file
+                    oscap_out_file,
+                    oscap_output_parser
                 ])
-                oscap_chroot_command(
-                    container_mount_path,
-                    oscap_eval_type,
-                    'eval',
-                    oscap_profile_flag,
-                    oscap_fetch_remote_resources_flag,
-                    oscap_tailoring_file_flag,
-                    f'--results={oscap_xml_results_file_path}',
-                    f'--report={oscap_html_report_path}',
-                    oscap_input_file,
-                    _out=out_callback,
-                    _err=err_callback,
-                    _tee='err'
-                )
+                try:
+                    oscap_chroot_command(
+                        container_mount_path,
+                        oscap_eval_type,
+                        'eval',
+                        oscap_profile_flag,
+                        oscap_fetch_remote_resources_flag,
+                        oscap_tailoring_file_flag,
+                        f'--results={oscap_xml_results_file_path}',
+                        f'--report={oscap_html_report_path}',
+                        oscap_input_file,
+                        _out=out_callback,
+                        _err=err_callback,
+                        _tee='err'
+                    )
+                finally:
+                    out_callback.finish()
+                    err_callback.finish()
                 oscap_eval_success = True
         except sh.ErrorReturnCode_1 as error:  # pylint: disable=no-member
             oscap_eval_success = error
@@ -600,16 +624,8 @@ class OpenSCAPGeneric(StepImplementer):
                 oscap_eval_success = error
         except sh.ErrorReturnCode as error:
             oscap_eval_success = error
-
-        # get the oscap output
-        oscap_eval_out = oscap_eval_out_buff.getvalue()
-
-        # parse the oscap output
-        # NOTE: oscap is puts carrage returns (\r / ^M) in their output, remove them
-        oscap_eval_out = re.sub('\r', '', oscap_eval_out)
-
-        # print the oscap output no matter the results
-        print(oscap_eval_out)
+        finally:
+            oscap_output_parser.close()
 
         # if unexpected error throw error
         if isinstance(oscap_eval_success, Exception):
@@ -620,35 +636,31 @@ class OpenSCAPGeneric(StepImplementer):
         # NOTE: oscap oval eval returns exit code 0 whether or not any rules failed
         #       need to search output to determine if there were any rule failures
         if oscap_eval_type == 'oval' and oscap_eval_success:
-            oscap_eval_fails = ""
+            oscap_eval_fails = []
             #oval does not contain serverity in output so it always meets threshold
             oscap_failure_met_threshold=True
-            for match in OpenSCAPGeneric.OSCAP_OVAL_STDOUT_PATTERN.finditer(oscap_eval_out):
+            for result in oscap_output_parser.results:
                 # NOTE: need to do regex and not == because may contain xterm color chars
-                if OpenSCAPGeneric.OSCAP_OVAL_STDOUT_FAIL_PATTERN.search(
-                        match.groupdict()['ruleresult']
-                ):
-                    oscap_eval_fails += match.groupdict()['ruleblock']
-                    oscap_eval_fails += "\n"
+                if OpenSCAPGeneric.OSCAP_OVAL_STDOUT_FAIL_PATTERN.search(result['ruleresult']):
+                    oscap_eval_fails.append(f"{result['ruleblock']}\n")
                     oscap_eval_success = False
+            oscap_eval_fails = ''.join(oscap_eval_fails)
 
         # if failed xccdf eval then parse out the fails check if any are above severity
         # threshold
         if oscap_eval_type == 'xccdf' and not oscap_eval_success:
-            oscap_eval_fails = ""
-            for match in OpenSCAPGeneric.OSCAP_XCCDF_STDOUT_PATTERN.finditer(oscap_eval_out):
+            oscap_eval_fails = []
+            for result in oscap_output_parser.results:
                 # NOTE: need to do regex and not == because may contain xterm color chars
-                if re.search(r'fail', match.groupdict()['ruleresult']):
-                    oscap_eval_fails += "\n"
-                    oscap_eval_fails += match.groupdict()['ruleblock']
-                    oscap_eval_fails += "\n"
+                if OpenSCAPGeneric.OSCAP_XCCDF_STDOUT_FAIL_PATTERN.search(result['ruleresult']):
+                    oscap_eval_fails.append(f"\n{result['ruleblock']}\n")
 
                     #No need to run severity check if value is not set
                     #or severity is not found for rule
                     if (oscap_severity_index is not None
-                        and match.groupdict()['severity']):
+                        and result['severity']):
                         match_severity_index = OpenSCAPGeneric.__parse_sev_to_int(
-                            oscap_severity=match.groupdict()['severity']
+                            oscap_severity=result['severity']
                         )
 
                         #If severity is not found or
@@ -659,6 +671,7 @@ class OpenSCAPGeneric(StepImplementer):
                             oscap_failure_met_threshold=True
                     else:
                         oscap_failure_met_threshold=True
+            oscap_eval_fails = ''.join(oscap_eval_fails)
 
         return oscap_eval_success, oscap_eval_fails, oscap_failure_met_threshold
 
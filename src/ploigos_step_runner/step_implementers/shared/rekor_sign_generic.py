@@ -27,14 +27,13 @@ Result Artifact Key | Description
 from base64 import b64encode
 import json
 import sys
-from io import StringIO
 import sh
 from ploigos_step_runner.step_implementer import StepImplementer
 from ploigos_step_runner.results import StepResult
 from ploigos_step_runner.utils.file import base64_encode, get_file_hash,\
     download_source_to_destination
 from ploigos_step_runner.utils.io import \
-    create_sh_redirect_to_multiple_streams_fn_callback
+    TextIORingBuffer, create_sh_redirect_to_multiple_streams_fn_callback
 from ploigos_step_runner.utils.pgp import detach_sign_with_pgp_key
 from ploigos_step_runner.utils.pgp import import_pgp_key
 from ploigos_step_runner.utils.pgp import export_pgp_public_key
@@ -210,22 +209,26 @@ class RekorSignGeneric(StepImplementer):  # pylint: disable=too-few-public-metho
             filename='entry.json',
             contents=bytes(json.dumps(rekor_entry), 'utf-8')
         )
-        rekor_upload_stdout_result = StringIO()
-        rekor_upload_stdout_callback = create_sh_redirect_to_multiple_streams_fn_callback([
-            sys.stdout,
-            rekor_upload_stdout_result
-        ])
-        rekor = sh.rekor( # pylint: disable=no-member
-            'upload',
-            '--rekor_server',
-            rekor_server,
-            '--entry',
-            rekor_entry_path,
-            _out=rekor_upload_stdout_callback,
-            _err_to_out=True,
-            _tee='out'
-        )
-        rekor_uuid = str(rekor).rsplit('/', maxsplit=1)[-1].strip(' \n')
+        # NOTE: the rekor uuid is at the end of the output so only keep the end of the output
+        with TextIORingBuffer(max_lines=1) as rekor_upload_stdout_result:
+            rekor_upload_stdout_callback = create_sh_redirect_to_multiple_streams_fn_callback([
+                sys.stdout,
+                rekor_upload_stdout_result
+            ])
+            try:
+                sh.rekor( # pylint: disable=no-member
+                    'upload',
+                    '--rekor_server',
+                    rekor_server,
+                    '--entry',
+                    rekor_entry_path,
+                    _out=rekor_upload_stdout_callback,
+                    _err_to_out=True
+                )
+            finally:
+                rekor_upload_stdout_callback.finish()
+        rekor_upload_stdout = rekor_upload_stdout_result.getvalue()
+        rekor_uuid = rekor_upload_stdout.rsplit('/', maxsplit=1)[-1].strip(' \n')
         return rekor_uuid
 
     def _run_step(self):
@@ -168,7 +168,7 @@ class ToxGeneric(StepImplementer):
         step_result = StepResult.from_step_implementer(self)
 
         # package the artifacts
-        tox_output_file_path = self.write_working_file('tox_output.txt')
+        tox_output_file_path = self.write_working_output_file('tox_output.txt')
         try:
             # execute tox step (params come from config)
             self._run_tox_step(
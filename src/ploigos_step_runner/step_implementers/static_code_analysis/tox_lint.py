@@ -68,7 +68,7 @@ class ToxLint(ToxGeneric):
         """
         step_result = StepResult.from_step_implementer(self)
 
-        tox_output_file_path = self.write_working_file('tox_lint_output.txt')
+        tox_output_file_path = self.write_working_output_file('tox_lint_output.txt')
 
         try:
             self._run_tox_step(
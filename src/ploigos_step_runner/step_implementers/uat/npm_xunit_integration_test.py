@@ -13,6 +13,12 @@ Configuration Key            | Required? | Default    | Description
 -----------------------------|-----------|------------|------------
 `npm-test-script`            | No        | 'test:uat'  | NPM script to run the integration test
 `test-reports-dir`           | Yes       |             | Location of test result files
+`test-reports-max-workers`   | No        |             | Maximum number of processes to read test reports with.
+                                                         Default is the number of CPUs.
+`test-reports-test-case-index` | No    | `False`      | `True` to index every test case in the test reports.
+                                                         Adds the `test-case-index` artifact and the `slowest-tests` and `failed-tests` evidence.
+`test-reports-cache`         | No        | `True`      | `True` to cache the results read from each test report by its path, size, and
+                                                         modification time, so only new or changed test reports are read again.
 `target-host-env-var-name`   | Yes       |             | It is assumed that integration tests need to know a URL
                                                          endpoint to run the tests against,
                                                          and we are standardizing on passing this in via an
@@ -28,6 +34,7 @@ Result Artifact Key | Description
 --------------------|------------
 `npm-output`        | Path to Stdout and Stderr from invoking NPM.
 `test-report`       | Directory containing the test reports generated from running this step.
+`test-case-index`   | Path to gzip compressed JSON index of every test case, if `test-reports-test-case-index` is `True`.
 """  # pylint: disable=line-too-long
 
 from ploigos_step_runner.step_implementers.shared import NpmXunitGeneric
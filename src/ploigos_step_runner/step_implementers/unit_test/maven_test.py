@@ -17,15 +17,31 @@ Configuration Key            | Required? | Default | Description
                                                      `False` to have the transfer progress printed.\
                                                       See https://maven.apache.org/ref/current/maven-embedder/cli.html
 `maven-additional-arguments` | No        | `[]`    | List of additional arguments to use.
+`maven-command`              | No        | `'auto'` | Maven command to run, EX: `mvn` or `mvnd`. \
+                                                      `auto` to run `mvnd` if installed, else `mvn`.
+`maven-threads`              | No        | `'1C'`  | Threads to build modules with in parallel (`-T`), \
+                                                     EX: `4`, or `1C` for one per CPU core.
 `maven-servers`              | No        |         | Dictionary of dictionaries of id, username, password
 `maven-repositories`         | No        |         | Dictionary of dictionaries of id, url, snapshots, releases
 `maven-mirrors`              | No        |         | Dictionary of dictionaries of id, url, mirror_of
+`maven-local-repository`     | No        |         | Path to the maven local repository, EX: one shared by \
+                                                     all of the steps of the workflow. \
+                                                     Sharing it between steps running at the same time \
+                                                     requires Maven 3.9 or newer.
+`maven-prewarm-local-repository` | No    | `False` | `True` to run `dependency:go-offline` once for each set of \
+                                                     dependencies to fill the `maven-local-repository`.
 `test-reports-dirs`          | No        |         | Default is to try and dynamically determine where the test reports directory is \
                                                      based on configuration in the given `pom-file`, but it is impossible task to do \
                                                      in all cases. \
                                                      So, this parameter provides a way for the user to specify where the test results \
                                                      are if our attempts at dynamically figuring it out are failing your unique pom.
 `test-reports-dir`           | No        |         | Alias for `test-reports-dirs`
+`test-reports-max-workers`   | No        |         | Maximum number of processes to read test reports with. \
+                                                     Default is the number of CPUs.
+`test-reports-test-case-index` | No    | `False`  | `True` to index every test case in the test reports. \
+                                                     Adds the `test-case-index` artifact and the `slowest-tests` and `failed-tests` evidence.
+`test-reports-cache`         | No        | `True`  | `True` to cache the results read from each test report by its path, size, and \
+                                                     modification time, so only new or changed test reports are read again.
 
 
 Result Artifacts
@@ -36,6 +52,7 @@ Result Artifact Key | Description
 --------------------|------------
 `maven-output`      | Path to Stdout and Stderr from invoking Maven.
 `test-report`       | Directory containing the test reports generated from running this step.
+`test-case-index`   | Path to gzip compressed JSON index of every test case, if `test-reports-test-case-index` is `True`.
 """# pylint: disable=line-too-long
 
 from ploigos_step_runner.results import StepResult
@@ -43,7 +60,9 @@ from ploigos_step_runner.exceptions import StepRunnerException
 from ploigos_step_runner.step_implementers.shared import (
     MavenGeneric, MavenTestReportingMixin)
 
-DEFAULT_CONFIG = {}
+DEFAULT_CONFIG = {
+    'test-reports-cache': True
+}
 
 REQUIRED_CONFIG_OR_PREVIOUS_STEP_RESULT_ARTIFACT_KEYS = [
     'pom-file'
@@ -112,7 +131,7 @@ class MavenTest(MavenGeneric, MavenTestReportingMixin):
 
         # run the tests
         print("Run unit tests")
-        mvn_output_file_path = self.write_working_file('mvn_output.txt')
+        mvn_output_file_path = self.write_working_output_file('mvn_output.txt')
         try:
             # execute maven step (params come from config)
             self._run_maven_step(
@@ -141,7 +160,10 @@ class MavenTest(MavenGeneric, MavenTestReportingMixin):
             # gather test report evidence
             self._gather_evidence_from_test_report_directory_testsuite_elements(
                 step_result=step_result,
-                test_report_dirs=test_report_dirs
+                test_report_dirs=test_report_dirs,
+                max_workers=self.get_value('test-reports-max-workers'),
+                test_case_index_path=self._get_test_case_index_path(),
+                cache_file_path=self._get_test_report_cache_file_path()
             )
 
         # return result
@@ -45,7 +45,7 @@ class NpmTest(NpmGeneric):
         """
         step_result = StepResult.from_step_implementer(self)
 
-        npm_output_file_path = self.write_working_file('npm_test_output.txt')
+        npm_output_file_path = self.write_working_output_file('npm_test_output.txt')
         try:
             if self.get_value('install-first'):
                 self._run_npm_step(
@@ -74,6 +74,7 @@ import sys
 import sh
 from ploigos_step_runner.step_implementer import StepImplementer
 from ploigos_step_runner.results import StepResult
+from ploigos_step_runner.utils.file import open_output_file
 from ploigos_step_runner.utils.io import create_sh_redirect_to_multiple_streams_fn_callback
 
 DEFAULT_CONFIG = {
@@ -148,11 +149,11 @@ class Configlint(StepImplementer):
             step_result.message = f'File specified in rules not found: {rules_file}'
             return step_result
 
-        configlint_results_file_path = self.write_working_file('configlint_results_file.txt')
+        configlint_results_file_path = self.write_working_output_file('configlint_results_file.txt')
         try:
             # run config-lint writing stdout and stderr to the standard streams
             # as well as to a results file.
-            with open(configlint_results_file_path, 'w', encoding='utf-8') \
+            with open_output_file(configlint_results_file_path, 'w') \
                     as configlint_results_file:
                 out_callback = create_sh_redirect_to_multiple_streams_fn_callback([
                     sys.stdout,
@@ -163,17 +164,21 @@ class Configlint(StepImplementer):
                     configlint_results_file
                 ])
 
-                sh.config_lint(  # pylint: disable=no-member
-                    "-verbose",
-                    "-debug",
-                    "-rules",
-                    rules_file,
-                    configlint_yml_path,
-                    _encoding='UTF-8',
-                    _out=out_callback,
-                    _err=err_callback,
-                    _tee='err'
-                )
+                try:
+                    sh.config_lint(  # pylint: disable=no-member
+                        "-verbose",
+                        "-debug",
+                        "-rules",
+                        rules_file,
+                        configlint_yml_path,
+                        _encoding='UTF-8',
+                        _out=out_callback,
+                        _err=err_callback,
+                        _tee='err'
+                    )
+                finally:
+                    out_callback.finish()
+                    err_callback.finish()
         except sh.ErrorReturnCode_255:  # pylint: disable=no-member
             # NOTE: expected failure condition,
             #       aka, the config lint run, but found an issue
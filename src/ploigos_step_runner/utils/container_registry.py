@@ -0,0 +1,431 @@
+"""Client for the container registry HTTP API.
+
+Reads what is needed about container images straight from the registry, EX: the digest of a
+tag by requesting just its manifest's headers, rather than pulling the whole image.
+
+SEE: https://github.com/opencontainers/distribution-spec/blob/main/spec.md
+"""
+
+import hashlib
+import json
+import re
+import ssl
+import urllib.error
+import urllib.parse
+import urllib.request
+
+# registry whose API is at a different host than the registry name used in image addresses
+DOCKER_HUB_REGISTRY = 'docker.io'
+DOCKER_HUB_API_HOST = 'registry-1.docker.io'
+
+# every manifest media type the registry may have stored the manifest as, so the registry never
+# converts the manifest, which would change its digest
+MANIFEST_MEDIA_TYPES = [
+    'application/vnd.oci.image.index.v1+json',
+    'application/vnd.docker.distribution.manifest.list.v2+json',
+    'application/vnd.oci.image.manifest.v1+json',
+    'application/vnd.docker.distribution.manifest.v2+json'
+]
+
+CONTAINER_REGISTRY_REQUEST_TIMEOUT_SECONDS = 60
+
+class ContainerRegistryClient:
+    """Client for the container registry HTTP API.
+
+    Parameters
+    ----------
+    containers_config_auth_file : str, optional
+        Path to container image registries authentication file, as written by
+        `buildah login` or `skopeo login`, to get the credentials for each registry from.
+    tls_verify : bool, optional
+        False to not verify the TLS certificates of the registries,
+        and to fall back to plain HTTP for registries not serving HTTPS.
+    """
+
+    def __init__(self, containers_config_auth_file=None, tls_verify=True):
+        self.__auths = ContainerRegistryClient.__read_auths(containers_config_auth_file)
+        self.__tls_verify = tls_verify
+        self.__tokens = {}
+        self.__schemes = {}
+
+        if tls_verify:
+            self.__ssl_context = ssl.create_default_context()
+        else:
+            self.__ssl_context = ssl.create_default_context()
+            self.__ssl_context.check_hostname = False
+            self.__ssl_context.verify_mode = ssl.CERT_NONE
+
+    def get_manifest_digest(self, registry, repository, reference):
+        """Gets the digest of a manifest without downloading the manifest or any of its layers.
+
+        Parameters
+        ----------
+        registry : str
+            Registry the container image is in, EX: quay.io or localhost:5000.
+        repository : str
+            Repository of the container image in the registry, EX: my-org/my-app.
+        reference : str
+            Tag or digest of the container image.
+
+        Returns
+        -------
+        str
+            Digest of the manifest, EX: sha256:abc123...
+
+        Raises
+        ------
+        RuntimeError
+            If the manifest can not be found or the registry can not be reached.
+        """
+        response = self.__request_manifest(registry, repository, reference, 'HEAD')
+        digest = response.headers.get('Docker-Content-Digest')
+        if digest:
+            return digest
+
+        # NOTE: registries should always give the digest, but if not, compute it from the
+        #       manifest, which is small, rather than the image
+        manifest, _ = self.get_manifest(registry, repository, reference)
+        return f"sha256:{hashlib.sha256(manifest).hexdigest()}"
+
+    def get_manifest(self, registry, repository, reference):
+        """Gets a manifest as it is stored in the registry.
+
+        Parameters
+        ----------
+        registry : str
+            Registry the container image is in, EX: quay.io or localhost:5000.
+        repository : str
+            Repository of the container image in the registry, EX: my-org/my-app.
+        reference : str
+            Tag or digest of the container image.
+
+        Returns
+        -------
+        bytes, str
+            The manifest and its media type.
+
+        Raises
+        ------
+        RuntimeError
+            If the manifest can not be found or the registry can not be reached.
+        """
+        response = self.__request_manifest(registry, repository, reference, 'GET')
+        return response.body, response.headers.get('Content-Type')
+
+    def put_manifest(self, registry, repository, reference, manifest, media_type):
+        """Puts a manifest into the registry, EX: to add a tag to an image already in the registry
+        without uploading any of its layers again.
+
+        Parameters
+        ----------
+        registry : str
+            Registry to put the manifest in, EX: quay.io or localhost:5000.
+        repository : str
+            Repository in the registry to put the manifest in, EX: my-org/my-app.
+        reference : str
+            Tag to put the manifest at.
+        manifest : bytes
+            The manifest, exactly as gotten from `get_manifest` so its digest does not change.
+        media_type : str
+            Media type of the manifest.
+
+        Raises
+        ------
+        RuntimeError
+            If the registry does not accept the manifest or can not be reached.
+        """
+        self.__request_manifest(
+            registry,
+            repository,
+            reference,
+            'PUT',
+            headers={'Content-Type': media_type},
+            data=manifest
+        )
+
+    def __request_manifest(
+        self,
+        registry,
+        repository,
+        reference,
+        method,
+        headers=None,
+        data=None
+    ): # pylint: disable=too-many-arguments
+        repository = ContainerRegistryClient.__normalize_repository(registry, repository)
+        try:
+            return self.__request(
+                registry=registry,
+                repository=repository,
+                path=f"/v2/{repository}/manifests/{reference}",
+                method=method,
+                headers={'Accept': ', '.join(MANIFEST_MEDIA_TYPES), **(headers or {})},
+                data=data
+            )
+        except urllib.error.HTTPError as error:
+            if method == 'PUT':
+                action = 'putting'
+                direction = 'to'
+            else:
+                action = 'getting'
+                direction = 'from'
+            raise RuntimeError(
+                f"Error {action} container image ({registry}/{repository}:{reference}) manifest"
+                f" {direction} registry: {error.code} {error.reason}"
+            ) from error
+        except (urllib.error.URLError, OSError) as error:
+            raise RuntimeError(
+                f"Error connecting to container image registry ({registry}): {error}"
+            ) from error
+
+    def __request(
+        self,
+        registry,
+        repository,
+        path,
+        method,
+        headers,
+        data=None,
+        retry_auth=True
+    ): # pylint: disable=too-many-arguments
+        scheme = self.__get_scheme(registry)
+        url = f"{scheme}://{ContainerRegistryClient.__api_host(registry)}{path}"
+        request_headers = dict(headers)
+        authorization = self.__tokens.get((registry, repository))
+        if authorization:
+            request_headers['Authorization'] = authorization
+
+        try:
+            return self.__open(urllib.request.Request(
+                url,
+                data=data,
+                headers=request_headers,
+                method=method
+            ))
+        except urllib.error.HTTPError as error:
+            if error.code != 401 or not retry_auth:
+                raise
+
+            # authenticate the way the registry asks for and try once more
+            self.__tokens[(registry, repository)] = self.__authenticate(
+                registry,
+                repository,
+                error.headers.get('WWW-Authenticate', '')
+            )
+            return self.__request(
+                registry,
+                repository,
+                path,
+                method,
+                headers,
+                data=data,
+                retry_auth=False
+            )
+
+    def __get_scheme(self, registry):
+        if registry not in self.__schemes:
+            self.__schemes[registry] = 'https'
+            if not self.__tls_verify:
+                # fall back to plain HTTP for registries that do not serve HTTPS,
+                # as skopeo and buildah do when not verifying TLS
+                try:
+                    self.__open(urllib.request.Request(
+                        f"https://{ContainerRegistryClient.__api_host(registry)}/v2/",
+                        method='GET'
+                    ))
+                except urllib.error.HTTPError:
+                    pass
+                except urllib.error.URLError as error:
+                    if isinstance(error.reason, ssl.SSLError):
+                        self.__schemes[registry] = 'http'
+
+        return self.__schemes[registry]
+
+    def __authenticate(self, registry, repository, www_authenticate):
+        credentials = self.__get_credentials(registry, repository)
+        scheme, _, params = www_authenticate.partition(' ')
+        challenge = dict(re.findall(r'(\w+)="([^"]*)"', params))
+
+        if scheme.lower() == 'basic':
+            if credentials is None:
+                raise urllib.error.HTTPError(
+                    f"{registry}/v2/", 401, 'No credentials for registry', {}, None
+                )
+            return f"Basic {credentials}"
+
+        # bearer token authentication
+        # SEE: https://docs.docker.com/registry/spec/auth/token/
+        query = {'scope': challenge.get('scope', f"repository:{repository}:pull")}
+        if challenge.get('service'):
+            query['service'] = challenge['service']
+        token_request = urllib.request.Request(
+            f"{challenge.get('realm', '')}?{urllib.parse.urlencode(query)}",
+            method='GET'
+        )
+        if credentials is not None:
+            token_request.add_header('Authorization', f"Basic {credentials}")
+
+        try:
+            token_response = json.loads(self.__open(token_request).body)
+        except ValueError as error:
+            raise RuntimeError(
+                f"Error reading authentication token for container image registry ({registry})"
+                f" from ({challenge.get('realm', '')}): {error}"
+            ) from error
+
+        token = None
+        if isinstance(token_response, dict):
+            token = token_response.get('token') or token_response.get('access_token')
+        if not token:
+            raise RuntimeError(
+                f"Error reading authentication token for container image registry ({registry})"
+                f" from ({challenge.get('realm', '')}): response has no token"
+            )
+
+        return f"Bearer {token}"
+
+    def __get_credentials(self, registry, repository):
+        # most specific auth entry first, as containers-auth.json(5) does
+        repository_parts = repository.split('/')
+        keys = [
+            f"{registry}/{'/'.join(repository_parts[:length])}"
+            for length in range(len(repository_parts), 0, -1)
+        ]
+        keys += [registry, f"https://{registry}", f"http://{registry}"]
+        if registry == DOCKER_HUB_REGISTRY:
+            keys += ['https://index.docker.io/v1/']
+
+        for key in keys:
+            if key in self.__auths and self.__auths[key].get('auth'):
+                return self.__auths[key]['auth']
+
+        return None
+
+    def __open(self, request):
+        context = self.__ssl_context if request.full_url.startswith('https:') else None
+        with urllib.request.urlopen(
+            request,
+            context=context,
+            timeout=CONTAINER_REGISTRY_REQUEST_TIMEOUT_SECONDS
+        ) as response:
+            return ContainerRegistryResponse(
+                status=response.status,
+                headers=response.headers,
+                body=response.read()
+            )
+
+    @staticmethod
+    def __read_auths(containers_config_auth_file):
+        if not containers_config_auth_file:
+            return {}
+
+        try:
+            with open(containers_config_auth_file, 'r', encoding='utf-8') as auth_file:
+                return json.load(auth_file).get('auths', {})
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, AttributeError) as error:
+            raise RuntimeError(
+                f"Error reading container registries authentication file"
+                f" ({containers_config_auth_file}): {error}"
+            ) from error
+
+    @staticmethod
+    def __api_host(registry):
+        if registry == DOCKER_HUB_REGISTRY:
+            return DOCKER_HUB_API_HOST
+        return registry
+
+    @staticmethod
+    def __normalize_repository(registry, repository):
+        if registry == DOCKER_HUB_REGISTRY and '/' not in repository:
+            return f"library/{repository}"
+        return repository
+
+class ContainerRegistryResponse: # pylint: disable=too-few-public-methods
+    """Response from a container registry with the body already read.
+
+    Parameters
+    ----------
+    status : int
+        HTTP status code of the response.
+    headers : email.message.Message
+        Headers of the response.
+    body : bytes
+        Body of the response.
+    """
+
+    def __init__(self, status, headers, body):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+def parse_container_image_address(container_image_address):
+    """Splits a container image address into its registry, repository, and tag or digest.
+
+    Parameters
+    ----------
+    container_image_address : str
+        Address of a container image, EX: quay.io/my-org/my-app:v1.0.0,
+        localhost:5000/my-app@sha256:abc123..., or my-app which is docker.io/library/my-app:latest.
+
+    Returns
+    -------
+    str, str, str
+        Registry, repository, and tag or digest of the container image.
+    """
+    name = container_image_address
+    reference = 'latest'
+    if '@' in name:
+        name, reference = name.split('@', 1)
+    else:
+        last_part = name.rsplit('/', 1)[-1]
+        if ':' in last_part:
+            name, reference = name.rsplit(':', 1)
+
+    registry = DOCKER_HUB_REGISTRY
+    name_parts = name.split('/', 1)
+    if len(name_parts) == 2 and (
+        '.' in name_parts[0] or ':' in name_parts[0] or name_parts[0] == 'localhost'
+    ):
+        registry, name = name_parts
+
+    return registry, name, reference
+
+def get_container_image_registry_digest(
+    container_image_address,
+    containers_config_auth_file=None,
+    tls_verify=True
+):
+    """Get the digest of a container image in a registry from the registry API,
+    without pulling the image.
+
+    Parameters
+    ----------
+    container_image_address : str
+        Address of the container image in a registry to get the digest of.
+    containers_config_auth_file : str, optional
+        Path to container image registries authentication file.
+    tls_verify : bool, optional
+        False to not verify the TLS certificate of the registry.
+
+    Raises
+    ------
+    RuntimeError
+        If error getting the digest from the registry.
+
+    Returns
+    -------
+    str
+        Container image digest for given container image.
+    """
+    registry, repository, reference = parse_container_image_address(container_image_address)
+    try:
+        return ContainerRegistryClient(
+            containers_config_auth_file=containers_config_auth_file,
+            tls_verify=tls_verify
+        ).get_manifest_digest(registry, repository, reference)
+    except RuntimeError as error:
+        raise RuntimeError(
+            f"Error getting container image ({container_image_address}) image digest: {error}"
+        ) from error
@@ -1,8 +1,18 @@
 """Shared utils for dealing with containers.
 """
 
+import base64
+import fcntl
+import glob
+import hashlib
+import hmac
 import json
+import os
+import re
+import shutil
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO
 
 import sh
@@ -10,6 +20,14 @@ from ploigos_step_runner.config.config_value import ConfigValue
 from ploigos_step_runner.utils.io import \
     create_sh_redirect_to_multiple_streams_fn_callback
 
+# where containers-storage keeps its configuration and images when not configured otherwise
+# SEE: containers-storage.conf(5)
+CONTAINERS_STORAGE_CONF_PATHS = [
+    '/etc/containers/storage.conf',
+    '/usr/share/containers/storage.conf'
+]
+CONTAINERS_STORAGE_ROOT_DEFAULT = '/var/lib/containers/storage'
+
 
 def container_registries_login(  #pylint: disable=too-many-branches
     registries,
@@ -69,6 +87,11 @@ def container_registries_login(  #pylint: disable=too-many-branches
             }
         ]
 
+    When given an authentication file, registries it already has the same credentials for,
+    EX: from an earlier step of the workflow sharing the same authentication file, are not logged
+    into again. The remaining logins are done in parallel, each to its own authentication file
+    that is then merged into the given one.
+
     Parameters
     ----------
     registries : dict or list or None
@@ -77,7 +100,8 @@ def container_registries_login(  #pylint: disable=too-many-branches
         If none, does nothing.
     containers_config_auth_file : str, optional
         Path of the authentication file.
-        If not specified default of the underlying authentication system will be used.
+        If not specified default of the underlying authentication system will be used,
+        and every registry is logged into one after the other every time.
     container_command_short_name : str, optional
         Short name for the command to log in with.
         If not provided will pick the first command found in order (buildah, podman, skopeo).
@@ -95,6 +119,7 @@ def container_registries_login(  #pylint: disable=too-many-branches
 
     assert isinstance(registries, (dict, list))
 
+    logins = []
     if isinstance(registries, dict):
         for registry_key, registry_conf in registries.items():
             if isinstance(registry_conf, ConfigValue):
@@ -122,14 +147,12 @@ def container_registries_login(  #pylint: disable=too-many-branches
             else:
                 registry_tls_verify = False
 
-            container_registry_login(
-                container_registry_uri=registry_uri,
-                container_registry_username=registry_conf['username'],
-                container_registry_password=registry_conf['password'],
-                container_registry_tls_verify=registry_tls_verify,
-                containers_config_auth_file=containers_config_auth_file,
-                container_command_short_name=container_command_short_name
-            )
+            logins.append({
+                'container_registry_uri': registry_uri,
+                'container_registry_username': registry_conf['username'],
+                'container_registry_password': registry_conf['password'],
+                'container_registry_tls_verify': registry_tls_verify
+            })
     elif isinstance(registries, list):
         for registry_conf in registries:
             if isinstance(registry_conf, ConfigValue):
@@ -153,14 +176,217 @@ def container_registries_login(  #pylint: disable=too-many-branches
             else:
                 registry_tls_verify = False
 
+            logins.append({
+                'container_registry_uri': registry_conf['uri'],
+                'container_registry_username': registry_conf['username'],
+                'container_registry_password': registry_conf['password'],
+                'container_registry_tls_verify': registry_tls_verify
+            })
+
+    if not containers_config_auth_file:
+        container_command = get_container_login_command(
+            container_registry_uri=', '.join(
+                str(login['container_registry_uri']) for login in logins
+            ),
+            container_command_short_name=container_command_short_name
+        )
+        for login in logins:
             container_registry_login(
-                container_registry_uri=registry_conf['uri'],
-                container_registry_username=registry_conf['username'],
-                container_registry_password=registry_conf['password'],
-                container_registry_tls_verify=registry_tls_verify,
+                **login,
+                containers_config_auth_file=containers_config_auth_file,
+                container_command_short_name=container_command_short_name,
+                container_command=container_command
+            )
+        return
+
+    # NOTE: lock so that concurrent steps sharing the authentication file
+    #       do not lose each others logins
+    os.makedirs(os.path.dirname(os.path.abspath(containers_config_auth_file)), exist_ok=True)
+    with open(f"{containers_config_auth_file}.lock", 'w', encoding='utf-8') as auth_file_lock:
+        fcntl.flock(auth_file_lock, fcntl.LOCK_EX)
+        try:
+            _login_to_container_registries_with_auth_file(
+                logins=logins,
                 containers_config_auth_file=containers_config_auth_file,
                 container_command_short_name=container_command_short_name
             )
+        finally:
+            fcntl.flock(auth_file_lock, fcntl.LOCK_UN)
+
+def _login_to_container_registries_with_auth_file( # pylint: disable=too-many-locals
+    logins,
+    containers_config_auth_file,
+    container_command_short_name
+):
+    """Logs into the given container registries that the given authentication file does not
+    already have the same credentials for, in parallel.
+    """
+    logged_in_credentials = {}
+    for registry_uri, registry_auth in \
+            _read_json_file(containers_config_auth_file).get('auths', {}).items():
+        # NOTE: registries logged into with a credential helper have no credential in the file
+        if isinstance(registry_auth, dict) and isinstance(registry_auth.get('auth'), str):
+            logged_in_credentials[_normalize_container_registry_uri(registry_uri)] = \
+                registry_auth['auth'].encode('utf-8')
+
+    remaining_logins = []
+    for login in logins:
+        registry_uri = _normalize_container_registry_uri(login['container_registry_uri'])
+        username, credential = _get_container_registry_login_credential(login)
+        if registry_uri in logged_in_credentials and \
+                hmac.compare_digest(logged_in_credentials[registry_uri], credential):
+            print(
+                f"Already logged into container image registry ({registry_uri})"
+                f" as ({username})"
+            )
+        else:
+            remaining_logins.append(login)
+
+    if not remaining_logins:
+        return
+
+    container_command = get_container_login_command(
+        container_registry_uri=', '.join(
+            str(login['container_registry_uri']) for login in remaining_logins
+        ),
+        container_command_short_name=container_command_short_name
+    )
+
+    login_auth_files_dir = tempfile.mkdtemp(
+        dir=os.path.dirname(os.path.abspath(containers_config_auth_file)),
+        prefix='.container-auth-'
+    )
+    try:
+        # log into each registry with its own authentication file so parallel logins
+        # do not overwrite each others changes to the same file
+        login_auth_file_paths = [
+            os.path.join(login_auth_files_dir, f"container-auth-{index}.json")
+            for index in range(len(remaining_logins))
+        ]
+        with ThreadPoolExecutor(max_workers=len(remaining_logins)) as executor:
+            login_futures = [
+                executor.submit(
+                    container_registry_login,
+                    **login,
+                    containers_config_auth_file=login_auth_file_path,
+                    container_command_short_name=container_command_short_name,
+                    container_command=container_command
+                )
+                for login, login_auth_file_path in zip(remaining_logins, login_auth_file_paths)
+            ]
+
+        # merge the successful logins into the shared authentication file
+        auth_file = _read_json_file(containers_config_auth_file)
+        login_errors = []
+        for login, login_auth_file_path, login_future in zip(
+            remaining_logins,
+            login_auth_file_paths,
+            login_futures
+        ):
+            if login_future.exception():
+                login_errors.append(login_future.exception())
+                continue
+
+            auth_file.setdefault('auths', {}).update(
+                _read_json_file(login_auth_file_path).get('auths', {})
+            )
+
+        _write_json_file(containers_config_auth_file, auth_file)
+    finally:
+        shutil.rmtree(login_auth_files_dir, ignore_errors=True)
+
+    if login_errors:
+        raise login_errors[0]
+
+def _get_container_registry_login_credential(login):
+    """Gets the username of the given login and the credential an authentication file has for
+    it once logged in, the base64 encoding of username:password.
+    SEE: containers-auth.json(5)
+    """
+    password = login['container_registry_password']
+    if isinstance(password, ConfigValue):
+        password = password.value
+    username = login['container_registry_username']
+    if isinstance(username, ConfigValue):
+        username = username.value
+
+    return username, base64.b64encode(f"{username}:{password}".encode('utf-8'))
+
+def _normalize_container_registry_uri(container_registry_uri):
+    if isinstance(container_registry_uri, ConfigValue):
+        container_registry_uri = container_registry_uri.value
+    return str(container_registry_uri).split('://', 1)[-1].rstrip('/')
+
+def _read_json_file(json_file_path):
+    try:
+        with open(json_file_path, 'r', encoding='utf-8') as json_file:
+            contents = json.load(json_file)
+    except (OSError, ValueError):
+        return {}
+
+    return contents if isinstance(contents, dict) else {}
+
+def _write_json_file(json_file_path, contents):
+    # NOTE: write to a temporary file and replace so readers never see a partial file
+    with tempfile.NamedTemporaryFile(
+        'w',
+        encoding='utf-8',
+        dir=os.path.dirname(os.path.abspath(json_file_path)),
+        delete=False
+    ) as json_file:
+        json.dump(contents, json_file, indent=2)
+    os.chmod(json_file.name, 0o600)
+    os.replace(json_file.name, json_file_path)
+
+def get_container_login_command(
+    container_registry_uri,
+    container_command_short_name=None
+):
+    """Finds the command to log into container registries with.
+
+    Parameters
+    ----------
+    container_registry_uri : str
+        URI of the container registries being logged into, for error messages.
+    container_command_short_name : str, optional
+        Short name for the command to log in with.
+        If not provided will pick the first command found in order (buildah, podman, skopeo).
+
+    Raises
+    ------
+    RuntimeError
+        When can not find tool to login to container registry with.
+
+    Returns
+    -------
+    sh.Command
+        Command to log into container registries with.
+    """
+    # can use any of these tools to authenticate, look for them and use first available
+    #
+    # NOTE: this all works because these three commands take the exact same parameters for login
+    # if implementing some new command, like docker, you will need to deal with the differences
+    if container_command_short_name:
+        if sh.which(container_command_short_name):
+            return sh.Command(container_command_short_name).bake()
+
+        raise RuntimeError(
+            f"When attempting to login to container registry ({container_registry_uri}) "
+            f"could not find the given expected tool ({container_command_short_name}) "
+            "to login with."
+        )
+
+    if sh.which('buildah') is not None:
+        return sh.buildah.bake() #pylint: disable=no-member
+    if sh.which('podman') is not None:
+        return sh.podman.bake() #pylint: disable=no-member
+    if sh.which('skopeo') is not None:
+        return sh.skopeo.bake() #pylint: disable=no-member
+
+    raise RuntimeError(
+        f"When attempting to login to container registry ({container_registry_uri}) "
+        "could not find one of the expected tools (buildah, podman, skopeo) to login with."
+    )
 
 def container_registry_login( #pylint: disable=too-many-arguments,too-many-branches
     container_registry_uri,
@@ -168,7 +394,8 @@ def container_registry_login( #pylint: disable=too-many-arguments,too-many-branc
     container_registry_password,
     container_registry_tls_verify=True,
     containers_config_auth_file=None,
-    container_command_short_name=None
+    container_command_short_name=None,
+    container_command=None
 ):
     """Performs the login for a single container registry.
 
@@ -195,6 +422,9 @@ def container_registry_login( #pylint: disable=too-many-arguments,too-many-branc
     container_command_short_name : str, optional
         Short name for the command to log in with.
         If not provided will pick the first command found in order (buildah, podman, skopeo).
+    container_command : sh.Command, optional
+        Command to log in with, as found by `get_container_login_command`.
+        If not provided will be found using `container_command_short_name`.
 
     Raises
     ------
@@ -225,33 +455,10 @@ def container_registry_login( #pylint: disable=too-many-arguments,too-many-branc
     if isinstance(containers_config_auth_file, ConfigValue):
         containers_config_auth_file = containers_config_auth_file.value
 
-    # can use any of these tools to authenticate, look for them all and use first available
-    #
-    # NOTE: this all works because these three commands take the exact same parameters for login
-    # if implementing some new command, like docker, you will need to deal with the differences
-    buildah_path = sh.which('buildah')
-    podman_path = sh.which('podman')
-    skopeo_path = sh.which('skopeo')
-    if container_command_short_name:
-        given_command_path = sh.which(container_command_short_name)
-        if given_command_path:
-            container_command = sh.Command(container_command_short_name).bake()
-        else:
-            raise RuntimeError(
-                f"When attempting to login to container registry ({container_registry_uri}) "
-                f"could not find the given expected tool ({container_command_short_name}) "
-                "to login with."
-            )
-    elif buildah_path is not None:
-        container_command = sh.buildah.bake() #pylint: disable=no-member
-    elif podman_path is not None:
-        container_command = sh.podman.bake() #pylint: disable=no-member
-    elif skopeo_path is not None:
-        container_command = sh.skopeo.bake() #pylint: disable=no-member
-    else:
-        raise RuntimeError(
-            f"When attempting to login to container registry ({container_registry_uri}) "
-            "could not find one of the expected tools (buildah, podman, skopeo) to login with."
+    if container_command is None:
+        container_command = get_container_login_command(
+            container_registry_uri=container_registry_uri,
+            container_command_short_name=container_command_short_name
         )
 
     login_command_named_flags = {
@@ -525,6 +732,149 @@ def get_container_image_digest(
             f" container image inspection."
         ) from error
 
+def get_container_image_manifest_digest(
+    container_image_address,
+    containers_config_auth_file=None,
+    tls_verify=True
+):
+    """Get the digest of the manifest of a container image, as it is stored where it is,
+    with `skopeo inspect --raw`, which reads only the manifest rather than pulling the image.
+
+    Parameters
+    ----------
+    container_image_address : str
+        Address of the container image including its transport,
+        EX: containers-storage:localhost/my-app:v1.0.0 or docker://quay.io/my-org/my-app:v1.0.0.
+    containers_config_auth_file : str, optional
+        Path to container image registries authentication file.
+    tls_verify : bool, optional
+        False to not verify the TLS certificate of the registry.
+
+    Raises
+    ------
+    RuntimeError
+        If error reading the container image manifest.
+
+    Returns
+    -------
+    str
+        Digest of the container image manifest.
+    """
+    skopeo_flags = [f"--tls-verify={str(tls_verify).lower()}"]
+    if containers_config_auth_file:
+        skopeo_flags.append(f"--authfile={containers_config_auth_file}")
+
+    try:
+        skopeo_inspect = sh.skopeo.inspect( # pylint: disable=no-member
+            '--raw',
+            *skopeo_flags,
+            container_image_address
+        )
+    except sh.ErrorReturnCode as error:  # pylint: disable=undefined-variable
+        raise RuntimeError(
+            f"Error reading container image ({container_image_address}) manifest: {error}"
+        ) from error
+
+    return f"sha256:{hashlib.sha256(skopeo_inspect.stdout).hexdigest()}"
+
+def get_containers_storage_root():
+    """Get the directory local containers-storage keeps its images in,
+    as buildah and podman would for the current user.
+
+    Returns
+    -------
+    str
+        Path to the containers-storage graph root.
+    """
+    if os.geteuid() == 0:
+        conf_paths = CONTAINERS_STORAGE_CONF_PATHS
+        storage_root = CONTAINERS_STORAGE_ROOT_DEFAULT
+    else:
+        config_home = os.environ.get('XDG_CONFIG_HOME') or \
+            os.path.join(os.path.expanduser('~'), '.config')
+        data_home = os.environ.get('XDG_DATA_HOME') or \
+            os.path.join(os.path.expanduser('~'), '.local', 'share')
+        conf_paths = [os.path.join(config_home, 'containers', 'storage.conf')]
+        storage_root = os.path.join(data_home, 'containers', 'storage')
+
+    if os.environ.get('CONTAINERS_STORAGE_CONF'):
+        conf_paths = [os.environ['CONTAINERS_STORAGE_CONF']]
+
+    for conf_path in conf_paths:
+        try:
+            with open(conf_path, 'r', encoding='utf-8') as conf_file:
+                graph_root = re.search(
+                    r'^\s*graphroot\s*=\s*["\']([^"\']+)["\']',
+                    conf_file.read(),
+                    re.MULTILINE
+                )
+        except OSError:
+            continue
+
+        if graph_root:
+            storage_root = os.path.expanduser(graph_root.group(1))
+        break
+
+    return storage_root
+
+def get_local_container_image_digest(
+    container_image_address,
+    container_image_id_file=None,
+    containers_storage_root=None
+):
+    """Get the digest of a container image in local containers-storage by reading the
+    containers-storage image metadata rather than running `buildah inspect`.
+
+    Parameters
+    ----------
+    container_image_address : str
+        Local address of the container image to get the digest for.
+    container_image_id_file : str, optional
+        Path to a file with the ID of the container image,
+        EX: as written by `buildah bud --iidfile`.
+        Used to find the image rather than the address if given and exists.
+    containers_storage_root : str, optional
+        containers-storage graph root to look for the container image in.
+        Defaults to the one buildah would use.
+
+    Returns
+    -------
+    str or None
+        Container image digest for the given container image,
+        or None if the container image can not be found in local containers-storage.
+    """
+    container_image_id = None
+    if container_image_id_file:
+        try:
+            with open(container_image_id_file, 'r', encoding='utf-8') as id_file:
+                container_image_id = id_file.read().strip().split(':')[-1]
+        except OSError:
+            pass
+
+    if containers_storage_root is None:
+        containers_storage_root = get_containers_storage_root()
+
+    # one images.json per storage driver, EX: overlay-images/images.json
+    for images_file_path in sorted(glob.glob(
+        os.path.join(containers_storage_root, '*-images', 'images.json')
+    )):
+        try:
+            with open(images_file_path, 'r', encoding='utf-8') as images_file:
+                images = json.load(images_file)
+        except (OSError, ValueError):
+            continue
+
+        for image in images:
+            if container_image_id:
+                found = image.get('id') == container_image_id
+            else:
+                found = container_image_address in image.get('names', [])
+
+            if found and image.get('digest'):
+                return image['digest']
+
+    return None
+
 def add_container_build_step_result_artifacts(
     step_result,
     contaimer_image_registry,
@@ -3,13 +3,16 @@
 
 import base64
 import bz2
+import gzip
 import hashlib
 import json
 import locale
+import lzma
 import os
 import re
 import shutil
 import urllib.request
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -17,6 +20,19 @@ import yaml
 
 SUPPORTED_COMPRESSION_EXTENSIONS = ['.bz2']
 
+# compression to use for tool output files written while the tool runs,
+# by the output-compression config value, and the extension those files are given
+OUTPUT_FILE_COMPRESSION_EXTENSIONS = {
+    'gzip': '.gz',
+    'xz': '.xz'
+}
+
+# compression level trading size for speed since the output is compressed as the tool writes it
+OUTPUT_FILE_GZIP_COMPRESSION_LEVEL = 6
+
+# below this many files the cost of starting worker processes outweighs the cost of parsing
+PARALLEL_PARSE_MIN_FILES = 8
+
 def parse_yaml_or_json_file(yaml_or_json_file):
     """
     Parse YAML or JSON config files.
@@ -62,6 +78,56 @@ def parse_yaml_or_json_file(yaml_or_json_file):
 
     return parsed_file
 
+def parse_yaml_or_json_files(yaml_or_json_files, max_workers=None):
+    """Parse multiple YAML or JSON files, concurrently if there are enough of them to be worth it.
+
+    Notes
+    -----
+    Parsing YAML is CPU bound so the files are parsed in a pool of worker processes
+    rather than threads.
+
+    Parameters
+    ----------
+    yaml_or_json_files : list of str
+        List of paths to YAML or JSON files to load as dictionaries.
+    max_workers : int, optional
+        Maximum number of worker processes to parse with.
+        If not given defaults to the number of CPUs on the machine.
+        If 1 then files are parsed one after another in the current process.
+
+    Yields
+    ------
+    dict
+        Dictionary parsed from each of the given files, in the same order as the given files,
+        regardless of the order the files finish being parsed in.
+
+    Raises
+    ------
+    ValueError
+        If any of the given files can not be parsed as YAML or JSON.
+        Raised when the result for that file is reached.
+
+    See Also
+    --------
+    parse_yaml_or_json_file
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    if max_workers <= 1 or len(yaml_or_json_files) < PARALLEL_PARSE_MIN_FILES:
+        for yaml_or_json_file in yaml_or_json_files:
+            yield parse_yaml_or_json_file(yaml_or_json_file)
+        return
+
+    # hand out work in a few chunks per worker to keep the inter process overhead down
+    chunksize = max(1, len(yaml_or_json_files) // (max_workers * 4))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(
+            parse_yaml_or_json_file,
+            yaml_or_json_files,
+            chunksize=chunksize
+        )
+
 def download_source_to_destination(
     source_uri,
     destination_dir
@@ -541,3 +607,85 @@ def is_remote_http_path(uri):
         True, if this is an http file (e.g., https://example.org/example.zip)
     """
     return re.match(r'^http://|^https://', uri)
+
+def get_output_file_compression_extension(output_compression):
+    """Gets the extension to give a tool output file compressed with the given compression.
+
+    Parameters
+    ----------
+    output_compression : str or None
+        Compression to use for the output file, one of the keys of
+        OUTPUT_FILE_COMPRESSION_EXTENSIONS, or None or 'none' for no compression.
+
+    Returns
+    -------
+    str
+        Extension to append to the output file name, or an empty string if not compressed.
+
+    Raises
+    ------
+    ValueError
+        If the given compression is not supported.
+    """
+    if output_compression is None or str(output_compression).lower() == 'none':
+        return ''
+
+    output_compression = str(output_compression).lower()
+    if output_compression not in OUTPUT_FILE_COMPRESSION_EXTENSIONS:
+        raise ValueError(
+            f"Unsupported output file compression ({output_compression})."
+            f" Must be one of: {list(OUTPUT_FILE_COMPRESSION_EXTENSIONS)}"
+        )
+
+    return OUTPUT_FILE_COMPRESSION_EXTENSIONS[output_compression]
+
+def open_output_file(file_path, mode='r'):
+    """Opens a tool output file as text, compressing or decompressing it as it is written or
+    read if its extension is one of OUTPUT_FILE_COMPRESSION_EXTENSIONS.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the output file to open.
+    mode : str, optional
+        'r' to read, 'w' to write, or 'a' to append.
+
+    Returns
+    -------
+    io.TextIOBase
+        Open text stream for the output file.
+    """
+    file_extension = get_file_extension(file_path)
+    if file_extension == OUTPUT_FILE_COMPRESSION_EXTENSIONS['gzip']:
+        output_file = gzip.open(
+            file_path,
+            f'{mode}t',
+            compresslevel=OUTPUT_FILE_GZIP_COMPRESSION_LEVEL,
+            encoding='utf-8'
+        )
+    elif file_extension == OUTPUT_FILE_COMPRESSION_EXTENSIONS['xz']:
+        output_file = lzma.open(file_path, f'{mode}t', encoding='utf-8')
+    else:
+        output_file = open(file_path, mode, encoding='utf-8') # pylint: disable=consider-using-with
+
+    return output_file
+
+def read_output_file(file_path):
+    """Reads all of a tool output file, whether or not it is compressed.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the output file to read.
+
+    Returns
+    -------
+    str
+        Contents of the output file.
+
+    See Also
+    --------
+    open_output_file
+    """
+    with open_output_file(file_path) as output_file:
+        return output_file.read()
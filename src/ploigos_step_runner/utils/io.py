@@ -1,20 +1,48 @@
+# pylint: disable=too-many-lines
 """Shared utilities for dealing with IO
 """
 
 import io
+import lzma
 import random
 import re
+import threading
+import time
+import zlib
+from collections import deque
 
+# seconds between flushes of streams being written to as output is produced
+DEFAULT_FLUSH_INTERVAL = 0.1
 
-def create_sh_redirect_to_multiple_streams_fn_callback(streams):
+# number of characters of output kept in memory when capturing the output of a command
+DEFAULT_OUTPUT_CAPTURE_SIZE = 64 * 1024
+
+
+def create_sh_redirect_to_multiple_streams_fn_callback(
+    streams,
+    flush_interval=DEFAULT_FLUSH_INTERVAL
+):
     """Creates and returns a function callback that will write given data to multiple given streams.
 
     AKA: this essentially allows you to do 'tee' for sh commands.
 
+    Notes
+    -----
+    The given streams are only flushed if at least flush_interval seconds have passed since they
+    were last flushed rather then after every write, so chatty commands are not slowed down by
+    flushing after every line they write. If nothing else is written within flush_interval
+    seconds of a write that was not flushed, the streams are flushed then, so the last output of
+    a command that has gone quiet, EX: while running a long test, is not held back.
+    Callers must call the finish function of the returned callback before closing the given
+    streams so that no flush of them happens while, or after, they are being closed.
+
     Parameters
     ----------
     streams : list of io.IOBase
         Streams to write to.
+    flush_interval : float, optional
+        Minimum seconds between flushes of the given streams.
+        0 to flush after every write.
 
     Examples
     --------
@@ -29,28 +57,389 @@ def create_sh_redirect_to_multiple_streams_fn_callback(streams):
     ...         sys.stderr,
     ...         results_file
     ...     ])
-    ...     sh.echo('hello world')
+    ...     try:
+    ...         sh.echo('hello world', _out=out_callback, _err=err_callback)
+    ...     finally:
+    ...         out_callback.finish()
+    ...         err_callback.finish()
     hello world
 
     Returns
     -------
     function(data)
         Function that takes one parameter, data, and writes that value to all the given streams.
+        Has a finish function attribute, taking no parameters, that cancels any pending idle
+        flush and flushes the given streams one last time.
     """
+    lock = threading.RLock()
+    last_flush_time = time.monotonic()
+    idle_flush_timer = None
+    finished = False
+
+    def flush_streams():
+        nonlocal last_flush_time, idle_flush_timer
+
+        with lock:
+            if idle_flush_timer is not None:
+                idle_flush_timer.cancel()
+                idle_flush_timer = None
+
+            last_flush_time = time.monotonic()
+            for stream in streams:
+                # streams may have been closed by their owners by the time an idle flush happens
+                if getattr(stream, 'closed', False) is True:
+                    continue
+                try:
+                    stream.flush()
+                except (ValueError, OSError, zlib.error, lzma.LZMAError):
+                    pass
+
+    def finish():
+        nonlocal finished
+
+        with lock:
+            finished = True
+            flush_streams()
 
     def sh_redirect_to_multiple_streams(data):
-        for stream in streams:
-            stream.write(data)
-            stream.flush()
+        nonlocal idle_flush_timer
+
+        with lock:
+            for stream in streams:
+                stream.write(data)
+
+            elapsed = time.monotonic() - last_flush_time
+            if finished or elapsed >= flush_interval:
+                flush_streams()
+            elif idle_flush_timer is None:
+                idle_flush_timer = threading.Timer(flush_interval - elapsed, flush_streams)
+                idle_flush_timer.daemon = True
+                idle_flush_timer.start()
 
+    sh_redirect_to_multiple_streams.finish = finish
     return sh_redirect_to_multiple_streams
 
 
-class TextIOSelectiveObfuscator(io.TextIOBase):
+class TextIOLineBuffer(io.TextIOBase): # pylint: disable=too-many-instance-attributes
+    """Coalesces many small writes into batches of whole lines written to the parent stream
+    with a single write.
+
+    This is useful in front of streams that do work for every write, such as TextIOIndenter and
+    TextIOSelectiveObfuscator, when the output of chatty commands is written a line at a time.
+
+    Notes
+    -----
+    Buffered lines are written to the parent stream once a line ending is written and either at
+    least flush_interval seconds have passed since the last time lines were written or at least
+    max_buffer_size characters are buffered. Buffered lines not written that way are written,
+    and the parent stream flushed, flush_interval seconds after the last time lines were written
+    even if nothing more is written, so the last lines of a command that has gone quiet are not
+    held back. Any partial line is only written once it is ended, once the buffer is full,
+    or when this stream is flushed or closed.
+
+    Parameters
+    ----------
+    parent_stream : IOBase
+        Stream to write batches of lines to.
+    flush_interval : float, optional
+        Minimum seconds between writes of batches of lines to the parent stream.
+    max_buffer_size : int, optional
+        Maximum number of characters to buffer before writing to the parent stream regardless of
+        how long ago the parent stream was last written to.
+
+    Attributes
+    ----------
+    __parent_stream : IOBase
+    __flush_interval : float
+    __max_buffer_size : int
+    __buffer : list of str
+    __buffer_size : int
+    __last_write_time : float
+    __lock : threading.RLock
+    __idle_flush_timer : threading.Timer
+    """
+
+    def __init__(
+        self,
+        parent_stream,
+        flush_interval=DEFAULT_FLUSH_INTERVAL,
+        max_buffer_size=64 * 1024
+    ):
+        self.__parent_stream = parent_stream
+        self.__flush_interval = flush_interval
+        self.__max_buffer_size = max_buffer_size
+        self.__buffer = []
+        self.__buffer_size = 0
+        self.__last_write_time = time.monotonic()
+        self.__lock = threading.RLock()
+        self.__idle_flush_timer = None
+        super().__init__()
+
+    @property
+    def parent_stream(self):
+        """Returns parent stream that this stream wraps
+
+        Returns
+        -------
+        IOBase
+            Stream to write batches of lines to.
+        """
+        return self.__parent_stream
+
+    def write(self, given):
+        """Buffers the given text and writes all buffered whole lines to the parent stream
+        if it is time to.
+
+        Parameters
+        ----------
+        given : str or bytes (utf-8)
+            Text to write.
+
+        Returns
+        -------
+        int
+            Number of characters written.
+
+        See Also
+        --------
+        io.TextIOBase.write
+        """
+        if isinstance(given, bytes):
+            given = given.decode('utf-8')
+
+        with self.__lock:
+            self.__buffer.append(given)
+            self.__buffer_size += len(given)
+
+            if self.__buffer_size >= self.__max_buffer_size:
+                self.__write_buffer()
+            elif '\n' in given or '\r' in given:
+                elapsed = time.monotonic() - self.__last_write_time
+                if elapsed >= self.__flush_interval:
+                    self.__write_buffer(whole_lines_only=True)
+                elif self.__idle_flush_timer is None:
+                    self.__idle_flush_timer = threading.Timer(
+                        self.__flush_interval - elapsed,
+                        self.__idle_flush
+                    )
+                    self.__idle_flush_timer.daemon = True
+                    self.__idle_flush_timer.start()
+
+        return len(given)
+
+    def __idle_flush(self):
+        """Writes the buffered whole lines to the parent stream and flushes the parent stream
+        when nothing has been written to this stream for flush_interval seconds.
+        """
+        with self.__lock:
+            self.__idle_flush_timer = None
+            if self.closed or getattr(self.parent_stream, 'closed', False) is True:
+                return
+
+            self.__write_buffer(whole_lines_only=True)
+            self.parent_stream.flush()
+
+    def __write_buffer(self, whole_lines_only=False):
+        """Writes the buffered text to the parent stream with a single write.
+
+        Parameters
+        ----------
+        whole_lines_only : bool, optional
+            True to keep buffering any partial line at the end of the buffered text.
+        """
+        if self.__idle_flush_timer is not None:
+            self.__idle_flush_timer.cancel()
+            self.__idle_flush_timer = None
+
+        buffered = ''.join(self.__buffer)
+        self.__buffer = []
+        self.__buffer_size = 0
+
+        if whole_lines_only:
+            end_of_lines = max(buffered.rfind('\n'), buffered.rfind('\r')) + 1
+            if end_of_lines < len(buffered):
+                self.__buffer.append(buffered[end_of_lines:])
+                self.__buffer_size = len(buffered) - end_of_lines
+                buffered = buffered[:end_of_lines]
+
+        if buffered:
+            self.parent_stream.write(buffered)
+        self.__last_write_time = time.monotonic()
+
+    def flush(self):
+        """Writes everything buffered to the parent stream and flushes the parent stream.
+
+        See Also
+        --------
+        io.TextIOBase.flush
+        """
+        with self.__lock:
+            self.__write_buffer()
+            self.parent_stream.flush()
+
+    def close(self):
+        """Writes everything buffered to the parent stream and closes this stream.
+
+        Notes
+        -----
+        Does not close the parent stream.
+
+        See Also
+        --------
+        io.TextIOBase.close
+        """
+        with self.__lock:
+            if not self.closed and self.__buffer \
+                    and not getattr(self.parent_stream, 'closed', False):
+                self.flush()
+            if self.__idle_flush_timer is not None:
+                self.__idle_flush_timer.cancel()
+                self.__idle_flush_timer = None
+            self.__buffer = []
+            self.__buffer_size = 0
+            super().close()
+
+
+class TextIORingBuffer(io.TextIOBase):
+    """Keeps only the end of the text written to it, and optionally streams every line written
+    to it to a consumer, so that the output of commands can be captured with bounded memory.
+
+    This is useful for capturing the output of commands for error messages or for parsing
+    while the full output only goes to a log file.
+
+    Parameters
+    ----------
+    max_size : int, optional
+        Maximum number of characters to keep.
+    max_lines : int, optional
+        Maximum number of lines to return from getvalue.
+        None for no limit other then max_size.
+    line_consumer : function(str), optional
+        Function called with every line written to this stream, without its line ending,
+        as soon as the line is ended. Any final line without a line ending is passed to this
+        function when this stream is closed.
+
+    Attributes
+    ----------
+    __max_size : int
+    __max_lines : int
+    __line_consumer : function(str)
+    __chunks : deque of str
+    __size : int
+    __truncated : bool
+    __partial_line : str
+    """
+
+    def __init__(self, max_size=DEFAULT_OUTPUT_CAPTURE_SIZE, max_lines=None, line_consumer=None):
+        self.__max_size = max_size
+        self.__max_lines = max_lines
+        self.__line_consumer = line_consumer
+        self.__chunks = deque()
+        self.__size = 0
+        self.__truncated = False
+        self.__partial_line = ''
+        super().__init__()
+
+    @property
+    def truncated(self):
+        """
+        Returns
+        -------
+        bool
+            True if some of the text written to this stream has been dropped.
+        """
+        return self.__truncated
+
+    def write(self, given):
+        """Keeps the end of the given text and passes any lines it ends to the line consumer.
+
+        Parameters
+        ----------
+        given : str or bytes (utf-8)
+            Text to write.
+
+        Returns
+        -------
+        int
+            Number of characters written.
+
+        See Also
+        --------
+        io.TextIOBase.write
+        """
+        if isinstance(given, bytes):
+            given = given.decode('utf-8')
+
+        if self.__line_consumer is not None:
+            lines = (self.__partial_line + given).split('\n')
+            self.__partial_line = lines.pop()[-self.__max_size:]
+            for line in lines:
+                self.__line_consumer(line.rstrip('\r'))
+
+        self.__chunks.append(given)
+        self.__size += len(given)
+        while self.__size - len(self.__chunks[0]) >= self.__max_size:
+            self.__size -= len(self.__chunks.popleft())
+            self.__truncated = True
+
+        return len(given)
+
+    def getvalue(self):
+        """Gets the end of the text written to this stream.
+
+        Returns
+        -------
+        str
+            Up to the last max_size characters, and max_lines lines, written to this stream.
+        """
+        value = ''.join(self.__chunks)
+        if len(value) > self.__max_size:
+            value = value[-self.__max_size:]
+            self.__truncated = True
+
+        if self.__max_lines is not None:
+            lines = value.splitlines(keepends=True)
+            if len(lines) > self.__max_lines:
+                value = ''.join(lines[-self.__max_lines:])
+                self.__truncated = True
+
+        return value
+
+    def close(self):
+        """Passes any final line without a line ending to the line consumer and closes
+        this stream.
+
+        Notes
+        -----
+        The text kept by this stream can still be gotten with getvalue after it is closed.
+
+        See Also
+        --------
+        io.TextIOBase.close
+        """
+        if not self.closed and self.__partial_line and self.__line_consumer is not None:
+            self.__line_consumer(self.__partial_line.rstrip('\r'))
+        self.__partial_line = ''
+        super().close()
+
+
+class TextIOSelectiveObfuscator(io.TextIOBase): # pylint: disable=too-many-instance-attributes
     """Extends the base class for text streams to allow the obfuscation of given patterns.
 
     This is useful to prevent accidentally writing "sensitive" information to stdout/stderr.
 
+    Notes
+    -----
+    Each write is first screened with plain substring checks so that only the obfuscation
+    targets that could be in the written text go through the regex engine.
+
+    Text at the end of a write that could be the start of an obfuscation target is held back
+    until the next write (or until this stream is closed) so that a target split across
+    multiple writes is still obfuscated. The start of all of the targets is combined into a
+    single trie shaped pattern which is only rebuilt when new targets are added.
+
+    Targets can be added from any thread while other threads write to this stream.
+
     Parameters
     ----------
     parent_stream : IOBase
@@ -64,20 +453,63 @@ class TextIOSelectiveObfuscator(io.TextIOBase):
     Attributes
     ----------
     __parent_stream : IOBase
-    __obfuscation_patterns : list
+    __obfuscation_targets : list of str
+        Normalized obfuscation targets, longest first.
+    __obfuscation_patterns : dict of str to re.Pattern
+        Pattern matching each obfuscation target.
+    __obfuscation_anchors : list of tuple (str, str)
+        Longest literal part of each obfuscation target, which must be present in text for
+        the target to match, and the target.
+    __partial_target_pattern : re.Pattern
+        Pattern matching the start of any obfuscation target at the end of text.
+    __long_partial_target_pattern : re.Pattern
+        Pattern matching the start of any obfuscation target too long to be fully covered
+        by the __partial_target_pattern.
+    __long_partial_targets : list of str
+        Obfuscation targets too long to be fully covered by the __partial_target_pattern,
+        with any gaps collapsed to a single space.
+    __held : str
+        Text held back from the parent stream because it could be the start of a target.
     __replacement_char : char
     __randomize_replacement_length : bool
     __random_replacement_length_min : int
     __random_replacement_length_max : int
+    __lock : threading.RLock
+        Lock held while adding obfuscation targets and while writing, so targets added by
+        different threads at the same time are never lost and writes use a consistent set
+        of targets.
     """
 
+    # any amount of whitespace, or escaped whitespace, as treated between parts of a target
+    # when deciding whether to hold back text that could be the start of a target
+    __TARGET_GAP_PATTERN = r'(?:\s|\\[nrt])+'
+
+    # number of characters from the start of each target to look for at the end of written text
+    __PARTIAL_TARGET_LENGTH = 64
+
+    # matches, in reversed text, as much of the end of the text as could be the start of a target
+    __REVERSED_PARTIAL_WINDOW_PATTERN = re.compile(
+        rf'(?:\s+|[nrt]\\|.){{0,{__PARTIAL_TARGET_LENGTH}}}',
+        re.DOTALL
+    )
+
+    # maximum number of characters that will ever be held back waiting for the next write
+    MAX_HELD_CHARS = 64 * 1024
+
     def __init__(self, parent_stream, randomize_replacment_length=True, replacement_char='*'):
         self.__parent_stream = parent_stream
-        self.__obfuscation_patterns = []
+        self.__obfuscation_targets = []
+        self.__obfuscation_patterns = {}
+        self.__obfuscation_anchors = []
+        self.__partial_target_pattern = None
+        self.__long_partial_target_pattern = None
+        self.__long_partial_targets = []
+        self.__held = ''
         self.__replacement_char = replacement_char
         self.__randomize_replacement_length = randomize_replacment_length
         self.__random_replacement_length_min = 5
         self.__random_replacement_length_max = 40
+        self.__lock = threading.RLock()
         super().__init__()
 
     @property
@@ -141,29 +573,110 @@ class TextIOSelectiveObfuscator(io.TextIOBase):
         if not isinstance(targets, list):
             targets = [targets]
 
-        for target in targets:
-            target_pattern = target
+        with self.__lock:
+            new_targets = []
+            for target in targets:
+                # replace any amount of whitespace with a single space
+                # and strip off leading and trialing whitespace
+                target = re.sub(r'\s+', ' ', target).strip()
 
-            # replace any amount of whitespace with a single space
-            target_pattern = re.sub(r'\s+', ' ', target_pattern)
+                # an empty target would match everywhere
+                if target and target not in self.__obfuscation_patterns \
+                        and target not in new_targets:
+                    new_targets.append(target)
 
-            # strip off leading and trialing whitespace
-            target_pattern = target_pattern.strip()
+            for target in new_targets:
+                # escape for use in regex pattern
+                target_pattern = re.escape(target)
 
-            # escape for use in regex pattern
-            target_pattern = re.escape(target_pattern)
+                # the spaces we added in now got escaped, so unescape them and turn them into .*
+                target_pattern = re.sub(r'\\ ', r'.*', target_pattern)
 
-            # the spaces we added in now got escaped, so unescape them and turn them into .*
-            target_pattern = re.sub(r'\\ ', r'.*', target_pattern)
+                # compile the pattern for re-use and make sure that .* matches accross lines
+                self.__obfuscation_patterns[target] = re.compile(target_pattern, re.DOTALL)
+
+            # only rebuild the combined patterns if the targets actually changed
+            if new_targets:
+                self.__obfuscation_targets = sorted(
+                    self.__obfuscation_targets + new_targets,
+                    key=len,
+                    reverse=True
+                )
+                self.__build_obfuscation_patterns()
+
+    def __build_obfuscation_patterns(self):
+        """Builds the patterns for finding any of the obfuscation targets.
+
+        Notes
+        -----
+        Targets are sorted longest first so that when one target is a substring of another
+        the longer one is obfuscated first and no part of it is left un-obfuscated.
+
+        Must be called holding __lock.
+        """
+        # the longest literal part of a target has to be present for the target to match
+        self.__obfuscation_anchors = [
+            (max(target.split(' '), key=len), target)
+            for target in self.__obfuscation_targets
+        ]
+
+        # trie of the start of every target, with any gaps collapsed to a single space
+        partial_targets_trie = {}
+        long_partial_target_patterns = []
+        self.__long_partial_targets = []
+        for target in self.__obfuscation_targets:
+            partial_target = re.sub(self.__TARGET_GAP_PATTERN, ' ', target)
+            node = partial_targets_trie
+            for char in partial_target[:self.__PARTIAL_TARGET_LENGTH]:
+                node = node.setdefault(char, {})
+
+            if len(partial_target) > self.__PARTIAL_TARGET_LENGTH:
+                self.__long_partial_targets.append(partial_target)
+                long_partial_target_patterns.append(''.join(
+                    self.__TARGET_GAP_PATTERN if char == ' ' else re.escape(char)
+                    for char in partial_target[:self.__PARTIAL_TARGET_LENGTH]
+                ))
+
+        self.__partial_target_pattern = re.compile(
+            TextIOSelectiveObfuscator.__partial_target_trie_to_pattern(partial_targets_trie)
+            + r'\Z'
+        )
+        self.__long_partial_target_pattern = re.compile(
+            '|'.join(long_partial_target_patterns)
+        ) if long_partial_target_patterns else None
+
+    @staticmethod
+    def __partial_target_trie_to_pattern(trie):
+        """Converts a trie of the start of targets into a pattern matching any part of the start
+        of any of those targets.
+
+        Parameters
+        ----------
+        trie : dict
+            Trie where each key is a character and each value is the trie of the characters
+            that can follow it.
+
+        Returns
+        -------
+        str
+            Pattern matching any non empty part of the start of any target in the given trie.
+        """
+        branches = []
+        for char, child_trie in trie.items():
+            if char == ' ':
+                branch = TextIOSelectiveObfuscator.__TARGET_GAP_PATTERN
+            else:
+                branch = re.escape(char)
 
-            # eat up pre and post newlines
-            # target_pattern = f"(\s*)({target_pattern})(\s*)"
+            if child_trie:
+                child_pattern = TextIOSelectiveObfuscator.__partial_target_trie_to_pattern(
+                    child_trie
+                )
+                branch += f"(?:{child_pattern})?"
 
-            # compile the pattern for re-use and make sure that .* matches accross lines
-            target_compiled_pattern = re.compile(target_pattern, re.DOTALL)
+            branches.append(branch)
 
-            # add the pattern
-            self.__obfuscation_patterns.append(target_compiled_pattern)
+        return f"(?:{'|'.join(branches)})"
 
     def __obfuscator(self, match):
         """Given a regex match returns a corresponding obfuscated string.
@@ -193,9 +706,110 @@ class TextIOSelectiveObfuscator(io.TextIOBase):
 
         return self.replacement_char * replacement_length
 
+    def __obfuscate(self, text, possible_targets):
+        """Obfuscates all of the obfuscation targets in the given text.
+
+        Parameters
+        ----------
+        text : str
+            Text to obfuscate.
+        possible_targets : list of str
+            Obfuscation targets that could be in the given text, longest first.
+
+        Returns
+        -------
+        str
+            Given text with all of the obfuscation targets obfuscated.
+        """
+        for target in possible_targets:
+            text = self.__obfuscation_patterns[target].sub(self.__obfuscator, text)
+
+        return text
+
+    def __get_possible_targets(self, text):
+        """Gets the obfuscation targets that could be in the given text.
+
+        Notes
+        -----
+        Plain substring checks are much faster then searching with a regex, or even with one
+        regex combining all of the targets, so use them to rule out as many targets as possible.
+
+        Parameters
+        ----------
+        text : str
+            Text to get the obfuscation targets that could be in.
+
+        Returns
+        -------
+        list of str
+            Obfuscation targets that could be in the given text, longest first.
+        """
+        return [target for anchor, target in self.__obfuscation_anchors if anchor in text]
+
+    def __get_held_index(self, text, possible_targets):
+        """Gets the index in the given text from which on the text could be the start of an
+        obfuscation target and so needs to be held back until more text is written.
+
+        Parameters
+        ----------
+        text : str
+            Text to find the start of a possible partial obfuscation target at the end of.
+        possible_targets : list of str
+            Obfuscation targets that could be in the given text, longest first.
+
+        Returns
+        -------
+        int
+            Index in the given text to hold back from, or the length of the given text if
+            nothing needs to be held back.
+        """
+        if self.__partial_target_pattern is None:
+            return len(text)
+
+        window_start = max(0, len(text) - self.MAX_HELD_CHARS)
+        held_index = None
+
+        # the earlier a partial target starts the longer it is, so check the long targets first
+        if self.__long_partial_target_pattern is not None:
+            for match in self.__long_partial_target_pattern.finditer(text, window_start):
+                partial_target = re.sub(
+                    self.__TARGET_GAP_PATTERN,
+                    ' ',
+                    text[match.start():]
+                )
+                if any(target.startswith(partial_target) for target in self.__long_partial_targets):
+                    held_index = match.start()
+                    break
+
+        if held_index is None:
+            # only the end of the text that could hold the start of a target needs searching
+            partial_window = TextIOSelectiveObfuscator.__REVERSED_PARTIAL_WINDOW_PATTERN.match(
+                text[window_start:][::-1]
+            )
+            match = self.__partial_target_pattern.search(text, len(text) - partial_window.end())
+            if match is None:
+                return len(text)
+            held_index = match.start()
+
+        # never split a complete match of a target that straddles the held back text
+        for target in possible_targets:
+            for match in self.__obfuscation_patterns[target].finditer(text, window_start):
+                if match.start() >= held_index:
+                    break
+                if match.end() > held_index:
+                    held_index = match.start()
+                    break
+
+        return held_index
+
     def write(self, given):
         """Writes to this streams parent stream after obfuscating all of the obfuscation targets.
 
+        Notes
+        -----
+        Any text at the end of the given text that could be the start of an obfuscation target
+        is held back until the next write or until this stream is closed.
+
         Parameters
         ----------
         given : str
@@ -212,24 +826,55 @@ class TextIOSelectiveObfuscator(io.TextIOBase):
         """
 
         if isinstance(given, bytes):
-            obfuscated = given.decode('utf-8')
-        else:
-            obfuscated = given
+            given = given.decode('utf-8')
+
+        with self.__lock:
+            text = self.__held + given
+            possible_targets = self.__get_possible_targets(text)
+            held_index = self.__get_held_index(text, possible_targets)
+            self.__held = text[held_index:]
 
-        for obfuscation_pattern in self.__obfuscation_patterns:
-            obfuscated = obfuscation_pattern.sub(self.__obfuscator, obfuscated)
+            if held_index:
+                self.parent_stream.write(self.__obfuscate(text[:held_index], possible_targets))
 
-        return self.parent_stream.write(obfuscated)
+        return len(given)
 
     def flush(self):
         """Flush the parent stream.
 
+        Notes
+        -----
+        Does not write any text being held back because it could be the start of an
+        obfuscation target, see close.
+
         See Also
         --------
         io.TextIOBase.flush
         """
         self.parent_stream.flush()
 
+    def close(self):
+        """Writes any held back text to the parent stream, after obfuscating it, and closes
+        this stream.
+
+        Notes
+        -----
+        Does not close the parent stream.
+
+        See Also
+        --------
+        io.TextIOBase.close
+        """
+        with self.__lock:
+            if not self.closed and self.__held \
+                    and not getattr(self.parent_stream, 'closed', False):
+                self.parent_stream.write(
+                    self.__obfuscate(self.__held, self.__get_possible_targets(self.__held))
+                )
+                self.parent_stream.flush()
+            self.__held = ''
+            super().close()
+
 
 class TextIOIndenter(io.TextIOBase):
     """Adds an indent to the first string written and after every new line written to this stream.
@@ -414,8 +1059,11 @@ class TextIOIndenter(io.TextIOBase):
             indented = f"{indent_chars}{indented}"
 
         # add indent after every new line
-        # NOTE: \1 is capture group one and contains the original new line character
-        indented = re.sub(r"(\r\n|\r|\n)", r"\1" + indent_chars, indented)
+        if '\r' not in indented:
+            indented = indented.replace('\n', '\n' + indent_chars)
+        else:
+            # NOTE: \1 is capture group one and contains the original new line character
+            indented = re.sub(r"(\r\n|\r|\n)", r"\1" + indent_chars, indented)
 
         return self.parent_stream.write(indented)
 
@@ -1,22 +1,45 @@
+# pylint: disable=too-many-lines
 """Shared utils for maven operations.
 """
 
 
+import hashlib
 import os
-import re
+import shutil
 import sys
 import xml.etree.ElementTree as ET
-from io import StringIO
 
 import sh
 from ploigos_step_runner.exceptions import StepRunnerException
-from ploigos_step_runner.utils.io import \
-    create_sh_redirect_to_multiple_streams_fn_callback
-from ploigos_step_runner.utils.xml import (get_xml_element_by_path,
-                                           get_xml_element_text_by_path)
-
-
-def generate_maven_settings(working_dir, maven_servers, maven_repositories, maven_mirrors):
+from ploigos_step_runner.utils.file import open_output_file
+from ploigos_step_runner.utils.io import (
+    DEFAULT_OUTPUT_CAPTURE_SIZE, create_sh_redirect_to_multiple_streams_fn_callback)
+from ploigos_step_runner.utils.output_parsers import TailOutputParser
+from ploigos_step_runner.utils.pom import MavenPom, get_local_name
+from ploigos_step_runner.utils.pom_resolver import (MavenPomResolver,
+                                                    UnresolvablePomError)
+
+# maven commands to run, in order of preference, when the maven command is 'auto'
+# SEE: https://github.com/apache/maven-mvnd
+MAVEN_AUTO_COMMANDS = ['mvnd', 'mvn']
+
+# arguments to have maven lock each artifact with a file lock in the local repository while
+# resolving it, so maven processes sharing a local repository never write the same file at once
+# NOTE: requires Maven 3.9 or newer (maven resolver 1.9), older versions ignore these arguments
+# SEE: https://maven.apache.org/resolver/maven-resolver-named-locks/index.html
+MAVEN_LOCAL_REPOSITORY_LOCKING_ARGUMENTS = [
+    '-Daether.syncContext.named.factory=file-lock',
+    '-Daether.syncContext.named.nameMapper=file-gav'
+]
+
+
+def generate_maven_settings(
+    working_dir,
+    maven_servers,
+    maven_repositories,
+    maven_mirrors,
+    local_repository=None
+):
     """
     Generates and returns a settings.xml file from the inputs it is provided.
 
@@ -28,6 +51,9 @@ def generate_maven_settings(working_dir, maven_servers, maven_repositories, mave
         Dictionary of id, url, snapshots, releases
     maven_mirrors:
         Dictionary of id, url, mirror_of
+    local_repository:
+        Path to the maven local repository, such as one shared by all of the steps of a workflow.
+        Maven uses ~/.m2/repository if not given.
 
     Raises
     ------
@@ -41,6 +67,8 @@ def generate_maven_settings(working_dir, maven_servers, maven_repositories, mave
     """
 
     root = ET.Element('settings')
+    if local_repository:
+        ET.SubElement(root, 'localRepository').text = os.path.abspath(local_repository)
     add_maven_servers(root, maven_servers)
     add_maven_repositories(root, maven_repositories)
     add_maven_mirrors(root, maven_mirrors)
@@ -414,10 +442,47 @@ def add_maven_mirror(
     mirror_mirror_of = ET.SubElement(mirror_element, 'mirrorOf')
     mirror_mirror_of.text = maven_mirror_mirror_of
 
+def get_local_repository_locking_arguments(settings_file):
+    """Gets the arguments to have maven lock the artifacts it writes to the local repository,
+    if the given maven settings file configures a local repository, EX: one shared by all of the
+    steps of a workflow, which other maven processes may be writing to at the same time.
+
+    Notes
+    -----
+    Only Maven 3.9 or newer (maven resolver 1.9) locks artifacts with these arguments,
+    older versions ignore them, so they must not share a local repository at the same time.
+
+    Parameters
+    ----------
+    settings_file : str
+        Maven settings file maven is run with.
+
+    Returns
+    -------
+    [str]
+        MAVEN_LOCAL_REPOSITORY_LOCKING_ARGUMENTS if the given settings file configures a local
+        repository, else an empty list.
+    """
+    if not settings_file:
+        return []
+
+    try:
+        settings = ET.parse(settings_file).getroot()
+    except (OSError, ET.ParseError):
+        return []
+
+    local_repository = settings.find('{*}localRepository')
+    if local_repository is None or not (local_repository.text or '').strip():
+        return []
+
+    return MAVEN_LOCAL_REPOSITORY_LOCKING_ARGUMENTS
+
 def write_effective_pom(
     pom_file_path,
     output_path,
-    profiles=None
+    profiles=None,
+    settings_file=None,
+    maven_command='mvn'
 ):
     """Generates the effective pom for a given pom and writes it to a given directory
 
@@ -429,6 +494,12 @@ def write_effective_pom(
         Path to write the effective pom to.
     profiles : list
         Maven profiles to use when generating the effective pom.
+    settings_file : str
+        Maven settings file to use when generating the effective pom.
+        If it configures a local repository maven is told to lock the artifacts it writes to it.
+        See get_local_repository_locking_arguments.
+    maven_command : str
+        Maven command to run. See resolve_maven_command.
 
     See
     ---
@@ -460,12 +531,18 @@ def write_effective_pom(
             profiles = [profiles]
         profiles_arguments = ['-P', f"{','.join(profiles)}"]
 
+    settings_arguments = []
+    if settings_file:
+        settings_arguments = ['-s', settings_file]
+
     try:
-        sh.mvn( # pylint: disable=no-member
+        getattr(sh, resolve_maven_command(maven_command))(
             'help:effective-pom',
             f'-f={pom_file_path}',
             f'-Doutput={output_path}',
-            *profiles_arguments
+            *profiles_arguments,
+            *settings_arguments,
+            *get_local_repository_locking_arguments(settings_file)
         )
     except sh.ErrorReturnCode as error:
         raise StepRunnerException(
@@ -474,38 +551,250 @@ def write_effective_pom(
 
     return output_path
 
+def get_pom_files(pom_file):
+    """Gets the given pom file and every local pom file it is built from or builds,
+    its parent poms found by their relative path and its modules, recursively.
+
+    Notes
+    -----
+    Parent poms that are not on the local file system, such as ones only in a maven repository,
+    are not included.
+
+    Parameters
+    ----------
+    pom_file : str
+        Path to the pom file to get the related pom files for.
+
+    Returns
+    -------
+    [str]
+        Absolute paths to the given pom file and all of its related local pom files,
+        in the order found.
+    """
+    pom_files = []
+    pom_files_to_search = [os.path.abspath(pom_file)]
+    while pom_files_to_search:
+        pom_file_path = pom_files_to_search.pop(0)
+        if pom_file_path in pom_files or not os.path.isfile(pom_file_path):
+            continue
+        pom_files.append(pom_file_path)
+
+        try:
+            pom_root = ET.parse(pom_file_path).getroot()
+        except ET.ParseError:
+            continue
+
+        # SEE: https://maven.apache.org/ref/current/maven-model/maven.html#class_parent
+        related_pom_paths = []
+        parent = pom_root.find('{*}parent')
+        if parent is not None:
+            related_pom_paths.append(
+                parent.findtext('{*}relativePath', default='../pom.xml').strip()
+            )
+        for module in pom_root.iterfind('.//{*}modules/{*}module'):
+            related_pom_paths.append((module.text or '').strip())
+
+        # related poms are given by a path to either the pom or the directory containing it,
+        # relative to the pom referencing it
+        for related_pom_path in filter(None, related_pom_paths):
+            related_pom_path = os.path.normpath(
+                os.path.join(os.path.dirname(pom_file_path), related_pom_path)
+            )
+            if os.path.isdir(related_pom_path):
+                related_pom_path = os.path.join(related_pom_path, 'pom.xml')
+            pom_files_to_search.append(related_pom_path)
+
+    return pom_files
+
+def get_effective_pom_cache_key(pom_file, profiles=None, settings_file=None):
+    """Gets a key for the effective pom of a given pom that changes whenever any input to
+    generating the effective pom changes.
+
+    Parameters
+    ----------
+    pom_file : str
+        Path to pom file to get the effective pom cache key for.
+    profiles : [str]
+        Profile(s) to use when generating the effective pom.
+    settings_file : str
+        Maven settings file to use when generating the effective pom.
+
+    Returns
+    -------
+    str
+        Hash of the contents of the given pom and its parent and module poms,
+        the given profiles, and the contents of the given settings file.
+    """
+    if isinstance(profiles, str):
+        profiles = [profiles]
+
+    cache_key = hashlib.sha256()
+    cache_key.update(f"profiles:{','.join(profiles or [])}\n".encode('utf-8'))
+    for pom_file_path in get_pom_files(pom_file):
+        cache_key.update(f"pom:{pom_file_path}\n".encode('utf-8'))
+        with open(pom_file_path, 'rb') as pom:
+            cache_key.update(pom.read())
+
+    if settings_file:
+        cache_key.update(b"settings:\n")
+        with open(settings_file, 'rb') as settings:
+            cache_key.update(settings.read())
+
+    return cache_key.hexdigest()
+
+def get_effective_pom_dependencies_hash(effective_pom_file):
+    """Gets a hash of the dependencies, plugins, and extensions of a given effective pom,
+    managed or not, from every project in it, which only changes when the set of artifacts maven
+    needs for the project may have changed.
+
+    Parameters
+    ----------
+    effective_pom_file : str
+        Path to the effective pom to get the dependencies hash of.
+
+    Returns
+    -------
+    str
+        sha256 hex digest of the sorted coordinates of the dependencies, plugins, and extensions.
+    """
+    coordinates = set()
+    for element in MavenPom.load(effective_pom_file).root.iter():
+        if get_local_name(element) not in ('dependency', 'plugin', 'extension'):
+            continue
+
+        values = {
+            get_local_name(child): (child.text or '').strip()
+            for child in element
+            if len(child) == 0
+        }
+        coordinates.add(':'.join([
+            get_local_name(element),
+            *[
+                values.get(name, '')
+                for name in ['groupId', 'artifactId', 'version', 'type', 'classifier']
+            ]
+        ]))
+
+    return hashlib.sha256('\n'.join(sorted(coordinates)).encode('utf-8')).hexdigest()
+
 def get_effective_pom(
     work_dir_path,
     pom_file,
-    profiles
-):
+    profiles,
+    settings_file=None,
+    cache_dir_path=None,
+    maven_command='mvn'
+): # pylint: disable=too-many-arguments
     """Writes the effective pom to a file if it does not already exist and returns the path.
 
+    Notes
+    -----
+    If a cache directory is given, such as one shared by all of the steps of a workflow,
+    the effective pom is written there named by get_effective_pom_cache_key, so that it is
+    reused by anything generating the effective pom from the same inputs and generated again
+    only once any of those inputs change.
+
     Parameters
     ----------
     work_dir_path : str
-        Path to write the effective pom to if it does not already exist
+        Path to write the effective pom to if it does not already exist and
+        no cache_dir_path is given.
     pom_file : str
         Path to pom file to create the effective pom for.
     profiles : [str]
         Profile(s) to use when generating the effective pom
+    settings_file : str
+        Maven settings file to use when generating the effective pom.
+    cache_dir_path : str
+        Path to the directory to cache effective poms in by their inputs.
+    maven_command : str
+        Maven command to run to generate the effective pom. See resolve_maven_command.
 
     Returns
     -------
     str
         Path to the written effective pom generated from the 'pom-file' value.
     """
-    effective_pom_path = os.path.join(work_dir_path, 'effective-pom.xml')
+    if cache_dir_path is None:
+        effective_pom_path = os.path.join(work_dir_path, 'effective-pom.xml')
+
+        if not os.path.exists(effective_pom_path):
+            write_effective_pom(
+                pom_file_path=pom_file,
+                output_path=effective_pom_path,
+                profiles=profiles,
+                maven_command=maven_command
+            )
+
+        return effective_pom_path
+
+    cache_key = get_effective_pom_cache_key(
+        pom_file=pom_file,
+        profiles=profiles,
+        settings_file=settings_file
+    )
+    effective_pom_path = os.path.join(
+        os.path.abspath(cache_dir_path),
+        f'effective-pom-{cache_key}.xml'
+    )
 
     if not os.path.exists(effective_pom_path):
-        write_effective_pom(
-            pom_file_path=pom_file,
-            output_path=effective_pom_path,
-            profiles=profiles
-        )
+        os.makedirs(os.path.dirname(effective_pom_path), exist_ok=True)
+
+        # NOTE: write to a process unique path then move into place so a step running at the
+        #       same time never reads a partially written effective pom
+        effective_pom_tmp_path = f"{effective_pom_path}.{os.getpid()}.tmp"
+        try:
+            write_effective_pom(
+                pom_file_path=pom_file,
+                output_path=effective_pom_tmp_path,
+                profiles=profiles,
+                settings_file=settings_file,
+                maven_command=maven_command
+            )
+            os.replace(effective_pom_tmp_path, effective_pom_path)
+        finally:
+            if os.path.exists(effective_pom_tmp_path):
+                os.remove(effective_pom_tmp_path)
 
     return effective_pom_path
 
+def resolve_maven_command(maven_command='mvn'):
+    """Resolves which maven command to run.
+
+    Parameters
+    ----------
+    maven_command : str
+        Maven command to run, EX: 'mvn' or 'mvnd'.
+        'auto' to run the first of MAVEN_AUTO_COMMANDS found on the path, preferring the maven
+        daemon, which keeps warm JVMs alive between runs, so every run after the first skips
+        JVM startup and plugin class loading.
+        None or empty to run 'mvn'.
+
+    Returns
+    -------
+    str
+        The given maven command if found on the path, else 'mvn'.
+    """
+    if not maven_command:
+        return 'mvn'
+
+    if maven_command == 'auto':
+        for auto_maven_command in MAVEN_AUTO_COMMANDS:
+            if shutil.which(auto_maven_command):
+                return auto_maven_command
+
+        return 'mvn'
+
+    if maven_command != 'mvn' and not shutil.which(maven_command):
+        print(
+            f"WARNING: Given maven command ({maven_command}) not found on path,"
+            " falling back to mvn."
+        )
+        return 'mvn'
+
+    return maven_command
+
 def run_maven( #pylint: disable=too-many-arguments, too-many-locals
     mvn_output_file_path,
     settings_file,
@@ -514,10 +803,20 @@ def run_maven( #pylint: disable=too-many-arguments, too-many-locals
     tls_verify=True,
     additional_arguments=None,
     profiles=None,
-    no_transfer_progress=True
+    no_transfer_progress=True,
+    output_capture_size=DEFAULT_OUTPUT_CAPTURE_SIZE,
+    output_line_consumer=None,
+    maven_command='mvn',
+    threads=None
 ):
     """Runs maven using the given configuration.
 
+    Notes
+    -----
+    The full maven output is only written to stdout/stderr and the given output file, only the
+    end of the standard out, up to output_capture_size characters, is kept in memory.
+    ANSI escape sequences are stripped from the standard out line by line as maven writes it.
+
     Parameters
     ----------
     mvn_output_file_path : str
@@ -538,11 +837,24 @@ def run_maven( #pylint: disable=too-many-arguments, too-many-locals
         See https://maven.apache.org/ref/current/maven-embedder/cli.html
     settings_file : str (path)
         Maven settings file to use.
+        If it configures a local repository maven is told to lock the artifacts it writes to it.
+        See get_local_repository_locking_arguments.
+    output_capture_size : int
+        Maximum number of characters from the end of the maven standard out to return.
+    output_line_consumer : function(str)
+        Function to call with every line of maven standard out, without ANSI escape sequences,
+        as it is written, for callers that need to parse more of the output then is returned.
+    maven_command : str
+        Maven command to run. See resolve_maven_command.
+    threads : int or str
+        Number of threads to build modules with in parallel, EX: 4 or '1C' for one per CPU core.
+        See https://cwiki.apache.org/confluence/display/MAVEN/Parallel+builds+in+Maven+3
+        If not given maven builds modules one at a time, or for the maven daemon, its default.
 
     Returns
     -------
     str
-        Standard Out from running Maven.
+        End of the Standard Out from running Maven.
 
     Raises
     ------
@@ -572,44 +884,59 @@ def run_maven( #pylint: disable=too-many-arguments, too-many-locals
             '-Dmaven.wagon.http.ssl.ignore.validity.dates=true',
         ]
 
+    # create threads argument
+    threads_arguments = []
+    if threads:
+        threads_arguments = ['-T', str(threads)]
+
+    # create local repository locking arguments
+    local_repository_locking_arguments = get_local_repository_locking_arguments(settings_file)
+
     if not additional_arguments:
         additional_arguments = []
 
     # run maven
-    maven_output_buff = StringIO()
+    maven_output_parser = TailOutputParser(
+        max_size=output_capture_size,
+        line_consumer=output_line_consumer
+    )
     try:
-        with open(mvn_output_file_path, 'w', encoding='utf-8') as mvn_output_file:
+        with open_output_file(mvn_output_file_path, 'w') as mvn_output_file:
             out_callback = create_sh_redirect_to_multiple_streams_fn_callback([
                 sys.stdout,
                 mvn_output_file,
-                maven_output_buff
+                maven_output_parser
             ])
             err_callback = create_sh_redirect_to_multiple_streams_fn_callback([
                 sys.stderr,
                 mvn_output_file
             ])
 
-            sh.mvn( # pylint: disable=no-member
-                *phases_and_goals,
-                '-f', pom_file,
-                '-s', settings_file,
-                *profiles_arguments,
-                no_transfer_progress_argument,
-                *tls_arguments,
-                *additional_arguments,
-                _out=out_callback,
-                _err=err_callback
-            )
+            try:
+                getattr(sh, resolve_maven_command(maven_command))(
+                    *phases_and_goals,
+                    '-f', pom_file,
+                    '-s', settings_file,
+                    *profiles_arguments,
+                    no_transfer_progress_argument,
+                    *threads_arguments,
+                    *tls_arguments,
+                    *local_repository_locking_arguments,
+                    *additional_arguments,
+                    _out=out_callback,
+                    _err=err_callback
+                )
+            finally:
+                out_callback.finish()
+                err_callback.finish()
     except sh.ErrorReturnCode as error:
         raise StepRunnerException(
             f"Error running maven. {error}"
         ) from error
+    finally:
+        maven_output_parser.close()
 
-    # remove ansi escape charaters from output before returning
-    maven_output = maven_output_buff.getvalue().rstrip()
-    maven_output_stripped_ansi = re.compile(r'\x1b[^m]*m').sub('', maven_output)
-
-    return maven_output_stripped_ansi
+    return maven_output_parser.getvalue().rstrip()
 
 def get_maven_plugin_xml_element_path(plugin_name):
     """Create XML element path for a given maven plugin.
@@ -633,12 +960,17 @@ def get_plugin_configuration_values(
     pom_file,
     profiles=None,
     phases_and_goals=None,
-    require_phase_execution_config=False
+    require_phase_execution_config=False,
+    settings_file=None,
+    effective_pom_cache_dir_path=None,
+    local_repository_path=None,
+    maven_command='mvn'
 ): # pylint: disable=too-many-arguments
     """Gets the value(s) of a given configuration key for a given maven plugin.
 
-    Will create an effective pom out of the given pom so as to be able to inherit configuration
-    from parent poms.
+    Will resolve the given pom in process, or if it can not, create an effective pom out of the
+    given pom, so as to be able to inherit configuration from parent poms.
+    See MavenPomResolver.
 
     Will search:
     * executions for given phase, return all matches
@@ -662,6 +994,17 @@ def get_plugin_configuration_values(
     require_phase_execution_config : bool
         True if the found configuration must be in a plugin execution matching one of the given
         phases. False if the found configuration can be a default configuration.
+    settings_file : str
+        Maven settings file to use when creating the effective pom to search.
+    effective_pom_cache_dir_path : str
+        Path to the directory to cache effective poms in by their inputs.
+        See get_effective_pom.
+    local_repository_path : str
+        Path to the maven local repository to find parent poms in when resolving the given pom
+        in process. See MavenPomResolver.
+    maven_command : str
+        Maven command to run if the effective pom has to be generated.
+        See resolve_maven_command.
 
     Raises
     ------
@@ -671,123 +1014,52 @@ def get_plugin_configuration_values(
     Returns
     -------
     [str]
-        List of configuration values found, or empty list if none found.
+        List of configuration values found, stripped and with the properties defined in the
+        effective pom resolved, or empty list if none found.
     """
+    # resolve the pom in process when it can be rather than starting maven to generate the
+    # effective pom, falling back to the effective pom if the plugin is not declared in the pom,
+    # since it could be bound by the packaging, or its configuration references properties only
+    # maven can resolve
+    try:
+        plugin = MavenPomResolver(local_repository_path).resolve(
+            pom_file,
+            profiles
+        ).get_plugin(plugin_name)
+        if plugin is not None:
+            configuration_values = plugin.get_configuration_values(
+                configuration_key=configuration_key,
+                phases_and_goals=phases_and_goals,
+                require_phase_execution_config=require_phase_execution_config
+            )
+            if not any('${' in value for value in configuration_values):
+                return configuration_values
+    except UnresolvablePomError:
+        pass
+
     # get effective pom
     effective_pom_file = get_effective_pom(
         work_dir_path=work_dir_path,
         pom_file=pom_file,
-        profiles=profiles
+        profiles=profiles,
+        settings_file=settings_file,
+        cache_dir_path=effective_pom_cache_dir_path,
+        maven_command=maven_command
     )
 
     # ensure plugin enabled
-    plugin_xml_element_path = get_maven_plugin_xml_element_path(plugin_name)
-    plugin = get_xml_element_by_path(
-        effective_pom_file,
-        xpath=plugin_xml_element_path,
-        default_namespace='mvn'
-    )
+    plugin = MavenPom.load(effective_pom_file).get_plugin(plugin_name)
     if plugin is None:
         raise RuntimeError(
             f"Expected maven plugin ({plugin_name}) not found in "
             f" effective pom for given pom ({pom_file})."
         )
 
-    # look for phase and/or goal specific plugin configuration
-    configuration_values = []
-    if phases_and_goals:
-        for phase_or_goal in phases_and_goals:
-            # look for phase specific plugin configuration
-            # EX:
-            #   <plugin>
-            #     <groupId>org.apache.maven.plugins</groupId>
-            #     <artifactId>maven-surefire-plugin</artifactId>
-            #     <version>${surefire-plugin.version}</version>
-            #     <configuration>
-            #       <reportsDirectory>
-            #         ${project.build.directory}/surefire-reports-unit-test
-            #       </reportsDirectory>
-            #     </configuration>
-            #     <executions>
-            #       <execution>
-            #         <id>integration-tests</id>
-            #         <phase>integration-test</phase> <!--NOTE: Matches on this-->
-            #         <goals>
-            #           <goal>test</goal>
-            #         </goals>
-            #         <configuration>
-            #           <skipTests>${skipITs}</skipTests>
-            #           <reportsDirectory>
-            #             ${project.build.directory}/surefire-reports-uat <!--NOTE: selects this-->
-            #           </reportsDirectory>
-            #           <systemProperties>
-            #             <java.util.logging.manager>
-            #               org.jboss.logmanager.LogManager
-            #             </java.util.logging.manager>
-            #           </systemProperties>
-            #           <includes>
-            #             <include>**/*IT.*</include>
-            #           </includes>
-            #         </configuration>
-            #       </execution>
-            #     </executions>
-            #   </plugin>
-            phase_config = get_xml_element_text_by_path(
-                effective_pom_file,
-                xpath=f'{plugin_xml_element_path}/mvn:executions/' \
-                    f'mvn:execution[mvn:phase="{phase_or_goal}"]/' \
-                    f'mvn:configuration/mvn:{configuration_key}',
-                default_namespace='mvn',
-                find_all=True
-            )
-            if isinstance(phase_config, list):
-                configuration_values += phase_config
-
-            # look for goals specific plugin configuration
-            # EX:
-            #   <plugin>
-            #     <groupId>org.apache.maven.plugins</groupId>
-            #     <artifactId>maven-failsafe-plugin</artifactId>
-            #     <version>2.22.2</version>
-            #     <executions>
-            #       <execution>
-            #         <goals>
-            #           <goal>integration-test</goal> <!--NOTE: Matches on this-->
-            #           <goal>verify</goal>
-            #         </goals>
-            #         <configuration>
-            #           <reportsDirectory> <!--NOTE: selects this-->
-            #             ${project.build.directory}/failsafe-reports-execution
-            #           </reportsDirectory>
-            #         </configuration>
-            #       </execution>
-            #     </executions>
-            #   </plugin>
-            goal_config = get_xml_element_text_by_path(
-                effective_pom_file,
-                xpath=f'{plugin_xml_element_path}/mvn:executions/mvn:execution/' \
-                    f'*[mvn:goal="{phase_or_goal}"]/../mvn:configuration/mvn:{configuration_key}',
-                default_namespace='mvn',
-                find_all=True
-            )
-            if isinstance(goal_config, list):
-                configuration_values += goal_config
-
-    # if didn't find any phase specific configuration, look for default configuration
-    if not require_phase_execution_config and not configuration_values:
-        default_config = get_xml_element_text_by_path(
-            effective_pom_file,
-            xpath=f'{plugin_xml_element_path}/mvn:configuration/mvn:{configuration_key}',
-            default_namespace='mvn',
-            find_all=True
-        )
-        if isinstance(default_config, list):
-            configuration_values += default_config
-
-    # de dup results and return
-    configuration_values = list(set(configuration_values))
-    configuration_values.sort()
-    return configuration_values
+    return plugin.get_configuration_values(
+        configuration_key=configuration_key,
+        phases_and_goals=phases_and_goals,
+        require_phase_execution_config=require_phase_execution_config
+    )
 
 def get_plugin_configuration_absolute_path_values(
     plugin_name,
@@ -796,7 +1068,11 @@ def get_plugin_configuration_absolute_path_values(
     pom_file,
     profiles=None,
     phases_and_goals=None,
-    require_phase_execution_config=False
+    require_phase_execution_config=False,
+    settings_file=None,
+    effective_pom_cache_dir_path=None,
+    local_repository_path=None,
+    maven_command='mvn'
 ): # pylint: disable=too-many-arguments
     """Gets the value(s) of a given configuration key for a given maven plugin and converts
     them to absolute paths (if they arn't already), if they were relative paths, assumes,
@@ -827,6 +1103,17 @@ def get_plugin_configuration_absolute_path_values(
     require_phase_execution_config : bool
         True if the found configuration must be in a plugin execution matching one of the given
         phases. False if the found configuration can be a default configuration.
+    settings_file : str
+        Maven settings file to use when creating the effective pom to search.
+    effective_pom_cache_dir_path : str
+        Path to the directory to cache effective poms in by their inputs.
+        See get_effective_pom.
+    local_repository_path : str
+        Path to the maven local repository to find parent poms in when resolving the given pom
+        in process. See MavenPomResolver.
+    maven_command : str
+        Maven command to run if the effective pom has to be generated.
+        See resolve_maven_command.
 
     Raises
     ------
@@ -848,7 +1135,11 @@ def get_plugin_configuration_absolute_path_values(
         pom_file=pom_file,
         profiles=profiles,
         phases_and_goals=phases_and_goals,
-        require_phase_execution_config=require_phase_execution_config
+        require_phase_execution_config=require_phase_execution_config,
+        settings_file=settings_file,
+        effective_pom_cache_dir_path=effective_pom_cache_dir_path,
+        local_repository_path=local_repository_path,
+        maven_command=maven_command
     )
 
     # transform that configuration into absolute paths for consistency
@@ -0,0 +1,298 @@
+"""Shared utilities for parsing the output of tools one line at a time as the tool writes it,
+so that parsing overlaps with the tool running rather then being done over all of the output
+once the tool is done.
+
+Parsers are text streams so they can be given to
+create_sh_redirect_to_multiple_streams_fn_callback along with any other streams the output of
+a tool is written to.
+"""
+
+import io
+import re
+from abc import ABCMeta, abstractmethod
+from collections import deque
+
+# ANSI control sequences, such as the ones for colors
+ANSI_ESCAPE_PATTERN = re.compile(r'\x1b\[[0-?]*[ -/]*[@-~]')
+
+
+class OutputParser(io.TextIOBase, metaclass=ABCMeta):
+    """Abstract base class for parsing the output of a tool one line at a time as it is written.
+
+    Parameters
+    ----------
+    strip_ansi_escapes : bool, optional
+        True to remove ANSI escape sequences from each line before it is parsed.
+    strip_carriage_returns : bool, optional
+        True to remove all carriage returns from each line before it is parsed.
+    line_consumer : function(str), optional
+        Function to also call with each line, after any stripping, as it is parsed.
+
+    Attributes
+    ----------
+    __strip_ansi_escapes : bool
+    __strip_carriage_returns : bool
+    __line_consumer : function(str)
+    __partial_line : str
+    """
+
+    def __new__(cls, *args, **kwargs): # pylint: disable=unused-argument
+        # NOTE: io base classes are created without the abstract method check object does
+        if cls.__abstractmethods__:
+            raise TypeError(
+                f"Can't instantiate abstract class {cls.__name__} with abstract methods" +
+                f" {', '.join(sorted(cls.__abstractmethods__))}"
+            )
+
+        return super().__new__(cls)
+
+    def __init__(self, strip_ansi_escapes=True, strip_carriage_returns=True, line_consumer=None):
+        self.__strip_ansi_escapes = strip_ansi_escapes
+        self.__strip_carriage_returns = strip_carriage_returns
+        self.__line_consumer = line_consumer
+        self.__partial_line = ''
+        super().__init__()
+
+    def write(self, given):
+        """Parses every line ended by the given text.
+
+        Parameters
+        ----------
+        given : str or bytes (utf-8)
+            Text to parse.
+
+        Returns
+        -------
+        int
+            Number of characters written.
+
+        See Also
+        --------
+        io.TextIOBase.write
+        """
+        if isinstance(given, bytes):
+            given = given.decode('utf-8')
+
+        lines = (self.__partial_line + given).split('\n')
+        self.__partial_line = lines.pop()
+        for line in lines:
+            self.__parse_line(line)
+
+        return len(given)
+
+    def close(self):
+        """Parses any final line without a line ending and closes this stream.
+
+        Notes
+        -----
+        Results of the parsing can still be gotten after this stream is closed.
+
+        See Also
+        --------
+        io.TextIOBase.close
+        """
+        if not self.closed:
+            if self.__partial_line:
+                self.__parse_line(self.__partial_line)
+            self.__partial_line = ''
+            self._finish()
+        super().close()
+
+    def __parse_line(self, line):
+        """Strips the given line as configured and parses it.
+
+        Parameters
+        ----------
+        line : str
+            Line, without its line ending, to parse.
+        """
+        if self.__strip_carriage_returns:
+            line = line.replace('\r', '')
+        else:
+            line = line.rstrip('\r')
+
+        # NOTE: escape sequences never span lines so stripping line by line is safe
+        if self.__strip_ansi_escapes and '\x1b' in line:
+            line = ANSI_ESCAPE_PATTERN.sub('', line)
+
+        self._parse_line(line)
+
+        if self.__line_consumer is not None:
+            self.__line_consumer(line)
+
+    @abstractmethod
+    def _parse_line(self, line):
+        """Parses one line of output.
+
+        Parameters
+        ----------
+        line : str
+            Line, without its line ending, to parse.
+        """
+
+    def _finish(self):
+        """Called once all of the output has been parsed.
+        """
+
+
+class TailOutputParser(OutputParser):
+    """Keeps the end of the output, after any stripping, up to a maximum size.
+
+    Parameters
+    ----------
+    max_size : int, optional
+        Maximum number of characters to keep.
+    **kwargs
+        See OutputParser.
+
+    Attributes
+    ----------
+    __max_size : int
+    __lines : deque of str
+    __size : int
+    """
+
+    def __init__(self, max_size=64 * 1024, **kwargs):
+        self.__max_size = max_size
+        self.__lines = deque()
+        self.__size = 0
+        super().__init__(**kwargs)
+
+    def _parse_line(self, line):
+        self.__lines.append(line)
+        self.__size += len(line) + 1
+        while len(self.__lines) > 1 and self.__size - len(self.__lines[0]) - 1 >= self.__max_size:
+            self.__size -= len(self.__lines.popleft()) + 1
+
+    def getvalue(self):
+        """Gets the end of the output.
+
+        Returns
+        -------
+        str
+            End of the output, up to max_size characters, with one new line after each line.
+        """
+        value = ''.join(f"{line}\n" for line in self.__lines)
+        return value[-self.__max_size:]
+
+
+class LineRegexOutputParser(OutputParser):
+    """Collects the named groups of every line matching a given pattern.
+
+    Parameters
+    ----------
+    pattern : re.Pattern
+        Pattern to search each line with.
+    **kwargs
+        See OutputParser.
+
+    Attributes
+    ----------
+    __pattern : re.Pattern
+    __results : list of dict
+    """
+
+    def __init__(self, pattern, **kwargs):
+        self.__pattern = pattern
+        self.__results = []
+        super().__init__(**kwargs)
+
+    @property
+    def results(self):
+        """
+        Returns
+        -------
+        list of dict
+            Named groups of each match, in the order the matching lines were written.
+        """
+        return self.__results
+
+    def _parse_line(self, line):
+        match = self.__pattern.search(line)
+        if match:
+            self.__results.append(match.groupdict())
+
+
+class BlockRegexOutputParser(OutputParser):
+    """Collects the named groups of every block of lines matching a given pattern.
+
+    A block starts at a line matching block_start_pattern and is matched against the given
+    pattern every time a line matching block_end_pattern is added to it, so only the block
+    currently being written is ever kept in memory.
+
+    Parameters
+    ----------
+    pattern : re.Pattern
+        Pattern to search each block with.
+        Each line in a block, including the last, is followed by a new line.
+    block_start_pattern : re.Pattern
+        Pattern matching the line a block starts at.
+    block_end_pattern : re.Pattern
+        Pattern matching any line that could end a block.
+    max_block_size : int, optional
+        Maximum number of characters to keep for a block that has not yet matched.
+        Blocks that grow larger are dropped.
+    **kwargs
+        See OutputParser.
+
+    Attributes
+    ----------
+    __pattern : re.Pattern
+    __block_start_pattern : re.Pattern
+    __block_end_pattern : re.Pattern
+    __max_block_size : int
+    __block : str
+    __results : list of dict
+    """
+
+    def __init__( # pylint: disable=too-many-arguments
+        self,
+        pattern,
+        block_start_pattern,
+        block_end_pattern,
+        max_block_size=1024 * 1024,
+        **kwargs
+    ):
+        self.__pattern = pattern
+        self.__block_start_pattern = block_start_pattern
+        self.__block_end_pattern = block_end_pattern
+        self.__max_block_size = max_block_size
+        self.__block = None
+        self.__results = []
+        super().__init__(**kwargs)
+
+    @property
+    def results(self):
+        """
+        Returns
+        -------
+        list of dict
+            Named groups of each match, in the order the matching blocks were written.
+        """
+        return self.__results
+
+    def _parse_line(self, line):
+        if self.__block is None:
+            block_start = self.__block_start_pattern.search(line)
+            if block_start is None:
+                return
+            line = line[block_start.start():]
+            self.__block = ''
+
+        self.__block += f"{line}\n"
+
+        if self.__block_end_pattern.search(line):
+            match = self.__pattern.search(self.__block)
+            while match:
+                self.__results.append(match.groupdict())
+                self.__block = self.__block[match.end():]
+                match = self.__pattern.search(self.__block)
+
+            block_start = self.__block_start_pattern.search(self.__block)
+            if block_start is None:
+                self.__block = None
+            else:
+                self.__block = self.__block[block_start.start():]
+
+        if self.__block is not None and len(self.__block) > self.__max_block_size:
+            self.__block = None
@@ -10,7 +10,8 @@ import sys
 from io import StringIO
 import sh
 
-from ploigos_step_runner.utils.io import create_sh_redirect_to_multiple_streams_fn_callback
+from ploigos_step_runner.utils.io import (
+    TextIORingBuffer, create_sh_redirect_to_multiple_streams_fn_callback)
 
 def detach_sign_with_pgp_key(file_to_sign_path, pgp_private_key_fingerprint, output_signature_path):
     """Does a detached sign of a given file using a given users private key.
@@ -78,29 +79,33 @@ def import_pgp_key(pgp_private_key):
 
         # NOTE: GPG is weird in that it sends "none error" output to stderr even on success...
         #       so merge the stderr into stdout
-        gpg_import_stdout_result = StringIO()
-        gpg_import_stdout_callback = create_sh_redirect_to_multiple_streams_fn_callback([
-            sys.stdout,
-            gpg_import_stdout_result
-        ])
-        sh.gpg( # pylint: disable=no-member
-            '--import',
-            '--fingerprint',
-            '--with-colons',
-            '--import-options=import-show',
-            _in=pgp_private_key,
-            _out=gpg_import_stdout_callback,
-            _err_to_out=True,
-            _tee='out'
-        )
+        #
+        # NOTE: only the fingerprints are kept from the output as it is written
+        gpg_imported_pgp_private_key_fingerprints = []
+        def collect_fingerprints(line):
+            gpg_imported_pgp_private_key_fingerprints.extend(gpg_regex.findall(line))
+
+        with TextIORingBuffer(line_consumer=collect_fingerprints) as gpg_import_stdout_result:
+            gpg_import_stdout_callback = create_sh_redirect_to_multiple_streams_fn_callback([
+                sys.stdout,
+                gpg_import_stdout_result
+            ])
+            try:
+                sh.gpg( # pylint: disable=no-member
+                    '--import',
+                    '--fingerprint',
+                    '--with-colons',
+                    '--import-options=import-show',
+                    _in=pgp_private_key,
+                    _out=gpg_import_stdout_callback,
+                    _err_to_out=True
+                )
+            finally:
+                gpg_import_stdout_callback.finish()
 
         # get the fingerprint of the imported key
         #
         # NOTE: if more then one match just using first one...
-        gpg_imported_pgp_private_key_fingerprints = re.findall(
-            gpg_regex,
-            gpg_import_stdout_result.getvalue()
-        )
         if len(gpg_imported_pgp_private_key_fingerprints) < 1:
             raise RuntimeError(
                 "Error getting PGP fingerprint for PGP key"
@@ -0,0 +1,619 @@
+"""In memory model of a Maven POM, parsed once and indexed for the plugin, execution, and
+configuration lookups the maven utilities make against effective poms.
+"""
+
+import functools
+import os
+import re
+from xml.etree import ElementTree
+
+# SEE: https://maven.apache.org/pom.html#Properties
+POM_PROPERTY_PATTERN = re.compile(r'\$\{(?P<name>[^}]+)\}')
+
+# maximum depth of properties referencing other properties to resolve
+POM_PROPERTY_MAX_RESOLVE_DEPTH = 10
+
+# number of parsed poms to keep for the life of the process
+POM_CACHE_SIZE = 16
+
+
+def get_local_name(element):
+    """Gets the tag of a given XML element without its namespace.
+
+    Parameters
+    ----------
+    element : xml.etree.ElementTree.Element
+        Element to get the local name of.
+
+    Returns
+    -------
+    str
+        Tag of the element without its namespace.
+    """
+    return element.tag.rsplit('}', 1)[-1]
+
+
+def resolve_property_references(value, properties):
+    """Replaces the ${property} references in a given value with the values of given properties.
+
+    Parameters
+    ----------
+    value : str
+        Value to resolve the property references in.
+    properties : dict
+        Properties to resolve the references with.
+
+    Returns
+    -------
+    str
+        Given value with the references to given properties replaced, following references in
+        the property values up to POM_PROPERTY_MAX_RESOLVE_DEPTH deep.
+        References to properties not given are left as is.
+    """
+    for _ in range(POM_PROPERTY_MAX_RESOLVE_DEPTH):
+        if '${' not in value:
+            break
+
+        resolved_value = POM_PROPERTY_PATTERN.sub(
+            lambda match: properties.get(match.group('name'), match.group(0)),
+            value
+        )
+        if resolved_value == value:
+            break
+        value = resolved_value
+
+    return value
+
+
+class MavenPomPluginExecution:
+    """A plugin execution from a Maven POM.
+
+    Parameters
+    ----------
+    execution_id : str
+        Id of the execution.
+    phase : str
+        Phase the execution is bound to, or None.
+    goals : [str]
+        Goals of the execution.
+    configuration : dict
+        Flattened configuration of the execution.
+        See MavenPom.flatten_configuration.
+    """
+
+    def __init__(self, execution_id, phase, goals, configuration):
+        self.__execution_id = execution_id
+        self.__phase = phase
+        self.__goals = goals
+        self.__configuration = configuration
+
+    @property
+    def execution_id(self):
+        """
+        Returns
+        -------
+        str
+            Id of the execution.
+        """
+        return self.__execution_id
+
+    @property
+    def phase(self):
+        """
+        Returns
+        -------
+        str
+            Phase the execution is bound to, or None.
+        """
+        return self.__phase
+
+    @property
+    def goals(self):
+        """
+        Returns
+        -------
+        [str]
+            Goals of the execution.
+        """
+        return self.__goals
+
+    @property
+    def configuration(self):
+        """
+        Returns
+        -------
+        dict
+            Flattened configuration of the execution.
+            See MavenPom.flatten_configuration.
+        """
+        return self.__configuration
+
+
+class MavenPomPlugin:
+    """A build plugin from a Maven POM with its executions indexed by phase and goal.
+
+    Parameters
+    ----------
+    group_id : str
+        Group id of the plugin.
+    artifact_id : str
+        Artifact id of the plugin.
+    version : str
+        Version of the plugin.
+    configuration : dict
+        Flattened default configuration of the plugin.
+        See MavenPom.flatten_configuration.
+    executions : [MavenPomPluginExecution]
+        Executions of the plugin.
+    """
+
+    def __init__( # pylint: disable=too-many-arguments
+        self,
+        group_id,
+        artifact_id,
+        version,
+        configuration,
+        executions
+    ):
+        self.__group_id = group_id
+        self.__artifact_id = artifact_id
+        self.__version = version
+        self.__configuration = configuration
+        self.__executions = executions
+
+        self.__executions_by_phase = {}
+        self.__executions_by_goal = {}
+        for execution in executions:
+            if execution.phase:
+                self.__executions_by_phase.setdefault(execution.phase, []).append(execution)
+            for goal in execution.goals:
+                self.__executions_by_goal.setdefault(goal, []).append(execution)
+
+    @property
+    def group_id(self):
+        """
+        Returns
+        -------
+        str
+            Group id of the plugin.
+        """
+        return self.__group_id
+
+    @property
+    def artifact_id(self):
+        """
+        Returns
+        -------
+        str
+            Artifact id of the plugin.
+        """
+        return self.__artifact_id
+
+    @property
+    def version(self):
+        """
+        Returns
+        -------
+        str
+            Version of the plugin.
+        """
+        return self.__version
+
+    @property
+    def configuration(self):
+        """
+        Returns
+        -------
+        dict
+            Flattened default configuration of the plugin.
+            See MavenPom.flatten_configuration.
+        """
+        return self.__configuration
+
+    @property
+    def executions(self):
+        """
+        Returns
+        -------
+        [MavenPomPluginExecution]
+            Executions of the plugin.
+        """
+        return self.__executions
+
+    def get_executions_by_phase(self, phase):
+        """Gets the executions of this plugin bound to a given phase.
+
+        Parameters
+        ----------
+        phase : str
+            Phase to get the executions for.
+
+        Returns
+        -------
+        [MavenPomPluginExecution]
+            Executions bound to the given phase, or empty list if none.
+        """
+        return self.__executions_by_phase.get(phase, [])
+
+    def get_executions_by_goal(self, goal):
+        """Gets the executions of this plugin that run a given goal.
+
+        Parameters
+        ----------
+        goal : str
+            Goal to get the executions for.
+
+        Returns
+        -------
+        [MavenPomPluginExecution]
+            Executions running the given goal, or empty list if none.
+        """
+        return self.__executions_by_goal.get(goal, [])
+
+    def get_configuration_values(
+        self,
+        configuration_key,
+        phases_and_goals=None,
+        require_phase_execution_config=False
+    ):
+        """Gets the value(s) of a given configuration key of this plugin.
+
+        Will search:
+        * executions for given phases and goals, return all matches
+        * if no matching executions will search plugin non execution specific configuration
+
+        Parameters
+        ----------
+        configuration_key : str
+            Configuration key to get the value(s) for.
+        phases_and_goals : [str]
+            List of phases and goals to search for specific plugin executions for for the
+            configuration value(s).
+        require_phase_execution_config : bool
+            True if the found configuration must be in a plugin execution matching one of the
+            given phases. False if the found configuration can be a default configuration.
+
+        Returns
+        -------
+        [str]
+            Sorted list of the unique configuration values found, or empty list if none found.
+        """
+        # look for phase and/or goal specific plugin configuration
+        configuration_values = []
+        if phases_and_goals:
+            for phase_or_goal in phases_and_goals:
+                # look for phase specific plugin configuration
+                # EX:
+                #   <plugin>
+                #     <groupId>org.apache.maven.plugins</groupId>
+                #     <artifactId>maven-surefire-plugin</artifactId>
+                #     <version>${surefire-plugin.version}</version>
+                #     <configuration>
+                #       <reportsDirectory>
+                #         ${project.build.directory}/surefire-reports-unit-test
+                #       </reportsDirectory>
+                #     </configuration>
+                #     <executions>
+                #       <execution>
+                #         <id>integration-tests</id>
+                #         <phase>integration-test</phase> <!--NOTE: Matches on this-->
+                #         <goals>
+                #           <goal>test</goal>
+                #         </goals>
+                #         <configuration>
+                #           <skipTests>${skipITs}</skipTests>
+                #           <reportsDirectory> <!--NOTE: selects this-->
+                #             ${project.build.directory}/surefire-reports-uat
+                #           </reportsDirectory>
+                #           <systemProperties>
+                #             <java.util.logging.manager>
+                #               org.jboss.logmanager.LogManager
+                #             </java.util.logging.manager>
+                #           </systemProperties>
+                #           <includes>
+                #             <include>**/*IT.*</include>
+                #           </includes>
+                #         </configuration>
+                #       </execution>
+                #     </executions>
+                #   </plugin>
+                for execution in self.get_executions_by_phase(phase_or_goal):
+                    configuration_values += execution.configuration.get(configuration_key, [])
+
+                # look for goals specific plugin configuration
+                # EX:
+                #   <plugin>
+                #     <groupId>org.apache.maven.plugins</groupId>
+                #     <artifactId>maven-failsafe-plugin</artifactId>
+                #     <version>2.22.2</version>
+                #     <executions>
+                #       <execution>
+                #         <goals>
+                #           <goal>integration-test</goal> <!--NOTE: Matches on this-->
+                #           <goal>verify</goal>
+                #         </goals>
+                #         <configuration>
+                #           <reportsDirectory> <!--NOTE: selects this-->
+                #             ${project.build.directory}/failsafe-reports-execution
+                #           </reportsDirectory>
+                #         </configuration>
+                #       </execution>
+                #     </executions>
+                #   </plugin>
+                for execution in self.get_executions_by_goal(phase_or_goal):
+                    configuration_values += execution.configuration.get(configuration_key, [])
+
+        # if didn't find any phase specific configuration, look for default configuration
+        if not require_phase_execution_config and not configuration_values:
+            configuration_values += self.__configuration.get(configuration_key, [])
+
+        # de dup results and return
+        configuration_values = list(set(configuration_values))
+        configuration_values.sort()
+        return configuration_values
+
+
+class MavenPom:
+    """In memory model of a Maven POM.
+
+    Build plugins are indexed by artifact id, their executions by phase and goal, and all
+    configuration is flattened with the properties defined in the pom resolved.
+
+    Use MavenPom.load to get the model for a pom file, which is only parsed again once the
+    file changes.
+
+    Parameters
+    ----------
+    pom_root : xml.etree.ElementTree.Element
+        Root (project) element of the pom.
+    base_properties : dict, optional
+        Properties known outside of the pom, such as project.basedir, which properties defined
+        in the pom take precedence over.
+    """
+
+    def __init__(self, pom_root, base_properties=None):
+        self.__root = pom_root
+        self.__base_properties = base_properties or {}
+
+        namespace_match = re.match(r'\{(.*?)\}', pom_root.tag)
+        self.__namespace = namespace_match.group(1) if namespace_match else ''
+
+        self.__properties = self.__get_properties()
+
+        self.__plugins = {}
+        for plugin in self.__findall('./mvn:build/mvn:plugins/mvn:plugin'):
+            artifact_id = self.__get_child_text(plugin, 'artifactId')
+            if artifact_id not in self.__plugins:
+                self.__plugins[artifact_id] = self.__create_plugin(plugin)
+
+    @staticmethod
+    def load(pom_file_path):
+        """Gets the model of a given pom file.
+
+        Notes
+        -----
+        Models are cached for the life of the process by path, modification time, and size,
+        so a pom is only parsed once no matter how many times it is queried.
+
+        Parameters
+        ----------
+        pom_file_path : str
+            Path to the pom file to get the model of.
+
+        Returns
+        -------
+        MavenPom
+            Model of the given pom file.
+
+        Raises
+        ------
+        ValueError
+            If the given pom file does not exist.
+        """
+        if not os.path.exists(pom_file_path):
+            raise ValueError(f'Given xml file does not exist: {pom_file_path}')
+
+        pom_file_stat = os.stat(pom_file_path)
+        return MavenPom.__load_cached(
+            os.path.abspath(pom_file_path),
+            pom_file_stat.st_mtime_ns,
+            pom_file_stat.st_size
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=POM_CACHE_SIZE)
+    def __load_cached(pom_file_path, _mtime_ns, _size):
+        return MavenPom(ElementTree.parse(pom_file_path).getroot())
+
+    @property
+    def root(self):
+        """
+        Returns
+        -------
+        xml.etree.ElementTree.Element
+            Root (project) element of the pom.
+        """
+        return self.__root
+
+    @property
+    def namespace(self):
+        """
+        Returns
+        -------
+        str
+            Namespace of the pom elements, or empty string if not namespaced.
+        """
+        return self.__namespace
+
+    @property
+    def properties(self):
+        """
+        Returns
+        -------
+        dict
+            Properties defined by the pom, including project.* properties for the
+            project and project build values given in the pom, with their values resolved.
+        """
+        return self.__properties
+
+    @property
+    def plugins(self):
+        """
+        Returns
+        -------
+        dict
+            Build plugins of the pom by artifact id.
+        """
+        return self.__plugins
+
+    def get_plugin(self, artifact_id):
+        """Gets a build plugin of the pom.
+
+        Parameters
+        ----------
+        artifact_id : str
+            Artifact id of the plugin to get.
+
+        Returns
+        -------
+        MavenPomPlugin
+            The plugin, or None if the pom does not have a build plugin with the given artifact id.
+        """
+        return self.__plugins.get(artifact_id)
+
+    def find(self, xpath, find_all=False):
+        """Gets the XML element(s) of the pom given an xpath using the 'mvn' namespace prefix
+        for the pom namespace.
+
+        Parameters
+        ----------
+        xpath : str
+            Xpath of the element you want.
+        find_all : bool
+            If False find only the first matching Element.
+            If True find all matching elements.
+
+        Returns
+        -------
+        xml.etree.ElementTree.Element or [xml.etree.ElementTree.Element]
+            The Element(s) found given the xpath.
+        """
+        if find_all:
+            return self.__findall(xpath)
+
+        return self.__root.find(xpath, {'mvn': self.__namespace})
+
+    def resolve_properties(self, value):
+        """Replaces the ${property} references in a given value with the values of the
+        properties defined in the pom.
+
+        References to properties the pom does not define, such as ones only known when
+        maven runs, are left as is.
+
+        Parameters
+        ----------
+        value : str
+            Value to resolve the property references in.
+
+        Returns
+        -------
+        str
+            Given value with the property references it can resolve replaced.
+        """
+        return resolve_property_references(value, self.__properties)
+
+    def flatten_configuration(self, configuration):
+        """Flattens a plugin configuration element.
+
+        Parameters
+        ----------
+        configuration : xml.etree.ElementTree.Element
+            Configuration element to flatten, or None.
+
+        Returns
+        -------
+        dict
+            Stripped and property resolved text of every element with text in the configuration,
+            keyed by the local names of the elements from the configuration element down to it
+            joined with '/', EX: 'reportsDirectory' or 'systemProperties/java.util.logging.manager'.
+            Values are lists since configuration elements can repeat.
+        """
+        flattened_configuration = {}
+        if configuration is None:
+            return flattened_configuration
+
+        elements_to_flatten = [(child, get_local_name(child)) for child in configuration]
+        while elements_to_flatten:
+            element, key = elements_to_flatten.pop(0)
+            if element.text and element.text.strip():
+                flattened_configuration.setdefault(key, []).append(
+                    self.resolve_properties(element.text.strip())
+                )
+            elements_to_flatten += [
+                (child, f"{key}/{get_local_name(child)}") for child in element
+            ]
+
+        return flattened_configuration
+
+    def __findall(self, xpath):
+        return self.__root.findall(xpath, {'mvn': self.__namespace})
+
+    def __get_child_text(self, element, child_name):
+        child = element.find(f'./mvn:{child_name}', {'mvn': self.__namespace})
+        if child is None or child.text is None:
+            return None
+
+        return self.resolve_properties(child.text.strip())
+
+    def __get_properties(self):
+        properties = dict(self.__base_properties)
+
+        # SEE: https://maven.apache.org/guides/introduction/introduction-to-the-pom.html#available-variables # pylint: disable=line-too-long
+        for prefix, parent in [
+            ('project', self.__root),
+            ('project.parent', self.__root.find('./mvn:parent', {'mvn': self.__namespace})),
+            ('project.build', self.__root.find('./mvn:build', {'mvn': self.__namespace}))
+        ]:
+            if parent is None:
+                continue
+            for child in parent:
+                if len(child) == 0 and child.text and child.text.strip():
+                    properties[f"{prefix}.{get_local_name(child)}"] = child.text.strip()
+
+        for project_properties in self.__findall('./mvn:properties'):
+            for child in project_properties:
+                properties[get_local_name(child)] = (child.text or '').strip()
+
+        # resolve properties that reference other properties
+        return {
+            name: resolve_property_references(value, properties)
+            for name, value in properties.items()
+        }
+
+    def __create_plugin(self, plugin):
+        namespaces = {'mvn': self.__namespace}
+
+        executions = []
+        for execution in plugin.findall('./mvn:executions/mvn:execution', namespaces):
+            executions.append(MavenPomPluginExecution(
+                execution_id=self.__get_child_text(execution, 'id'),
+                phase=self.__get_child_text(execution, 'phase'),
+                goals=[
+                    self.resolve_properties(goal.text.strip())
+                    for goal in execution.findall('./mvn:goals/mvn:goal', namespaces)
+                    if goal.text
+                ],
+                configuration=self.flatten_configuration(
+                    execution.find('./mvn:configuration', namespaces)
+                )
+            ))
+
+        return MavenPomPlugin(
+            group_id=self.__get_child_text(plugin, 'groupId'),
+            artifact_id=self.__get_child_text(plugin, 'artifactId'),
+            version=self.__get_child_text(plugin, 'version'),
+            configuration=self.flatten_configuration(
+                plugin.find('./mvn:configuration', namespaces)
+            ),
+            executions=executions
+        )
@@ -0,0 +1,471 @@
+"""Resolves Maven POMs in process, inheriting from their parents and applying their profiles,
+for the common cases where only project metadata or declared plugin configuration is needed
+and starting maven to generate the effective pom would take far longer then the lookup.
+"""
+
+import copy
+import os
+from xml.etree import ElementTree
+
+from ploigos_step_runner.exceptions import StepRunnerException
+from ploigos_step_runner.utils.pom import MavenPom, get_local_name
+
+# build values every pom inherits from the super pom
+# SEE: https://maven.apache.org/ref/current/maven-model-builder/super-pom.html
+SUPER_POM_BUILD_DEFAULTS = {
+    'directory': '${project.basedir}/target',
+    'outputDirectory': '${project.build.directory}/classes',
+    'finalName': '${project.artifactId}-${project.version}',
+    'testOutputDirectory': '${project.build.directory}/test-classes',
+    'sourceDirectory': '${project.basedir}/src/main/java',
+    'scriptSourceDirectory': '${project.basedir}/src/main/scripts',
+    'testSourceDirectory': '${project.basedir}/src/test/java'
+}
+
+# elements of a pom its children do not inherit
+# SEE: https://maven.apache.org/pom.html#Inheritance
+POM_NON_INHERITED_ELEMENTS = [
+    'artifactId',
+    'name',
+    'packaging',
+    'modules',
+    'prerequisites',
+    'profiles',
+    'parent'
+]
+
+# lists of elements merged by key rather than by name, with the (name, default) of the
+# child elements that make up the key of each element in the list
+POM_MERGE_KEYS = {
+    'plugins': [('groupId', 'org.apache.maven.plugins'), ('artifactId', None)],
+    'executions': [('id', 'default')],
+    'dependencies': [
+        ('groupId', None), ('artifactId', None), ('type', 'jar'), ('classifier', None)
+    ],
+    'extensions': [('groupId', None), ('artifactId', None)],
+    'repositories': [('id', None)],
+    'pluginRepositories': [('id', None)],
+    'profiles': [('id', 'default')]
+}
+
+
+class UnresolvablePomError(StepRunnerException):
+    """Raised when a pom uses constructs that MavenPomResolver can not resolve in process,
+    such that only maven itself can resolve the pom.
+    """
+
+
+class MavenPomResolver:
+    """Resolves a pom in process, without running maven, for the common cases.
+
+    Resolves:
+    * parent poms from their relative path or the local maven repository
+    * ${property} references to the project, its build, its properties,
+      env.* variables, and project.basedir
+    * profiles activated by id, by default, or by property
+    * plugin management
+
+    Notes
+    -----
+    The resolved pom is not a complete effective pom; it does not include dependencies imported
+    from boms, the plugins maven binds to the lifecycle for the packaging, or settings profiles.
+    It is intended for looking up project metadata and the configuration of declared plugins
+    without the time of starting maven.
+
+    Parameters
+    ----------
+    local_repository_path : str, optional
+        Path to the local maven repository to find parent poms in.
+        Defaults to ~/.m2/repository.
+    """
+
+    def __init__(self, local_repository_path=None):
+        if local_repository_path is None:
+            local_repository_path = os.path.join(
+                os.path.expanduser('~'), '.m2', 'repository'
+            )
+        self.__local_repository_path = local_repository_path
+
+    @property
+    def local_repository_path(self):
+        """
+        Returns
+        -------
+        str
+            Path to the local maven repository to find parent poms in.
+        """
+        return self.__local_repository_path
+
+    def resolve(self, pom_file_path, profiles=None):
+        """Resolves a given pom.
+
+        Parameters
+        ----------
+        pom_file_path : str
+            Path to the pom file to resolve.
+        profiles : [str] or str, optional
+            Ids of the profile(s) to activate.
+            Ids prefixed with ! or - deactivate the profile instead.
+
+        Returns
+        -------
+        MavenPom
+            Model of the resolved pom, with all property references it could resolve replaced
+            and namespaces removed.
+
+        Raises
+        ------
+        UnresolvablePomError
+            If the pom can not be resolved in process and maven must be used instead.
+        """
+        if isinstance(profiles, str):
+            profiles = [profiles]
+
+        pom_file_path = os.path.abspath(pom_file_path)
+        model = self.__resolve_model(pom_file_path, profiles or [], [])
+
+        build = model.find('./build')
+        if build is None:
+            build = ElementTree.SubElement(model, 'build')
+        for name, default in SUPER_POM_BUILD_DEFAULTS.items():
+            if build.find(f'./{name}') is None:
+                ElementTree.SubElement(build, name).text = default
+
+        MavenPomResolver.__apply_plugin_management(model)
+
+        basedir = os.path.dirname(pom_file_path)
+        base_properties = {
+            **{f'env.{name}': value for name, value in os.environ.items()},
+            'user.home': os.path.expanduser('~'),
+            'basedir': basedir,
+            'project.basedir': basedir
+        }
+
+        pom = MavenPom(model, base_properties)
+        for element in model.iter():
+            if element.text and '${' in element.text:
+                element.text = pom.resolve_properties(element.text)
+
+        return MavenPom(model, base_properties)
+
+    def __resolve_model(self, pom_file_path, profiles, pom_file_paths_resolving):
+        """Gets the model of a given pom with its active profiles applied and its parents
+        inherited from.
+        """
+        if pom_file_path in pom_file_paths_resolving:
+            raise UnresolvablePomError(
+                f"Parent poms of pom ({pom_file_paths_resolving[0]}) form a cycle:"
+                f" {' -> '.join(pom_file_paths_resolving + [pom_file_path])}"
+            )
+        pom_file_paths_resolving = pom_file_paths_resolving + [pom_file_path]
+
+        model = MavenPomResolver.__parse(pom_file_path)
+        model = MavenPomResolver.__apply_profiles(pom_file_path, model, profiles)
+
+        parent_pom_file_path = self.__find_parent_pom_file(pom_file_path, model)
+        if parent_pom_file_path is None:
+            return model
+
+        parent_model = self.__resolve_model(
+            parent_pom_file_path,
+            profiles,
+            pom_file_paths_resolving
+        )
+        return MavenPomResolver.__merge(
+            model,
+            MavenPomResolver.__get_inheritable(parent_model)
+        )
+
+    @staticmethod
+    def __parse(pom_file_path):
+        """Parses a given pom file and removes the namespace from all of its elements,
+        so the elements of poms with and without namespaces can be merged.
+        """
+        try:
+            model = ElementTree.parse(pom_file_path).getroot()
+        except (OSError, ElementTree.ParseError) as error:
+            raise UnresolvablePomError(
+                f"Error parsing pom ({pom_file_path}): {error}"
+            ) from error
+
+        for element in model.iter():
+            element.tag = get_local_name(element)
+
+        return model
+
+    def __find_parent_pom_file(self, pom_file_path, model):
+        """Finds the parent pom file of a given pom from its relative path, or if not there,
+        in the local maven repository.
+
+        Returns
+        -------
+        str
+            Path to the parent pom file, or None if the given pom has no parent.
+        """
+        parent = model.find('./parent')
+        if parent is None:
+            return None
+
+        group_id = (parent.findtext('./groupId') or '').strip()
+        artifact_id = (parent.findtext('./artifactId') or '').strip()
+        version = (parent.findtext('./version') or '').strip()
+        if not (group_id and artifact_id and version):
+            raise UnresolvablePomError(
+                f"Parent of pom ({pom_file_path}) must have a groupId, artifactId, and version."
+            )
+
+        # SEE: https://maven.apache.org/ref/current/maven-model/maven.html#parent
+        relative_path = (parent.findtext('./relativePath', default='../pom.xml') or '').strip()
+        if relative_path:
+            parent_pom_file_path = os.path.normpath(
+                os.path.join(os.path.dirname(pom_file_path), relative_path)
+            )
+            if os.path.isdir(parent_pom_file_path):
+                parent_pom_file_path = os.path.join(parent_pom_file_path, 'pom.xml')
+
+            if os.path.isfile(parent_pom_file_path):
+                parent_model = MavenPomResolver.__parse(parent_pom_file_path)
+                coordinates = {
+                    name: (
+                        parent_model.findtext(f'./{name}')
+                        or parent_model.findtext(f'./parent/{name}')
+                        or ''
+                    ).strip()
+                    for name in ['groupId', 'artifactId', 'version']
+                }
+                if coordinates['groupId'] == group_id \
+                        and coordinates['artifactId'] == artifact_id \
+                        and coordinates['version'] in (version, ''):
+                    return parent_pom_file_path
+
+        parent_pom_file_path = os.path.join(
+            self.__local_repository_path,
+            *group_id.split('.'),
+            artifact_id,
+            version,
+            f'{artifact_id}-{version}.pom'
+        )
+        if os.path.isfile(parent_pom_file_path):
+            return parent_pom_file_path
+
+        raise UnresolvablePomError(
+            f"Parent ({group_id}:{artifact_id}:{version}) of pom ({pom_file_path}) not found"
+            f" by relative path or in local maven repository ({self.__local_repository_path})."
+        )
+
+    @staticmethod
+    def __apply_profiles(pom_file_path, model, profiles):
+        """Merges the active profiles of a given pom into it.
+
+        SEE: https://maven.apache.org/guides/introduction/introduction-to-profiles.html
+        """
+        profile_elements = model.findall('./profiles/profile')
+        if not profile_elements:
+            return model
+
+        activated_ids = [profile for profile in profiles if not profile.startswith(('!', '-'))]
+        deactivated_ids = [profile[1:] for profile in profiles if profile.startswith(('!', '-'))]
+
+        active_profiles = []
+        active_by_default_profiles = []
+        for profile in profile_elements:
+            profile_id = (profile.findtext('./id') or 'default').strip()
+            if profile_id in deactivated_ids:
+                continue
+
+            if profile_id in activated_ids:
+                active_profiles.append(profile)
+                continue
+
+            activation = profile.find('./activation')
+            if activation is None:
+                continue
+
+            conditions = [
+                condition for condition in activation
+                if condition.tag != 'activeByDefault'
+            ]
+            if conditions:
+                if MavenPomResolver.__is_activated(pom_file_path, profile_id, conditions):
+                    active_profiles.append(profile)
+            elif (activation.findtext('./activeByDefault') or '').strip() == 'true':
+                active_by_default_profiles.append(profile)
+
+        # profiles active by default are only active if no other profile in the pom is
+        if not active_profiles:
+            active_profiles = active_by_default_profiles
+
+        for profile in active_profiles:
+            profile = copy.deepcopy(profile)
+            for name in ['id', 'activation']:
+                for element in profile.findall(f'./{name}'):
+                    profile.remove(element)
+            profile.tag = model.tag
+            model = MavenPomResolver.__merge(profile, model)
+
+        return model
+
+    @staticmethod
+    def __is_activated(pom_file_path, profile_id, conditions):
+        """Determines if all of the given activation conditions of a profile are met.
+
+        Only property conditions can be evaluated in process. Since maven is never given
+        system properties by this step runner only env.* properties are ever defined.
+        """
+        for condition in conditions:
+            if condition.tag != 'property':
+                raise UnresolvablePomError(
+                    f"Can not determine if profile ({profile_id}) of pom ({pom_file_path})"
+                    f" is activated by its {condition.tag} condition."
+                )
+
+            name = (condition.findtext('./name') or '').strip()
+            expected_value = (condition.findtext('./value') or '').strip()
+            negated = name.startswith('!')
+            name = name.lstrip('!')
+
+            value = None
+            if name.startswith('env.'):
+                value = os.environ.get(name[len('env.'):])
+
+            if expected_value:
+                negated = expected_value.startswith('!')
+                activated = value == expected_value.lstrip('!')
+            else:
+                activated = value is not None
+
+            if activated == negated:
+                return False
+
+        return True
+
+    @staticmethod
+    def __get_inheritable(parent_model):
+        """Gets a copy of a given parent model without the elements children do not inherit.
+        """
+        parent_model = copy.deepcopy(parent_model)
+        for element in list(parent_model):
+            if element.tag in POM_NON_INHERITED_ELEMENTS:
+                parent_model.remove(element)
+
+        for xpath in [
+            './build/plugins',
+            './build/pluginManagement/plugins',
+            './build/plugins/plugin/executions',
+            './build/pluginManagement/plugins/plugin/executions'
+        ]:
+            for container in parent_model.findall(xpath):
+                for element in list(container):
+                    if (element.findtext('./inherited') or '').strip() == 'false':
+                        container.remove(element)
+
+        return parent_model
+
+    @staticmethod
+    def __apply_plugin_management(model):
+        """Merges the managed configuration of each plugin of a given model into the plugin.
+        """
+        plugins = model.find('./build/plugins')
+        managed_plugins = model.find('./build/pluginManagement/plugins')
+        if plugins is None or managed_plugins is None:
+            return
+
+        key_fields = POM_MERGE_KEYS['plugins']
+        managed_plugins_by_key = {
+            MavenPomResolver.__get_merge_key(managed_plugin, key_fields): managed_plugin
+            for managed_plugin in managed_plugins
+        }
+        for index, plugin in enumerate(list(plugins)):
+            managed_plugin = managed_plugins_by_key.get(
+                MavenPomResolver.__get_merge_key(plugin, key_fields)
+            )
+            if managed_plugin is not None:
+                plugins[index] = MavenPomResolver.__merge(plugin, managed_plugin)
+
+    @staticmethod
+    def __get_merge_key(element, key_fields):
+        return tuple(
+            (element.findtext(f'./{name}') or default or '').strip()
+            for name, default in key_fields
+        )
+
+    @staticmethod
+    def __merge(dominant, recessive, in_configuration=False): # pylint: disable=too-many-branches
+        """Merges two elements the way maven merges a pom with its parent, or a profile into
+        a pom.
+
+        Children are merged by name, or for lists such as plugins and executions by key.
+        Plugin configuration is merged by name honoring the combine.self and combine.children
+        attributes.
+
+        SEE: https://maven.apache.org/pom.html#Plugins
+
+        Parameters
+        ----------
+        dominant : xml.etree.ElementTree.Element
+            Element whose values win.
+        recessive : xml.etree.ElementTree.Element
+            Element whose values are only used where the dominant element has none.
+        in_configuration : bool
+            True if the elements are in plugin configuration.
+
+        Returns
+        -------
+        xml.etree.ElementTree.Element
+            New merged element.
+        """
+        in_configuration = in_configuration or dominant.tag == 'configuration'
+
+        if len(dominant) == 0 and dominant.text and dominant.text.strip():
+            return copy.deepcopy(dominant)
+        if in_configuration and dominant.get('combine.self') == 'override':
+            return copy.deepcopy(dominant)
+
+        merged = ElementTree.Element(dominant.tag, dominant.attrib)
+        merged.text = dominant.text if len(dominant) > 0 else recessive.text
+        merged.tail = dominant.tail
+
+        key_fields = None if in_configuration else POM_MERGE_KEYS.get(dominant.tag)
+        if key_fields:
+            dominant_children_by_key = {
+                MavenPomResolver.__get_merge_key(child, key_fields): child
+                for child in dominant
+            }
+            recessive_keys = set()
+            for child in recessive:
+                key = MavenPomResolver.__get_merge_key(child, key_fields)
+                recessive_keys.add(key)
+                if key in dominant_children_by_key:
+                    merged.append(MavenPomResolver.__merge(
+                        dominant_children_by_key[key],
+                        child,
+                        in_configuration
+                    ))
+                else:
+                    merged.append(copy.deepcopy(child))
+            for key, child in dominant_children_by_key.items():
+                if key not in recessive_keys:
+                    merged.append(copy.deepcopy(child))
+        elif in_configuration and dominant.get('combine.children') == 'append':
+            merged.extend(copy.deepcopy(child) for child in recessive)
+            merged.extend(copy.deepcopy(child) for child in dominant)
+        else:
+            dominant_child_tags = set()
+            for child in dominant:
+                if child.tag in dominant_child_tags:
+                    merged.append(copy.deepcopy(child))
+                    continue
+                dominant_child_tags.add(child.tag)
+
+                recessive_child = recessive.find(f'./{child.tag}')
+                if recessive_child is None:
+                    merged.append(copy.deepcopy(child))
+                else:
+                    merged.append(
+                        MavenPomResolver.__merge(child, recessive_child, in_configuration)
+                    )
+            for child in recessive:
+                if child.tag not in dominant_child_tags:
+                    merged.append(copy.deepcopy(child))
+
+        return merged
@@ -6,6 +6,7 @@ import os
 import sys
 import sh
 from ploigos_step_runner.exceptions import StepRunnerException
+from ploigos_step_runner.utils.file import open_output_file
 from ploigos_step_runner.utils.io import \
     create_sh_redirect_to_multiple_streams_fn_callback
 
@@ -31,7 +32,7 @@ class Shell:
             Dictionary representing additional environment variables
         """
         try:
-            with open(output_file_path, 'w', encoding='utf-8') as output_file:
+            with open_output_file(output_file_path, 'w') as output_file:
                 out_callback = create_sh_redirect_to_multiple_streams_fn_callback([
                     sys.stdout,
                     output_file
@@ -50,12 +51,16 @@ class Shell:
                 shell_command = sh.Command(  # pylint: disable=unexpected-keyword-arg
                     command
                 )
-                shell_command(
-                    args,
-                    _env=new_env,
-                    _out=out_callback,
-                    _err=err_callback
-                )
+                try:
+                    shell_command(
+                        args,
+                        _env=new_env,
+                        _out=out_callback,
+                        _err=err_callback
+                    )
+                finally:
+                    out_callback.finish()
+                    err_callback.finish()
         except sh.ErrorReturnCode as error:
             raise StepRunnerException(
                 f"Error running shell command. {error}"
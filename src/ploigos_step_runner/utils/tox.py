@@ -4,6 +4,7 @@ import sys
 import sh
 
 from ploigos_step_runner.exceptions import StepRunnerException
+from ploigos_step_runner.utils.file import open_output_file
 from ploigos_step_runner.utils.io import \
     create_sh_redirect_to_multiple_streams_fn_callback
 
@@ -20,7 +21,7 @@ def run_tox(tox_output_file_path, tox_args):
     """
 
     try:
-        with open(tox_output_file_path, 'w', encoding='utf-8') as tox_output_file:
+        with open_output_file(tox_output_file_path, 'w') as tox_output_file:
             out_callback = create_sh_redirect_to_multiple_streams_fn_callback([
                 sys.stdout,
                 tox_output_file
@@ -30,11 +31,15 @@ def run_tox(tox_output_file_path, tox_args):
                 tox_output_file
             ])
 
-            sh.tox( # pylint: disable=no-member
-                tox_args,
-                _out=out_callback,
-                _err=err_callback
-            )
+            try:
+                sh.tox( # pylint: disable=no-member
+                    tox_args,
+                    _out=out_callback,
+                    _err=err_callback
+                )
+            finally:
+                out_callback.finish()
+                err_callback.finish()
     except sh.ErrorReturnCode as error:
         raise StepRunnerException(
             f"Error running tox. {error}"
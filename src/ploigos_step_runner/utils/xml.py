@@ -4,8 +4,160 @@ Shared utils for dealing with XML.
 
 import re
 import os.path
+import threading
+from collections import OrderedDict
 from xml.etree import ElementTree
 
+# bound on the total size of the files whose parsed documents are cached for the life of the
+# process, parsed documents take several times the memory of their file
+XML_DOCUMENT_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+class XmlDocumentCache:
+    """Least recently used cache of parsed xml documents by path, modification time, and size,
+    bounded by the total size of the cached documents' files.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Maximum total size of the files of the cached documents.
+        Documents of files bigger than this are never cached.
+    """
+
+    def __init__(self, max_bytes):
+        self.__max_bytes = max_bytes
+        self.__documents = OrderedDict()
+        self.__bytes = 0
+        self.__lock = threading.Lock()
+
+    @property
+    def cached_bytes(self):
+        """
+        Returns
+        -------
+        int
+            Total size of the files of the cached documents.
+        """
+        return self.__bytes
+
+    def parse(self, xml_file_path):
+        """Gets the root element of the given xml file, parsing it only if it is not cached or
+        has changed since it was cached.
+
+        Parameters
+        ----------
+        xml_file_path : str
+            Path to the xml file to parse.
+
+        Returns
+        -------
+        xml.etree.ElementTree.Element
+            Root element of the parsed xml file.
+        """
+        xml_file_stat = os.stat(xml_file_path)
+        xml_file_path = os.path.abspath(xml_file_path)
+        cache_key = (xml_file_stat.st_mtime_ns, xml_file_stat.st_size)
+
+        with self.__lock:
+            cached_document = self.__documents.get(xml_file_path)
+            if cached_document is not None and cached_document[0] == cache_key:
+                self.__documents.move_to_end(xml_file_path)
+                return cached_document[1]
+
+        xml_root = ElementTree.parse(xml_file_path).getroot()
+
+        if xml_file_stat.st_size <= self.__max_bytes:
+            with self.__lock:
+                # replaces any document cached from before the file changed
+                replaced_document = self.__documents.pop(xml_file_path, None)
+                if replaced_document is not None:
+                    self.__bytes -= replaced_document[0][1]
+
+                self.__documents[xml_file_path] = (cache_key, xml_root)
+                self.__bytes += xml_file_stat.st_size
+
+                while self.__bytes > self.__max_bytes:
+                    _, ((_, evicted_size), _) = self.__documents.popitem(last=False)
+                    self.__bytes -= evicted_size
+
+        return xml_root
+
+    def clear(self):
+        """Forgets all of the cached documents.
+        """
+        with self.__lock:
+            self.__documents.clear()
+            self.__bytes = 0
+
+XML_DOCUMENT_CACHE = XmlDocumentCache(XML_DOCUMENT_CACHE_MAX_BYTES)
+
+def parse_xml_file(xml_file_path):
+    """Gets the root element of a parsed xml file.
+
+    Notes
+    -----
+    Parsed documents are cached for the life of the process by XML_DOCUMENT_CACHE, so querying
+    the same file many times only parses it once, until it changes.
+    The returned document is shared so must not be modified.
+
+    Parameters
+    ----------
+    xml_file_path : str
+        Path to the xml file to parse.
+
+    Returns
+    -------
+    xml.etree.ElementTree.Element
+        Root element of the parsed xml file.
+
+    Raises
+    ------
+    ValueError
+        If the given xml file does not exist.
+    """
+    if not os.path.exists(xml_file_path):
+        raise ValueError('Given xml file does not exist: ' + xml_file_path)
+
+    return XML_DOCUMENT_CACHE.parse(xml_file_path)
+
+def get_xml_root_element(xml_file):
+    """Gets the root element of a given xml file, with its attributes but without its text
+    or any of its children, without reading the rest of the file.
+
+    Notes
+    -----
+    Only for callers that need nothing of the root element beyond its tag and attributes,
+    use parse_xml_file to get the fully parsed root element.
+
+    Parameters
+    ----------
+    xml_file : str
+        Path to the xml file to get the root element of.
+
+    Returns
+    -------
+    xml.etree.ElementTree.Element
+        Root element of the xml file, with its attributes but without its text or children.
+        None if the start of the file is not valid xml.
+
+    Raises
+    ------
+    ValueError
+        If the given xml_file does not exist.
+    """
+    if not os.path.exists(xml_file):
+        raise ValueError('Given xml file does not exist: ' + xml_file)
+
+    try:
+        with open(xml_file, 'rb') as open_xml_file:
+            for _, xml_root in ElementTree.iterparse(open_xml_file, events=('start',)):
+                # NOTE: the parser reads the file in chunks so the root element it gives can
+                #       already have some text and children, only keep its tag and attributes
+                return ElementTree.Element(xml_root.tag, dict(xml_root.attrib))
+    except ElementTree.ParseError:
+        pass
+
+    return None
+
 def get_xml_element(xml_file, element_name):
     """ Gets a given element from a given xml file.
 
@@ -51,25 +203,18 @@ def get_xml_element_if_present(xml_file, element_name):
         Or None if the file does not contain an Element with element_name.
     """
 
-    # verify runtime config
-    if not os.path.exists(xml_file):
-        raise ValueError('Given xml file does not exist: ' + xml_file)
-
     # parse the xml file and figure out the namespace if there is one
-    xml_xml = ElementTree.parse(xml_file)
-    xml_root = xml_xml.getroot()
+    xml_root = parse_xml_file(xml_file)
+    if xml_root.tag == element_name:
+        return xml_root
+
     xml_namespace_match = re.match(r'\{.*}', str(xml_root.tag))
     xml_namespace = ''
     if xml_namespace_match:
         xml_namespace = xml_namespace_match.group(0)
 
     # extract needed information from the xml file
-    if xml_root.tag == element_name:
-        xml_element = xml_root
-    else:
-        xml_element = xml_root.find('./' + xml_namespace + element_name)
-
-    return xml_element
+    return xml_root.find('./' + xml_namespace + element_name)
 
 def get_xml_element_by_path(
     xml_file_path,
@@ -103,12 +248,8 @@ def get_xml_element_by_path(
     xml.etree.ElementTree.Element or [xml.etree.ElementTree.Element]
         The Element(s) found given the xpath
     """
-    # verify runtime config
-    if not os.path.exists(xml_file_path):
-        raise ValueError(f'Given xml file does not exist: {xml_file_path}')
-
     # figure out the xml namespaceing
-    xml_file = ElementTree.parse(xml_file_path).getroot()
+    xml_file = parse_xml_file(xml_file_path)
     namespaces = xml_namespace_dict
     if xml_namespace_dict is None and default_namespace is not None:
         xml_namespace_match = re.findall(r'{(.*?)}', xml_file.tag)
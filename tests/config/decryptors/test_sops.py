@@ -9,7 +9,7 @@ from unittest.mock import patch
 
 from tests.helpers.base_test_case import BaseTestCase
 from tests.helpers.sops_integration_test_case import SOPSIntegrationTestCase
-from tests.helpers.test_utils import Any
+from tests.helpers.test_utils import Any, create_sops_side_effect
 
 from ploigos_step_runner.config.config_value import ConfigValue
 from ploigos_step_runner.config.decryptors.sops import SOPS
@@ -223,6 +223,113 @@ class TestSOPSConfigValueDecryptor(BaseTestCase):
             sops_value_path,
             '["step-runner-config"]["step-foo"][0]["config"]["test1"]')
 
+    def test_batch_decrypt_parent_source_file(self, sops_mock):
+        encrypted_config_file_path = os.path.join(
+            os.path.dirname(__file__),
+            'files',
+            'step-runner-config-secret-stuff.yml'
+        )
+        sops_mock.side_effect = create_sops_side_effect(json.dumps({
+            'step-runner-config': {
+                'global-environment-defaults': {
+                    'DEV': {
+                        'kube-api-token': 'mock token',
+                        'port': 8080
+                    }
+                },
+                'step-foo': [{'config': {'password': 'mock password'}}]
+            }
+        }))
+
+        sops_decryptor = SOPS(
+            additional_sops_args=['--aws-profile=foo'],
+            batch_decrypt=True
+        )
+
+        token = sops_decryptor.decrypt(ConfigValue(
+            value='ENC[AES256_GCM,data:abc,type:str]',
+            parent_source=encrypted_config_file_path,
+            path_parts=['step-runner-config', 'global-environment-defaults', 'DEV', 'kube-api-token']
+        ))
+        port = sops_decryptor.decrypt(ConfigValue(
+            value='ENC[AES256_GCM,data:def,type:int]',
+            parent_source=encrypted_config_file_path,
+            path_parts=['step-runner-config', 'global-environment-defaults', 'DEV', 'port']
+        ))
+        password = sops_decryptor.decrypt(ConfigValue(
+            value='ENC[AES256_GCM,data:ghi,type:str]',
+            parent_source=encrypted_config_file_path,
+            path_parts=['step-runner-config', 'step-foo', 0, 'config', 'password']
+        ))
+
+        self.assertEqual(token, 'mock token')
+        self.assertEqual(port, '8080')
+        self.assertEqual(password, 'mock password')
+        sops_mock.assert_called_once_with(
+            '--decrypt',
+            '--output-type=json',
+            None,
+            encrypted_config_file_path,
+            '--aws-profile=foo',
+            _in=None,
+            _out=Any(StringIO),
+            _err=Any(StringIO)
+        )
+
+    def test_batch_decrypt_parent_source_dict(self, sops_mock):
+        encrypted_config = {
+            'step-runner-config': {
+                'password': 'ENC[AES256_GCM,data:abc,type:str]'
+            }
+        }
+        sops_mock.side_effect = create_sops_side_effect(json.dumps({
+            'step-runner-config': {
+                'password': 'mock password'
+            }
+        }))
+
+        sops_decryptor = SOPS(batch_decrypt=True)
+        for _ in range(2):
+            decrypted_value = sops_decryptor.decrypt(ConfigValue(
+                value='ENC[AES256_GCM,data:abc,type:str]',
+                parent_source=encrypted_config,
+                path_parts=['step-runner-config', 'password']
+            ))
+            self.assertEqual(decrypted_value, 'mock password')
+
+        sops_mock.assert_called_once_with(
+            '--decrypt',
+            '--output-type=json',
+            '--input-type=json',
+            '/dev/stdin',
+            _in=json.dumps(encrypted_config),
+            _out=Any(StringIO),
+            _err=Any(StringIO)
+        )
+
+    def test_batch_decrypt_path_does_not_exist(self, sops_mock):
+        encrypted_config_file_path = os.path.join(
+            os.path.dirname(__file__),
+            'files',
+            'step-runner-config-secret-stuff.yml'
+        )
+        sops_mock.side_effect = create_sops_side_effect(json.dumps({
+            'step-runner-config': {}
+        }))
+
+        sops_decryptor = SOPS(batch_decrypt=True)
+        with self.assertRaisesRegex(
+            ValueError,
+            r"Given config value \(ConfigValue\(.*\)\) path"
+            r" \(\[\"step-runner-config\"\]\[\"password\"\]\)"
+            r" does not exist in its decrypted parent source"
+        ):
+            sops_decryptor.decrypt(ConfigValue(
+                value='ENC[AES256_GCM,data:abc,type:str]',
+                parent_source=encrypted_config_file_path,
+                path_parts=['step-runner-config', 'password']
+            ))
+
 class TestSOPSConfigValueDecryptorSOPSIntegrationTests(SOPSIntegrationTestCase):
     def test_can_decrypt_true(self):
         encrypted_config_file_path = os.path.join(
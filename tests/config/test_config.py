@@ -1,3 +1,4 @@
+import pickle
 import os.path
 
 from ploigos_step_runner.config import Config
@@ -770,6 +771,91 @@ class TestConfig(BaseTestCase):
                 config = Config()
                 config.add_config(os.path.join(temp_dir.path, config_dir))
 
+    def test_add_config_dir_many_files_parallel_parse(self):
+        with TempDirectory() as temp_dir:
+            config_dir = "test"
+            num_files = 40
+
+            for index in range(num_files):
+                temp_dir.write(
+                    os.path.join(config_dir, f"step-{index}.yml"),
+                    bytes(str({
+                        Config.CONFIG_KEY: {
+                            f'step-test-{index}': {
+                                'implementer': 'foo',
+                                'config': {
+                                    'index': index
+                                }
+                            }
+                        }
+                    }), 'utf-8')
+                )
+
+            config = Config()
+            config.add_config(os.path.join(temp_dir.path, config_dir))
+
+            for index in range(num_files):
+                self.assertEqual(
+                    config.get_step_config(f'step-test-{index}').get_sub_step(
+                        'foo'
+                    ).get_config_value('index'),
+                    index
+                )
+
+    def test_add_config_dir_many_files_parallel_parse_conflict_names_files(self):
+        with TempDirectory() as temp_dir:
+            config_dir = "test"
+
+            for index in range(20):
+                temp_dir.write(
+                    os.path.join(config_dir, f"defaults-{index}.yml"),
+                    bytes(str({
+                        Config.CONFIG_KEY: {
+                            'global-defaults': {
+                                f'key-{index}': 'foo'
+                            }
+                        }
+                    }), 'utf-8')
+                )
+            temp_dir.write(
+                os.path.join(config_dir, "dup-a.yml"),
+                bytes(str({Config.CONFIG_KEY: {'global-defaults': {'dup-key': 'a'}}}), 'utf-8')
+            )
+            temp_dir.write(
+                os.path.join(config_dir, "dup-b.yml"),
+                bytes(str({Config.CONFIG_KEY: {'global-defaults': {'dup-key': 'b'}}}), 'utf-8')
+            )
+
+            with self.assertRaisesRegex(
+                ValueError,
+                r"Failed to add parsed configuration file \(.*/dup-[ab].yml\): "
+                r"Error merging global defaults: Conflict at dup-key "
+                r"\(conflicts with config file: .*/dup-[ab].yml\)"
+            ):
+                config = Config()
+                config.add_config(os.path.join(temp_dir.path, config_dir))
+
+    def test_add_config_dir_many_files_parallel_parse_bad_file(self):
+        with TempDirectory() as temp_dir:
+            config_dir = "test"
+
+            for index in range(20):
+                temp_dir.write(
+                    os.path.join(config_dir, f"step-{index}.yml"),
+                    bytes(str({Config.CONFIG_KEY: {}}), 'utf-8')
+                )
+            temp_dir.write(
+                os.path.join(config_dir, "bad.yml"),
+                b": blarg this: is {} bad syntax"
+            )
+
+            with self.assertRaisesRegex(
+                ValueError,
+                r"Error parsing config file \(.*/bad.yml\) as json or yaml"
+            ):
+                config = Config()
+                config.add_config(os.path.join(temp_dir.path, config_dir))
+
     def test_duplicate_global_environment_default_keys(self):
         with TempDirectory() as temp_dir:
             config_dir = "test"
@@ -1176,3 +1262,129 @@ class TestConfig(BaseTestCase):
             sops_decryptor._SOPS__additional_sops_args,
             ['--aws-profile=foo']
         )
+
+    def test_write_and_add_bundle(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('psr.yml', bytes(str({
+                Config.CONFIG_KEY: {
+                    'global-defaults': {
+                        'global-key': 'global-value'
+                    },
+                    'global-environment-defaults': {
+                        'DEV': {
+                            'env-key': 'dev-value'
+                        }
+                    },
+                    'step-foo': [
+                        {
+                            'implementer': 'foo',
+                            'name': 'foo-sub-step',
+                            'continue-sub-steps-on-failure': True,
+                            'config': {
+                                'secret': 'ENC[AES256_GCM,data:abc,type:str]'
+                            },
+                            'environment-config': {
+                                'DEV': {
+                                    'dev-step-key': 'dev-step-value'
+                                }
+                            }
+                        }
+                    ]
+                }
+            }), 'utf-8'))
+            config_file_path = os.path.join(temp_dir.path, 'psr.yml')
+            bundle_path = os.path.join(temp_dir.path, 'out', 'psr.bundle')
+
+            Config(config_file_path).write_bundle(bundle_path)
+            self.assertTrue(Config.is_bundle_file(bundle_path))
+            self.assertFalse(Config.is_bundle_file(config_file_path))
+
+            config = Config(bundle_path)
+
+            self.assertEqual(
+                ConfigValue.convert_leaves_to_values(config.global_defaults),
+                {'global-key': 'global-value'}
+            )
+            self.assertEqual(
+                ConfigValue.convert_leaves_to_values(
+                    config.get_global_environment_defaults_for_environment('DEV')
+                ),
+                {'environment-name': 'DEV', 'env-key': 'dev-value'}
+            )
+            sub_step = config.get_step_config('step-foo').get_sub_step('foo-sub-step')
+            self.assertEqual(sub_step.sub_step_implementer_name, 'foo')
+            self.assertTrue(sub_step.sub_step_contine_sub_steps_on_failure)
+            self.assertEqual(
+                sub_step.get_config_value('dev-step-key', environment='DEV'),
+                'dev-step-value'
+            )
+
+            # encrypted leaves stay encrypted and keep their source
+            secret = sub_step.sub_step_config['secret']
+            self.assertEqual(secret.raw_value, 'ENC[AES256_GCM,data:abc,type:str]')
+            self.assertEqual(secret.parent_source, config_file_path)
+
+    def test_add_bundle_registers_decryptors(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('psr.yml', bytes(str({
+                Config.CONFIG_KEY: {
+                    'config-decryptors': [
+                        {
+                            'implementer': 'SOPS'
+                        }
+                    ]
+                }
+            }), 'utf-8'))
+            bundle_path = os.path.join(temp_dir.path, 'psr.bundle')
+            Config(os.path.join(temp_dir.path, 'psr.yml')).write_bundle(bundle_path)
+            DecryptionUtils._DecryptionUtils__config_value_decryptors = []
+
+            Config(bundle_path)
+
+            decryptors = DecryptionUtils._DecryptionUtils__config_value_decryptors
+            self.assertEqual(len(decryptors), 1)
+            self.assertIsInstance(decryptors[0], SOPS)
+
+    def test_add_bundle_conflicts_with_existing_config(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('a.yml', bytes(str({
+                Config.CONFIG_KEY: {'global-defaults': {'dup-key': 'a'}}
+            }), 'utf-8'))
+            temp_dir.write('b.yml', bytes(str({
+                Config.CONFIG_KEY: {'global-defaults': {'dup-key': 'b'}}
+            }), 'utf-8'))
+            bundle_path = os.path.join(temp_dir.path, 'psr.bundle')
+            Config(os.path.join(temp_dir.path, 'a.yml')).write_bundle(bundle_path)
+
+            with self.assertRaisesRegex(
+                ValueError,
+                r"Failed to add config bundle \(.*psr.bundle\): "
+                r"Error merging global defaults: Conflict at dup-key"
+            ):
+                Config([os.path.join(temp_dir.path, 'b.yml'), bundle_path])
+
+    def test_add_bundle_unsupported_version(self):
+        with TempDirectory() as temp_dir:
+            bundle_path = temp_dir.write(
+                'psr.bundle',
+                Config.BUNDLE_MAGIC + pickle.dumps({'version': -1})
+            )
+
+            with self.assertRaisesRegex(
+                ValueError,
+                r"Config bundle \(.*psr.bundle\) is not of supported format version"
+            ):
+                Config(bundle_path)
+
+    def test_add_bundle_corrupt(self):
+        with TempDirectory() as temp_dir:
+            bundle_path = temp_dir.write(
+                'psr.bundle',
+                Config.BUNDLE_MAGIC + b'not a pickle'
+            )
+
+            with self.assertRaisesRegex(
+                ValueError,
+                r"Error loading config bundle \(.*psr.bundle\):"
+            ):
+                Config(bundle_path)
@@ -1,3 +1,4 @@
+import copy
 import os.path
 from io import StringIO
 from unittest.mock import patch
@@ -47,6 +48,31 @@ class TestConfigValue(BaseTestCase):
 
         self.assertNotEqual(test1, test2)
 
+    def test_parent_source_key_file(self):
+        test1 = ConfigValue('foo1', '/mock/psr.yml', None)
+
+        self.assertEqual(test1.parent_source_key, '/mock/psr.yml')
+
+    def test_parent_source_key_dict(self):
+        source = {'foo': 'foo1'}
+        test1 = ConfigValue('foo1', source, ['foo'])
+        test2 = ConfigValue('foo1', source, ['foo'])
+        test3 = ConfigValue('foo1', dict(source), ['foo'])
+
+        self.assertEqual(test1.parent_source_key, test2.parent_source_key)
+        self.assertNotEqual(test1.parent_source_key, test3.parent_source_key)
+
+    def test__deepcopy__shares_parent_source(self):
+        source = {'foo': ['foo1']}
+        test1 = ConfigValue(['foo1'], source, ['foo'])
+
+        test2 = copy.deepcopy(test1)
+
+        self.assertEqual(test2.raw_value, ['foo1'])
+        self.assertEqual(test2.path_parts, ['foo'])
+        self.assertEqual(test2.parent_source, source)
+        self.assertEqual(test1.parent_source_key, test2.parent_source_key)
+
     def test__repr__(self):
         source = {
             Config.CONFIG_KEY: {
@@ -292,6 +318,32 @@ class TestConfigValue(BaseTestCase):
             }
         )
 
+    def test_get_config_value_leaves(self):
+        implementer = ConfigValue('foo1', None, None)
+        test1 = ConfigValue('foo', None, None)
+        test2 = ConfigValue('bar', None, None)
+        source_values = {
+            Config.CONFIG_KEY: {
+                'step-foo': [
+                    {
+                        'implementer': implementer,
+                        'config': {
+                            'test1': test1,
+                            'test': 'not a config value object',
+                            'list': [test2, None]
+                        }
+                    }
+                ]
+            }
+        }
+
+        leaves = ConfigValue.get_config_value_leaves(source_values)
+
+        self.assertEqual(len(leaves), 3)
+        self.assertIs(leaves[0], implementer)
+        self.assertIs(leaves[1], test1)
+        self.assertIs(leaves[2], test2)
+
     @patch('sh.sops', create=True)
     def test_value_decyrpt(self, sops_mock):
         encrypted_config_file_path = os.path.join(
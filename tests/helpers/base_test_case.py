@@ -15,6 +15,10 @@ class BaseTestCase(unittest.TestCase):
     def tearDown(self):
         DecryptionUtils._DecryptionUtils__config_value_decryptors = []
         DecryptionUtils._DecryptionUtils__obfuscation_streams = []
+        DecryptionUtils._DecryptionUtils__decryption_cache = {}
+        DecryptionUtils._DecryptionUtils__decryption_cache_sources = {}
+        DecryptionUtils._DecryptionUtils__decryption_count = 0
+        DecryptionUtils._DecryptionUtils__decryption_cache_hit_count = 0
 
         try:
             shutil.rmtree("./step-runner-working")
@@ -265,8 +265,7 @@ class TestStepImplementerOpenPolicyAgent_audit_attestation(TestStepImplementerOp
             workflow_policy_file_path,
             workflow_policy_query,
             _out=Any(IOBase),
-            _err_to_out=True,
-            _tee='out'
+            _err_to_out=True
         )
 
     @patch('sh.opa', create=True)
@@ -161,6 +161,10 @@ class TestStepImplementerCreateContainerImageBuildah___required_config_or_result
         ]
         self.assertEqual(required_keys, expected_required_keys)
 
+@patch(
+    'ploigos_step_runner.step_implementers.create_container_image.buildah.get_local_container_image_digest',
+    return_value=None
+)
 @patch('ploigos_step_runner.step_implementers.create_container_image.buildah.add_container_build_step_result_artifacts')
 @patch('ploigos_step_runner.step_implementers.create_container_image.buildah.get_container_image_digest')
 @patch('ploigos_step_runner.step_implementers.create_container_image.buildah.determine_container_image_address_info')
@@ -173,7 +177,8 @@ class TestStepImplementerCreateContainerImageBuildah___run_step(
         buildah_mock,
         mock_determine_container_image_address_info,
         mock_get_container_image_digest,
-        mock_add_container_build_step_result_artifacts
+        mock_add_container_build_step_result_artifacts,
+        mock_get_local_container_image_digest
     ):
         with TempDirectory() as temp_dir:
             # setup test
@@ -233,7 +238,8 @@ class TestStepImplementerCreateContainerImageBuildah___run_step(
                 '--tls-verify=true',
                 '--layers', '-f', 'Containerfile',
                 '-t', 'localhost/mock-org/mock-app/mock-service:1.0-123abc',
-                '--authfile', os.path.join(step_implementer.work_dir_path, 'container-auth.json'),
+                '--authfile', os.path.join(step_implementer.parent_work_dir_path, 'container-auth.json'),
+                '--iidfile', os.path.join(step_implementer.work_dir_path, 'container-image-id'),
                 temp_dir.path,
                 _out=sys.stdout,
                 _err=sys.stderr,
@@ -245,7 +251,8 @@ class TestStepImplementerCreateContainerImageBuildah___run_step(
         buildah_mock,
         mock_determine_container_image_address_info,
         mock_get_container_image_digest,
-        mock_add_container_build_step_result_artifacts
+        mock_add_container_build_step_result_artifacts,
+        mock_get_local_container_image_digest
     ):
         with TempDirectory() as temp_dir:
             # setup test
@@ -307,6 +314,7 @@ class TestStepImplementerCreateContainerImageBuildah___run_step(
                 '--layers', '-f', 'Containerfile',
                 '-t', 'localhost/mock-org/mock-app/mock-service:1.0-123abc',
                 '--authfile', 'mock-auth.json',
+                '--iidfile', os.path.join(step_implementer.work_dir_path, 'container-image-id'),
                 temp_dir.path,
                 _out=sys.stdout,
                 _err=sys.stderr,
@@ -318,7 +326,8 @@ class TestStepImplementerCreateContainerImageBuildah___run_step(
         buildah_mock,
         mock_determine_container_image_address_info,
         mock_get_container_image_digest,
-        mock_add_container_build_step_result_artifacts
+        mock_add_container_build_step_result_artifacts,
+        mock_get_local_container_image_digest
     ):
         with TempDirectory() as temp_dir:
             # setup test
@@ -385,7 +394,8 @@ class TestStepImplementerCreateContainerImageBuildah___run_step(
                 '--tls-verify=true',
                 '--layers', '-f', 'Containerfile',
                 '-t', 'localhost/mock-org/mock-app/mock-service:1.0-123abc',
-                '--authfile', os.path.join(step_implementer.work_dir_path, 'container-auth.json'),
+                '--authfile', os.path.join(step_implementer.parent_work_dir_path, 'container-auth.json'),
+                '--iidfile', os.path.join(step_implementer.work_dir_path, 'container-image-id'),
                 temp_dir.path,
                 _out=sys.stdout,
                 _err=sys.stderr,
@@ -397,7 +407,8 @@ class TestStepImplementerCreateContainerImageBuildah___run_step(
         buildah_mock,
         mock_determine_container_image_address_info,
         mock_get_container_image_digest,
-        mock_add_container_build_step_result_artifacts
+        mock_add_container_build_step_result_artifacts,
+        mock_get_local_container_image_digest
     ):
         with TempDirectory() as temp_dir:
             # setup test
@@ -464,7 +475,8 @@ class TestStepImplementerCreateContainerImageBuildah___run_step(
                 '--tls-verify=false',
                 '--layers', '-f', 'Containerfile',
                 '-t', 'localhost/mock-org/mock-app/mock-service:1.0-123abc',
-                '--authfile', os.path.join(step_implementer.work_dir_path, 'container-auth.json'),
+                '--authfile', os.path.join(step_implementer.parent_work_dir_path, 'container-auth.json'),
+                '--iidfile', os.path.join(step_implementer.work_dir_path, 'container-image-id'),
                 temp_dir.path,
                 _out=sys.stdout,
                 _err=sys.stderr,
@@ -476,7 +488,8 @@ class TestStepImplementerCreateContainerImageBuildah___run_step(
         buildah_mock,
         mock_determine_container_image_address_info,
         mock_get_container_image_digest,
-        mock_add_container_build_step_result_artifacts
+        mock_add_container_build_step_result_artifacts,
+        mock_get_local_container_image_digest
     ):
         with TempDirectory() as temp_dir:
             # setup test
@@ -536,7 +549,8 @@ class TestStepImplementerCreateContainerImageBuildah___run_step(
                 '--tls-verify=true',
                 '--layers', '-f', 'Containerfile',
                 '-t', 'localhost/mock-org/mock-app/mock-service:latest',
-                '--authfile', os.path.join(step_implementer.work_dir_path, 'container-auth.json'),
+                '--authfile', os.path.join(step_implementer.parent_work_dir_path, 'container-auth.json'),
+                '--iidfile', os.path.join(step_implementer.work_dir_path, 'container-image-id'),
                 temp_dir.path,
                 _out=sys.stdout,
                 _err=sys.stderr,
@@ -548,7 +562,8 @@ class TestStepImplementerCreateContainerImageBuildah___run_step(
         buildah_mock,
         mock_determine_container_image_address_info,
         mock_get_container_image_digest,
-        mock_add_container_build_step_result_artifacts
+        mock_add_container_build_step_result_artifacts,
+        mock_get_local_container_image_digest
     ):
         with TempDirectory() as temp_dir:
             parent_work_dir_path = os.path.join(temp_dir.path, 'working')
@@ -611,7 +626,8 @@ class TestStepImplementerCreateContainerImageBuildah___run_step(
         buildah_mock,
         mock_determine_container_image_address_info,
         mock_get_container_image_digest,
-        mock_add_container_build_step_result_artifacts
+        mock_add_container_build_step_result_artifacts,
+        mock_get_local_container_image_digest
     ):
         with TempDirectory() as temp_dir:
             parent_work_dir_path = os.path.join(temp_dir.path, 'working')
@@ -661,3 +677,69 @@ class TestStepImplementerCreateContainerImageBuildah___run_step(
                     re.DOTALL
                 )
             )
+
+    def test_pass_digest_from_build(
+        self,
+        buildah_mock,
+        mock_determine_container_image_address_info,
+        mock_get_container_image_digest,
+        mock_add_container_build_step_result_artifacts,
+        mock_get_local_container_image_digest
+    ):
+        with TempDirectory() as temp_dir:
+            parent_work_dir_path = os.path.join(temp_dir.path, 'working')
+            temp_dir.write('Containerfile',b'''testing''')
+
+            artifact_config = {
+                'container-image-version': {'description': '', 'value': '1.0-123abc'},
+            }
+            workflow_result = self.setup_previous_result(parent_work_dir_path, artifact_config)
+
+            step_config = {
+                'imagespecfile': 'Containerfile',
+                'context': temp_dir.path,
+                'tls-verify': True,
+                'format': 'oci',
+                'organization': 'mock-org',
+                'service-name': 'mock-service',
+                'application-name': 'mock-app'
+            }
+            step_implementer = self.create_step_implementer(
+                step_config=step_config,
+                step_name='create-container-image',
+                implementer='Buildah',
+                workflow_result=workflow_result,
+                parent_work_dir_path=parent_work_dir_path
+            )
+
+            # set up mocks
+            mock_determine_container_image_address_info.return_value=[
+                'localhost/mock-org/mock-app/mock-service:1.0-123abc',
+                'mock-org/mock-app/mock-service:1.0-123abc',
+                'localhost',
+                'mock-app/mock-service',
+                '1.0-123abc'
+            ]
+            mock_get_local_container_image_digest.return_value = 'sha256:mocklocal123'
+
+            # run test
+            actual_step_result = step_implementer._run_step()
+
+            # verify results
+            mock_get_local_container_image_digest.assert_called_once_with(
+                container_image_address='localhost/mock-org/mock-app/mock-service:1.0-123abc',
+                container_image_id_file=os.path.join(
+                    step_implementer.work_dir_path,
+                    'container-image-id'
+                )
+            )
+            mock_get_container_image_digest.assert_not_called()
+            mock_add_container_build_step_result_artifacts.assert_called_once_with(
+                step_result=actual_step_result,
+                contaimer_image_registry='localhost',
+                container_image_repository='mock-app/mock-service',
+                container_image_tag='1.0-123abc',
+                container_image_digest='sha256:mocklocal123',
+                container_image_build_address='localhost/mock-org/mock-app/mock-service:1.0-123abc',
+                container_image_build_short_address='mock-org/mock-app/mock-service:1.0-123abc'
+            )
@@ -66,6 +66,9 @@ class TestStepImplementerMavenJKubeK8sBuild_step_implementer_config_defaults(
                 'maven-profiles': [],
                 'maven-additional-arguments': [],
                 'maven-no-transfer-progress': True,
+                'maven-command': 'auto',
+                'maven-threads': '1C',
+                'maven-prewarm-local-repository': False,
                 'maven-additional-arguments': [
                     '-Dmaven.install.skip=true',
                     '-Dmaven.test.skip=true'
@@ -84,6 +87,10 @@ class TestStepImplementerMavenJKubeK8sBuild__required_config_or_result_keys(
             ]
         )
 
+@patch(
+    'ploigos_step_runner.step_implementers.create_container_image.maven_jkube_k8sbuild.get_local_container_image_digest',
+    return_value=None
+)
 @patch('ploigos_step_runner.step_implementers.create_container_image.maven_jkube_k8sbuild.add_container_build_step_result_artifacts')
 @patch('ploigos_step_runner.step_implementers.create_container_image.maven_jkube_k8sbuild.get_container_image_digest')
 @patch('ploigos_step_runner.step_implementers.create_container_image.maven_jkube_k8sbuild.determine_container_image_address_info')
@@ -117,7 +124,8 @@ class TestStepImplementerMavenJKubeK8sBuild__run_step(
         mock_run_maven_step,
         mock_determine_container_image_address_info,
         mock_get_container_image_digest,
-        mock_add_container_build_step_result_artifacts
+        mock_add_container_build_step_result_artifacts,
+        mock_get_local_container_image_digest
     ):
         with TempDirectory() as test_dir:
             parent_work_dir_path = os.path.join(test_dir.path, 'working')
@@ -195,7 +203,8 @@ class TestStepImplementerMavenJKubeK8sBuild__run_step(
         mock_run_maven_step,
         mock_determine_container_image_address_info,
         mock_get_container_image_digest,
-        mock_add_container_build_step_result_artifacts
+        mock_add_container_build_step_result_artifacts,
+        mock_get_local_container_image_digest
     ):
         with TempDirectory() as test_dir:
             parent_work_dir_path = os.path.join(test_dir.path, 'working')
@@ -272,7 +281,8 @@ class TestStepImplementerMavenJKubeK8sBuild__run_step(
         mock_run_maven_step,
         mock_determine_container_image_address_info,
         mock_get_container_image_digest,
-        mock_add_container_build_step_result_artifacts
+        mock_add_container_build_step_result_artifacts,
+        mock_get_local_container_image_digest
     ):
         with TempDirectory() as test_dir:
             parent_work_dir_path = os.path.join(test_dir.path, 'working')
@@ -336,7 +346,8 @@ class TestStepImplementerMavenJKubeK8sBuild__run_step(
         mock_run_maven_step,
         mock_determine_container_image_address_info,
         mock_get_container_image_digest,
-        mock_add_container_build_step_result_artifacts
+        mock_add_container_build_step_result_artifacts,
+        mock_get_local_container_image_digest
     ):
         with TempDirectory() as test_dir:
             parent_work_dir_path = os.path.join(test_dir.path, 'working')
@@ -119,11 +119,11 @@ class TestStepImplementerSourceToImage__run_step(
 
         mock_inspect_container_image.assert_called_once_with(
             container_image_address='mock.io/awesome-image:v42',
-            containers_config_auth_file='create-container-image/container-auth.json'
+            containers_config_auth_file='container-auth.json'
         )
         mock_container_registries_login.assert_called_once_with(
             registries=None,
-            containers_config_auth_file='create-container-image/container-auth.json',
+            containers_config_auth_file='container-auth.json',
             containers_config_tls_verify=True
         )
         mock_s2i.build.assert_called_once_with(
@@ -253,7 +253,7 @@ class TestStepImplementerSourceToImage__run_step(
 
         mock_inspect_container_image.assert_called_once_with(
             container_image_address='mock.io/awesome-image:v42',
-            containers_config_auth_file='create-container-image/container-auth.json'
+            containers_config_auth_file='container-auth.json'
         )
         mock_s2i.build.assert_called_once_with(
             '.',
@@ -312,7 +312,7 @@ class TestStepImplementerSourceToImage__run_step(
 
         mock_inspect_container_image.assert_called_once_with(
             container_image_address='mock.io/awesome-image:v42',
-            containers_config_auth_file='create-container-image/container-auth.json'
+            containers_config_auth_file='container-auth.json'
         )
         mock_s2i.build.assert_called_once_with(
             '.',
@@ -376,7 +376,7 @@ class TestStepImplementerSourceToImage__run_step(
 
         mock_inspect_container_image.assert_called_once_with(
             container_image_address='mock.io/awesome-image:v42',
-            containers_config_auth_file='create-container-image/container-auth.json'
+            containers_config_auth_file='container-auth.json'
         )
         mock_s2i.build.assert_called_once_with(
             '.',
@@ -440,7 +440,7 @@ class TestStepImplementerSourceToImage__run_step(
 
         mock_inspect_container_image.assert_called_once_with(
             container_image_address='mock.io/awesome-image:v42',
-            containers_config_auth_file='create-container-image/container-auth.json'
+            containers_config_auth_file='container-auth.json'
         )
         mock_s2i.build.assert_called_once_with(
             '.',
@@ -569,7 +569,7 @@ class TestStepImplementerSourceToImage__run_step(
 
         mock_inspect_container_image.assert_called_once_with(
             container_image_address='mock.io/awesome-image:v42',
-            containers_config_auth_file='create-container-image/container-auth.json'
+            containers_config_auth_file='container-auth.json'
         )
         mock_s2i.build.assert_called_once_with(
             '.',
@@ -637,11 +637,11 @@ class TestStepImplementerSourceToImage__run_step(
 
         mock_inspect_container_image.assert_called_once_with(
             container_image_address='mock.io/awesome-image:v42',
-            containers_config_auth_file='create-container-image/container-auth.json'
+            containers_config_auth_file='container-auth.json'
         )
         mock_container_registries_login.assert_called_once_with(
             registries=None,
-            containers_config_auth_file='create-container-image/container-auth.json',
+            containers_config_auth_file='container-auth.json',
             containers_config_tls_verify=True
         )
         mock_s2i.build.assert_called_once_with(
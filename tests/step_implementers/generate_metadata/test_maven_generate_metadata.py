@@ -2,7 +2,7 @@
 # pylint: disable=missing-class-docstring
 # pylint: disable=missing-function-docstring
 import os
-from unittest.mock import patch, call, PropertyMock
+from unittest.mock import patch, PropertyMock
 
 from testfixtures import TempDirectory
 from tests.helpers.base_step_implementer_test_case import \
@@ -12,6 +12,7 @@ from ploigos_step_runner.results import StepResult
 from ploigos_step_runner.exceptions import StepRunnerException
 
 
+@patch.object(Maven, 'maven_command', 'mvn')
 class TestStepImplementerMavenGenerateMetadata(BaseStepImplementerTestCase):
     def create_step_implementer(
             self,
@@ -37,6 +38,9 @@ class TestStepImplementerMavenGenerateMetadata(BaseStepImplementerTestCase):
             'auto-increment-version-segment': None,
             'maven-additional-arguments': [],
             'maven-no-transfer-progress': True,
+            'maven-command': 'auto',
+            'maven-threads': '1C',
+            'maven-prewarm-local-repository': False,
             'maven-profiles': [],
             'pom-file': 'pom.xml',
             'tls-verify': True
@@ -159,6 +163,68 @@ class TestStepImplementerMavenGenerateMetadata(BaseStepImplementerTestCase):
 
             self.assertEqual(result, expected_step_result)
 
+    @patch.object(
+        Maven,
+        'maven_settings_file',
+        new_callable=PropertyMock,
+        return_value='/fake/settings.xml'
+    )
+    @patch('ploigos_step_runner.step_implementers.generate_metadata.maven.run_maven')
+    def test_run_step_pass_version_not_resolvable_in_process(
+            self,
+            mock_run_maven,
+            mock_maven_settings
+    ):
+        with TempDirectory() as temp_dir:
+            parent_work_dir_path = os.path.join(temp_dir.path, 'working')
+
+            temp_dir.write('pom.xml', b'''<project>
+                <modelVersion>4.0.0</modelVersion>
+                <groupId>com.mycompany.app</groupId>
+                <artifactId>my-app</artifactId>
+                <version>${revision}</version>
+            </project>''')
+            pom_file_path = os.path.join(temp_dir.path, 'pom.xml')
+
+            step_config = {
+                'pom-file': pom_file_path
+            }
+            step_implementer = self.create_step_implementer(
+                step_config=step_config,
+                step_name='generate-metadata',
+                implementer='Maven',
+                parent_work_dir_path=parent_work_dir_path,
+            )
+
+            mock_run_maven.return_value = '42.1'
+
+            result = step_implementer._run_step()
+
+            mock_run_maven.assert_called_once_with(
+                mvn_output_file_path=f'{parent_work_dir_path}/generate-metadata/mvn_evaluate_project_version.txt',
+                settings_file='/fake/settings.xml',
+                pom_file=pom_file_path,
+                phases_and_goals=[
+                    'help:evaluate'
+                ],
+                additional_arguments=[
+                    '-Dexpression=project.version',
+                    '--batch-mode',
+                    '-q',
+                    '-DforceStdout'
+                ],
+                maven_command='mvn'
+            )
+
+            expected_step_result = StepResult(
+                step_name='generate-metadata',
+                sub_step_name='Maven',
+                sub_step_implementer_name='Maven'
+            )
+            expected_step_result.add_artifact(name='app-version', value='42.1')
+
+            self.assertEqual(result, expected_step_result)
+
     @patch.object(
         Maven,
         'maven_settings_file',
@@ -194,42 +260,31 @@ class TestStepImplementerMavenGenerateMetadata(BaseStepImplementerTestCase):
                 parent_work_dir_path=parent_work_dir_path,
             )
 
-            mock_run_maven.return_value = '42.0.0'
+            # simulate maven setting the new version in the pom
+            mock_run_maven.side_effect = lambda **_kwargs: temp_dir.write(
+                'pom.xml',
+                b'<project><artifactId>my-app</artifactId><version>42.0.0</version></project>'
+            )
 
             # Invoke method under test
             result = step_implementer._run_step()
 
             # Assertions / Validations
-            mock_run_maven.assert_has_calls([
-                call(
-                    mvn_output_file_path=f'{parent_work_dir_path}/generate-metadata/mvn_versions_set_output.txt',
-                    settings_file='/fake/settings.xml',
-                    pom_file=pom_file_path,
-                    phases_and_goals=[
-                        'build-helper:parse-version',
-                        'versions:set',
-                        'versions:commit'
-                    ],
-                    additional_arguments=[
-                        r'-DnewVersion=${parsedVersion.nextMajorVersion}.0.0',
-                        '-DprocessAllModules'
-                    ]
-                ),
-                call(
-                    mvn_output_file_path=f'{parent_work_dir_path}/generate-metadata/mvn_evaluate_project_version.txt',
-                    settings_file='/fake/settings.xml',
-                    pom_file=pom_file_path,
-                    phases_and_goals=[
-                        'help:evaluate'
-                    ],
-                    additional_arguments=[
-                        '-Dexpression=project.version',
-                        '--batch-mode',
-                        '-q',
-                        '-DforceStdout'
-                    ]
-                )
-            ])
+            mock_run_maven.assert_called_once_with(
+                mvn_output_file_path=f'{parent_work_dir_path}/generate-metadata/mvn_versions_set_output.txt',
+                settings_file='/fake/settings.xml',
+                pom_file=pom_file_path,
+                phases_and_goals=[
+                    'build-helper:parse-version',
+                    'versions:set',
+                    'versions:commit'
+                ],
+                additional_arguments=[
+                    r'-DnewVersion=${parsedVersion.nextMajorVersion}.0.0',
+                    '-DprocessAllModules'
+                ],
+                maven_command='mvn'
+            )
 
             expected_step_result = StepResult(
                 step_name='generate-metadata',
@@ -281,42 +336,31 @@ class TestStepImplementerMavenGenerateMetadata(BaseStepImplementerTestCase):
                 parent_work_dir_path=parent_work_dir_path,
             )
 
-            mock_run_maven.return_value = '41.2.0'
+            # simulate maven setting the new version in the pom
+            mock_run_maven.side_effect = lambda **_kwargs: temp_dir.write(
+                'pom.xml',
+                b'<project><artifactId>my-app</artifactId><version>41.2.0</version></project>'
+            )
 
             # Invoke method under test
             result = step_implementer._run_step()
 
             # Assertions / Validations
-            mock_run_maven.assert_has_calls([
-                call(
-                    mvn_output_file_path=f'{parent_work_dir_path}/generate-metadata/mvn_versions_set_output.txt',
-                    settings_file='/fake/settings.xml',
-                    pom_file=pom_file_path,
-                    phases_and_goals=[
-                        'build-helper:parse-version',
-                        'versions:set',
-                        'versions:commit'
-                    ],
-                    additional_arguments=[
-                        r'-DnewVersion=${parsedVersion.majorVersion}.${parsedVersion.nextMinorVersion}.0',
-                        '-DprocessAllModules'
-                    ]
-                ),
-                call(
-                    mvn_output_file_path=f'{parent_work_dir_path}/generate-metadata/mvn_evaluate_project_version.txt',
-                    settings_file='/fake/settings.xml',
-                    pom_file=pom_file_path,
-                    phases_and_goals=[
-                        'help:evaluate'
-                    ],
-                    additional_arguments=[
-                        '-Dexpression=project.version',
-                        '--batch-mode',
-                        '-q',
-                        '-DforceStdout'
-                    ]
-                )
-            ])
+            mock_run_maven.assert_called_once_with(
+                mvn_output_file_path=f'{parent_work_dir_path}/generate-metadata/mvn_versions_set_output.txt',
+                settings_file='/fake/settings.xml',
+                pom_file=pom_file_path,
+                phases_and_goals=[
+                    'build-helper:parse-version',
+                    'versions:set',
+                    'versions:commit'
+                ],
+                additional_arguments=[
+                    r'-DnewVersion=${parsedVersion.majorVersion}.${parsedVersion.nextMinorVersion}.0',
+                    '-DprocessAllModules'
+                ],
+                maven_command='mvn'
+            )
 
             expected_step_result = StepResult(
                 step_name='generate-metadata',
@@ -368,44 +412,33 @@ class TestStepImplementerMavenGenerateMetadata(BaseStepImplementerTestCase):
                 parent_work_dir_path=parent_work_dir_path,
             )
 
-            mock_run_maven.return_value = '41.1.13'
+            # simulate maven setting the new version in the pom
+            mock_run_maven.side_effect = lambda **_kwargs: temp_dir.write(
+                'pom.xml',
+                b'<project><artifactId>my-app</artifactId><version>41.1.13</version></project>'
+            )
 
             # Invoke method under test
             result = step_implementer._run_step()
 
             # Assertions / Validations
-            mock_run_maven.assert_has_calls([
-                call(
-                    mvn_output_file_path=f'{parent_work_dir_path}/generate-metadata/mvn_versions_set_output.txt',
-                    settings_file='/fake/settings.xml',
-                    pom_file=pom_file_path,
-                    phases_and_goals=[
-                        'build-helper:parse-version',
-                        'versions:set',
-                        'versions:commit'
-                    ],
-                    additional_arguments=[
-                        r'-DnewVersion=${parsedVersion.majorVersion}'
-                        r'.${parsedVersion.minorVersion}'
-                        r'.${parsedVersion.nextIncrementalVersion}',
-                        '-DprocessAllModules'
-                    ]
-                ),
-                call(
-                    mvn_output_file_path=f'{parent_work_dir_path}/generate-metadata/mvn_evaluate_project_version.txt',
-                    settings_file='/fake/settings.xml',
-                    pom_file=pom_file_path,
-                    phases_and_goals=[
-                        'help:evaluate'
-                    ],
-                    additional_arguments=[
-                        '-Dexpression=project.version',
-                        '--batch-mode',
-                        '-q',
-                        '-DforceStdout'
-                    ]
-                )
-            ])
+            mock_run_maven.assert_called_once_with(
+                mvn_output_file_path=f'{parent_work_dir_path}/generate-metadata/mvn_versions_set_output.txt',
+                settings_file='/fake/settings.xml',
+                pom_file=pom_file_path,
+                phases_and_goals=[
+                    'build-helper:parse-version',
+                    'versions:set',
+                    'versions:commit'
+                ],
+                additional_arguments=[
+                    r'-DnewVersion=${parsedVersion.majorVersion}'
+                    r'.${parsedVersion.minorVersion}'
+                    r'.${parsedVersion.nextIncrementalVersion}',
+                    '-DprocessAllModules'
+                ],
+                maven_command='mvn'
+            )
 
             expected_step_result = StepResult(
                 step_name='generate-metadata',
@@ -458,43 +491,32 @@ class TestStepImplementerMavenGenerateMetadata(BaseStepImplementerTestCase):
                 parent_work_dir_path=parent_work_dir_path,
             )
 
-            mock_run_maven.return_value = '41.1.13'
+            # simulate maven setting the new version in the pom
+            mock_run_maven.side_effect = lambda **_kwargs: temp_dir.write(
+                'pom.xml',
+                b'<project><artifactId>my-app</artifactId><version>41.1.13</version></project>'
+            )
 
             # Invoke method under test
             result = step_implementer._run_step()
 
             # Assertions / Validations
-            mock_run_maven.assert_has_calls([
-                call(
-                    mvn_output_file_path=f'{parent_work_dir_path}/generate-metadata/mvn_versions_set_output.txt',
-                    settings_file='/fake/settings.xml',
-                    pom_file=pom_file_path,
-                    phases_and_goals=[
-                        'build-helper:parse-version',
-                        'versions:set',
-                        'versions:commit'
-                    ],
-                    additional_arguments=[
-                        r'-DnewVersion=${parsedVersion.majorVersion}'
-                        r'.${parsedVersion.minorVersion}'
-                        r'.${parsedVersion.nextIncrementalVersion}'
-                    ]
-                ),
-                call(
-                    mvn_output_file_path=f'{parent_work_dir_path}/generate-metadata/mvn_evaluate_project_version.txt',
-                    settings_file='/fake/settings.xml',
-                    pom_file=pom_file_path,
-                    phases_and_goals=[
-                        'help:evaluate'
-                    ],
-                    additional_arguments=[
-                        '-Dexpression=project.version',
-                        '--batch-mode',
-                        '-q',
-                        '-DforceStdout'
-                    ]
-                )
-            ])
+            mock_run_maven.assert_called_once_with(
+                mvn_output_file_path=f'{parent_work_dir_path}/generate-metadata/mvn_versions_set_output.txt',
+                settings_file='/fake/settings.xml',
+                pom_file=pom_file_path,
+                phases_and_goals=[
+                    'build-helper:parse-version',
+                    'versions:set',
+                    'versions:commit'
+                ],
+                additional_arguments=[
+                    r'-DnewVersion=${parsedVersion.majorVersion}'
+                    r'.${parsedVersion.minorVersion}'
+                    r'.${parsedVersion.nextIncrementalVersion}'
+                ],
+                maven_command='mvn'
+            )
 
             expected_step_result = StepResult(
                 step_name='generate-metadata',
@@ -566,7 +588,8 @@ class TestStepImplementerMavenGenerateMetadata(BaseStepImplementerTestCase):
                     r'.${parsedVersion.minorVersion}'
                     r'.${parsedVersion.nextIncrementalVersion}',
                     '-DprocessAllModules'
-                ]
+                ],
+                maven_command='mvn'
             )
 
             expected_step_result = StepResult(
@@ -64,6 +64,9 @@ class TestStepImplementerMavenPackage_step_implementer_config_defaults(
                 'maven-profiles': [],
                 'maven-additional-arguments': [],
                 'maven-no-transfer-progress': True,
+                'maven-command': 'auto',
+                'maven-threads': '1C',
+                'maven-prewarm-local-repository': False,
                 'maven-additional-arguments': [
                     '-Dmaven.test.skip=true'
                 ],
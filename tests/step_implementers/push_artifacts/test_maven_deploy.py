@@ -63,6 +63,9 @@ class TestStepImplementerMavenDeploy_step_implementer_config_defaults(
                 'maven-profiles': [],
                 'maven-additional-arguments': [],
                 'maven-no-transfer-progress': True,
+                'maven-command': 'auto',
+                'maven-threads': '1C',
+                'maven-prewarm-local-repository': False,
                 'maven-additional-arguments': [
                     '-Dmaven.install.skip=true',
                     '-Dmaven.test.skip=true',
@@ -87,6 +90,7 @@ class TestStepImplementerMavenDeploy__required_config_or_result_keys(
         )
 
 @patch('ploigos_step_runner.step_implementers.push_artifacts.maven_deploy.run_maven')
+@patch.object(MavenDeploy, 'maven_command', 'mvn')
 @patch.object(MavenDeploy, '_run_maven_step')
 @patch.object(
     MavenDeploy,
@@ -177,7 +181,8 @@ class TestStepImplementerMavenDeploy__run_step(
                 phases_and_goals=['versions:set'],
                 additional_arguments=[
                     f'-DnewVersion={version}'
-                ]
+                ],
+                maven_command='mvn'
             )
             mock_run_maven_step.assert_called_with(
                 mvn_output_file_path='/mock/mvn_deploy_output.txt',
@@ -252,7 +257,8 @@ class TestStepImplementerMavenDeploy__run_step(
                 phases_and_goals=['versions:set'],
                 additional_arguments=[
                     f'-DnewVersion={version}'
-                ]
+                ],
+                maven_command='mvn'
             )
             mock_run_maven_step.assert_not_called()
 
@@ -321,7 +327,8 @@ class TestStepImplementerMavenDeploy__run_step(
                 phases_and_goals=['versions:set'],
                 additional_arguments=[
                     f'-DnewVersion={version}'
-                ]
+                ],
+                maven_command='mvn'
             )
             mock_run_maven_step.assert_called_with(
                 mvn_output_file_path='/mock/mvn_deploy_output.txt',
@@ -1,6 +1,6 @@
 import os
 from io import IOBase
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import sh
 from ploigos_step_runner.results import StepResult
@@ -39,7 +39,9 @@ class TestStepImplementerSkopeoSourceBase_step_implementer_config_defaults(
             'dest-tls-verify': True,
             'container-image-pull-registry-type': 'containers-storage:',
             'container-image-push-registry-type': 'docker://',
-            'container-image-push-tag': 'latest'
+            'container-image-push-tag': 'latest',
+            'container-image-push-max-workers-per-registry': 2,
+            'container-image-push-skip-existing': True
         }
         self.assertEqual(defaults, expected_defaults)
 
@@ -61,7 +63,11 @@ class TestStepImplementerSkopeoSourceBase___required_config_or_result_keys(
         ]
         self.assertEqual(required_keys, expected_required_keys)
 
-@patch('ploigos_step_runner.step_implementers.push_container_image.skopeo.get_container_image_digest')
+@patch(
+    'ploigos_step_runner.step_implementers.push_container_image.skopeo.get_container_image_manifest_digest',
+    new=Mock(side_effect=RuntimeError('mock error reading manifest'))
+)
+@patch('ploigos_step_runner.step_implementers.push_container_image.skopeo.get_container_image_registry_digest')
 @patch.object(sh, 'skopeo', create=True)
 class TestStepImplementerSkopeoSourceBase__run_step(
     BaseTestStepImplementerSkopeoSourceBase
@@ -74,7 +80,7 @@ class TestStepImplementerSkopeoSourceBase__run_step(
         image_push_address,
         temp_dir,
         mock_skopeo,
-        mock_get_container_image_digest,
+        mock_get_container_image_registry_digest,
         mock_skopeo_call_dest_tls_value='true',
         mock_skopeo_call_src_tls_value='true',
         expected_step_result_success=True,
@@ -85,7 +91,7 @@ class TestStepImplementerSkopeoSourceBase__run_step(
         parent_work_dir_path = os.path.join(temp_dir.path, 'working')
 
         # setup mocks
-        mock_get_container_image_digest.return_value = 'sha256:mockabc123'
+        mock_get_container_image_registry_digest.return_value = 'sha256:mockabc123'
 
         # setup step
         step_implementer = self.create_step_implementer(
@@ -149,12 +155,25 @@ class TestStepImplementerSkopeoSourceBase__run_step(
                 value='fake-org/fake-app/fake-service@sha256:mockabc123',
                 description='Pushed container image short address (no registry) by digest.'
             )
+            expected_step_result.add_artifact(
+                name='container-image-push-destinations',
+                value=[{
+                    'registry': 'mock-reg.xyz',
+                    'repository': 'fake-org/fake-app/fake-service',
+                    'tags': [image_tag],
+                    'digest': 'sha256:mockabc123',
+                    'addresses-by-tag': [f'mock-reg.xyz/fake-org/fake-app/fake-service:{image_tag}'],
+                    'address-by-digest': 'mock-reg.xyz/fake-org/fake-app/fake-service@sha256:mockabc123'
+                }],
+                description='Every registry the container image was pushed to,'
+                    ' with its tags and digest in that registry.'
+            )
 
         self.assertEqual(result, expected_step_result)
 
         if not containers_config_auth_file:
             containers_config_auth_file = os.path.join(
-                step_implementer.work_dir_path,
+                step_implementer.parent_work_dir_path,
                 'container-auth.json'
             )
 
@@ -168,8 +187,13 @@ class TestStepImplementerSkopeoSourceBase__run_step(
             _err=Any(IOBase),
             _tee='err'
         )
+        mock_get_container_image_registry_digest.assert_called_once_with(
+            container_image_address=image_push_address,
+            containers_config_auth_file=containers_config_auth_file,
+            tls_verify=mock_skopeo_call_dest_tls_value == 'true'
+        )
 
-    def test_pass(self, mock_skopeo, mock_get_container_image_digest):
+    def test_pass(self, mock_skopeo, mock_get_container_image_registry_digest):
         with TempDirectory() as temp_dir:
             image_tag = '1.0-69442c8'
             image_pull_address = f'localhost/fake-org/fake-app/fake-service:{image_tag}'
@@ -187,10 +211,10 @@ class TestStepImplementerSkopeoSourceBase__run_step(
                 image_push_address=image_push_address,
                 step_config=step_config,
                 mock_skopeo=mock_skopeo,
-                mock_get_container_image_digest=mock_get_container_image_digest
+                mock_get_container_image_registry_digest=mock_get_container_image_registry_digest
             )
 
-    def test_pass_default_version(self, mock_skopeo, mock_get_container_image_digest):
+    def test_pass_default_version(self, mock_skopeo, mock_get_container_image_registry_digest):
         with TempDirectory() as temp_dir:
             image_tag = 'latest'
             image_pull_address = f'localhost/fake-org/fake-app/fake-service:{image_tag}'
@@ -207,10 +231,10 @@ class TestStepImplementerSkopeoSourceBase__run_step(
                 image_push_address=image_push_address,
                 step_config=step_config,
                 mock_skopeo=mock_skopeo,
-                mock_get_container_image_digest=mock_get_container_image_digest
+                mock_get_container_image_registry_digest=mock_get_container_image_registry_digest
             )
 
-    def test_pass_string_destination_tls_truethy(self, mock_skopeo, mock_get_container_image_digest):
+    def test_pass_string_destination_tls_truethy(self, mock_skopeo, mock_get_container_image_registry_digest):
         with TempDirectory() as temp_dir:
             image_tag = '1.0-69442c8'
             image_pull_address = f'localhost/fake-org/fake-app/fake-service:{image_tag}'
@@ -229,10 +253,10 @@ class TestStepImplementerSkopeoSourceBase__run_step(
                 image_push_address=image_push_address,
                 step_config=step_config,
                 mock_skopeo=mock_skopeo,
-                mock_get_container_image_digest=mock_get_container_image_digest
+                mock_get_container_image_registry_digest=mock_get_container_image_registry_digest
             )
 
-    def test_pass_string_destination_tls_falsy(self, mock_skopeo, mock_get_container_image_digest):
+    def test_pass_string_destination_tls_falsy(self, mock_skopeo, mock_get_container_image_registry_digest):
         with TempDirectory() as temp_dir:
             image_tag = '1.0-69442c8'
             image_pull_address = f'localhost/fake-org/fake-app/fake-service:{image_tag}'
@@ -251,11 +275,11 @@ class TestStepImplementerSkopeoSourceBase__run_step(
                 image_push_address=image_push_address,
                 step_config=step_config,
                 mock_skopeo=mock_skopeo,
-                mock_get_container_image_digest=mock_get_container_image_digest,
+                mock_get_container_image_registry_digest=mock_get_container_image_registry_digest,
                 mock_skopeo_call_dest_tls_value='false'
             )
 
-    def test_pass_string_source_tls_truthy(self, mock_skopeo, mock_get_container_image_digest):
+    def test_pass_string_source_tls_truthy(self, mock_skopeo, mock_get_container_image_registry_digest):
         with TempDirectory() as temp_dir:
             image_tag = '1.0-69442c8'
             image_pull_address = f'localhost/fake-org/fake-app/fake-service:{image_tag}'
@@ -274,10 +298,10 @@ class TestStepImplementerSkopeoSourceBase__run_step(
                 image_push_address=image_push_address,
                 step_config=step_config,
                 mock_skopeo=mock_skopeo,
-                mock_get_container_image_digest=mock_get_container_image_digest
+                mock_get_container_image_registry_digest=mock_get_container_image_registry_digest
             )
 
-    def test_pass_string_source_tls_falsy(self, mock_skopeo, mock_get_container_image_digest):
+    def test_pass_string_source_tls_falsy(self, mock_skopeo, mock_get_container_image_registry_digest):
         with TempDirectory() as temp_dir:
             image_tag = '1.0-69442c8'
             image_pull_address = f'localhost/fake-org/fake-app/fake-service:{image_tag}'
@@ -296,11 +320,11 @@ class TestStepImplementerSkopeoSourceBase__run_step(
                 image_push_address=image_push_address,
                 step_config=step_config,
                 mock_skopeo=mock_skopeo,
-                mock_get_container_image_digest=mock_get_container_image_digest,
+                mock_get_container_image_registry_digest=mock_get_container_image_registry_digest,
                 mock_skopeo_call_src_tls_value='false'
             )
 
-    def test_pass_custom_auth_file(self, mock_skopeo, mock_get_container_image_digest):
+    def test_pass_custom_auth_file(self, mock_skopeo, mock_get_container_image_registry_digest):
         with TempDirectory() as temp_dir:
             image_tag = '1.0-69442c8'
             image_pull_address = f'localhost/fake-org/fake-app/fake-service:{image_tag}'
@@ -319,11 +343,11 @@ class TestStepImplementerSkopeoSourceBase__run_step(
                 image_push_address=image_push_address,
                 step_config=step_config,
                 mock_skopeo=mock_skopeo,
-                mock_get_container_image_digest=mock_get_container_image_digest,
+                mock_get_container_image_registry_digest=mock_get_container_image_registry_digest,
                 containers_config_auth_file='mock-auth.json'
             )
 
-    def test_fail_run_skopeo(self, mock_skopeo, mock_get_container_image_digest):
+    def test_fail_run_skopeo(self, mock_skopeo, mock_get_container_image_registry_digest):
         with TempDirectory() as temp_dir:
             parent_work_dir_path = os.path.join(temp_dir.path, 'working')
 
@@ -393,7 +417,7 @@ class TestStepImplementerSkopeoSourceBase__run_step(
             self.assertEqual(result, expected_step_result)
 
             containers_config_auth_file = os.path.join(
-                step_implementer.work_dir_path,
+                step_implementer.parent_work_dir_path,
                 'container-auth.json'
             )
             mock_skopeo.copy.assert_called_once_with(
@@ -407,7 +431,7 @@ class TestStepImplementerSkopeoSourceBase__run_step(
                 _tee='err'
             )
 
-    def test_fail_getting_digest(self, mock_skopeo, mock_get_container_image_digest):
+    def test_fail_getting_digest(self, mock_skopeo, mock_get_container_image_registry_digest):
         with TempDirectory() as temp_dir:
             image_tag = '1.0-69442c8'
             image_pull_address = f'localhost/fake-org/fake-app/fake-service:{image_tag}'
@@ -419,7 +443,7 @@ class TestStepImplementerSkopeoSourceBase__run_step(
                 'container-image-push-tag': image_tag
             }
 
-            mock_get_container_image_digest.side_effect = RuntimeError('mock error getting digest')
+            mock_get_container_image_registry_digest.side_effect = RuntimeError('mock error getting digest')
 
             self.__run_test(
                 temp_dir=temp_dir,
@@ -428,9 +452,388 @@ class TestStepImplementerSkopeoSourceBase__run_step(
                 image_push_address=image_push_address,
                 step_config=step_config,
                 mock_skopeo=mock_skopeo,
-                mock_get_container_image_digest=mock_get_container_image_digest,
+                mock_get_container_image_registry_digest=mock_get_container_image_registry_digest,
                 expected_step_result_success=False,
                 expected_step_result_message="Error getting pushed container image digest:" \
                     " mock error getting digest",
                 include_digest_results=False
             )
+
+    @patch('ploigos_step_runner.step_implementers.push_container_image.skopeo.get_container_image_digest')
+    def test_pass_not_docker_push_registry_type(
+        self,
+        mock_get_container_image_digest,
+        mock_skopeo,
+        mock_get_container_image_registry_digest
+    ):
+        with TempDirectory() as temp_dir:
+            parent_work_dir_path = os.path.join(temp_dir.path, 'working')
+            image_tag = '1.0-69442c8'
+            image_pull_address = f'localhost/fake-org/fake-app/fake-service:{image_tag}'
+            step_config = {
+                'container-image-pull-address': image_pull_address,
+                'container-image-push-registry-type': 'containers-storage:',
+                'container-image-push-registry': 'mock-reg.xyz',
+                'container-image-push-repository': 'fake-org/fake-app/fake-service',
+                'container-image-push-tag': image_tag
+            }
+            step_implementer = self.create_step_implementer(
+                step_config=step_config,
+                step_name='push-container-image',
+                implementer='Skopeo',
+                parent_work_dir_path=parent_work_dir_path,
+            )
+            mock_get_container_image_digest.return_value = 'sha256:mockabc123'
+
+            result = step_implementer._run_step()
+
+            self.assertTrue(result.success)
+            self.assertEqual(
+                result.get_artifact_value('container-image-push-digest'),
+                'sha256:mockabc123'
+            )
+            mock_get_container_image_digest.assert_called_once_with(
+                container_image_address=f'mock-reg.xyz/fake-org/fake-app/fake-service:{image_tag}',
+                containers_config_auth_file=os.path.join(
+                    step_implementer.parent_work_dir_path,
+                    'container-auth.json'
+                )
+            )
+            mock_get_container_image_registry_digest.assert_not_called()
+
+@patch(
+    'ploigos_step_runner.step_implementers.push_container_image.skopeo.get_container_image_manifest_digest',
+    new=Mock(side_effect=RuntimeError('mock error reading manifest'))
+)
+@patch('ploigos_step_runner.step_implementers.push_container_image.skopeo.ContainerRegistryClient')
+@patch('ploigos_step_runner.step_implementers.push_container_image.skopeo.get_container_image_registry_digest')
+@patch.object(sh, 'skopeo', create=True)
+class TestStepImplementerSkopeoSourceBase__run_step_multiple_destinations(
+    BaseTestStepImplementerSkopeoSourceBase
+):
+    def __create_step_implementer(self, temp_dir, step_config):
+        return self.create_step_implementer(
+            step_config={
+                'container-image-pull-address': 'localhost/fake-org/fake-service:1.0',
+                'container-image-push-registry': ['mock-reg.xyz', 'mock-dr.xyz', 'mock-reg.xyz'],
+                'container-image-push-repository': 'fake-org/fake-service',
+                'container-image-push-tag': '1.0',
+                'container-image-push-additional-tags': ['latest', 'abc123', '1.0'],
+                **step_config
+            },
+            step_name='push-container-image',
+            implementer='Skopeo',
+            parent_work_dir_path=os.path.join(temp_dir.path, 'working')
+        )
+
+    def test_pass(
+        self,
+        mock_skopeo,
+        mock_get_container_image_registry_digest,
+        mock_container_registry_client
+    ):
+        with TempDirectory() as temp_dir:
+            step_implementer = self.__create_step_implementer(temp_dir, {})
+            mock_get_container_image_registry_digest.side_effect = \
+                lambda container_image_address, **kwargs: \
+                    f"sha256:{container_image_address.split('/')[0]}"
+            mock_registry_client = mock_container_registry_client.return_value
+            mock_registry_client.get_manifest.return_value = (b'mock-manifest', 'mock-media-type')
+
+            result = step_implementer._run_step()
+
+            self.assertTrue(result.success)
+            self.assertEqual(result.get_artifact_value('container-image-push-registry'), 'mock-reg.xyz')
+            self.assertEqual(result.get_artifact_value('container-image-push-tag'), '1.0')
+            self.assertEqual(
+                result.get_artifact_value('container-image-push-digest'),
+                'sha256:mock-reg.xyz'
+            )
+            self.assertEqual(
+                result.get_artifact_value('container-image-push-destinations'),
+                [
+                    {
+                        'registry': registry,
+                        'repository': 'fake-org/fake-service',
+                        'tags': ['1.0', 'latest', 'abc123'],
+                        'digest': f'sha256:{registry}',
+                        'addresses-by-tag': [
+                            f'{registry}/fake-org/fake-service:1.0',
+                            f'{registry}/fake-org/fake-service:latest',
+                            f'{registry}/fake-org/fake-service:abc123'
+                        ],
+                        'address-by-digest': f'{registry}/fake-org/fake-service@sha256:{registry}'
+                    }
+                    for registry in ['mock-reg.xyz', 'mock-dr.xyz']
+                ]
+            )
+
+            # copied once per registry, other tags added with the registry API
+            self.assertEqual(
+                sorted(copy_call.args[4] for copy_call in mock_skopeo.copy.call_args_list),
+                [
+                    'docker://mock-dr.xyz/fake-org/fake-service:1.0',
+                    'docker://mock-reg.xyz/fake-org/fake-service:1.0'
+                ]
+            )
+            self.assertEqual(
+                sorted(
+                    (put_call.args[0], put_call.args[2])
+                    for put_call in mock_registry_client.put_manifest.call_args_list
+                ),
+                [
+                    ('mock-dr.xyz', 'abc123'),
+                    ('mock-dr.xyz', 'latest'),
+                    ('mock-reg.xyz', 'abc123'),
+                    ('mock-reg.xyz', 'latest')
+                ]
+            )
+            mock_registry_client.put_manifest.assert_any_call(
+                'mock-reg.xyz',
+                'fake-org/fake-service',
+                'latest',
+                b'mock-manifest',
+                'mock-media-type'
+            )
+
+    def test_pass_not_docker_push_registry_type(
+        self,
+        mock_skopeo,
+        mock_get_container_image_registry_digest,
+        mock_container_registry_client
+    ):
+        with TempDirectory() as temp_dir:
+            step_implementer = self.__create_step_implementer(temp_dir, {
+                'container-image-push-registry': 'mock-reg.xyz',
+                'container-image-push-registry-type': 'containers-storage:'
+            })
+
+            with patch(
+                'ploigos_step_runner.step_implementers.push_container_image.skopeo.'
+                'get_container_image_digest',
+                return_value='sha256:mockabc123'
+            ):
+                result = step_implementer._run_step()
+
+            self.assertTrue(result.success)
+            self.assertEqual(
+                sorted(copy_call.args[4] for copy_call in mock_skopeo.copy.call_args_list),
+                [
+                    'containers-storage:mock-reg.xyz/fake-org/fake-service:1.0',
+                    'containers-storage:mock-reg.xyz/fake-org/fake-service:abc123',
+                    'containers-storage:mock-reg.xyz/fake-org/fake-service:latest'
+                ]
+            )
+            mock_container_registry_client.assert_not_called()
+
+    def test_fail_one_registry(
+        self,
+        mock_skopeo,
+        mock_get_container_image_registry_digest,
+        mock_container_registry_client
+    ):
+        with TempDirectory() as temp_dir:
+            step_implementer = self.__create_step_implementer(temp_dir, {})
+            mock_get_container_image_registry_digest.return_value = 'sha256:mockabc123'
+            mock_container_registry_client.return_value.get_manifest.return_value = \
+                (b'mock-manifest', 'mock-media-type')
+
+            def skopeo_copy_side_effect(*args, **kwargs):
+                if 'mock-dr.xyz' in args[4]:
+                    raise sh.ErrorReturnCode('skopeo', b'mock stdout', b'mock error')
+            mock_skopeo.copy.side_effect = skopeo_copy_side_effect
+
+            result = step_implementer._run_step()
+
+            self.assertFalse(result.success)
+            self.assertRegex(
+                result.message,
+                r'Error pushing container image \(localhost/fake-org/fake-service:1.0\)'
+                r'  to tag \(mock-dr.xyz/fake-org/fake-service:1.0\) using skopeo'
+            )
+            self.assertEqual(
+                [
+                    destination['registry'] for destination in
+                    result.get_artifact_value('container-image-push-destinations')
+                ],
+                ['mock-reg.xyz']
+            )
+
+    def test_fail_additional_tag(
+        self,
+        mock_skopeo,
+        mock_get_container_image_registry_digest,
+        mock_container_registry_client
+    ):
+        with TempDirectory() as temp_dir:
+            step_implementer = self.__create_step_implementer(temp_dir, {
+                'container-image-push-registry': 'mock-reg.xyz'
+            })
+            mock_registry_client = mock_container_registry_client.return_value
+            mock_registry_client.get_manifest.return_value = (b'mock-manifest', 'mock-media-type')
+            mock_registry_client.put_manifest.side_effect = RuntimeError('mock put error')
+
+            result = step_implementer._run_step()
+
+            self.assertFalse(result.success)
+            self.assertEqual(
+                result.message,
+                'Error tagging pushed container image (mock-reg.xyz/fake-org/fake-service:1.0)'
+                ' with additional tags (latest, abc123): mock put error'
+            )
+            self.assertIsNone(result.get_artifact_value('container-image-push-destinations'))
+            mock_get_container_image_registry_digest.assert_not_called()
+
+@patch('ploigos_step_runner.step_implementers.push_container_image.skopeo.get_container_image_manifest_digest')
+@patch('ploigos_step_runner.step_implementers.push_container_image.skopeo.ContainerRegistryClient')
+@patch('ploigos_step_runner.step_implementers.push_container_image.skopeo.get_container_image_registry_digest')
+@patch.object(sh, 'skopeo', create=True)
+class TestStepImplementerSkopeoSourceBase__run_step_skip_existing(
+    BaseTestStepImplementerSkopeoSourceBase
+):
+    def __create_step_implementer(self, temp_dir, step_config=None):
+        return self.create_step_implementer(
+            step_config={
+                'container-image-pull-address': 'localhost/fake-org/fake-service:1.0',
+                'container-image-push-registry': 'mock-reg.xyz',
+                'container-image-push-repository': 'fake-org/fake-service',
+                'container-image-push-tag': '1.0',
+                **(step_config or {})
+            },
+            step_name='push-container-image',
+            implementer='Skopeo',
+            parent_work_dir_path=os.path.join(temp_dir.path, 'working')
+        )
+
+    def test_skip_same_digest(
+        self,
+        mock_skopeo,
+        mock_get_container_image_registry_digest,
+        mock_container_registry_client,
+        mock_get_container_image_manifest_digest
+    ):
+        with TempDirectory() as temp_dir:
+            step_implementer = self.__create_step_implementer(temp_dir)
+            mock_get_container_image_manifest_digest.return_value = 'sha256:mocksource'
+            mock_container_registry_client.return_value.get_manifest_digest.return_value = \
+                'sha256:mocksource'
+
+            result = step_implementer._run_step()
+
+            self.assertTrue(result.success)
+            self.assertEqual(
+                result.message,
+                'Push of container image (localhost/fake-org/fake-service:1.0) to'
+                ' (mock-reg.xyz/fake-org/fake-service:1.0) skipped: already present'
+            )
+            self.assertEqual(
+                result.get_artifact_value('container-image-push-digest'),
+                'sha256:mocksource'
+            )
+            self.assertEqual(
+                result.get_artifact_value('container-image-address-by-digest'),
+                'mock-reg.xyz/fake-org/fake-service@sha256:mocksource'
+            )
+            self.assertEqual(
+                result.get_artifact_value('container-image-address-by-tag'),
+                'mock-reg.xyz/fake-org/fake-service:1.0'
+            )
+            mock_get_container_image_manifest_digest.assert_called_once_with(
+                container_image_address='containers-storage:localhost/fake-org/fake-service:1.0',
+                containers_config_auth_file=os.path.join(
+                    step_implementer.parent_work_dir_path,
+                    'container-auth.json'
+                ),
+                tls_verify=True
+            )
+            mock_container_registry_client.return_value.get_manifest_digest.assert_called_once_with(
+                'mock-reg.xyz',
+                'fake-org/fake-service',
+                '1.0'
+            )
+            mock_skopeo.copy.assert_not_called()
+            mock_get_container_image_registry_digest.assert_not_called()
+
+    def test_push_then_skip_recorded_digest(
+        self,
+        mock_skopeo,
+        mock_get_container_image_registry_digest,
+        mock_container_registry_client,
+        mock_get_container_image_manifest_digest
+    ):
+        with TempDirectory() as temp_dir:
+            mock_get_container_image_manifest_digest.return_value = 'sha256:mocksource'
+            mock_get_manifest_digest = \
+                mock_container_registry_client.return_value.get_manifest_digest
+            mock_get_container_image_registry_digest.return_value = 'sha256:mockpushed'
+
+            # first run, destination has another image
+            mock_get_manifest_digest.return_value = 'sha256:mockother'
+            result = self.__create_step_implementer(temp_dir)._run_step()
+
+            self.assertTrue(result.success)
+            self.assertEqual(result.message, '')
+            self.assertEqual(
+                result.get_artifact_value('container-image-push-digest'),
+                'sha256:mockpushed'
+            )
+            mock_skopeo.copy.assert_called_once()
+
+            # second run, destination has the image as pushed by the first run
+            mock_skopeo.reset_mock()
+            mock_get_container_image_registry_digest.reset_mock()
+            mock_get_manifest_digest.return_value = 'sha256:mockpushed'
+            result = self.__create_step_implementer(temp_dir)._run_step()
+
+            self.assertTrue(result.success)
+            self.assertRegex(result.message, r'skipped: already present')
+            self.assertEqual(
+                result.get_artifact_value('container-image-push-digest'),
+                'sha256:mockpushed'
+            )
+            mock_skopeo.copy.assert_not_called()
+            mock_get_container_image_registry_digest.assert_not_called()
+
+    def test_push_when_not_in_destination(
+        self,
+        mock_skopeo,
+        mock_get_container_image_registry_digest,
+        mock_container_registry_client,
+        mock_get_container_image_manifest_digest
+    ):
+        with TempDirectory() as temp_dir:
+            mock_get_container_image_manifest_digest.return_value = 'sha256:mocksource'
+            mock_container_registry_client.return_value.get_manifest_digest.side_effect = \
+                RuntimeError('mock not found')
+            mock_get_container_image_registry_digest.return_value = 'sha256:mockpushed'
+
+            result = self.__create_step_implementer(temp_dir)._run_step()
+
+            self.assertTrue(result.success)
+            mock_skopeo.copy.assert_called_once()
+            self.assertEqual(
+                result.get_artifact_value('container-image-push-digest'),
+                'sha256:mockpushed'
+            )
+
+    def test_skip_existing_disabled(
+        self,
+        mock_skopeo,
+        mock_get_container_image_registry_digest,
+        mock_container_registry_client,
+        mock_get_container_image_manifest_digest
+    ):
+        with TempDirectory() as temp_dir:
+            mock_get_container_image_registry_digest.return_value = 'sha256:mockpushed'
+
+            result = self.__create_step_implementer(temp_dir, {
+                'container-image-push-skip-existing': False
+            })._run_step()
+
+            self.assertTrue(result.success)
+            mock_skopeo.copy.assert_called_once()
+            mock_get_container_image_manifest_digest.assert_not_called()
+            mock_container_registry_client.return_value.get_manifest_digest.assert_not_called()
+            self.assertFalse(os.path.exists(
+                os.path.join(temp_dir.path, 'working', 'container-image-push-records.json')
+            ))
@@ -1,3 +1,4 @@
+import gzip
 import os
 import zipfile
 from pathlib import Path
@@ -731,3 +732,60 @@ class TestStepImplementerResultArtifactsArchive__create_archive(TestStepImplemen
                 artifact_file_contents = artifact_file.read().decode('UTF-8')
 
                 self.assertEqual(artifact_file_contents, 'hello world file contents')
+
+    def test_compressed_file_result_stored(self):
+        with TempDirectory() as temp_dir:
+            parent_work_dir_path = os.path.join(temp_dir.path, 'working')
+            step_config = {
+                'organization': 'test-ORG',
+                'application-name': 'test-APP',
+                'service-name': 'test-SERVICE',
+                'version': '42.0-test'
+            }
+
+            compressed_file_contents = gzip.compress(b'hello world compressed file contents')
+            temp_dir.write('test-output.txt.gz', compressed_file_contents)
+            temp_dir.write('test-artifact.txt', bytes('hello world file contents', 'utf-8'))
+
+            step_result = StepResult(
+                step_name='test-step',
+                sub_step_name='test-sub-step',
+                sub_step_implementer_name='test-sub-step-implementer'
+            )
+            step_result.add_artifact(
+                name='test-step-result-compressed',
+                value=os.path.join(temp_dir.path, 'test-output.txt.gz')
+            )
+            step_result.add_artifact(
+                name='test-step-result-str',
+                value=os.path.join(temp_dir.path, 'test-artifact.txt')
+            )
+            workflow_result = WorkflowResult()
+            workflow_result.add_step_result(step_result)
+
+            step_implementer = self.create_step_implementer(
+                step_config=step_config,
+                parent_work_dir_path=parent_work_dir_path,
+                workflow_result=workflow_result
+            )
+
+            archive_path = step_implementer._ResultArtifactsArchive__create_archive()
+
+            archive_zip = zipfile.ZipFile(archive_path)
+
+            archive_dir_path = f"{step_config['organization']}-" \
+                f"{step_config['application-name']}-{step_config['service-name']}-" \
+                f"{step_config['version']}/test-step/test-sub-step"
+            compressed_file_info = archive_zip.getinfo(
+                f"{archive_dir_path}/test-step-result-compressed/test-output.txt.gz"
+            )
+            self.assertEqual(compressed_file_info.compress_type, zipfile.ZIP_STORED)
+            self.assertEqual(
+                archive_zip.read(compressed_file_info),
+                compressed_file_contents
+            )
+
+            artifact_file_info = archive_zip.getinfo(
+                f"{archive_dir_path}/test-step-result-str/test-artifact.txt"
+            )
+            self.assertEqual(artifact_file_info.compress_type, zipfile.ZIP_DEFLATED)
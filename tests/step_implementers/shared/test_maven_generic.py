@@ -1,4 +1,5 @@
 import os
+from io import StringIO
 from pathlib import Path
 from shutil import copyfile
 from unittest.mock import PropertyMock, patch
@@ -9,10 +10,10 @@ from ploigos_step_runner.results import WorkflowResult
 from ploigos_step_runner.config import Config
 from ploigos_step_runner.step_implementers.shared.maven_generic import \
     MavenGeneric
-from ploigos_step_runner.utils.file import create_parent_dir
 from testfixtures import TempDirectory
 from tests.helpers.base_step_implementer_test_case import \
     BaseStepImplementerTestCase
+from tests.helpers.test_utils import Any
 
 
 @patch("ploigos_step_runner.step_implementer.StepImplementer.__init__")
@@ -94,7 +95,10 @@ class TestStepImplementerSharedMavenGeneric_step_implementer_config_defaults(
                 'tls-verify': True,
                 'maven-profiles': [],
                 'maven-additional-arguments': [],
-                'maven-no-transfer-progress': True
+                'maven-no-transfer-progress': True,
+                'maven-command': 'auto',
+                'maven-threads': '1C',
+                'maven-prewarm-local-repository': False
             }
         )
 
@@ -270,7 +274,8 @@ class TestStepImplementerSharedMavenGeneric_maven_settings_file(
                 working_dir=step_implementer.work_dir_path,
                 maven_servers=None,
                 maven_repositories=None,
-                maven_mirrors=None
+                maven_mirrors=None,
+                local_repository=None
             )
 
             # call second time
@@ -333,7 +338,8 @@ class TestStepImplementerSharedMavenGeneric_maven_settings_file(
                 working_dir=step_implementer.work_dir_path,
                 maven_servers=maven_servers,
                 maven_repositories=maven_repositories,
-                maven_mirrors=maven_mirrors
+                maven_mirrors=maven_mirrors,
+                local_repository=None
             )
 
             # call second time
@@ -345,17 +351,21 @@ class TestStepImplementerSharedMavenGeneric_maven_settings_file(
             )
             mock_gen_mvn_settings.assert_not_called()
 
-@patch('ploigos_step_runner.step_implementers.shared.maven_generic.write_effective_pom')
-class TestStepImplementerSharedMavenGeneric__get_effective_pom(
+@patch(
+    "ploigos_step_runner.step_implementers.shared.maven_generic.resolve_maven_command",
+    return_value='mvnd'
+)
+class TestStepImplementerSharedMavenGeneric_maven_command(
     BaseTestStepImplementerSharedMavenGeneric
 ):
-    def test_call_once(self, write_effective_pom_mock):
+    def test_resolved_once(self, mock_resolve_maven_command):
         with TempDirectory() as test_dir:
             parent_work_dir_path = os.path.join(test_dir.path, 'working')
 
-            pom_file_path = os.path.join(test_dir.path, 'pom.xml')
             step_config = {
-                'pom-file': pom_file_path
+                'pom-file': os.path.join(test_dir.path, 'pom.xml'),
+                'maven-phases-and-goals': 'fake-phase',
+                'maven-command': 'auto'
             }
 
             step_implementer = self.create_step_implementer(
@@ -363,111 +373,156 @@ class TestStepImplementerSharedMavenGeneric__get_effective_pom(
                 parent_work_dir_path=parent_work_dir_path,
             )
 
+            # call first time
+            self.assertEqual(step_implementer.maven_command, 'mvnd')
+            mock_resolve_maven_command.assert_called_once_with('auto')
+
+            # call second time
+            mock_resolve_maven_command.reset_mock()
+            self.assertEqual(step_implementer.maven_command, 'mvnd')
+            mock_resolve_maven_command.assert_not_called()
+
+@patch('ploigos_step_runner.utils.maven.write_effective_pom')
+@patch.object(MavenGeneric, 'maven_command', 'mvn')
+class TestStepImplementerSharedMavenGeneric__get_effective_pom(
+    BaseTestStepImplementerSharedMavenGeneric
+):
+    @staticmethod
+    def __write_effective_pom_mock_side_effect(
+        pom_file_path,
+        output_path,
+        profiles,
+        settings_file,
+        maven_command
+    ):
+        copyfile(pom_file_path, output_path)
+
+    def __create_step_implementer(self, test_dir, step_name, step_config):
+        return self.create_given_step_implementer(
+            step_implementer=MavenGeneric,
+            step_config=step_config,
+            step_name=step_name,
+            implementer='MavenGeneric',
+            parent_work_dir_path=os.path.join(test_dir.path, 'working')
+        )
+
+    def test_call_once(self, write_effective_pom_mock):
+        with TempDirectory() as test_dir:
+            pom_file_path = os.path.join(test_dir.path, 'pom.xml')
+            step_config = {
+                'pom-file': pom_file_path
+            }
+
+            step_implementer = self.__create_step_implementer(test_dir, 'foo', step_config)
+
             # mock effective pom
-            Path(pom_file_path).touch()
-            def write_effective_pom_mock_side_effect(pom_file_path, output_path, profiles):
-                create_parent_dir(pom_file_path)
-                copyfile(pom_file_path, output_path)
-            write_effective_pom_mock.side_effect = write_effective_pom_mock_side_effect
+            test_dir.write('pom.xml', b'<project></project>')
+            write_effective_pom_mock.side_effect = self.__write_effective_pom_mock_side_effect
 
             # first call
-            expected_effective_pom_path = os.path.join(
-                step_implementer.work_dir_path,
-                'effective-pom.xml'
-            )
             actual_effective_pom_path = step_implementer._get_effective_pom()
-            self.assertEqual(actual_effective_pom_path, expected_effective_pom_path)
+            self.assertEqual(
+                os.path.dirname(actual_effective_pom_path),
+                os.path.join(test_dir.path, 'working', 'maven-effective-pom-cache')
+            )
+            self.assertTrue(os.path.exists(actual_effective_pom_path))
             write_effective_pom_mock.assert_called_once_with(
                 pom_file_path=pom_file_path,
-                output_path=expected_effective_pom_path,
-                profiles=[]
+                output_path=Any(str),
+                profiles=[],
+                settings_file=step_implementer.maven_settings_file,
+                maven_command='mvn'
             )
 
-    def test__get_effective_pom_call_twice(self, write_effective_pom_mock):
+    def test_call_twice_from_different_steps(self, write_effective_pom_mock):
         with TempDirectory() as test_dir:
-            parent_work_dir_path = os.path.join(test_dir.path, 'working')
-
             pom_file_path = os.path.join(test_dir.path, 'pom.xml')
             step_config = {
                 'pom-file': pom_file_path
             }
 
-            step_implementer = self.create_step_implementer(
-                step_config=step_config,
-                parent_work_dir_path=parent_work_dir_path,
-            )
-
             # mock effective pom
-            Path(pom_file_path).touch()
-            def write_effective_pom_mock_side_effect(pom_file_path, output_path, profiles):
-                create_parent_dir(pom_file_path)
-                copyfile(pom_file_path, output_path)
-            write_effective_pom_mock.side_effect = write_effective_pom_mock_side_effect
+            test_dir.write('pom.xml', b'<project></project>')
+            write_effective_pom_mock.side_effect = self.__write_effective_pom_mock_side_effect
 
             # first call
-            expected_effective_pom_path = os.path.join(
-                step_implementer.work_dir_path,
-                'effective-pom.xml'
-            )
-            actual_effective_pom_path = step_implementer._get_effective_pom()
-            self.assertEqual(actual_effective_pom_path, expected_effective_pom_path)
-            write_effective_pom_mock.assert_called_once_with(
-                pom_file_path=pom_file_path,
-                output_path=expected_effective_pom_path,
-                profiles=[]
-            )
+            step_implementer = self.__create_step_implementer(test_dir, 'foo', step_config)
+            first_effective_pom_path = step_implementer._get_effective_pom()
+            write_effective_pom_mock.assert_called_once()
 
-            # second call
+            # second call from a different step shares the cached effective pom
             write_effective_pom_mock.reset_mock()
-            expected_effective_pom_path = os.path.join(
-                step_implementer.work_dir_path,
-                'effective-pom.xml'
-            )
-            actual_effective_pom_path = step_implementer._get_effective_pom()
-            self.assertEqual(actual_effective_pom_path, expected_effective_pom_path)
+            step_implementer = self.__create_step_implementer(test_dir, 'bar', step_config)
+            second_effective_pom_path = step_implementer._get_effective_pom()
+            self.assertEqual(second_effective_pom_path, first_effective_pom_path)
             write_effective_pom_mock.assert_not_called()
 
-    def test_call_with_profiles(self, write_effective_pom_mock):
+    def test_call_again_after_pom_change(self, write_effective_pom_mock):
         with TempDirectory() as test_dir:
-            parent_work_dir_path = os.path.join(test_dir.path, 'working')
-
             pom_file_path = os.path.join(test_dir.path, 'pom.xml')
             step_config = {
-                'pom-file': pom_file_path,
-                'maven-profiles': ['mock-profile1']
+                'pom-file': pom_file_path
             }
 
-            step_implementer = self.create_step_implementer(
-                step_config=step_config,
-                parent_work_dir_path=parent_work_dir_path,
-            )
+            # mock effective pom
+            test_dir.write('pom.xml', b'<project><modules><module>sub</module></modules></project>')
+            test_dir.write('sub/pom.xml', b'<project><version>1</version></project>')
+            write_effective_pom_mock.side_effect = self.__write_effective_pom_mock_side_effect
+
+            # first call
+            step_implementer = self.__create_step_implementer(test_dir, 'foo', step_config)
+            first_effective_pom_path = step_implementer._get_effective_pom()
+            write_effective_pom_mock.assert_called_once()
+
+            # change module pom
+            write_effective_pom_mock.reset_mock()
+            test_dir.write('sub/pom.xml', b'<project><version>2</version></project>')
+
+            # second call regenerates the effective pom
+            second_effective_pom_path = step_implementer._get_effective_pom()
+            self.assertNotEqual(second_effective_pom_path, first_effective_pom_path)
+            write_effective_pom_mock.assert_called_once()
+
+    def test_call_with_profiles(self, write_effective_pom_mock):
+        with TempDirectory() as test_dir:
+            pom_file_path = os.path.join(test_dir.path, 'pom.xml')
+            step_config = {
+                'pom-file': pom_file_path
+            }
 
             # mock effective pom
-            Path(pom_file_path).touch()
-            def write_effective_pom_mock_side_effect(pom_file_path, output_path, profiles):
-                create_parent_dir(pom_file_path)
-                copyfile(pom_file_path, output_path)
-            write_effective_pom_mock.side_effect = write_effective_pom_mock_side_effect
+            test_dir.write('pom.xml', b'<project></project>')
+            write_effective_pom_mock.side_effect = self.__write_effective_pom_mock_side_effect
 
             # first call
-            expected_effective_pom_path = os.path.join(
-                step_implementer.work_dir_path,
-                'effective-pom.xml'
+            step_implementer = self.__create_step_implementer(test_dir, 'foo', step_config)
+            first_effective_pom_path = step_implementer._get_effective_pom()
+
+            # second call with profiles
+            write_effective_pom_mock.reset_mock()
+            step_implementer = self.__create_step_implementer(
+                test_dir,
+                'foo',
+                {
+                    'pom-file': pom_file_path,
+                    'maven-profiles': ['mock-profile1']
+                }
             )
-            actual_effective_pom_path = step_implementer._get_effective_pom()
-            self.assertEqual(actual_effective_pom_path, expected_effective_pom_path)
+            second_effective_pom_path = step_implementer._get_effective_pom()
+            self.assertNotEqual(second_effective_pom_path, first_effective_pom_path)
             write_effective_pom_mock.assert_called_once_with(
                 pom_file_path=pom_file_path,
-                output_path=expected_effective_pom_path,
-                profiles=['mock-profile1']
+                output_path=Any(str),
+                profiles=['mock-profile1'],
+                settings_file=step_implementer.maven_settings_file,
+                maven_command='mvn'
             )
 
-@patch('ploigos_step_runner.step_implementers.shared.maven_generic.get_xml_element_by_path')
 @patch.object(MavenGeneric, '_get_effective_pom')
 class TestStepImplementerSharedMavenGeneric__get_effective_pom_element(
     BaseTestStepImplementerSharedMavenGeneric
 ):
-    def test_result(self, get_effective_pom_mock, get_xml_element_by_path_mock):
+    def test_result(self, get_effective_pom_mock):
         with TempDirectory() as test_dir:
             parent_work_dir_path = os.path.join(test_dir.path, 'working')
 
@@ -481,19 +536,20 @@ class TestStepImplementerSharedMavenGeneric__get_effective_pom_element(
                 parent_work_dir_path=parent_work_dir_path,
             )
 
-            def get_effective_pom_side_effect():
-                return '/does/not/matter/pom.xml'
-            get_effective_pom_mock.side_effect = get_effective_pom_side_effect
+            test_dir.write(
+                'effective-pom.xml',
+                b'<project xmlns="http://maven.apache.org/POM/4.0.0"><foo>bar</foo></project>'
+            )
+            get_effective_pom_mock.return_value = os.path.join(test_dir.path, 'effective-pom.xml')
 
-            step_implementer._get_effective_pom_element('foo')
+            element = step_implementer._get_effective_pom_element('mvn:foo')
             get_effective_pom_mock.assert_called_once_with()
-            get_xml_element_by_path_mock.assert_called_once_with(
-                '/does/not/matter/pom.xml',
-                'foo',
-                default_namespace='mvn'
-            )
+            self.assertEqual(element.text, 'bar')
+
+            self.assertIsNone(step_implementer._get_effective_pom_element('mvn:missing'))
 
 @patch('ploigos_step_runner.step_implementers.shared.maven_generic.run_maven')
+@patch.object(MavenGeneric, 'maven_command', 'mvn')
 @patch.object(
     MavenGeneric,
     'maven_phases_and_goals',
@@ -536,7 +592,9 @@ class TestStepImplementerSharedMavenGeneric__run_maven_step(
                 tls_verify=True,
                 profiles=[],
                 no_transfer_progress=True,
-                settings_file='/fake/settings.xml'
+                settings_file='/fake/settings.xml',
+                maven_command='mvn',
+                threads='1C'
             )
 
 
@@ -568,7 +626,9 @@ class TestStepImplementerSharedMavenGeneric__run_maven_step(
                 tls_verify=True,
                 profiles=['fake-profile-1', 'fakse-profile-2'],
                 no_transfer_progress=True,
-                settings_file='/fake/settings.xml'
+                settings_file='/fake/settings.xml',
+                maven_command='mvn',
+                threads='1C'
             )
 
     def test_no_tls_verify(self, mock_settings_file, mock_phases_and_goals, mock_run_maven):
@@ -599,7 +659,9 @@ class TestStepImplementerSharedMavenGeneric__run_maven_step(
                 tls_verify=False,
                 profiles=[],
                 no_transfer_progress=True,
-                settings_file='/fake/settings.xml'
+                settings_file='/fake/settings.xml',
+                maven_command='mvn',
+                threads='1C'
             )
 
     def test_yes_transfer_progress(self, mock_settings_file, mock_phases_and_goals, mock_run_maven):
@@ -630,7 +692,9 @@ class TestStepImplementerSharedMavenGeneric__run_maven_step(
                 tls_verify=True,
                 profiles=[],
                 no_transfer_progress=False,
-                settings_file='/fake/settings.xml'
+                settings_file='/fake/settings.xml',
+                maven_command='mvn',
+                threads='1C'
             )
 
     def test_config_additional_arguments(
@@ -666,7 +730,9 @@ class TestStepImplementerSharedMavenGeneric__run_maven_step(
                 tls_verify=True,
                 profiles=[],
                 no_transfer_progress=True,
-                settings_file='/fake/settings.xml'
+                settings_file='/fake/settings.xml',
+                maven_command='mvn',
+                threads='1C'
             )
 
     def test_step_implementer_additional_arguments(
@@ -702,7 +768,9 @@ class TestStepImplementerSharedMavenGeneric__run_maven_step(
                 tls_verify=True,
                 profiles=[],
                 no_transfer_progress=True,
-                settings_file='/fake/settings.xml'
+                settings_file='/fake/settings.xml',
+                maven_command='mvn',
+                threads='1C'
             )
 
     def test_step_implementer_additional_arguments_and_config_additional_arguments(
@@ -739,8 +807,243 @@ class TestStepImplementerSharedMavenGeneric__run_maven_step(
                 tls_verify=True,
                 profiles=[],
                 no_transfer_progress=True,
-                settings_file='/fake/settings.xml'
+                settings_file='/fake/settings.xml',
+                maven_command='mvn',
+                threads='1C'
+            )
+
+    @patch.object(MavenGeneric, '_prewarm_maven_local_repository')
+    def test_local_repository(
+        self,
+        mock_prewarm,
+        mock_settings_file,
+        mock_phases_and_goals,
+        mock_run_maven
+    ):
+        with TempDirectory() as test_dir:
+            parent_work_dir_path = os.path.join(test_dir.path, 'working')
+
+            pom_file_path = os.path.join(test_dir.path, 'pom.xml')
+            step_config = {
+                'pom-file': pom_file_path,
+                'maven-local-repository': '/mock/local-repository',
+                'maven-additional-arguments': ['-Dfake.config.arg=True']
+            }
+
+            step_implementer = self.create_step_implementer(
+                step_config=step_config,
+                parent_work_dir_path=parent_work_dir_path,
+            )
+
+            mvn_output_file_path = os.path.join(test_dir.path, 'maven-output.txt')
+            step_implementer._run_maven_step(
+                mvn_output_file_path=mvn_output_file_path
+            )
+
+            mock_prewarm.assert_called_once_with()
+            mock_run_maven.assert_called_with(
+                mvn_output_file_path=mvn_output_file_path,
+                phases_and_goals=['fake-phase'],
+                additional_arguments=['-Dfake.config.arg=True'],
+                pom_file=pom_file_path,
+                tls_verify=True,
+                profiles=[],
+                no_transfer_progress=True,
+                settings_file='/fake/settings.xml',
+                maven_command='mvn',
+                threads='1C'
+            )
+
+@patch('ploigos_step_runner.step_implementers.shared.maven_generic.run_maven')
+@patch.object(MavenGeneric, 'maven_command', 'mvn')
+@patch.object(MavenGeneric, '_get_effective_pom')
+@patch.object(
+    MavenGeneric,
+    'maven_settings_file',
+    new_callable=PropertyMock,
+    return_value='/fake/settings.xml'
+)
+class TestStepImplementerSharedMavenGeneric__prewarm_maven_local_repository(
+    BaseTestStepImplementerSharedMavenGeneric
+):
+    EFFECTIVE_POM = b"""<project>
+        <dependencies>
+            <dependency>
+                <groupId>com.example</groupId>
+                <artifactId>mock-dependency</artifactId>
+                <version>1.0.0</version>
+            </dependency>
+        </dependencies>
+    </project>"""
+
+    def __create_step_implementer(self, test_dir, get_effective_pom_mock, **step_config):
+        test_dir.write('effective-pom.xml', self.EFFECTIVE_POM)
+        get_effective_pom_mock.return_value = os.path.join(test_dir.path, 'effective-pom.xml')
+
+        return self.create_step_implementer(
+            step_config={
+                'pom-file': os.path.join(test_dir.path, 'pom.xml'),
+                **step_config
+            },
+            parent_work_dir_path=os.path.join(test_dir.path, 'working'),
+        )
+
+    def test_no_local_repository(self, mock_settings_file, get_effective_pom_mock, mock_run_maven):
+        with TempDirectory() as test_dir:
+            step_implementer = self.__create_step_implementer(
+                test_dir,
+                get_effective_pom_mock,
+                **{'maven-prewarm-local-repository': True}
+            )
+
+            step_implementer._prewarm_maven_local_repository()
+
+            get_effective_pom_mock.assert_not_called()
+            mock_run_maven.assert_not_called()
+
+    def test_prewarm_not_enabled(self, mock_settings_file, get_effective_pom_mock, mock_run_maven):
+        with TempDirectory() as test_dir:
+            step_implementer = self.__create_step_implementer(
+                test_dir,
+                get_effective_pom_mock,
+                **{'maven-local-repository': os.path.join(test_dir.path, 'repository')}
+            )
+
+            step_implementer._prewarm_maven_local_repository()
+
+            mock_run_maven.assert_not_called()
+
+    def test_prewarm_once_per_dependencies(
+        self,
+        mock_settings_file,
+        get_effective_pom_mock,
+        mock_run_maven
+    ):
+        with TempDirectory() as test_dir:
+            local_repository = os.path.join(test_dir.path, 'repository')
+            step_implementer = self.__create_step_implementer(
+                test_dir,
+                get_effective_pom_mock,
+                **{
+                    'maven-local-repository': local_repository,
+                    'maven-prewarm-local-repository': True
+                }
+            )
+
+            step_implementer._prewarm_maven_local_repository()
+            step_implementer._prewarm_maven_local_repository()
+
+            mock_run_maven.assert_called_once_with(
+                mvn_output_file_path=os.path.join(
+                    test_dir.path, 'working', 'foo', 'mvn_dependency_go_offline_output.txt'
+                ),
+                phases_and_goals=['dependency:go-offline'],
+                pom_file=os.path.join(test_dir.path, 'pom.xml'),
+                tls_verify=True,
+                profiles=[],
+                no_transfer_progress=True,
+                settings_file='/fake/settings.xml',
+                maven_command='mvn',
+                threads='1C'
+            )
+            self.assertEqual(
+                len(os.listdir(os.path.join(local_repository, '.ploigos-prewarm'))),
+                2
+            )
+
+            # new dependency set is pre-warmed again
+            mock_run_maven.reset_mock()
+            test_dir.write(
+                'effective-pom.xml',
+                self.EFFECTIVE_POM.replace(b'1.0.0', b'1.0.1')
+            )
+            step_implementer._prewarm_maven_local_repository()
+            mock_run_maven.assert_called_once()
+
+    def test_prewarm_error(self, mock_settings_file, get_effective_pom_mock, mock_run_maven):
+        with TempDirectory() as test_dir:
+            local_repository = os.path.join(test_dir.path, 'repository')
+            step_implementer = self.__create_step_implementer(
+                test_dir,
+                get_effective_pom_mock,
+                **{
+                    'maven-local-repository': local_repository,
+                    'maven-prewarm-local-repository': True
+                }
+            )
+            mock_run_maven.side_effect = StepRunnerException('mock error')
+
+            with patch('sys.stdout', new_callable=StringIO) as stdout_mock:
+                step_implementer._prewarm_maven_local_repository()
+
+            self.assertRegex(
+                stdout_mock.getvalue(),
+                r'WARNING: Error pre-warming maven local repository, maven will download'
+                r' any missing dependencies as it runs: mock error'
+            )
+            self.assertEqual(
+                [
+                    file_name
+                    for file_name in os.listdir(os.path.join(local_repository, '.ploigos-prewarm'))
+                    if not file_name.endswith('.lock')
+                ],
+                []
+            )
+
+    def test_prewarm_local_repository_not_writable(
+        self,
+        mock_settings_file,
+        get_effective_pom_mock,
+        mock_run_maven
+    ):
+        with TempDirectory() as test_dir:
+            # a file where the local repository should be so its directories can not be made
+            test_dir.write('repository', b'not a directory')
+            step_implementer = self.__create_step_implementer(
+                test_dir,
+                get_effective_pom_mock,
+                **{
+                    'maven-local-repository': os.path.join(test_dir.path, 'repository'),
+                    'maven-prewarm-local-repository': True
+                }
+            )
+
+            with patch('sys.stdout', new_callable=StringIO) as stdout_mock:
+                step_implementer._prewarm_maven_local_repository()
+
+            self.assertRegex(
+                stdout_mock.getvalue(),
+                r'WARNING: Error pre-warming maven local repository, maven will download'
+                r' any missing dependencies as it runs: .*repository'
+            )
+            mock_run_maven.assert_not_called()
+
+    def test_prewarm_effective_pom_not_xml(
+        self,
+        mock_settings_file,
+        get_effective_pom_mock,
+        mock_run_maven
+    ):
+        with TempDirectory() as test_dir:
+            step_implementer = self.__create_step_implementer(
+                test_dir,
+                get_effective_pom_mock,
+                **{
+                    'maven-local-repository': os.path.join(test_dir.path, 'repository'),
+                    'maven-prewarm-local-repository': True
+                }
+            )
+            test_dir.write('effective-pom.xml', b'not xml')
+
+            with patch('sys.stdout', new_callable=StringIO) as stdout_mock:
+                step_implementer._prewarm_maven_local_repository()
+
+            self.assertRegex(
+                stdout_mock.getvalue(),
+                r'WARNING: Error pre-warming maven local repository, maven will download'
+                r' any missing dependencies as it runs: syntax error'
             )
+            mock_run_maven.assert_not_called()
 
 @patch.object(MavenGeneric, '_run_maven_step')
 @patch.object(MavenGeneric, 'write_working_file', return_value='/mock/mvn_output.txt')
@@ -1,4 +1,6 @@
 
+import gzip
+import json
 import os
 import unittest
 from unittest.mock import MagicMock, patch
@@ -29,6 +31,8 @@ class TestMavenTestReportingMixin__attempt_get_test_report_directory(BaseStepImp
                 return 'mock-pom.xml'
             elif key == 'maven-profiles':
                 return []
+            elif key == 'maven-local-repository':
+                return '/mock/local-repository'
             else:
                 return None
         maven_test_reporting_mixin.get_value = MagicMock(
@@ -39,6 +43,11 @@ class TestMavenTestReportingMixin__attempt_get_test_report_directory(BaseStepImp
         # mock maven_phases_and_goals
         maven_test_reporting_mixin.maven_phases_and_goals = []
 
+        # mock maven_settings_file, maven_effective_pom_cache_dir_path, and maven_command
+        maven_test_reporting_mixin.maven_settings_file = '/mock/settings.xml'
+        maven_test_reporting_mixin.maven_effective_pom_cache_dir_path = '/mock/cache-dir-path'
+        maven_test_reporting_mixin.maven_command = 'mvn'
+
         return maven_test_reporting_mixin
 
     def test_one_found_result(self, get_plugin_configuration_absolute_path_values_mock):
@@ -64,7 +73,11 @@ class TestMavenTestReportingMixin__attempt_get_test_report_directory(BaseStepImp
             pom_file='mock-pom.xml',
             profiles=[],
             phases_and_goals=[],
-            require_phase_execution_config=False
+            require_phase_execution_config=False,
+            settings_file='/mock/settings.xml',
+            effective_pom_cache_dir_path='/mock/cache-dir-path',
+            local_repository_path='/mock/local-repository',
+            maven_command='mvn'
         )
 
         self.assertEqual(actual_test_report_dir, '/mock/test-dir')
@@ -95,7 +108,11 @@ class TestMavenTestReportingMixin__attempt_get_test_report_directory(BaseStepImp
             pom_file='mock-pom.xml',
             profiles=[],
             phases_and_goals=[],
-            require_phase_execution_config=False
+            require_phase_execution_config=False,
+            settings_file='/mock/settings.xml',
+            effective_pom_cache_dir_path='/mock/cache-dir-path',
+            local_repository_path='/mock/local-repository',
+            maven_command='mvn'
         )
 
         self.assertEqual(actual_test_report_dir, '/mock/test-dir1')
@@ -123,7 +140,11 @@ class TestMavenTestReportingMixin__attempt_get_test_report_directory(BaseStepImp
             pom_file='mock-pom.xml',
             profiles=[],
             phases_and_goals=[],
-            require_phase_execution_config=False
+            require_phase_execution_config=False,
+            settings_file='/mock/settings.xml',
+            effective_pom_cache_dir_path='/mock/cache-dir-path',
+            local_repository_path='/mock/local-repository',
+            maven_command='mvn'
         )
 
         self.assertEqual(actual_test_report_dir, '/mock/default')
@@ -159,7 +180,11 @@ class TestMavenTestReportingMixin__attempt_get_test_report_directory(BaseStepImp
             pom_file='mock-pom.xml',
             profiles=[],
             phases_and_goals=[],
-            require_phase_execution_config=False
+            require_phase_execution_config=False,
+            settings_file='/mock/settings.xml',
+            effective_pom_cache_dir_path='/mock/cache-dir-path',
+            local_repository_path='/mock/local-repository',
+            maven_command='mvn'
         )
 
 @patch.object(MavenTestReportingMixin, '_collect_report_results')
@@ -210,7 +235,10 @@ class TestMavenTestReportingMixin__gather_evidence_from_test_report_directory_te
             expected_step_result.add_evidence(name='failures', value=1)
             self.assertEqual(actual_step_result, expected_step_result)
             mock_collect_report_results.assert_called_once_with(
-                test_report_dirs=[test_report_dir]
+                test_report_dirs=[test_report_dir],
+                max_workers=None,
+                test_cases=None,
+                cache_file_path=None
             )
 
     def test_found_dir_found_some_attributes(self, mock_collect_report_results):
@@ -256,7 +284,10 @@ class TestMavenTestReportingMixin__gather_evidence_from_test_report_directory_te
                 f" directory (['{test_report_dir}'])."
             self.assertEqual(actual_step_result, expected_step_result)
             mock_collect_report_results.assert_called_once_with(
-                test_report_dirs=[test_report_dir]
+                test_report_dirs=[test_report_dir],
+                max_workers=None,
+                test_cases=None,
+                cache_file_path=None
             )
 
     def test_found_dir_found_no_attributes(self, mock_collect_report_results):
@@ -297,7 +328,10 @@ class TestMavenTestReportingMixin__gather_evidence_from_test_report_directory_te
                 f" directory (['{test_report_dir}'])."
             self.assertEqual(actual_step_result, expected_step_result)
             mock_collect_report_results.assert_called_once_with(
-                test_report_dirs=[test_report_dir]
+                test_report_dirs=[test_report_dir],
+                max_workers=None,
+                test_cases=None,
+                cache_file_path=None
             )
 
     def test_test_report_dir_does_not_exist(self, mock_collect_report_results):
@@ -336,7 +370,10 @@ class TestMavenTestReportingMixin__gather_evidence_from_test_report_directory_te
                 f" on a recognized xml root element (['testsuites', 'testsuite']) in test report directory (['{test_report_dir}'])."
             self.assertEqual(actual_step_result, expected_step_result)
             mock_collect_report_results.assert_called_once_with(
-                test_report_dirs=[test_report_dir]
+                test_report_dirs=[test_report_dir],
+                max_workers=None,
+                test_cases=None,
+                cache_file_path=None
             )
 
     def test_found_all_attributes_multiple_test_dirs(self, mock_collect_report_results):
@@ -393,7 +430,10 @@ class TestMavenTestReportingMixin__gather_evidence_from_test_report_directory_te
             expected_step_result.add_evidence(name='failures', value=1)
             self.assertEqual(actual_step_result, expected_step_result)
             mock_collect_report_results.assert_called_once_with(
-                test_report_dirs=test_report_dirs
+                test_report_dirs=test_report_dirs,
+                max_workers=None,
+                test_cases=None,
+                cache_file_path=None
             )
 
     def test_found_warning(self, mock_collect_report_results):
@@ -441,7 +481,10 @@ class TestMavenTestReportingMixin__gather_evidence_from_test_report_directory_te
             expected_step_result.add_evidence(name='failures', value=1)
             self.assertEqual(actual_step_result, expected_step_result)
             mock_collect_report_results.assert_called_once_with(
-                test_report_dirs=[test_report_dir]
+                test_report_dirs=[test_report_dir],
+                max_workers=None,
+                test_cases=None,
+                cache_file_path=None
             )
 
 # NOTE: really should mock _to_number and get_xml_element but that would be a lot of work
@@ -593,3 +636,618 @@ class TestMavenTestReportingMixin__collect_report_results(unittest.TestCase):
                 {'time': 1.176, 'tests': 1, 'failures': 0}
             )
             self.assertEqual(actual_warnings, [])
+
+    def test_truncated_file_only_root_element_read(self):
+        with TempDirectory() as test_dir:
+            # setup test
+            # the test JVM was killed part way through writing the report
+            test_dir.write(
+                'test_result1.xml',
+                b'<?xml version="1.0" encoding="UTF-8"?>\n'
+                b'<testsuite time="1.42" tests="42" errors="3" skipped="2" failures="1">\n'
+                b'  <testcase name="mock-test" classname="mock.MockTest" time="0.1">\n'
+                b'    <system-out><![CDATA[mock output that never'
+            )
+
+            # run test
+            report_results, warnings = MavenTestReportingMixin._collect_report_results(
+                test_report_dirs=[test_dir.path]
+            )
+
+            # verify results
+            self.assertEqual(
+                report_results,
+                {'time': 1.42, 'tests': 42, 'errors': 3, 'skipped': 2, 'failures': 1}
+            )
+            self.assertEqual(warnings, [])
+
+    def test_namespaced_root_element(self):
+        with TempDirectory() as test_dir:
+            # setup test
+            test_dir.write(
+                'test_result1.xml',
+                b'<testsuite xmlns="urn:mock" time="1.42" tests="42" failures="1" />'
+            )
+
+            # run test
+            report_results, warnings = MavenTestReportingMixin._collect_report_results(
+                test_report_dirs=[test_dir.path]
+            )
+
+            # verify results
+            self.assertEqual(report_results, {'time': 1.42, 'tests': 42, 'failures': 1})
+            self.assertEqual(warnings, [])
+
+    def test_single_file_with_warning_about_not_being_xml(self):
+        with TempDirectory() as test_dir:
+            # setup test
+            test_dir.write('test_result1.xml', b'')
+
+            # run test
+            report_results, warnings = MavenTestReportingMixin._collect_report_results(
+                test_report_dirs=[test_dir.path]
+            )
+
+            # verify results
+            mock_result_file_path = os.path.join(test_dir.path, "test_result1.xml")
+            self.assertEqual(report_results, {})
+            self.assertEqual(
+                warnings,
+                [
+                    f'WARNING: could not parse test results in file ({mock_result_file_path}).'
+                    ' Ignoring.'
+                ]
+            )
+
+    @patch.object(MavenTestReportingMixin, 'TEST_REPORTS_PARALLEL_MIN_FILES', 4)
+    def test_multiple_files_in_parallel(self):
+        with TempDirectory() as test_dir:
+            # setup test
+            for report_index in range(12):
+                test_dir.write(
+                    f'test_result{report_index:02}.xml',
+                    b'<testsuite time="0.5" tests="2" errors="1" skipped="0" failures="1" />'
+                )
+            test_dir.write('test_result05.xml', b'<not-a-test-suite />')
+            test_dir.write('test_result09.xml', b'<testsuite time="0.5" tests="mock-bad" />')
+
+            # run test
+            report_results, warnings = MavenTestReportingMixin._collect_report_results(
+                test_report_dirs=[test_dir.path],
+                max_workers='2'
+            )
+            sequential_report_results, sequential_warnings = \
+                MavenTestReportingMixin._collect_report_results(
+                    test_report_dirs=[test_dir.path],
+                    max_workers=1
+                )
+
+            # verify results
+            self.assertEqual(
+                report_results,
+                {'time': 5.5, 'tests': 20, 'errors': 10, 'skipped': 0, 'failures': 10}
+            )
+            self.assertEqual(report_results, sequential_report_results)
+            self.assertEqual(warnings, sequential_warnings)
+            self.assertEqual(len(warnings), 2)
+
+    @patch('ploigos_step_runner.step_implementers.shared.maven_test_reporting_mixin.ProcessPoolExecutor')
+    def test_one_worker_does_not_start_worker_processes(self, mock_executor):
+        with TempDirectory() as test_dir:
+            # setup test
+            test_dir.write(
+                'test_result1.xml',
+                b'<testsuite time="1.42" tests="42" errors="3" skipped="2" failures="1" />'
+            )
+
+            # run test
+            with patch.object(MavenTestReportingMixin, 'TEST_REPORTS_PARALLEL_MIN_FILES', 1):
+                report_results, warnings = MavenTestReportingMixin._collect_report_results(
+                    test_report_dirs=[test_dir.path],
+                    max_workers=1
+                )
+
+            # verify results
+            self.assertEqual(
+                report_results,
+                {'time': 1.42, 'tests': 42, 'errors': 3, 'skipped': 2, 'failures': 1}
+            )
+            self.assertEqual(warnings, [])
+            mock_executor.assert_not_called()
+
+
+MOCK_TEST_REPORT_WITH_TEST_CASES = b'''<?xml version="1.0" encoding="UTF-8"?>
+<testsuite name="mock.MockTest" time="3.5" tests="4" errors="1" skipped="1" failures="1">
+  <properties>
+    <property name="java.version" value="11"/>
+  </properties>
+  <testcase name="test_pass" classname="mock.MockTest" time="0.5">
+    <system-out><![CDATA[mock output]]></system-out>
+  </testcase>
+  <testcase name="test_failure" classname="mock.MockTest" time="2">
+    <failure message="expected: 1 but was: 2" type="org.opentest4j.AssertionFailedError">
+      mock stack trace
+    </failure>
+  </testcase>
+  <testcase name="test_error" classname="mock.MockTest" time="1.0">
+    <error type="java.lang.NullPointerException">mock error stack trace</error>
+  </testcase>
+  <testcase name="test_skipped" classname="mock.MockTest" time="">
+    <skipped/>
+  </testcase>
+</testsuite>
+'''
+
+MOCK_TEST_CASES = [
+    {
+        'classname': 'mock.MockTest',
+        'name': 'test_pass',
+        'time': 0.5,
+        'status': 'passed',
+        'message': None
+    },
+    {
+        'classname': 'mock.MockTest',
+        'name': 'test_failure',
+        'time': 2,
+        'status': 'failure',
+        'message': 'expected: 1 but was: 2'
+    },
+    {
+        'classname': 'mock.MockTest',
+        'name': 'test_error',
+        'time': 1.0,
+        'status': 'error',
+        'message': 'mock error stack trace'
+    },
+    {
+        'classname': 'mock.MockTest',
+        'name': 'test_skipped',
+        'time': None,
+        'status': 'skipped',
+        'message': None
+    }
+]
+
+class TestMavenTestReportingMixin__collect_report_results_test_cases(unittest.TestCase):
+    def test_index_test_cases(self):
+        with TempDirectory() as test_dir:
+            # setup test
+            test_dir.write('test_result1.xml', MOCK_TEST_REPORT_WITH_TEST_CASES)
+
+            # run test
+            test_cases = []
+            report_results, warnings = MavenTestReportingMixin._collect_report_results(
+                test_report_dirs=[test_dir.path],
+                test_cases=test_cases
+            )
+
+            # verify results
+            self.assertEqual(
+                report_results,
+                {'time': 3.5, 'tests': 4, 'errors': 1, 'skipped': 1, 'failures': 1}
+            )
+            self.assertEqual(warnings, [])
+            self.assertEqual(test_cases, MOCK_TEST_CASES)
+
+    def test_index_test_cases_nested_test_suites(self):
+        with TempDirectory() as test_dir:
+            # setup test
+            test_dir.write(
+                'test_result1.xml',
+                b'''<testsuites time="1.5" tests="2" failures="1">
+                  <testsuite name="Root Suite.Home Page" tests="1" time="1" failures="0">
+                    <testcase name="Says Hello" time="1" classname="Home Page"/>
+                  </testsuite>
+                  <testsuite name="Root Suite.Other Page" tests="1" time="0.5" failures="1">
+                    <testcase name="Says Goodbye" time="0.5" classname="Other Page">
+                      <failure>mock failure</failure>
+                    </testcase>
+                  </testsuite>
+                </testsuites>'''
+            )
+
+            # run test
+            test_cases = []
+            report_results, warnings = MavenTestReportingMixin._collect_report_results(
+                test_report_dirs=[test_dir.path],
+                test_cases=test_cases
+            )
+
+            # verify results
+            self.assertEqual(report_results, {'time': 1.5, 'tests': 2, 'failures': 1})
+            self.assertEqual(warnings, [])
+            self.assertEqual(
+                [(test_case['name'], test_case['status']) for test_case in test_cases],
+                [('Says Hello', 'passed'), ('Says Goodbye', 'failure')]
+            )
+            self.assertEqual(test_cases[1]['message'], 'mock failure')
+
+    def test_index_test_cases_truncated_file(self):
+        with TempDirectory() as test_dir:
+            # setup test
+            test_dir.write(
+                'test_result1.xml',
+                MOCK_TEST_REPORT_WITH_TEST_CASES[:MOCK_TEST_REPORT_WITH_TEST_CASES.index(
+                    b'<testcase name="test_error"'
+                )]
+            )
+
+            # run test
+            test_cases = []
+            report_results, warnings = MavenTestReportingMixin._collect_report_results(
+                test_report_dirs=[test_dir.path],
+                test_cases=test_cases
+            )
+
+            # verify results
+            self.assertEqual(report_results['tests'], 4)
+            self.assertEqual(warnings, [])
+            self.assertEqual(test_cases, MOCK_TEST_CASES[:2])
+
+    def test_index_test_cases_not_a_test_report(self):
+        with TempDirectory() as test_dir:
+            # setup test
+            test_dir.write(
+                'test_result1.xml',
+                b'<not-a-test-suite><testcase name="mock" classname="mock"/></not-a-test-suite>'
+            )
+
+            # run test
+            test_cases = []
+            report_results, warnings = MavenTestReportingMixin._collect_report_results(
+                test_report_dirs=[test_dir.path],
+                test_cases=test_cases
+            )
+
+            # verify results
+            self.assertEqual(report_results, {})
+            self.assertEqual(len(warnings), 1)
+            self.assertEqual(test_cases, [])
+
+    def test_index_test_cases_message_truncated(self):
+        with TempDirectory() as test_dir:
+            # setup test
+            test_dir.write(
+                'test_result1.xml',
+                b'<testsuite tests="1" failures="1" time="1">'
+                b'<testcase name="mock" classname="mock" time="1">'
+                b'<failure message="' + b'x' * 1000 + b'"/>'
+                b'</testcase></testsuite>'
+            )
+
+            # run test
+            test_cases = []
+            MavenTestReportingMixin._collect_report_results(
+                test_report_dirs=[test_dir.path],
+                test_cases=test_cases
+            )
+
+            # verify results
+            self.assertEqual(
+                test_cases[0]['message'],
+                'x' * MavenTestReportingMixin.TEST_CASE_FAILURE_MESSAGE_MAX_LENGTH
+            )
+
+    @patch.object(MavenTestReportingMixin, 'TEST_REPORTS_PARALLEL_MIN_FILES', 4)
+    def test_index_test_cases_in_parallel(self):
+        with TempDirectory() as test_dir:
+            # setup test
+            for report_index in range(12):
+                test_dir.write(f'test_result{report_index:02}.xml', MOCK_TEST_REPORT_WITH_TEST_CASES)
+
+            # run test
+            test_cases = []
+            report_results, warnings = MavenTestReportingMixin._collect_report_results(
+                test_report_dirs=[test_dir.path],
+                max_workers=2,
+                test_cases=test_cases
+            )
+
+            # verify results
+            self.assertEqual(report_results['tests'], 48)
+            self.assertEqual(warnings, [])
+            self.assertEqual(test_cases, MOCK_TEST_CASES * 12)
+
+
+class TestMavenTestReportingMixin__test_case_index(unittest.TestCase):
+    def test_gather_evidence_with_test_case_index(self):
+        with TempDirectory() as test_dir:
+            # setup test
+            test_dir.write('mock-test-results/test_result1.xml', MOCK_TEST_REPORT_WITH_TEST_CASES)
+            test_case_index_path = os.path.join(
+                test_dir.path,
+                'working',
+                'test-case-index.json.gz'
+            )
+            actual_step_result = StepResult(
+                step_name='mock-maven-test-step',
+                sub_step_name='mock-maven-test-sub-step',
+                sub_step_implementer_name='MockMavenTestReportingMixinStepImplementer'
+            )
+
+            # run test
+            MavenTestReportingMixin._gather_evidence_from_test_report_directory_testsuite_elements(
+                step_result=actual_step_result,
+                test_report_dirs=os.path.join(test_dir.path, 'mock-test-results'),
+                max_workers=1,
+                test_case_index_path=test_case_index_path
+            )
+
+            # verify results
+            self.assertEqual(
+                actual_step_result.get_artifact_value('test-case-index'),
+                test_case_index_path
+            )
+            with gzip.open(test_case_index_path, 'rt', encoding='utf-8') as test_case_index:
+                self.assertEqual(json.load(test_case_index), MOCK_TEST_CASES)
+            self.assertEqual(
+                actual_step_result.get_evidence_value('slowest-tests'),
+                [
+                    {'classname': 'mock.MockTest', 'name': 'test_failure', 'time': 2},
+                    {'classname': 'mock.MockTest', 'name': 'test_error', 'time': 1.0},
+                    {'classname': 'mock.MockTest', 'name': 'test_pass', 'time': 0.5}
+                ]
+            )
+            self.assertEqual(
+                actual_step_result.get_evidence_value('failed-tests'),
+                [
+                    {
+                        'classname': 'mock.MockTest',
+                        'name': 'test_failure',
+                        'status': 'failure',
+                        'message': 'expected: 1 but was: 2'
+                    },
+                    {
+                        'classname': 'mock.MockTest',
+                        'name': 'test_error',
+                        'status': 'error',
+                        'message': 'mock error stack trace'
+                    }
+                ]
+            )
+            self.assertEqual(actual_step_result.get_evidence_value('tests'), 4)
+
+    @patch.object(MavenTestReportingMixin, 'TEST_CASE_SLOWEST_COUNT', 1)
+    def test_slowest_tests_limited(self):
+        with TempDirectory() as test_dir:
+            # setup test
+            test_dir.write('mock-test-results/test_result1.xml', MOCK_TEST_REPORT_WITH_TEST_CASES)
+            actual_step_result = StepResult(
+                step_name='mock-maven-test-step',
+                sub_step_name='mock-maven-test-sub-step',
+                sub_step_implementer_name='MockMavenTestReportingMixinStepImplementer'
+            )
+
+            # run test
+            MavenTestReportingMixin._gather_evidence_from_test_report_directory_testsuite_elements(
+                step_result=actual_step_result,
+                test_report_dirs=os.path.join(test_dir.path, 'mock-test-results'),
+                test_case_index_path=os.path.join(test_dir.path, 'test-case-index.json.gz')
+            )
+
+            # verify results
+            self.assertEqual(
+                actual_step_result.get_evidence_value('slowest-tests'),
+                [{'classname': 'mock.MockTest', 'name': 'test_failure', 'time': 2}]
+            )
+
+    def test_get_test_case_index_path(self):
+        maven_test_reporting_mixin = MavenTestReportingMixin()
+        maven_test_reporting_mixin.work_dir_path = '/mock/work-dir-path'
+        maven_test_reporting_mixin.get_value = MagicMock(return_value=True)
+
+        self.assertEqual(
+            maven_test_reporting_mixin._get_test_case_index_path(),
+            '/mock/work-dir-path/test-case-index.json.gz'
+        )
+        maven_test_reporting_mixin.get_value.assert_called_once_with(
+            'test-reports-test-case-index'
+        )
+
+    def test_get_test_case_index_path_not_enabled(self):
+        maven_test_reporting_mixin = MavenTestReportingMixin()
+        maven_test_reporting_mixin.work_dir_path = '/mock/work-dir-path'
+        maven_test_reporting_mixin.get_value = MagicMock(return_value=None)
+
+        self.assertIsNone(maven_test_reporting_mixin._get_test_case_index_path())
+
+
+class TestMavenTestReportingMixin__test_report_cache(unittest.TestCase):
+    @staticmethod
+    def __write_report(test_dir, file_name, contents, mtime_ns=1000000000000000000):
+        report_path = test_dir.write(file_name, contents)
+        os.utime(report_path, ns=(mtime_ns, mtime_ns))
+        return report_path
+
+    def test_unchanged_reports_read_from_cache(self):
+        with TempDirectory() as test_dir:
+            # setup test
+            self.__write_report(
+                test_dir,
+                'reports/test_result1.xml',
+                b'<testsuite time="1.42" tests="42" errors="3" skipped="2" failures="1" />'
+            )
+            self.__write_report(test_dir, 'reports/test_result2.xml', b'<not-a-test-suite />')
+            cache_file_path = os.path.join(test_dir.path, 'working', 'test-report-cache.json')
+
+            # run test
+            first_results = MavenTestReportingMixin._collect_report_results(
+                test_report_dirs=[os.path.join(test_dir.path, 'reports')],
+                cache_file_path=cache_file_path
+            )
+            with patch.object(
+                MavenTestReportingMixin,
+                '_read_evidence_element'
+            ) as mock_read_evidence_element:
+                second_results = MavenTestReportingMixin._collect_report_results(
+                    test_report_dirs=[os.path.join(test_dir.path, 'reports')],
+                    cache_file_path=cache_file_path
+                )
+
+            # verify results
+            self.assertEqual(
+                first_results[0],
+                {'time': 1.42, 'tests': 42, 'errors': 3, 'skipped': 2, 'failures': 1}
+            )
+            self.assertEqual(len(first_results[1]), 1)
+            self.assertEqual(second_results, first_results)
+            mock_read_evidence_element.assert_not_called()
+
+    def test_changed_report_read_again(self):
+        with TempDirectory() as test_dir:
+            # setup test
+            self.__write_report(
+                test_dir,
+                'reports/test_result1.xml',
+                b'<testsuite time="1.42" tests="42" failures="1" />'
+            )
+            cache_file_path = os.path.join(test_dir.path, 'test-report-cache.json')
+            MavenTestReportingMixin._collect_report_results(
+                test_report_dirs=[os.path.join(test_dir.path, 'reports')],
+                cache_file_path=cache_file_path
+            )
+
+            # same size, different modification time
+            self.__write_report(
+                test_dir,
+                'reports/test_result1.xml',
+                b'<testsuite time="2.42" tests="24" failures="2" />',
+                mtime_ns=1000000000000000001
+            )
+
+            # run test
+            report_results, warnings = MavenTestReportingMixin._collect_report_results(
+                test_report_dirs=[os.path.join(test_dir.path, 'reports')],
+                cache_file_path=cache_file_path
+            )
+
+            # verify results
+            self.assertEqual(report_results, {'time': 2.42, 'tests': 24, 'failures': 2})
+            self.assertEqual(warnings, [])
+
+    def test_recently_modified_report_not_cached(self):
+        with TempDirectory() as test_dir:
+            # setup test
+            test_dir.write(
+                'reports/test_result1.xml',
+                b'<testsuite time="1.42" tests="42" failures="1" />'
+            )
+            cache_file_path = os.path.join(test_dir.path, 'test-report-cache.json')
+
+            # run test
+            MavenTestReportingMixin._collect_report_results(
+                test_report_dirs=[os.path.join(test_dir.path, 'reports')],
+                cache_file_path=cache_file_path
+            )
+
+            # verify results
+            with open(cache_file_path, 'r', encoding='utf-8') as cache_file:
+                self.assertEqual(json.load(cache_file), {'version': 1, 'reports': {}})
+
+    def test_cached_without_test_cases_read_again_for_test_cases(self):
+        with TempDirectory() as test_dir:
+            # setup test
+            self.__write_report(
+                test_dir,
+                'reports/test_result1.xml',
+                MOCK_TEST_REPORT_WITH_TEST_CASES
+            )
+            cache_file_path = os.path.join(test_dir.path, 'test-report-cache.json')
+            MavenTestReportingMixin._collect_report_results(
+                test_report_dirs=[os.path.join(test_dir.path, 'reports')],
+                cache_file_path=cache_file_path
+            )
+
+            # run test
+            test_cases = []
+            MavenTestReportingMixin._collect_report_results(
+                test_report_dirs=[os.path.join(test_dir.path, 'reports')],
+                test_cases=test_cases,
+                cache_file_path=cache_file_path
+            )
+            cached_test_cases = []
+            with patch.object(
+                MavenTestReportingMixin,
+                '_read_evidence_element_and_test_cases'
+            ) as mock_read_evidence_element_and_test_cases:
+                MavenTestReportingMixin._collect_report_results(
+                    test_report_dirs=[os.path.join(test_dir.path, 'reports')],
+                    test_cases=cached_test_cases,
+                    cache_file_path=cache_file_path
+                )
+
+            # verify results
+            self.assertEqual(test_cases, MOCK_TEST_CASES)
+            self.assertEqual(cached_test_cases, MOCK_TEST_CASES)
+            mock_read_evidence_element_and_test_cases.assert_not_called()
+
+    def test_deleted_report_removed_from_cache(self):
+        with TempDirectory() as test_dir:
+            # setup test
+            report_path = self.__write_report(
+                test_dir,
+                'reports/test_result1.xml',
+                b'<testsuite time="1.42" tests="42" failures="1" />'
+            )
+            cache_file_path = os.path.join(test_dir.path, 'test-report-cache.json')
+            MavenTestReportingMixin._collect_report_results(
+                test_report_dirs=[os.path.join(test_dir.path, 'reports')],
+                cache_file_path=cache_file_path
+            )
+            with open(cache_file_path, 'r', encoding='utf-8') as cache_file:
+                self.assertEqual(list(json.load(cache_file)['reports']), [report_path])
+
+            os.remove(report_path)
+
+            # run test
+            report_results, warnings = MavenTestReportingMixin._collect_report_results(
+                test_report_dirs=[os.path.join(test_dir.path, 'reports')],
+                cache_file_path=cache_file_path
+            )
+
+            # verify results
+            self.assertEqual(report_results, {})
+            self.assertEqual(warnings, [])
+            with open(cache_file_path, 'r', encoding='utf-8') as cache_file:
+                self.assertEqual(json.load(cache_file)['reports'], {})
+
+    def test_unreadable_cache_ignored(self):
+        with TempDirectory() as test_dir:
+            # setup test
+            self.__write_report(
+                test_dir,
+                'reports/test_result1.xml',
+                b'<testsuite time="1.42" tests="42" failures="1" />'
+            )
+            cache_file_path = test_dir.write('test-report-cache.json', b'not json')
+
+            # run test
+            report_results, warnings = MavenTestReportingMixin._collect_report_results(
+                test_report_dirs=[os.path.join(test_dir.path, 'reports')],
+                cache_file_path=cache_file_path
+            )
+
+            # verify results
+            self.assertEqual(report_results, {'time': 1.42, 'tests': 42, 'failures': 1})
+            self.assertEqual(warnings, [])
+            with open(cache_file_path, 'r', encoding='utf-8') as cache_file:
+                self.assertEqual(json.load(cache_file)['version'], 1)
+
+    def test_get_test_report_cache_file_path(self):
+        maven_test_reporting_mixin = MavenTestReportingMixin()
+        maven_test_reporting_mixin.parent_work_dir_path = '/mock/working'
+        maven_test_reporting_mixin.get_value = MagicMock(return_value=True)
+
+        self.assertEqual(
+            maven_test_reporting_mixin._get_test_report_cache_file_path(),
+            '/mock/working/test-report-cache.json'
+        )
+        maven_test_reporting_mixin.get_value.assert_called_once_with('test-reports-cache')
+
+    def test_get_test_report_cache_file_path_not_enabled(self):
+        maven_test_reporting_mixin = MavenTestReportingMixin()
+        maven_test_reporting_mixin.parent_work_dir_path = '/mock/working'
+        maven_test_reporting_mixin.get_value = MagicMock(return_value=False)
+
+        self.assertIsNone(maven_test_reporting_mixin._get_test_report_cache_file_path())
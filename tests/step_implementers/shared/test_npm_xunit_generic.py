@@ -78,7 +78,8 @@ class TestStepImplementerNpmXunitGeneric_step_implementer_config_defaults(
         self.assertEqual(
             NpmXunitGeneric.step_implementer_config_defaults(),
             {
-                'package-file': 'package.json'
+                'package-file': 'package.json',
+                'test-reports-cache': True
             }
         )
 
@@ -174,7 +175,10 @@ class TestStepImplementerNpmXunitGeneric__run_step(
             )
             mock_gather_evidence.assert_called_once_with(
                 step_result=Any(StepResult),
-                test_report_dirs='/mock/test-results-dir'
+                test_report_dirs='/mock/test-results-dir',
+                max_workers=None,
+                test_case_index_path=None,
+                cache_file_path=os.path.join(parent_work_dir_path, 'test-report-cache.json')
             )
 
             self.assertEqual(step_implementer.npm_args, ['run', 'myscript'])
@@ -233,7 +237,10 @@ class TestStepImplementerNpmXunitGeneric__run_step(
             )
             mock_gather_evidence.assert_called_once_with(
                 step_result=Any(StepResult),
-                test_report_dirs='/mock/test-results-dir'
+                test_report_dirs='/mock/test-results-dir',
+                max_workers=None,
+                test_case_index_path=None,
+                cache_file_path=os.path.join(parent_work_dir_path, 'test-report-cache.json')
             )
 
             self.assertEqual(step_implementer.npm_args, ['run', 'myscript'])
@@ -298,7 +305,10 @@ class TestStepImplementerNpmXunitGeneric__run_step(
             )
             mock_gather_evidence.assert_called_once_with(
                 step_result=Any(StepResult),
-                test_report_dirs='/mock/test-results-dir'
+                test_report_dirs='/mock/test-results-dir',
+                max_workers=None,
+                test_case_index_path=None,
+                cache_file_path=os.path.join(parent_work_dir_path, 'test-report-cache.json')
             )
 
     def test_success_with_report_dir_target_host_url(
@@ -355,7 +365,10 @@ class TestStepImplementerNpmXunitGeneric__run_step(
             )
             mock_gather_evidence.assert_called_once_with(
                 step_result=Any(StepResult),
-                test_report_dirs='/mock/test-results-dir'
+                test_report_dirs='/mock/test-results-dir',
+                max_workers=None,
+                test_case_index_path=None,
+                cache_file_path=os.path.join(parent_work_dir_path, 'test-report-cache.json')
             )
 
     def test_error_in_npm(
@@ -400,5 +413,8 @@ class TestStepImplementerNpmXunitGeneric__run_step(
             )
             mock_gather_evidence.assert_called_once_with(
                 step_result=Any(StepResult),
-                test_report_dirs='/mock/test-results-dir'
+                test_report_dirs='/mock/test-results-dir',
+                max_workers=None,
+                test_case_index_path=None,
+                cache_file_path=os.path.join(parent_work_dir_path, 'test-report-cache.json')
             )
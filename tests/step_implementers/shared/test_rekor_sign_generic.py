@@ -244,7 +244,10 @@ B8pBNt1QOA==
                 return self.TEST_REKOR_ENTRY
 
             def rekor_mock_side_effect(*args, **kwargs):
-                return 'Created entry at: ' + args[2]+ '/api/v1/log/entries/' + self.TEST_REKOR_UUID
+                kwargs['_out']('Uploading entry\n')
+                kwargs['_out'](
+                    'Created entry at: ' + args[2]+ '/api/v1/log/entries/' + self.TEST_REKOR_UUID + '\n'
+                )
 
             create_mock.side_effect = create_mock_side_effect
             rekor_mock.side_effect = rekor_mock_side_effect
@@ -264,8 +267,7 @@ B8pBNt1QOA==
                 '--entry',
                 rekor_entry_path_name,
                 _out=Any(IOBase),
-                _err_to_out=True,
-                _tee='out'
+                _err_to_out=True
             )
             self.assertEqual(result_uuid, self.TEST_REKOR_UUID)
     @patch('ploigos_step_runner.step_implementers.shared.rekor_sign_generic.export_pgp_public_key')
@@ -80,7 +80,11 @@ class TestStepImplementerMavenIntegrationTest_step_implementer_config_defaults(
                 'tls-verify': True,
                 'maven-profiles': [],
                 'maven-additional-arguments': ['-DskipTests'],
-                'maven-no-transfer-progress': True
+                'maven-no-transfer-progress': True,
+                'maven-command': 'auto',
+                'maven-threads': '1C',
+                'maven-prewarm-local-repository': False,
+                'test-reports-cache': True
             }
         )
 
@@ -170,7 +174,10 @@ class TestStepImplementerMavenIntegrationTest__run_step(
             )
             mock_gather_evidence.assert_called_once_with(
                 step_result=Any(StepResult),
-                test_report_dirs='/mock/test-results-dir'
+                test_report_dirs='/mock/test-results-dir',
+                max_workers=None,
+                test_case_index_path=None,
+                cache_file_path=os.path.join(parent_work_dir_path, 'test-report-cache.json')
             )
 
     def test_success_with_report_dir_deployed_host_urls_list_multiple_entries_no_target(
@@ -229,7 +236,10 @@ class TestStepImplementerMavenIntegrationTest__run_step(
             )
             mock_gather_evidence.assert_called_once_with(
                 step_result=Any(StepResult),
-                test_report_dirs='/mock/test-results-dir'
+                test_report_dirs='/mock/test-results-dir',
+                max_workers=None,
+                test_case_index_path=None,
+                cache_file_path=os.path.join(parent_work_dir_path, 'test-report-cache.json')
             )
     
     def test_success_with_report_dir_deployed_host_urls_list_multiple_entries_target(
@@ -290,7 +300,10 @@ class TestStepImplementerMavenIntegrationTest__run_step(
             )
             mock_gather_evidence.assert_called_once_with(
                 step_result=Any(StepResult),
-                test_report_dirs='/mock/test-results-dir'
+                test_report_dirs='/mock/test-results-dir',
+                max_workers=None,
+                test_case_index_path=None,
+                cache_file_path=os.path.join(parent_work_dir_path, 'test-report-cache.json')
             )
 
     def test_success_with_report_dir_deployed_host_urls_list_multiple_entries_bad_target(
@@ -350,7 +363,10 @@ class TestStepImplementerMavenIntegrationTest__run_step(
             )
             mock_gather_evidence.assert_called_once_with(
                 step_result=Any(StepResult),
-                test_report_dirs='/mock/test-results-dir'
+                test_report_dirs='/mock/test-results-dir',
+                max_workers=None,
+                test_case_index_path=None,
+                cache_file_path=os.path.join(parent_work_dir_path, 'test-report-cache.json')
             )
 
     def test_success_with_report_dir_deployed_host_urls_single(
@@ -403,7 +419,10 @@ class TestStepImplementerMavenIntegrationTest__run_step(
             )
             mock_gather_evidence.assert_called_once_with(
                 step_result=Any(StepResult),
-                test_report_dirs='/mock/test-results-dir'
+                test_report_dirs='/mock/test-results-dir',
+                max_workers=None,
+                test_case_index_path=None,
+                cache_file_path=os.path.join(parent_work_dir_path, 'test-report-cache.json')
             )
 
     def test_success_with_report_dir_target_host_url(
@@ -456,7 +475,10 @@ class TestStepImplementerMavenIntegrationTest__run_step(
             )
             mock_gather_evidence.assert_called_once_with(
                 step_result=Any(StepResult),
-                test_report_dirs='/mock/test-results-dir'
+                test_report_dirs='/mock/test-results-dir',
+                max_workers=None,
+                test_case_index_path=None,
+                cache_file_path=os.path.join(parent_work_dir_path, 'test-report-cache.json')
             )
 
     def test_success_no_report_dir_deployed_host_urls_list_one_entry(
@@ -568,7 +590,10 @@ class TestStepImplementerMavenIntegrationTest__run_step(
             )
             mock_gather_evidence.assert_called_once_with(
                 step_result=Any(StepResult),
-                test_report_dirs='/mock/test-results-dir'
+                test_report_dirs='/mock/test-results-dir',
+                max_workers=None,
+                test_case_index_path=None,
+                cache_file_path=os.path.join(parent_work_dir_path, 'test-report-cache.json')
             )
 
     def test_fail_no_report_dir(
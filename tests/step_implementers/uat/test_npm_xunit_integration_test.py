@@ -79,6 +79,7 @@ class TestStepImplementerNpmXunitIntegrationTest_step_implementer_config_default
             NpmXunitIntegrationTest.step_implementer_config_defaults(),
             {
                 'package-file': 'package.json',
+                'test-reports-cache': True,
                 'npm-test-script': 'test:uat'
             }
         )
@@ -171,7 +172,10 @@ class TestStepImplementerNpmXunitIntegrationTest__run_step(
             )
             mock_gather_evidence.assert_called_once_with(
                 step_result=Any(StepResult),
-                test_report_dirs='/mock/test-results-dir'
+                test_report_dirs='/mock/test-results-dir',
+                max_workers=None,
+                test_case_index_path=None,
+                cache_file_path=os.path.join(parent_work_dir_path, 'test-report-cache.json')
             )
 
             self.assertEqual(step_implementer.npm_args, ['run', 'test:uat'])
@@ -80,7 +80,11 @@ class TestStepImplementerMavenTest_step_implementer_config_defaults(
                 'tls-verify': True,
                 'maven-profiles': [],
                 'maven-additional-arguments': [],
-                'maven-no-transfer-progress': True
+                'maven-no-transfer-progress': True,
+                'maven-command': 'auto',
+                'maven-threads': '1C',
+                'maven-prewarm-local-repository': False,
+                'test-reports-cache': True
             }
         )
 
@@ -162,7 +166,10 @@ class TestStepImplementerMavenTest__run_step(
             )
             mock_gather_evidence.assert_called_once_with(
                 step_result=Any(StepResult),
-                test_report_dirs='/mock/test-results-dir'
+                test_report_dirs='/mock/test-results-dir',
+                max_workers=None,
+                test_case_index_path=None,
+                cache_file_path=os.path.join(parent_work_dir_path, 'test-report-cache.json')
             )
 
     def test_success_no_report_dir(
@@ -260,7 +267,10 @@ class TestStepImplementerMavenTest__run_step(
             )
             mock_gather_evidence.assert_called_once_with(
                 step_result=Any(StepResult),
-                test_report_dirs='/mock/test-results-dir'
+                test_report_dirs='/mock/test-results-dir',
+                max_workers=None,
+                test_case_index_path=None,
+                cache_file_path=os.path.join(parent_work_dir_path, 'test-report-cache.json')
             )
 
     def test_fail_no_report_dir(
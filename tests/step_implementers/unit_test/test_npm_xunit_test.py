@@ -75,6 +75,7 @@ class TestStepImplementerNpmXunitTest_step_implementer_config_defaults(
             NpmXunitTest.step_implementer_config_defaults(),
             {
                 'package-file': 'package.json',
+                'test-reports-cache': True,
                 'npm-test-script': 'test'
             }
         )
@@ -8,6 +8,7 @@ from ploigos_step_runner.utils.io import TextIOSelectiveObfuscator
 from ploigos_step_runner.config.decryptors.sops import SOPS
 
 from contextlib import redirect_stdout
+from unittest.mock import patch
 import io
 import unittest
 import re
@@ -122,6 +123,156 @@ class TestDecryptionUtils(BaseTestCase):
                 new_stdout.close()
                 sys.stdout = old_stdout
 
+    def test_decrypt_cached(self):
+        secret_value = "decrypt me"
+        config_value = ConfigValue(
+            f'TEST_ENC[{secret_value}]',
+            parent_source='/mock/psr.yml',
+            path_parts=['step-runner-config', 'foo', 'password']
+        )
+        decryptor = SampleConfigValueDecryptor()
+        DecryptionUtils.register_config_value_decryptor(decryptor)
+
+        with patch.object(decryptor, 'decrypt', wraps=decryptor.decrypt) as decrypt_mock:
+            for _ in range(3):
+                self.assertEqual(DecryptionUtils.decrypt(config_value), secret_value)
+
+            decrypt_mock.assert_called_once()
+
+        self.assertEqual(
+            DecryptionUtils.get_decryption_counts(),
+            {'decryptions': 1, 'cache-hits': 2}
+        )
+
+    def test_decrypt_cached_keyed_by_source_and_path(self):
+        decryptor = SampleConfigValueDecryptor()
+        DecryptionUtils.register_config_value_decryptor(decryptor)
+
+        config_values = [
+            ConfigValue('TEST_ENC[a]', parent_source='/mock/a.yml', path_parts=['secret']),
+            ConfigValue('TEST_ENC[a]', parent_source='/mock/b.yml', path_parts=['secret']),
+            ConfigValue('TEST_ENC[a]', parent_source='/mock/a.yml', path_parts=['other']),
+            ConfigValue('TEST_ENC[a]', parent_source={'secret': 'TEST_ENC[a]'}, path_parts=['secret'])
+        ]
+        for config_value in config_values:
+            DecryptionUtils.decrypt(config_value)
+
+        self.assertEqual(
+            DecryptionUtils.get_decryption_counts(),
+            {'decryptions': 4, 'cache-hits': 0}
+        )
+
+    def test_decrypt_cached_keyed_by_source_identity(self):
+        decryptor = SampleConfigValueDecryptor()
+        DecryptionUtils.register_config_value_decryptor(decryptor)
+        parent_source = {'secret': 'TEST_ENC[a]'}
+
+        with patch.object(decryptor, 'decrypt', wraps=decryptor.decrypt) as decrypt_mock:
+            DecryptionUtils.decrypt(
+                ConfigValue('TEST_ENC[a]', parent_source=parent_source, path_parts=['secret'])
+            )
+            DecryptionUtils.decrypt(
+                ConfigValue('TEST_ENC[a]', parent_source=parent_source, path_parts=['secret'])
+            )
+            self.assertEqual(decrypt_mock.call_count, 1)
+
+            # equal but different source is decrypted again
+            DecryptionUtils.decrypt(
+                ConfigValue('TEST_ENC[a]', parent_source=dict(parent_source), path_parts=['secret'])
+            )
+            self.assertEqual(decrypt_mock.call_count, 2)
+
+            # changed value at the same path of the same source is decrypted again
+            parent_source['secret'] = 'TEST_ENC[b]'
+            self.assertEqual(
+                DecryptionUtils.decrypt(
+                    ConfigValue('TEST_ENC[b]', parent_source=parent_source, path_parts=['secret'])
+                ),
+                'b'
+            )
+            self.assertEqual(decrypt_mock.call_count, 3)
+
+    def test_clear_decryption_cache(self):
+        config_value = ConfigValue('TEST_ENC[decrypt me]')
+        DecryptionUtils.register_config_value_decryptor(SampleConfigValueDecryptor())
+
+        DecryptionUtils.decrypt(config_value)
+        DecryptionUtils.clear_decryption_cache()
+        DecryptionUtils.decrypt(config_value)
+
+        self.assertEqual(
+            DecryptionUtils.get_decryption_counts(),
+            {'decryptions': 2, 'cache-hits': 0}
+        )
+
+    def test_register_obfuscation_stream_after_decrypt(self):
+        secret_value = "decrypt me"
+        DecryptionUtils.register_config_value_decryptor(SampleConfigValueDecryptor())
+        DecryptionUtils.decrypt(ConfigValue(f'TEST_ENC[{secret_value}]'))
+
+        out = io.StringIO()
+        obfuscated_out = TextIOSelectiveObfuscator(out)
+        DecryptionUtils.register_obfuscation_stream(obfuscated_out)
+
+        obfuscated_out.write(f"ensure that I can't actually leak secret value ({secret_value})")
+        self.assertRegex(
+            out.getvalue(),
+            r"ensure that I can't actually leak secret value \(\*+\)"
+        )
+
+    def test_decrypt_obfuscates_before_caching(self):
+        secret_value = "decrypt me"
+        config_value = ConfigValue(f'TEST_ENC[{secret_value}]')
+        DecryptionUtils.register_config_value_decryptor(SampleConfigValueDecryptor())
+        out = io.StringIO()
+        obfuscated_out = TextIOSelectiveObfuscator(out)
+        DecryptionUtils.register_obfuscation_stream(obfuscated_out)
+
+        cached_when_obfuscated = []
+        def add_obfuscation_targets_side_effect(targets):
+            cached_when_obfuscated.append(
+                targets in DecryptionUtils._DecryptionUtils__decryption_cache.values()
+            )
+        with patch.object(
+            obfuscated_out,
+            'add_obfuscation_targets',
+            side_effect=add_obfuscation_targets_side_effect
+        ):
+            self.assertEqual(DecryptionUtils.decrypt(config_value), secret_value)
+
+        self.assertEqual(cached_when_obfuscated, [False])
+        self.assertIn(secret_value, DecryptionUtils._DecryptionUtils__decryption_cache.values())
+
+    def test_decrypt_all(self):
+        decryptor = SampleConfigValueDecryptor()
+        DecryptionUtils.register_config_value_decryptor(decryptor)
+
+        config_values = [
+            ConfigValue('TEST_ENC[a]', parent_source='/mock/a.yml', path_parts=['a']),
+            ConfigValue('TEST_ENC[b]', parent_source='/mock/a.yml', path_parts=['b']),
+            ConfigValue('TEST_ENC[b]', parent_source='/mock/a.yml', path_parts=['b']),
+            ConfigValue('not encrypted', parent_source='/mock/a.yml', path_parts=['c'])
+        ]
+        with patch.object(decryptor, 'decrypt', wraps=decryptor.decrypt) as decrypt_mock:
+            DecryptionUtils.decrypt_all(config_values, max_workers=2)
+            self.assertEqual(decrypt_mock.call_count, 2)
+
+            # already decrypted so should not decrypt again
+            DecryptionUtils.decrypt_all(config_values, max_workers=2)
+            self.assertEqual(decrypt_mock.call_count, 2)
+
+            self.assertEqual(config_values[0].value, 'a')
+            self.assertEqual(config_values[2].value, 'b')
+            self.assertEqual(decrypt_mock.call_count, 2)
+
+    def test_decrypt_all_error(self):
+        decryptor = SampleConfigValueDecryptor()
+        DecryptionUtils.register_config_value_decryptor(decryptor)
+
+        with patch.object(decryptor, 'decrypt', side_effect=RuntimeError('mock decrypt error')):
+            with self.assertRaisesRegex(RuntimeError, 'mock decrypt error'):
+                DecryptionUtils.decrypt_all([ConfigValue('TEST_ENC[a]')])
+
     def test__get_decryption_class_sops_short_name(self):
         decryptor_class = DecryptionUtils._DecryptionUtils__get_decryption_class('SOPS')
         self.assertEqual(
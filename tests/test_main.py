@@ -546,3 +546,87 @@ class TestMain(BaseTestCase):
             expected_exit_code=200,
             config_files=config_files
         )
+
+    @patch('sh.sops', create=True)
+    def test_config_compile_and_run_step_from_bundle(self, sops_mock):
+        config_file_path = os.path.join(
+            os.path.dirname(__file__),
+            'files',
+            'step-runner-config.yml'
+        )
+        decryptors_config_file_path = os.path.join(
+            os.path.dirname(__file__),
+            'files',
+            'step-runner-config-decryptors.yml'
+        )
+        encrypted_config_file_path = os.path.join(
+            os.path.dirname(__file__),
+            'files',
+            'step-runner-config-secret-stuff.yml'
+        )
+        expected_results = {
+            'step-runner-results': {
+                'DEV': {
+                    'required-step-config-test': {
+                        'tests.helpers.sample_step_implementers.RequiredStepConfigStepImplementer': {
+                            'artifacts': [
+                                {'name': 'environment-name', 'description': '', 'value': 'DEV'},
+                                {'name': 'kube-api-token', 'description': '', 'value': 'mock decrypted value'},
+                                {'name': 'required-config-key', 'description': '', 'value': 'mock decrypted value'}
+                            ],
+                            'message': '',
+                            'sub-step-implementer-name':
+                                'tests.helpers.sample_step_implementers.RequiredStepConfigStepImplementer',
+                            'success': True}
+                    }
+                }
+            }
+        }
+
+        mock_decrypted_value = 'mock decrypted value'
+        sops_mock.side_effect = create_sops_side_effect(mock_decrypted_value)
+
+        cwd = os.getcwd()
+        try:
+            with TempDirectory() as temp_dir:
+                os.chdir(temp_dir.path)
+
+                main([
+                    'config', 'compile',
+                    '--config', config_file_path,
+                                decryptors_config_file_path,
+                                encrypted_config_file_path,
+                    '--output', 'psr.bundle'
+                ])
+                sops_mock.assert_not_called()
+
+                main([
+                    '--step', 'required-step-config-test',
+                    '--config', 'psr.bundle',
+                    '--environment', 'DEV'
+                ])
+
+                work_dir_path = os.path.join(temp_dir.path, 'step-runner-working')
+                with open(os.path.join(work_dir_path, "step-runner-results.yml"), 'r') as step_results_file:
+                    results = yaml.safe_load(step_results_file.read())
+                    self.assertCountEqual(results, expected_results)
+        finally:
+            os.chdir(cwd)
+
+    def test_config_compile_invalid_config(self):
+        config_files = [
+            {
+                'name': 'psr.yaml',
+                'contents': '''---
+                foo: bar
+                '''
+            }
+        ]
+        self._run_main_test(
+            ['config', 'compile', '--output', 'psr.bundle'],
+            expected_exit_code=102,
+            config_files=config_files
+        )
+
+    def test_config_compile_missing_output(self):
+        self._run_main_test(['config', 'compile'], expected_exit_code=2)
@@ -5,9 +5,11 @@ from unittest.mock import patch
 
 from ploigos_step_runner.results import StepResult, WorkflowResult
 from ploigos_step_runner.config import Config
+from ploigos_step_runner.decryption_utils import DecryptionUtils
 from ploigos_step_runner.exceptions import StepRunnerException
 from ploigos_step_runner.step_implementer import StepImplementer
 from ploigos_step_runner.step_runner import StepRunner
+from ploigos_step_runner.utils.file import read_output_file
 from testfixtures import TempDirectory
 
 from tests.helpers.base_step_implementer_test_case import \
@@ -708,6 +710,123 @@ class TestStepImplementer_run_step(TestStepImplementer):
 
         mock_add_additional_artifacts_to_step_result.assert_not_called()
 
+    def test_prints_config_value_decryption_counts(
+        self,
+        mock_add_additional_artifacts_to_step_result
+    ):
+        config = {
+            'step-runner-config': {
+                'foo': {
+                    'implementer': 'tests.helpers.sample_step_implementers.FooStepImplementer',
+                    'config': {
+                        'password': 'hello world'
+                    }
+                }
+            }
+        }
+        DecryptionUtils.create_and_register_config_value_decryptor('ObfuscationDefaults')
+
+        with TempDirectory() as test_dir:
+            stdout_buff = StringIO()
+            with redirect_stdout(stdout_buff):
+                self._run_step_implementer_test(
+                    config,
+                    'foo',
+                    StepResult(
+                        step_name='foo',
+                        sub_step_name='tests.helpers.sample_step_implementers.FooStepImplementer',
+                        sub_step_implementer_name='tests.helpers.sample_step_implementers.FooStepImplementer'
+                    ),
+                    test_dir
+                )
+
+        counts = DecryptionUtils.get_decryption_counts()
+        self.assertEqual(counts['decryptions'], 1)
+        self.assertGreater(counts['cache-hits'], 0)
+        self.assertRegex(
+            stdout_buff.getvalue(),
+            r'Config Value Decryptions\n\s+{\n\s+"decryptions": 1,\n\s+"cache-hits": \d+\n'
+        )
+
+    def test_pre_decrypt_config_values(
+        self,
+        mock_add_additional_artifacts_to_step_result
+    ):
+        config = {
+            'step-runner-config': {
+                'foo': {
+                    'implementer': 'tests.helpers.sample_step_implementers.FooStepImplementer',
+                    'config': {
+                        'pre-decrypt-config-values': 'true',
+                        'pre-decrypt-max-workers': 2,
+                        'registries': {
+                            'a': {'password': 'a-password'},
+                            'b': {'password': 'b-password'}
+                        }
+                    }
+                }
+            }
+        }
+        DecryptionUtils.create_and_register_config_value_decryptor('ObfuscationDefaults')
+
+        with TempDirectory() as test_dir, \
+                patch.object(
+                    DecryptionUtils,
+                    'decrypt_all',
+                    wraps=DecryptionUtils.decrypt_all
+                ) as decrypt_all_mock:
+            self._run_step_implementer_test(
+                config,
+                'foo',
+                StepResult(
+                    step_name='foo',
+                    sub_step_name='tests.helpers.sample_step_implementers.FooStepImplementer',
+                    sub_step_implementer_name='tests.helpers.sample_step_implementers.FooStepImplementer'
+                ),
+                test_dir
+            )
+
+            decrypt_all_mock.assert_called_once()
+            self.assertEqual(decrypt_all_mock.call_args.kwargs['max_workers'], 2)
+            self.assertEqual(
+                sorted(
+                    config_value.raw_value
+                    for config_value in decrypt_all_mock.call_args.kwargs['config_values']
+                    if config_value.raw_value in ['a-password', 'b-password']
+                ),
+                ['a-password', 'b-password']
+            )
+
+        # both passwords decrypted up front, every later access is a cache hit
+        self.assertEqual(DecryptionUtils.get_decryption_counts()['decryptions'], 2)
+
+    def test_pre_decrypt_config_values_disabled_by_default(
+        self,
+        mock_add_additional_artifacts_to_step_result
+    ):
+        config = {
+            'step-runner-config': {
+                'foo': {
+                    'implementer': 'tests.helpers.sample_step_implementers.FooStepImplementer'
+                }
+            }
+        }
+
+        with TempDirectory() as test_dir, \
+                patch.object(DecryptionUtils, 'decrypt_all') as decrypt_all_mock:
+            self._run_step_implementer_test(
+                config,
+                'foo',
+                StepResult(
+                    step_name='foo',
+                    sub_step_name='tests.helpers.sample_step_implementers.FooStepImplementer',
+                    sub_step_implementer_name='tests.helpers.sample_step_implementers.FooStepImplementer'
+                ),
+                test_dir
+            )
+
+            decrypt_all_mock.assert_not_called()
+
 class TestStepImplementer_other(TestStepImplementer):
     def test_empty_constructor_params(self):
         config = Config({
@@ -790,6 +909,68 @@ class TestStepImplementer_other(TestStepImplementer):
             with open(working_file_path, 'r') as working_file:
                 self.assertEqual(working_file.read(), '')
 
+    def __create_foo_step_implementer(self, working_dir_path, step_config):
+        config = Config({
+            'step-runner-config': {
+                'foo': {
+                    'implementer': 'tests.helpers.sample_step_implementers.FooStepImplementer',
+                    'config': step_config
+                }
+            }
+        })
+        sub_step = config.get_step_config('foo').get_sub_step(
+            'tests.helpers.sample_step_implementers.FooStepImplementer')
+
+        return FooStepImplementer(
+            workflow_result=WorkflowResult(),
+            parent_work_dir_path=working_dir_path,
+            config=sub_step
+        )
+
+    def test_write_working_output_file_uncompressed(self):
+        with TempDirectory() as test_dir:
+            working_dir_path = os.path.join(test_dir.path, 'step-runner-working')
+            step = self.__create_foo_step_implementer(working_dir_path, {})
+
+            output_file_path = step.write_working_output_file('test_output.txt')
+
+            self.assertEqual(
+                output_file_path,
+                os.path.join(working_dir_path, 'foo', 'test_output.txt')
+            )
+            self.assertEqual(read_output_file(output_file_path), '')
+
+    def test_write_working_output_file_compressed(self):
+        for output_compression, extension in [('gzip', '.gz'), ('xz', '.xz')]:
+            with TempDirectory() as test_dir:
+                working_dir_path = os.path.join(test_dir.path, 'step-runner-working')
+                step = self.__create_foo_step_implementer(
+                    working_dir_path,
+                    {'output-compression': output_compression}
+                )
+
+                output_file_path = step.write_working_output_file('test_output.txt')
+
+                self.assertEqual(
+                    output_file_path,
+                    os.path.join(working_dir_path, 'foo', f'test_output.txt{extension}')
+                )
+                self.assertEqual(read_output_file(output_file_path), '')
+
+    def test_write_working_output_file_unsupported_compression(self):
+        with TempDirectory() as test_dir:
+            working_dir_path = os.path.join(test_dir.path, 'step-runner-working')
+            step = self.__create_foo_step_implementer(
+                working_dir_path,
+                {'output-compression': 'zstd'}
+            )
+
+            with self.assertRaisesRegex(
+                ValueError,
+                r"Unsupported output file compression \(zstd\)"
+            ):
+                step.write_working_output_file('test_output.txt')
+
     def test_get_config_value(self):
         step_config = {
             'test': 'hello world'
@@ -0,0 +1,356 @@
+"""Test for container_registry.py
+
+Test for the container registry HTTP API client, against a local stand in registry.
+"""
+import base64
+import hashlib
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ploigos_step_runner.utils.container_registry import (
+    ContainerRegistryClient, get_container_image_registry_digest,
+    parse_container_image_address)
+from testfixtures import TempDirectory
+from tests.helpers.base_test_case import BaseTestCase
+
+MOCK_MANIFEST = b'{"schemaVersion": 2, "mediaType": "application/vnd.oci.image.manifest.v1+json"}'
+MOCK_DIGEST = f"sha256:{hashlib.sha256(MOCK_MANIFEST).hexdigest()}"
+MOCK_AUTH = base64.b64encode(b'mock-user:mock-password').decode('ascii')
+
+
+class MockRegistryRequestHandler(BaseHTTPRequestHandler):
+    """Stand in container registry serving a single manifest."""
+
+    def log_message(self, format, *args): # pylint: disable=redefined-builtin
+        pass
+
+    def do_HEAD(self):
+        self.__serve_manifest(include_body=False)
+
+    def do_GET(self):
+        if self.path.startswith('/token'):
+            self.server.requests.append(('GET', self.path, self.headers.get('Authorization')))
+            if self.headers.get('Authorization') != f"Basic {MOCK_AUTH}":
+                self.__respond(401)
+                return
+            self.__respond(200, body=self.server.token_response)
+            return
+
+        self.__serve_manifest(include_body=True)
+
+    def do_PUT(self):
+        self.server.requests.append((self.command, self.path, self.headers.get('Authorization')))
+        manifest = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+        if self.server.auth == 'basic' and \
+                self.headers.get('Authorization') != f"Basic {MOCK_AUTH}":
+            self.__respond(401, {'WWW-Authenticate': 'Basic realm="mock-registry"'})
+            return
+        if self.headers.get('Content-Type') != 'application/vnd.oci.image.manifest.v1+json':
+            self.__respond(400)
+            return
+
+        self.server.manifests[self.path.rsplit('/', 1)[-1]] = manifest
+        self.__respond(201, {'Docker-Content-Digest': MOCK_DIGEST})
+
+    def __serve_manifest(self, include_body):
+        self.server.requests.append((self.command, self.path, self.headers.get('Authorization')))
+
+        if self.path == '/v2/':
+            self.__respond(200)
+            return
+
+        auth = self.server.auth
+        if auth == 'basic' and self.headers.get('Authorization') != f"Basic {MOCK_AUTH}":
+            self.__respond(401, {'WWW-Authenticate': 'Basic realm="mock-registry"'})
+            return
+        if auth == 'bearer' and self.headers.get('Authorization') != 'Bearer mock-token':
+            self.__respond(401, {
+                'WWW-Authenticate': f'Bearer realm="http://127.0.0.1:{self.server.server_port}'
+                f'/token",service="mock-registry",scope="repository:mock-org/mock-app:pull"'
+            })
+            return
+
+        reference = self.path.rsplit('/', 1)[-1]
+        if not self.path.startswith('/v2/mock-org/mock-app/manifests/') or \
+                (reference not in self.server.manifests and reference != MOCK_DIGEST):
+            self.__respond(404)
+            return
+
+        headers = {'Content-Type': 'application/vnd.oci.image.manifest.v1+json'}
+        if self.server.include_digest_header:
+            headers['Docker-Content-Digest'] = MOCK_DIGEST
+        self.__respond(200, headers, MOCK_MANIFEST if include_body else None)
+
+    def __respond(self, status, headers=None, body=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body) if body else 0))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+
+class TestContainerRegistryClient(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), MockRegistryRequestHandler)
+        self.server.auth = None
+        self.server.include_digest_header = True
+        self.server.token_response = json.dumps({'token': 'mock-token'}).encode('utf-8')
+        self.server.requests = []
+        self.server.manifests = {'v1.0.0': MOCK_MANIFEST}
+        self.registry = f"127.0.0.1:{self.server.server_port}"
+        threading.Thread(
+            target=self.server.serve_forever,
+            kwargs={'poll_interval': 0.05},
+            daemon=True
+        ).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        super().tearDown()
+
+    def __write_auth_file(self, temp_dir, auth_key=None):
+        temp_dir.write('auth.json', json.dumps({
+            'auths': {auth_key or self.registry: {'auth': MOCK_AUTH}}
+        }).encode('utf-8'))
+        return os.path.join(temp_dir.path, 'auth.json')
+
+    def __manifest_requests(self):
+        return [request for request in self.server.requests if '/manifests/' in request[1]]
+
+    def test_get_manifest_digest_by_head_request(self):
+        client = ContainerRegistryClient(tls_verify=False)
+
+        digest = client.get_manifest_digest(self.registry, 'mock-org/mock-app', 'v1.0.0')
+
+        self.assertEqual(digest, MOCK_DIGEST)
+        self.assertEqual(
+            self.__manifest_requests(),
+            [('HEAD', '/v2/mock-org/mock-app/manifests/v1.0.0', None)]
+        )
+
+    def test_get_manifest_digest_no_digest_header(self):
+        self.server.include_digest_header = False
+        client = ContainerRegistryClient(tls_verify=False)
+
+        digest = client.get_manifest_digest(self.registry, 'mock-org/mock-app', 'v1.0.0')
+
+        self.assertEqual(digest, MOCK_DIGEST)
+        self.assertEqual(
+            [request[0] for request in self.__manifest_requests()],
+            ['HEAD', 'GET']
+        )
+
+    def test_get_manifest(self):
+        client = ContainerRegistryClient(tls_verify=False)
+
+        manifest, media_type = client.get_manifest(self.registry, 'mock-org/mock-app', 'v1.0.0')
+
+        self.assertEqual(manifest, MOCK_MANIFEST)
+        self.assertEqual(media_type, 'application/vnd.oci.image.manifest.v1+json')
+
+    def test_put_manifest(self):
+        self.server.auth = 'basic'
+        with TempDirectory() as temp_dir:
+            client = ContainerRegistryClient(
+                containers_config_auth_file=self.__write_auth_file(temp_dir),
+                tls_verify=False
+            )
+            manifest, media_type = client.get_manifest(
+                self.registry,
+                'mock-org/mock-app',
+                'v1.0.0'
+            )
+
+            client.put_manifest(self.registry, 'mock-org/mock-app', 'latest', manifest, media_type)
+
+            self.assertEqual(self.server.manifests['latest'], MOCK_MANIFEST)
+            self.assertEqual(
+                client.get_manifest_digest(self.registry, 'mock-org/mock-app', 'latest'),
+                MOCK_DIGEST
+            )
+
+    def test_put_manifest_error(self):
+        client = ContainerRegistryClient(tls_verify=False)
+
+        with self.assertRaisesRegex(
+            RuntimeError,
+            r'Error putting container image \(.*/mock-org/mock-app:latest\) manifest'
+            r' to registry: 400'
+        ):
+            client.put_manifest(
+                self.registry,
+                'mock-org/mock-app',
+                'latest',
+                MOCK_MANIFEST,
+                'application/vnd.docker.distribution.manifest.v2+json'
+            )
+
+    def test_get_manifest_digest_basic_auth(self):
+        self.server.auth = 'basic'
+        with TempDirectory() as temp_dir:
+            client = ContainerRegistryClient(
+                containers_config_auth_file=self.__write_auth_file(temp_dir),
+                tls_verify=False
+            )
+
+            digest = client.get_manifest_digest(self.registry, 'mock-org/mock-app', 'v1.0.0')
+
+            self.assertEqual(digest, MOCK_DIGEST)
+            self.assertEqual(
+                self.__manifest_requests()[-1],
+                ('HEAD', '/v2/mock-org/mock-app/manifests/v1.0.0', f"Basic {MOCK_AUTH}")
+            )
+
+    def test_get_manifest_digest_bearer_auth(self):
+        self.server.auth = 'bearer'
+        with TempDirectory() as temp_dir:
+            client = ContainerRegistryClient(
+                containers_config_auth_file=self.__write_auth_file(
+                    temp_dir,
+                    f"{self.registry}/mock-org"
+                ),
+                tls_verify=False
+            )
+
+            digest = client.get_manifest_digest(self.registry, 'mock-org/mock-app', 'v1.0.0')
+            digest_again = client.get_manifest_digest(
+                self.registry,
+                'mock-org/mock-app',
+                'v1.0.0'
+            )
+
+            self.assertEqual(digest, MOCK_DIGEST)
+            self.assertEqual(digest_again, MOCK_DIGEST)
+            token_requests = [
+                request for request in self.server.requests if request[1].startswith('/token')
+            ]
+            self.assertEqual(len(token_requests), 1)
+            self.assertIn('service=mock-registry', token_requests[0][1])
+            self.assertEqual(
+                self.__manifest_requests()[-1],
+                ('HEAD', '/v2/mock-org/mock-app/manifests/v1.0.0', 'Bearer mock-token')
+            )
+
+    def test_get_manifest_digest_bearer_auth_token_response_not_json(self):
+        self.server.auth = 'bearer'
+        self.server.token_response = b'<html>mock proxy error page</html>'
+        with TempDirectory() as temp_dir:
+            client = ContainerRegistryClient(
+                containers_config_auth_file=self.__write_auth_file(temp_dir),
+                tls_verify=False
+            )
+
+            with self.assertRaisesRegex(
+                RuntimeError,
+                r'Error reading authentication token for container image registry'
+                r' \(127.0.0.1:.*\) from \(http://127.0.0.1:.*/token\): Expecting value'
+            ):
+                client.get_manifest_digest(self.registry, 'mock-org/mock-app', 'v1.0.0')
+
+    def test_get_manifest_digest_bearer_auth_token_response_no_token(self):
+        self.server.auth = 'bearer'
+        self.server.token_response = json.dumps({'expires_in': 300}).encode('utf-8')
+        with TempDirectory() as temp_dir:
+            client = ContainerRegistryClient(
+                containers_config_auth_file=self.__write_auth_file(temp_dir),
+                tls_verify=False
+            )
+
+            with self.assertRaisesRegex(
+                RuntimeError,
+                r'Error reading authentication token for container image registry'
+                r' \(127.0.0.1:.*\) from \(http://127.0.0.1:.*/token\): response has no token'
+            ):
+                client.get_manifest_digest(self.registry, 'mock-org/mock-app', 'v1.0.0')
+
+            self.assertNotIn(
+                'Bearer None',
+                [request[2] for request in self.__manifest_requests()]
+            )
+
+    def test_get_manifest_digest_no_credentials(self):
+        self.server.auth = 'basic'
+        client = ContainerRegistryClient(tls_verify=False)
+
+        with self.assertRaisesRegex(
+            RuntimeError,
+            r'Error getting container image \(.*/mock-org/mock-app:v1.0.0\) manifest'
+            r' from registry: 401'
+        ):
+            client.get_manifest_digest(self.registry, 'mock-org/mock-app', 'v1.0.0')
+
+    def test_get_manifest_digest_not_found(self):
+        client = ContainerRegistryClient(tls_verify=False)
+
+        with self.assertRaisesRegex(
+            RuntimeError,
+            r'Error getting container image \(.*/mock-org/does-not-exist:v1.0.0\) manifest'
+            r' from registry: 404'
+        ):
+            client.get_manifest_digest(self.registry, 'mock-org/does-not-exist', 'v1.0.0')
+
+    def test_get_manifest_digest_tls_verify_plain_http_registry(self):
+        client = ContainerRegistryClient(tls_verify=True)
+
+        with self.assertRaisesRegex(
+            RuntimeError,
+            r'Error connecting to container image registry \(127.0.0.1:.*\)'
+        ):
+            client.get_manifest_digest(self.registry, 'mock-org/mock-app', 'v1.0.0')
+
+    def test_invalid_auth_file(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('auth.json', b'not json')
+
+            with self.assertRaisesRegex(
+                RuntimeError,
+                r'Error reading container registries authentication file \(.*auth.json\)'
+            ):
+                ContainerRegistryClient(
+                    containers_config_auth_file=os.path.join(temp_dir.path, 'auth.json')
+                )
+
+    def test_get_container_image_registry_digest(self):
+        digest = get_container_image_registry_digest(
+            container_image_address=f"{self.registry}/mock-org/mock-app:v1.0.0",
+            tls_verify=False
+        )
+
+        self.assertEqual(digest, MOCK_DIGEST)
+
+    def test_get_container_image_registry_digest_error(self):
+        with self.assertRaisesRegex(
+            RuntimeError,
+            r'Error getting container image \(.*/mock-org/mock-app:v2.0.0\) image digest:'
+        ):
+            get_container_image_registry_digest(
+                container_image_address=f"{self.registry}/mock-org/mock-app:v2.0.0",
+                tls_verify=False
+            )
+
+
+class TestParseContainerImageAddress(BaseTestCase):
+    def test_registry_repository_tag(self):
+        self.assertEqual(
+            parse_container_image_address('quay.io/mock-org/mock-app:v1.0.0'),
+            ('quay.io', 'mock-org/mock-app', 'v1.0.0')
+        )
+
+    def test_registry_with_port_by_digest(self):
+        self.assertEqual(
+            parse_container_image_address('localhost:5000/mock-app@sha256:abc123'),
+            ('localhost:5000', 'mock-app', 'sha256:abc123')
+        )
+
+    def test_no_registry_no_tag(self):
+        self.assertEqual(
+            parse_container_image_address('mock-org/mock-app'),
+            ('docker.io', 'mock-org/mock-app', 'latest')
+        )
@@ -1,15 +1,22 @@
+import base64
+import hashlib
+import json
+import os
 import re
 from io import IOBase
-from unittest.mock import ANY, call, patch
+from unittest.mock import ANY, Mock, call, patch
 
 import sh
 from ploigos_step_runner.results import StepResult
 from ploigos_step_runner.config.config_value import ConfigValue
 from ploigos_step_runner.utils.containers import *
+from testfixtures import TempDirectory
 from tests.helpers.base_test_case import BaseTestCase
 from tests.helpers.test_utils import *
 
 
+MOCK_CONTAINER_COMMAND = 'mock-container-command'
+
 def create_which_side_effect(cmd, cmd_path):
     def which_side_effect(*args, **kwargs):
         if args[0] == cmd:
@@ -381,6 +388,10 @@ class TestContainerRegistryLogin(BaseTestCase):
                 container_registry_password='nope'
             )
 
+@patch(
+    'ploigos_step_runner.utils.containers.get_container_login_command',
+    new=Mock(return_value=MOCK_CONTAINER_COMMAND)
+)
 class TestContainerRegistriesLogin(BaseTestCase):
     @patch('ploigos_step_runner.utils.containers.container_registry_login')
     def test_dict_of_dicts(self, container_registry_login_mock):
@@ -404,7 +415,8 @@ class TestContainerRegistriesLogin(BaseTestCase):
                 container_registry_password='nope1',
                 container_registry_tls_verify=True,
                 containers_config_auth_file=None,
-                container_command_short_name=None
+                container_command_short_name=None,
+                container_command=MOCK_CONTAINER_COMMAND
             ),
             call(
                 container_registry_uri='registry.internal.example.xyz',
@@ -412,7 +424,8 @@ class TestContainerRegistriesLogin(BaseTestCase):
                 container_registry_password='nope2',
                 container_registry_tls_verify=True,
                 containers_config_auth_file=None,
-                container_command_short_name=None
+                container_command_short_name=None,
+                container_command=MOCK_CONTAINER_COMMAND
             )
         ]
         container_registry_login_mock.assert_has_calls(calls)
@@ -441,7 +454,8 @@ class TestContainerRegistriesLogin(BaseTestCase):
                 container_registry_password='nope1',
                 container_registry_tls_verify=False,
                 containers_config_auth_file=None,
-                container_command_short_name=None
+                container_command_short_name=None,
+                container_command=MOCK_CONTAINER_COMMAND
             ),
             call(
                 container_registry_uri='registry.internal.example.xyz',
@@ -449,7 +463,8 @@ class TestContainerRegistriesLogin(BaseTestCase):
                 container_registry_password='nope2',
                 container_registry_tls_verify=True,
                 containers_config_auth_file=None,
-                container_command_short_name=None
+                container_command_short_name=None,
+                container_command=MOCK_CONTAINER_COMMAND
             )
         ]
         container_registry_login_mock.assert_has_calls(calls)
@@ -512,6 +527,7 @@ class TestContainerRegistriesLogin(BaseTestCase):
                 container_registry_tls_verify=True,
                 containers_config_auth_file=None,
                 container_command_short_name=None,
+                container_command=MOCK_CONTAINER_COMMAND
             ),
             call(
                 container_registry_uri='registry.internal.example.xyz',
@@ -519,7 +535,8 @@ class TestContainerRegistriesLogin(BaseTestCase):
                 container_registry_password='nope2',
                 container_registry_tls_verify=True,
                 containers_config_auth_file=None,
-                container_command_short_name=None
+                container_command_short_name=None,
+                container_command=MOCK_CONTAINER_COMMAND
             )
         ]
         container_registry_login_mock.assert_has_calls(calls)
@@ -548,7 +565,8 @@ class TestContainerRegistriesLogin(BaseTestCase):
                 container_registry_password='nope1',
                 container_registry_tls_verify=True,
                 containers_config_auth_file=None,
-                container_command_short_name=None
+                container_command_short_name=None,
+                container_command=MOCK_CONTAINER_COMMAND
             ),
             call(
                 container_registry_uri='registry.internal.example.xyz',
@@ -556,7 +574,8 @@ class TestContainerRegistriesLogin(BaseTestCase):
                 container_registry_password='nope2',
                 container_registry_tls_verify=True,
                 containers_config_auth_file=None,
-                container_command_short_name=None
+                container_command_short_name=None,
+                container_command=MOCK_CONTAINER_COMMAND
             )
         ]
         container_registry_login_mock.assert_has_calls(calls)
@@ -585,7 +604,8 @@ class TestContainerRegistriesLogin(BaseTestCase):
                 container_registry_password='nope1',
                 container_registry_tls_verify=True,
                 containers_config_auth_file=None,
-                container_command_short_name=None
+                container_command_short_name=None,
+                container_command=MOCK_CONTAINER_COMMAND
             ),
             call(
                 container_registry_uri='registry.internal.example.xyz',
@@ -593,7 +613,8 @@ class TestContainerRegistriesLogin(BaseTestCase):
                 container_registry_password='nope2',
                 container_registry_tls_verify=True,
                 containers_config_auth_file=None,
-                container_command_short_name=None
+                container_command_short_name=None,
+                container_command=MOCK_CONTAINER_COMMAND
             )
         ]
         container_registry_login_mock.assert_has_calls(calls)
@@ -624,7 +645,8 @@ class TestContainerRegistriesLogin(BaseTestCase):
                 container_registry_password='nope1',
                 container_registry_tls_verify=False,
                 containers_config_auth_file=None,
-                container_command_short_name=None
+                container_command_short_name=None,
+                container_command=MOCK_CONTAINER_COMMAND
             ),
             call(
                 container_registry_uri='registry.internal.example.xyz',
@@ -632,7 +654,8 @@ class TestContainerRegistriesLogin(BaseTestCase):
                 container_registry_password='nope2',
                 container_registry_tls_verify=True,
                 containers_config_auth_file=None,
-                container_command_short_name=None
+                container_command_short_name=None,
+                container_command=MOCK_CONTAINER_COMMAND
             )
         ]
         container_registry_login_mock.assert_has_calls(calls)
@@ -652,27 +675,31 @@ class TestContainerRegistriesLogin(BaseTestCase):
             }
         ]
 
-        container_registries_login(registries, '/tmp/mock/auth.json')
+        with TempDirectory() as temp_dir:
+            container_registries_login(registries, os.path.join(temp_dir.path, 'auth.json'))
 
+        # NOTE: each login is to its own authentication file that is merged after
         calls = [
             call(
                 container_registry_uri='registry.redhat.io',
                 container_registry_username='hello1@world.xyz',
                 container_registry_password='nope1',
                 container_registry_tls_verify=True,
-                containers_config_auth_file='/tmp/mock/auth.json',
-                container_command_short_name=None
+                containers_config_auth_file=ANY,
+                container_command_short_name=None,
+                container_command=MOCK_CONTAINER_COMMAND
             ),
             call(
                 container_registry_uri='registry.internal.example.xyz',
                 container_registry_username='hello2@example.xyz',
                 container_registry_password='nope2',
                 container_registry_tls_verify=True,
-                containers_config_auth_file='/tmp/mock/auth.json',
-                container_command_short_name=None
+                containers_config_auth_file=ANY,
+                container_command_short_name=None,
+                container_command=MOCK_CONTAINER_COMMAND
             )
         ]
-        container_registry_login_mock.assert_has_calls(calls)
+        container_registry_login_mock.assert_has_calls(calls, any_order=True)
 
     @patch('ploigos_step_runner.utils.containers.container_registry_login')
     def test_list_of_config_value(self, container_registry_login_mock):
@@ -698,7 +725,8 @@ class TestContainerRegistriesLogin(BaseTestCase):
                 container_registry_password='nope1',
                 container_registry_tls_verify=True,
                 containers_config_auth_file=None,
-                container_command_short_name=None
+                container_command_short_name=None,
+                container_command=MOCK_CONTAINER_COMMAND
             ),
             call(
                 container_registry_uri='registry.internal.example.xyz',
@@ -706,7 +734,8 @@ class TestContainerRegistriesLogin(BaseTestCase):
                 container_registry_password='nope2',
                 container_registry_tls_verify=True,
                 containers_config_auth_file=None,
-                container_command_short_name=None
+                container_command_short_name=None,
+                container_command=MOCK_CONTAINER_COMMAND
             )
         ]
         container_registry_login_mock.assert_has_calls(calls)
@@ -831,7 +860,8 @@ class TestContainerRegistriesLogin(BaseTestCase):
                 container_registry_password='nope1',
                 container_registry_tls_verify=True,
                 containers_config_auth_file=None,
-                container_command_short_name='fake-podman'
+                container_command_short_name='fake-podman',
+                container_command=MOCK_CONTAINER_COMMAND
             ),
             call(
                 container_registry_uri='registry.internal.example.xyz',
@@ -839,12 +869,17 @@ class TestContainerRegistriesLogin(BaseTestCase):
                 container_registry_password='nope2',
                 container_registry_tls_verify=True,
                 containers_config_auth_file=None,
-                container_command_short_name='fake-podman'
+                container_command_short_name='fake-podman',
+                container_command=MOCK_CONTAINER_COMMAND
             )
         ]
         container_registry_login_mock.assert_has_calls(calls)
 
 
+@patch(
+    'ploigos_step_runner.utils.containers.get_container_login_command',
+    new=Mock(return_value=MOCK_CONTAINER_COMMAND)
+)
 class TestContainerRegistriesLoginForceOverrideTlsVerifyLogin(BaseTestCase):
     @patch('ploigos_step_runner.utils.containers.container_registry_login')
     def test_dict_of_dicts(self, container_registry_login_mock):
@@ -868,7 +903,8 @@ class TestContainerRegistriesLoginForceOverrideTlsVerifyLogin(BaseTestCase):
                 container_registry_password='nope1',
                 container_registry_tls_verify=False,
                 containers_config_auth_file=None,
-                container_command_short_name=None
+                container_command_short_name=None,
+                container_command=MOCK_CONTAINER_COMMAND
             ),
             call(
                 container_registry_uri='registry.internal.example.xyz',
@@ -876,7 +912,8 @@ class TestContainerRegistriesLoginForceOverrideTlsVerifyLogin(BaseTestCase):
                 container_registry_password='nope2',
                 container_registry_tls_verify=False,
                 containers_config_auth_file=None,
-                container_command_short_name=None
+                container_command_short_name=None,
+                container_command=MOCK_CONTAINER_COMMAND
             )
         ]
         container_registry_login_mock.assert_has_calls(calls)
@@ -905,7 +942,8 @@ class TestContainerRegistriesLoginForceOverrideTlsVerifyLogin(BaseTestCase):
                 container_registry_password='nope1',
                 container_registry_tls_verify=False,
                 containers_config_auth_file=None,
-                container_command_short_name=None
+                container_command_short_name=None,
+                container_command=MOCK_CONTAINER_COMMAND
             ),
             call(
                 container_registry_uri='registry.internal.example.xyz',
@@ -913,7 +951,8 @@ class TestContainerRegistriesLoginForceOverrideTlsVerifyLogin(BaseTestCase):
                 container_registry_password='nope2',
                 container_registry_tls_verify=False,
                 containers_config_auth_file=None,
-                container_command_short_name=None
+                container_command_short_name=None,
+                container_command=MOCK_CONTAINER_COMMAND
             )
         ]
         container_registry_login_mock.assert_has_calls(calls)
@@ -943,7 +982,8 @@ class TestContainerRegistriesLoginForceOverrideTlsVerifyLogin(BaseTestCase):
                 container_registry_password='nope1',
                 container_registry_tls_verify=True,
                 containers_config_auth_file=None,
-                container_command_short_name=None
+                container_command_short_name=None,
+                container_command=MOCK_CONTAINER_COMMAND
             ),
             call(
                 container_registry_uri='registry.internal.example.xyz',
@@ -951,7 +991,8 @@ class TestContainerRegistriesLoginForceOverrideTlsVerifyLogin(BaseTestCase):
                 container_registry_password='nope2',
                 container_registry_tls_verify=True,
                 containers_config_auth_file=None,
-                container_command_short_name=None
+                container_command_short_name=None,
+                container_command=MOCK_CONTAINER_COMMAND
             )
         ]
         container_registry_login_mock.assert_has_calls(calls)
@@ -980,7 +1021,8 @@ class TestContainerRegistriesLoginForceOverrideTlsVerifyLogin(BaseTestCase):
                 container_registry_password='nope1',
                 container_registry_tls_verify=False,
                 containers_config_auth_file=None,
-                container_command_short_name=None
+                container_command_short_name=None,
+                container_command=MOCK_CONTAINER_COMMAND
             ),
             call(
                 container_registry_uri='registry.internal.example.xyz',
@@ -988,11 +1030,222 @@ class TestContainerRegistriesLoginForceOverrideTlsVerifyLogin(BaseTestCase):
                 container_registry_password='nope2',
                 container_registry_tls_verify=False,
                 containers_config_auth_file=None,
-                container_command_short_name=None
+                container_command_short_name=None,
+                container_command=MOCK_CONTAINER_COMMAND
             )
         ]
         container_registry_login_mock.assert_has_calls(calls)
 
+def mock_auth(username, password):
+    return base64.b64encode(f"{username}:{password}".encode('utf-8')).decode('utf-8')
+
+def write_login_auth_file_side_effect(**kwargs):
+    if kwargs['container_registry_password'] == 'bad-password':
+        raise RuntimeError(
+            f"Failed to login to container registry ({kwargs['container_registry_uri']})"
+        )
+
+    with open(kwargs['containers_config_auth_file'], 'w', encoding='utf-8') as auth_file:
+        json.dump(
+            {
+                'auths': {
+                    kwargs['container_registry_uri']: {
+                        'auth': mock_auth(
+                            kwargs['container_registry_username'],
+                            kwargs['container_registry_password']
+                        )
+                    }
+                }
+            },
+            auth_file
+        )
+
+@patch('ploigos_step_runner.utils.containers.container_registry_login')
+@patch('ploigos_step_runner.utils.containers.get_container_login_command')
+class TestContainerRegistriesLoginSharedAuthFile(BaseTestCase):
+    REGISTRIES = {
+        'registry.redhat.io': {
+            'username': 'hello1@world.xyz',
+            'password': 'nope1'
+        },
+        'registry.internal.example.xyz': {
+            'username': 'hello2@example.xyz',
+            'password': 'nope2'
+        }
+    }
+
+    def test_logins_merged_into_auth_file(
+        self,
+        get_container_login_command_mock,
+        container_registry_login_mock
+    ):
+        container_registry_login_mock.side_effect = write_login_auth_file_side_effect
+
+        with TempDirectory() as temp_dir:
+            auth_file_path = os.path.join(temp_dir.path, 'auth.json')
+            temp_dir.write(
+                'auth.json',
+                json.dumps({'auths': {'quay.io': {'auth': 'existing-auth'}}}).encode()
+            )
+
+            container_registries_login(self.REGISTRIES, auth_file_path)
+
+            with open(auth_file_path, encoding='utf-8') as auth_file:
+                self.assertEqual(
+                    json.load(auth_file),
+                    {
+                        'auths': {
+                            'quay.io': {'auth': 'existing-auth'},
+                            'registry.redhat.io': {
+                                'auth': mock_auth('hello1@world.xyz', 'nope1')
+                            },
+                            'registry.internal.example.xyz': {
+                                'auth': mock_auth('hello2@example.xyz', 'nope2')
+                            }
+                        }
+                    }
+                )
+            self.assertEqual(sorted(os.listdir(temp_dir.path)), [
+                'auth.json',
+                'auth.json.lock'
+            ])
+            get_container_login_command_mock.assert_called_once()
+
+    def test_already_logged_in_skipped(
+        self,
+        get_container_login_command_mock,
+        container_registry_login_mock
+    ):
+        container_registry_login_mock.side_effect = write_login_auth_file_side_effect
+
+        with TempDirectory() as temp_dir:
+            auth_file_path = os.path.join(temp_dir.path, 'auth.json')
+            container_registries_login(self.REGISTRIES, auth_file_path)
+            container_registry_login_mock.reset_mock()
+            get_container_login_command_mock.reset_mock()
+
+            container_registries_login(self.REGISTRIES, auth_file_path)
+
+            container_registry_login_mock.assert_not_called()
+            get_container_login_command_mock.assert_not_called()
+
+    def test_changed_credentials_logged_in_again(
+        self,
+        get_container_login_command_mock,
+        container_registry_login_mock
+    ):
+        container_registry_login_mock.side_effect = write_login_auth_file_side_effect
+
+        with TempDirectory() as temp_dir:
+            auth_file_path = os.path.join(temp_dir.path, 'auth.json')
+            container_registries_login(self.REGISTRIES, auth_file_path)
+            container_registry_login_mock.reset_mock()
+
+            container_registries_login(
+                {
+                    'registry.redhat.io': {
+                        'username': 'hello1@world.xyz',
+                        'password': 'new-nope1'
+                    },
+                    'registry.internal.example.xyz': {
+                        'username': 'hello2@example.xyz',
+                        'password': 'nope2'
+                    }
+                },
+                auth_file_path
+            )
+
+            container_registry_login_mock.assert_called_once_with(
+                container_registry_uri='registry.redhat.io',
+                container_registry_username='hello1@world.xyz',
+                container_registry_password='new-nope1',
+                container_registry_tls_verify=True,
+                containers_config_auth_file=ANY,
+                container_command_short_name=None,
+                container_command=get_container_login_command_mock.return_value
+            )
+
+    def test_auth_file_missing_logged_in_again(
+        self,
+        get_container_login_command_mock,
+        container_registry_login_mock
+    ):
+        container_registry_login_mock.side_effect = write_login_auth_file_side_effect
+
+        with TempDirectory() as temp_dir:
+            auth_file_path = os.path.join(temp_dir.path, 'auth.json')
+            container_registries_login(self.REGISTRIES, auth_file_path)
+            container_registry_login_mock.reset_mock()
+            os.remove(auth_file_path)
+
+            container_registries_login(self.REGISTRIES, auth_file_path)
+
+            self.assertEqual(container_registry_login_mock.call_count, 2)
+
+    def test_logged_in_with_credential_helper_logged_in_again(
+        self,
+        get_container_login_command_mock,
+        container_registry_login_mock
+    ):
+        container_registry_login_mock.side_effect = write_login_auth_file_side_effect
+
+        with TempDirectory() as temp_dir:
+            auth_file_path = os.path.join(temp_dir.path, 'auth.json')
+            temp_dir.write(
+                'auth.json',
+                json.dumps({
+                    'auths': {
+                        'registry.redhat.io': {},
+                        'registry.internal.example.xyz': {
+                            'auth': mock_auth('hello2@example.xyz', 'nope2')
+                        }
+                    }
+                }).encode()
+            )
+
+            container_registries_login(self.REGISTRIES, auth_file_path)
+
+            container_registry_login_mock.assert_called_once_with(
+                container_registry_uri='registry.redhat.io',
+                container_registry_username='hello1@world.xyz',
+                container_registry_password='nope1',
+                container_registry_tls_verify=True,
+                containers_config_auth_file=ANY,
+                container_command_short_name=None,
+                container_command=get_container_login_command_mock.return_value
+            )
+
+    def test_login_error(
+        self,
+        get_container_login_command_mock,
+        container_registry_login_mock
+    ):
+        container_registry_login_mock.side_effect = write_login_auth_file_side_effect
+
+        with TempDirectory() as temp_dir:
+            auth_file_path = os.path.join(temp_dir.path, 'auth.json')
+
+            with self.assertRaisesRegex(
+                RuntimeError,
+                r'Failed to login to container registry \(registry.internal.example.xyz\)'
+            ):
+                container_registries_login(
+                    {
+                        'registry.redhat.io': {
+                            'username': 'hello1@world.xyz',
+                            'password': 'nope1'
+                        },
+                        'registry.internal.example.xyz': {
+                            'username': 'hello2@example.xyz',
+                            'password': 'bad-password'
+                        }
+                    },
+                    auth_file_path
+                )
+
+            with open(auth_file_path, encoding='utf-8') as auth_file:
+                self.assertEqual(list(json.load(auth_file)['auths']), ['registry.redhat.io'])
+
 class Test_create_container_from_image(BaseTestCase):
     @patch('sh.buildah', create=True)
     def test_success_default_repository_type(self, buildah_mock):
@@ -1403,6 +1656,132 @@ class Test_get_container_image_digest(BaseTestCase):
             containers_config_auth_file=None
         )
 
+@patch('sh.skopeo', create=True)
+class Test_get_container_image_manifest_digest(BaseTestCase):
+    def test_success(self, mock_skopeo):
+        manifest = b'{"schemaVersion": 2}'
+        mock_skopeo.inspect.return_value.stdout = manifest
+
+        digest = get_container_image_manifest_digest(
+            container_image_address='containers-storage:localhost/mock-org/mock-app:v42',
+            containers_config_auth_file='/mock/auth.json',
+            tls_verify=False
+        )
+
+        self.assertEqual(digest, f"sha256:{hashlib.sha256(manifest).hexdigest()}")
+        mock_skopeo.inspect.assert_called_once_with(
+            '--raw',
+            '--tls-verify=false',
+            '--authfile=/mock/auth.json',
+            'containers-storage:localhost/mock-org/mock-app:v42'
+        )
+
+    def test_error(self, mock_skopeo):
+        mock_skopeo.inspect.side_effect = sh.ErrorReturnCode('skopeo', b'mock out', b'mock error')
+
+        with self.assertRaisesRegex(
+            RuntimeError,
+            r'Error reading container image \(docker://mock-reg.xyz/mock-repo:v42\) manifest'
+        ):
+            get_container_image_manifest_digest(
+                container_image_address='docker://mock-reg.xyz/mock-repo:v42'
+            )
+
+class Test_get_containers_storage_root(BaseTestCase):
+    @patch('os.geteuid', return_value=0)
+    def test_root_default(self, mock_geteuid):
+        with TempDirectory() as temp_dir:
+            with patch.dict(os.environ, {
+                'CONTAINERS_STORAGE_CONF': os.path.join(temp_dir.path, 'does-not-exist.conf')
+            }):
+                self.assertEqual(get_containers_storage_root(), '/var/lib/containers/storage')
+
+    @patch('os.geteuid', return_value=1000)
+    def test_rootless_default(self, mock_geteuid):
+        with TempDirectory() as temp_dir:
+            with patch.dict(os.environ, {
+                'XDG_CONFIG_HOME': os.path.join(temp_dir.path, 'config'),
+                'XDG_DATA_HOME': os.path.join(temp_dir.path, 'data')
+            }):
+                self.assertEqual(
+                    get_containers_storage_root(),
+                    os.path.join(temp_dir.path, 'data', 'containers', 'storage')
+                )
+
+    def test_graphroot_from_storage_conf(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('storage.conf', b'''[storage]
+driver = "overlay"
+graphroot = "/mock/storage"
+''')
+            with patch.dict(os.environ, {
+                'CONTAINERS_STORAGE_CONF': os.path.join(temp_dir.path, 'storage.conf')
+            }):
+                self.assertEqual(get_containers_storage_root(), '/mock/storage')
+
+class Test_get_local_container_image_digest(BaseTestCase):
+    IMAGES = [
+        {
+            'id': 'mockid1',
+            'digest': 'sha256:mockdigest1',
+            'names': ['localhost/mock-org/mock-app:v42']
+        },
+        {
+            'id': 'mockid2',
+            'digest': 'sha256:mockdigest2',
+            'names': ['localhost/mock-org/mock-app:v43']
+        }
+    ]
+
+    def test_by_container_image_id_file(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('storage/overlay-images/images.json', json.dumps(self.IMAGES).encode())
+            temp_dir.write('container-image-id', b'sha256:mockid2')
+
+            self.assertEqual(
+                get_local_container_image_digest(
+                    container_image_address='localhost/mock-org/mock-app:v42',
+                    container_image_id_file=os.path.join(temp_dir.path, 'container-image-id'),
+                    containers_storage_root=os.path.join(temp_dir.path, 'storage')
+                ),
+                'sha256:mockdigest2'
+            )
+
+    def test_by_container_image_address(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('storage/vfs-images/images.json', json.dumps(self.IMAGES).encode())
+
+            self.assertEqual(
+                get_local_container_image_digest(
+                    container_image_address='localhost/mock-org/mock-app:v42',
+                    container_image_id_file=os.path.join(temp_dir.path, 'does-not-exist'),
+                    containers_storage_root=os.path.join(temp_dir.path, 'storage')
+                ),
+                'sha256:mockdigest1'
+            )
+
+    def test_not_found(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('storage/overlay-images/images.json', json.dumps(self.IMAGES).encode())
+
+            self.assertIsNone(
+                get_local_container_image_digest(
+                    container_image_address='localhost/mock-org/mock-app:v44',
+                    containers_storage_root=os.path.join(temp_dir.path, 'storage')
+                )
+            )
+
+    def test_invalid_images_file(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('storage/overlay-images/images.json', b'not json')
+
+            self.assertIsNone(
+                get_local_container_image_digest(
+                    container_image_address='localhost/mock-org/mock-app:v42',
+                    containers_storage_root=os.path.join(temp_dir.path, 'storage')
+                )
+            )
+
 class Test_add_container_build_step_result_artifacts(BaseTestCase):
     def test_success(self):
         # run test
@@ -1,3 +1,5 @@
+import gzip
+import lzma
 import os
 import urllib
 from unittest.mock import Mock, patch
@@ -9,9 +11,13 @@ from ploigos_step_runner.utils.file import (
     download_and_decompress_source_to_destination,
     get_file_hash,
     parse_yaml_or_json_file,
+    parse_yaml_or_json_files,
     upload_file,
     is_compressed,
     get_file_extension,
+    get_output_file_compression_extension,
+    open_output_file,
+    read_output_file,
 )
 from testfixtures import TempDirectory
 from tests.helpers.base_test_case import BaseTestCase
@@ -59,6 +65,57 @@ class TestParseYAMLOrJASONFile(BaseTestCase):
             parse_yaml_or_json_file(sample_file_path)
 
 
+class TestParseYAMLOrJSONFiles(BaseTestCase):
+    @staticmethod
+    def __write_files(test_dir, num_files):
+        file_paths = []
+        for index in range(num_files):
+            file_paths.append(test_dir.write(
+                f"file{index}.yml",
+                bytes(f"index: {index}\n", 'utf-8')
+            ))
+
+        return file_paths
+
+    def test_serial(self):
+        with TempDirectory() as test_dir:
+            file_paths = self.__write_files(test_dir, 3)
+
+            parsed_files = list(parse_yaml_or_json_files(file_paths))
+
+            self.assertEqual(parsed_files, [{'index': 0}, {'index': 1}, {'index': 2}])
+
+    def test_serial_one_worker(self):
+        with TempDirectory() as test_dir:
+            file_paths = self.__write_files(test_dir, 20)
+
+            parsed_files = list(parse_yaml_or_json_files(file_paths, max_workers=1))
+
+            self.assertEqual(parsed_files, [{'index': index} for index in range(20)])
+
+    def test_parallel_keeps_order(self):
+        with TempDirectory() as test_dir:
+            file_paths = self.__write_files(test_dir, 50)
+
+            parsed_files = list(parse_yaml_or_json_files(file_paths, max_workers=4))
+
+            self.assertEqual(parsed_files, [{'index': index} for index in range(50)])
+
+    def test_parallel_bad_file(self):
+        with TempDirectory() as test_dir:
+            file_paths = self.__write_files(test_dir, 20)
+            file_paths[10] = os.path.join(os.path.dirname(__file__), "files", "bad.yaml")
+
+            parsed_files = parse_yaml_or_json_files(file_paths, max_workers=4)
+            for index in range(10):
+                self.assertEqual(next(parsed_files), {'index': index})
+
+            with self.assertRaisesRegex(
+                ValueError, r"Error parsing file \(.+bad.yaml\) as YAML or JSON:"
+            ):
+                next(parsed_files)
+
+
 class TestDownloadAndDecompressSourceToDestination(BaseTestCase):
     def test_https_bz2(self):
         with TempDirectory() as test_dir:
@@ -462,3 +519,53 @@ class TestFileMisc(BaseTestCase):
 
         # Verification of results
         self.assertFalse(compressed)
+
+
+class TestOutputFiles(BaseTestCase):
+    def test_get_output_file_compression_extension(self):
+        self.assertEqual(get_output_file_compression_extension(None), '')
+        self.assertEqual(get_output_file_compression_extension('None'), '')
+        self.assertEqual(get_output_file_compression_extension('gzip'), '.gz')
+        self.assertEqual(get_output_file_compression_extension('XZ'), '.xz')
+
+    def test_get_output_file_compression_extension_unsupported(self):
+        with self.assertRaisesRegex(
+            ValueError,
+            r"Unsupported output file compression \(bz2\)"
+        ):
+            get_output_file_compression_extension('bz2')
+
+    def test_open_output_file_uncompressed(self):
+        with TempDirectory() as temp_dir:
+            output_file_path = os.path.join(temp_dir.path, 'output.txt')
+            with open_output_file(output_file_path, 'w') as output_file:
+                output_file.write('line 1\n')
+                output_file.write('line 2\n')
+
+            with open(output_file_path, encoding='utf-8') as output_file:
+                self.assertEqual(output_file.read(), 'line 1\nline 2\n')
+            self.assertEqual(read_output_file(output_file_path), 'line 1\nline 2\n')
+
+    def test_open_output_file_gzip(self):
+        with TempDirectory() as temp_dir:
+            output_file_path = os.path.join(temp_dir.path, 'output.txt.gz')
+            with open_output_file(output_file_path, 'w') as output_file:
+                for index in range(1000):
+                    output_file.write(f'line {index}\n')
+
+            with gzip.open(output_file_path, 'rt', encoding='utf-8') as output_file:
+                self.assertEqual(len(output_file.readlines()), 1000)
+            self.assertTrue(read_output_file(output_file_path).endswith('line 999\n'))
+            self.assertLess(os.path.getsize(output_file_path), 1000 * len('line 999\n'))
+
+    def test_open_output_file_xz(self):
+        with TempDirectory() as temp_dir:
+            output_file_path = os.path.join(temp_dir.path, 'output.txt.xz')
+            with open_output_file(output_file_path, 'w') as output_file:
+                for index in range(1000):
+                    output_file.write(f'line {index}\n')
+
+            with lzma.open(output_file_path, 'rt', encoding='utf-8') as output_file:
+                self.assertEqual(len(output_file.readlines()), 1000)
+            self.assertTrue(read_output_file(output_file_path).endswith('line 999\n'))
+            self.assertLess(os.path.getsize(output_file_path), 1000 * len('line 999\n'))
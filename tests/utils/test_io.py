@@ -1,14 +1,22 @@
 import copy
+import gzip
 import io
 import json
+import os
 import re
 import sys
+import threading
+import time
 from contextlib import redirect_stdout
 from io import StringIO
+from unittest.mock import MagicMock
 
 import yaml
+from testfixtures import TempDirectory
 from tests.helpers.base_test_case import BaseTestCase
-from ploigos_step_runner.utils.io import (TextIOIndenter, TextIOSelectiveObfuscator,
+from ploigos_step_runner.utils.file import open_output_file
+from ploigos_step_runner.utils.io import (TextIOIndenter, TextIOLineBuffer,
+                           TextIORingBuffer, TextIOSelectiveObfuscator,
                            create_sh_redirect_to_multiple_streams_fn_callback)
 
 class TestCreateSHRedirectToMultipleStreamsFNCallback(BaseTestCase):
@@ -37,6 +45,231 @@ class TestCreateSHRedirectToMultipleStreamsFNCallback(BaseTestCase):
         self.assertEqual('data1', stream_one.getvalue())
         self.assertEqual('data1', stream_two.getvalue())
 
+    def test_flush_interval_not_elapsed(self):
+        stream_one = MagicMock()
+        sh_redirect_to_multiple_streams_fn_callback = \
+            create_sh_redirect_to_multiple_streams_fn_callback(
+                [stream_one],
+                flush_interval=600
+            )
+
+        sh_redirect_to_multiple_streams_fn_callback('data1')
+        sh_redirect_to_multiple_streams_fn_callback('data2')
+
+        self.assertEqual(stream_one.write.call_count, 2)
+        stream_one.flush.assert_not_called()
+
+    def test_flush_interval_zero(self):
+        stream_one = MagicMock()
+        stream_two = MagicMock()
+        sh_redirect_to_multiple_streams_fn_callback = \
+            create_sh_redirect_to_multiple_streams_fn_callback(
+                [stream_one, stream_two],
+                flush_interval=0
+            )
+
+        sh_redirect_to_multiple_streams_fn_callback('data1')
+        sh_redirect_to_multiple_streams_fn_callback('data2')
+
+        self.assertEqual(stream_one.flush.call_count, 2)
+        self.assertEqual(stream_two.flush.call_count, 2)
+
+    def test_idle_flush_after_flush_interval(self):
+        stream_one = MagicMock()
+        sh_redirect_to_multiple_streams_fn_callback = \
+            create_sh_redirect_to_multiple_streams_fn_callback(
+                [stream_one],
+                flush_interval=0.05
+            )
+
+        sh_redirect_to_multiple_streams_fn_callback('data1')
+        stream_one.flush.assert_not_called()
+
+        time.sleep(0.5)
+        stream_one.flush.assert_called_once_with()
+
+    def test_finish_cancels_idle_flush(self):
+        stream_one = MagicMock()
+        sh_redirect_to_multiple_streams_fn_callback = \
+            create_sh_redirect_to_multiple_streams_fn_callback(
+                [stream_one],
+                flush_interval=0.05
+            )
+
+        sh_redirect_to_multiple_streams_fn_callback('data1')
+        sh_redirect_to_multiple_streams_fn_callback.finish()
+        stream_one.flush.assert_called_once_with()
+
+        time.sleep(0.5)
+        stream_one.flush.assert_called_once_with()
+
+    def test_finish_before_closing_compressed_stream(self):
+        with TempDirectory() as temp_dir:
+            output_file_path = os.path.join(temp_dir.path, 'output.txt.gz')
+            with open_output_file(output_file_path, 'w') as output_file:
+                sh_redirect_to_multiple_streams_fn_callback = \
+                    create_sh_redirect_to_multiple_streams_fn_callback(
+                        [output_file],
+                        flush_interval=0.05
+                    )
+
+                sh_redirect_to_multiple_streams_fn_callback('data1\n')
+                sh_redirect_to_multiple_streams_fn_callback.finish()
+
+            time.sleep(0.5)
+            with gzip.open(output_file_path, 'rt') as output_file:
+                self.assertEqual('data1\n', output_file.read())
+
+    def test_idle_flush_of_stream_failing_to_flush(self):
+        stream_one = MagicMock()
+        stream_one.closed = False
+        stream_one.flush.side_effect = OSError('mock flush error')
+        stream_two = MagicMock()
+        sh_redirect_to_multiple_streams_fn_callback = \
+            create_sh_redirect_to_multiple_streams_fn_callback(
+                [stream_one, stream_two],
+                flush_interval=0.05
+            )
+
+        sh_redirect_to_multiple_streams_fn_callback('data1')
+
+        time.sleep(0.5)
+        stream_one.flush.assert_called_once_with()
+        stream_two.flush.assert_called_once_with()
+
+class TestTextIOLineBuffer(BaseTestCase):
+    def test_buffers_until_flush_interval(self):
+        parent_stream = StringIO()
+        line_buffer = TextIOLineBuffer(parent_stream, flush_interval=600)
+
+        self.assertEqual(line_buffer.write('line one\n'), 9)
+        line_buffer.write('line two\n')
+        self.assertEqual(parent_stream.getvalue(), '')
+
+        line_buffer.flush()
+        self.assertEqual(parent_stream.getvalue(), 'line one\nline two\n')
+
+    def test_writes_whole_lines_in_one_write(self):
+        parent_stream = MagicMock()
+        line_buffer = TextIOLineBuffer(parent_stream, flush_interval=0)
+
+        line_buffer.write('line one\nline ')
+        parent_stream.write.assert_called_once_with('line one\n')
+
+        line_buffer.write('two')
+        parent_stream.write.assert_called_once_with('line one\n')
+
+        line_buffer.write('\nline three\r')
+        parent_stream.write.assert_called_with('line two\nline three\r')
+        self.assertEqual(parent_stream.write.call_count, 2)
+
+    def test_max_buffer_size(self):
+        parent_stream = StringIO()
+        line_buffer = TextIOLineBuffer(parent_stream, flush_interval=600, max_buffer_size=10)
+
+        line_buffer.write('12345')
+        self.assertEqual(parent_stream.getvalue(), '')
+
+        line_buffer.write('67890')
+        self.assertEqual(parent_stream.getvalue(), '1234567890')
+
+    def test_bytes(self):
+        parent_stream = StringIO()
+        line_buffer = TextIOLineBuffer(parent_stream, flush_interval=0)
+
+        line_buffer.write(b'hello world\n')
+        self.assertEqual(parent_stream.getvalue(), 'hello world\n')
+
+    def test_with_indenter(self):
+        parent_stream = StringIO()
+        line_buffer = TextIOLineBuffer(TextIOIndenter(parent_stream, 1), flush_interval=600)
+
+        line_buffer.write('hello\n')
+        line_buffer.write('world\n')
+        line_buffer.flush()
+        self.assertEqual(parent_stream.getvalue(), '    hello\n    world\n    ')
+
+    def test_close_writes_buffered(self):
+        parent_stream = StringIO()
+        line_buffer = TextIOLineBuffer(parent_stream, flush_interval=600)
+
+        line_buffer.write('hello')
+        line_buffer.close()
+        self.assertEqual(parent_stream.getvalue(), 'hello')
+        self.assertFalse(parent_stream.closed)
+
+    def test_idle_flush_after_flush_interval(self):
+        parent_stream = StringIO()
+        line_buffer = TextIOLineBuffer(parent_stream, flush_interval=0.05)
+
+        line_buffer.write('line1\n')
+        line_buffer.write('Running long test...\n')
+        line_buffer.write('partial')
+
+        time.sleep(0.5)
+        self.assertEqual(parent_stream.getvalue(), 'line1\nRunning long test...\n')
+        line_buffer.close()
+        self.assertEqual(parent_stream.getvalue(), 'line1\nRunning long test...\npartial')
+
+    def test_close_cancels_idle_flush(self):
+        parent_stream = StringIO()
+        line_buffer = TextIOLineBuffer(parent_stream, flush_interval=0.05)
+
+        line_buffer.write('hello\n')
+        line_buffer.close()
+        parent_stream.close()
+
+        time.sleep(0.2)
+        self.assertTrue(line_buffer.closed)
+
+class TestTextIORingBuffer(BaseTestCase):
+    def test_under_max_size(self):
+        ring_buffer = TextIORingBuffer(max_size=100)
+
+        self.assertEqual(ring_buffer.write('hello\n'), 6)
+        ring_buffer.write(b'world\n')
+
+        self.assertEqual(ring_buffer.getvalue(), 'hello\nworld\n')
+        self.assertFalse(ring_buffer.truncated)
+
+    def test_over_max_size(self):
+        ring_buffer = TextIORingBuffer(max_size=8)
+
+        for index in range(100):
+            ring_buffer.write(f"line {index}\n")
+
+        self.assertEqual(ring_buffer.getvalue(), 'line 99\n')
+        self.assertTrue(ring_buffer.truncated)
+
+    def test_max_lines(self):
+        ring_buffer = TextIORingBuffer(max_lines=2)
+
+        ring_buffer.write('line 1\nline 2\n')
+        ring_buffer.write('line 3\nline 4')
+
+        self.assertEqual(ring_buffer.getvalue(), 'line 3\nline 4')
+        self.assertTrue(ring_buffer.truncated)
+
+    def test_line_consumer(self):
+        lines = []
+        ring_buffer = TextIORingBuffer(max_size=8, line_consumer=lines.append)
+
+        ring_buffer.write('line 1\r\nli')
+        ring_buffer.write('ne 2\n\nline 3')
+        self.assertEqual(lines, ['line 1', 'line 2', ''])
+
+        ring_buffer.close()
+        self.assertEqual(lines, ['line 1', 'line 2', '', 'line 3'])
+        self.assertEqual(ring_buffer.getvalue(), '\n\nline 3')
+
+    def test_as_sh_redirect_stream(self):
+        ring_buffer = TextIORingBuffer(max_size=5)
+        callback = create_sh_redirect_to_multiple_streams_fn_callback([ring_buffer])
+
+        callback('hello world\n')
+
+        self.assertEqual(ring_buffer.getvalue(), 'orld\n')
+
 class TestTextIOSelectiveObfuscator(BaseTestCase):
     def run_test(self, input, expected, randomize_replacment_length=False, obfuscation_targets=None, replacment_char=None):
         out = io.StringIO()
@@ -52,6 +285,7 @@ class TestTextIOSelectiveObfuscator(BaseTestCase):
                 io_obfuscator.replacement_char = replacment_char
 
             io_obfuscator.write(input)
+            io_obfuscator.close()
 
             self.assertRegex(out.getvalue(), expected)
 
@@ -257,6 +491,140 @@ class TestTextIOSelectiveObfuscator(BaseTestCase):
             obfuscation_targets=private_key_block
         )
 
+    def test_overlapping_targets_longest_wins(self):
+        self.run_test(
+            input='hello world secretpassword should be hidden',
+            expected=r'^hello world \*{14} should be hidden$',
+            obfuscation_targets=['secret', 'secretpassword']
+        )
+
+    def test_empty_target_ignored(self):
+        self.run_test(
+            input='hello world',
+            expected='^hello world$',
+            obfuscation_targets=['', '   ']
+        )
+
+    def test_write_returns_given_length(self):
+        out = io.StringIO()
+        io_obfuscator = TextIOSelectiveObfuscator(parent_stream=out)
+        io_obfuscator.add_obfuscation_targets('secret')
+
+        self.assertEqual(io_obfuscator.write('hello secret'), 12)
+        self.assertEqual(io_obfuscator.write(b'hello secret'), 12)
+
+    def test_pattern_only_rebuilt_when_targets_change(self):
+        io_obfuscator = TextIOSelectiveObfuscator(parent_stream=io.StringIO())
+        io_obfuscator.add_obfuscation_targets(['secret', 'hidden'])
+        pattern = io_obfuscator._TextIOSelectiveObfuscator__partial_target_pattern
+
+        io_obfuscator.add_obfuscation_targets(['hidden', ' secret\n'])
+        self.assertIs(io_obfuscator._TextIOSelectiveObfuscator__partial_target_pattern, pattern)
+
+        io_obfuscator.add_obfuscation_targets('another')
+        self.assertIsNot(io_obfuscator._TextIOSelectiveObfuscator__partial_target_pattern, pattern)
+
+    def test_target_split_across_writes(self):
+        out = io.StringIO()
+        io_obfuscator = TextIOSelectiveObfuscator(
+            parent_stream=out,
+            randomize_replacment_length=False
+        )
+        io_obfuscator.add_obfuscation_targets('supersecret')
+
+        io_obfuscator.write('hello super')
+        io_obfuscator.flush()
+        self.assertEqual(out.getvalue(), 'hello ')
+
+        io_obfuscator.write('sec')
+        io_obfuscator.write('ret world\n')
+        self.assertEqual(out.getvalue(), 'hello *********** world\n')
+
+    def test_multi_line_target_split_across_writes(self):
+        out = io.StringIO()
+        io_obfuscator = TextIOSelectiveObfuscator(
+            parent_stream=out,
+            randomize_replacment_length=False
+        )
+        io_obfuscator.add_obfuscation_targets('line one\nline two')
+
+        io_obfuscator.write('key: line one\n')
+        io_obfuscator.write('     line t')
+        io_obfuscator.write('wo\ndone\n')
+        self.assertEqual(out.getvalue(), 'key: ' + '*' * 22 + '\ndone\n')
+
+    def test_long_multi_line_target_split_across_writes(self):
+        secret_lines = [f"{index:02d}" + 'abcdefghijklmnopqrstuvwxyz' * 2 for index in range(5)]
+
+        out = io.StringIO()
+        io_obfuscator = TextIOSelectiveObfuscator(
+            parent_stream=out,
+            randomize_replacment_length=False
+        )
+        io_obfuscator.add_obfuscation_targets('\n'.join(secret_lines))
+
+        io_obfuscator.write('key: |\n')
+        for secret_line in secret_lines:
+            io_obfuscator.write(f"    {secret_line[:30]}")
+            io_obfuscator.write(f"{secret_line[30:]}\n")
+        io_obfuscator.write('done\n')
+
+        self.assertRegex(out.getvalue(), r'^key: \|\n    \*+\ndone\n$')
+
+    def test_partial_target_not_a_match_written_on_next_write(self):
+        out = io.StringIO()
+        io_obfuscator = TextIOSelectiveObfuscator(parent_stream=out)
+        io_obfuscator.add_obfuscation_targets('supersecret')
+
+        io_obfuscator.write('hello super')
+        io_obfuscator.write('man\n')
+        self.assertEqual(out.getvalue(), 'hello superman\n')
+
+    def test_close_writes_held_text(self):
+        out = io.StringIO()
+        io_obfuscator = TextIOSelectiveObfuscator(parent_stream=out)
+        io_obfuscator.add_obfuscation_targets('supersecret')
+
+        io_obfuscator.write('hello super')
+        self.assertEqual(out.getvalue(), 'hello ')
+
+        io_obfuscator.close()
+        self.assertEqual(out.getvalue(), 'hello super')
+        self.assertFalse(out.closed)
+
+    def test_add_obfuscation_targets_from_many_threads(self):
+        # switch threads as often as possible to give any race the best chance of happening
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, switch_interval)
+
+        for _ in range(50):
+            out = io.StringIO()
+            io_obfuscator = TextIOSelectiveObfuscator(parent_stream=out)
+            secrets = [
+                [f"secret-{thread_index}-{secret_index}" for secret_index in range(5)]
+                for thread_index in range(8)
+            ]
+            barrier = threading.Barrier(len(secrets))
+
+            def add_secrets(thread_secrets):
+                barrier.wait()
+                for secret in thread_secrets:
+                    io_obfuscator.add_obfuscation_targets(secret)
+
+            threads = [
+                threading.Thread(target=add_secrets, args=(thread_secrets,))
+                for thread_secrets in secrets
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            io_obfuscator.write(' '.join(sum(secrets, [])) + '\n')
+            io_obfuscator.close()
+            self.assertNotIn('secret-', out.getvalue())
+
 class TestTextIOIndenter(BaseTestCase):
     def __run_test(self, inputs, expected, indent_level=0, indent_size=4, indent_char=' '):
         out = io.StringIO()
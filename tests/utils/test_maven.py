@@ -2,7 +2,9 @@
 
 Test for the utility for maven operations.
 """
-from io import BytesIO, IOBase
+import re
+from contextlib import redirect_stdout
+from io import BytesIO, IOBase, StringIO
 from pathlib import Path
 from unittest.mock import call, mock_open, patch
 
@@ -127,6 +129,23 @@ class TestMavenUtils_other(BaseTestCase):
             ):
                 generate_maven_settings(temp_dir.path, None, None, maven_mirrors)
 
+    def test_generate_maven_settings_local_repository(self):
+        with TempDirectory() as temp_dir:
+            generate_maven_settings(
+                temp_dir.path,
+                None,
+                None,
+                None,
+                local_repository=os.path.join(temp_dir.path, 'repository')
+            )
+            with open(temp_dir.path + '/settings.xml', 'r') as tester:
+                results = tester.read()
+                self.assertEqual(
+                    results,
+                    f'<settings><localRepository>{temp_dir.path}/repository'
+                    '</localRepository></settings>'
+                )
+
     def test_generate_maven_params_empty(self):
         settings = '<settings />'
 
@@ -1006,6 +1025,25 @@ class TestMavenUtils_write_effective_pom(BaseTestCase):
             '-P', 'mock-profile1'
         )
 
+    def test_with_settings_file(self, mvn_mock):
+        pom_file_path = 'input/pom.xml'
+        effective_pom_path = '/tmp/output/effective-pom.xml'
+
+        actual_effective_pom_path = write_effective_pom(
+            pom_file_path=pom_file_path,
+            output_path=effective_pom_path,
+            profiles='mock-profile1',
+            settings_file='/mock/settings.xml'
+        )
+        self.assertEqual(actual_effective_pom_path, effective_pom_path)
+        mvn_mock.assert_any_call(
+            'help:effective-pom',
+            f'-f={pom_file_path}',
+            f'-Doutput={effective_pom_path}',
+            '-P', 'mock-profile1',
+            '-s', '/mock/settings.xml'
+        )
+
     def test_with_one_profile_list(self, mvn_mock):
         pom_file_path = 'input/pom.xml'
         effective_pom_path = '/tmp/output/effective-pom.xml'
@@ -1040,6 +1078,51 @@ class TestMavenUtils_write_effective_pom(BaseTestCase):
             '-P', 'mock-profile1,mock-profile2'
         )
 
+    @patch('ploigos_step_runner.utils.maven.shutil.which', return_value='/usr/bin/mvnd')
+    @patch('sh.mvnd', create=True)
+    def test_with_maven_command(self, mvnd_mock, which_mock, mvn_mock):
+        pom_file_path = 'input/pom.xml'
+        effective_pom_path = '/tmp/output/effective-pom.xml'
+
+        actual_effective_pom_path = write_effective_pom(
+            pom_file_path=pom_file_path,
+            output_path=effective_pom_path,
+            maven_command='auto'
+        )
+        self.assertEqual(actual_effective_pom_path, effective_pom_path)
+        mvnd_mock.assert_any_call(
+            'help:effective-pom',
+            f'-f={pom_file_path}',
+            f'-Doutput={effective_pom_path}'
+        )
+        mvn_mock.assert_not_called()
+
+    def test_with_settings_file_with_local_repository(self, mvn_mock):
+        with TempDirectory() as temp_dir:
+            settings_file = generate_maven_settings(
+                temp_dir.path,
+                None,
+                None,
+                None,
+                local_repository=os.path.join(temp_dir.path, 'repository')
+            )
+            pom_file_path = 'input/pom.xml'
+            effective_pom_path = '/tmp/output/effective-pom.xml'
+
+            write_effective_pom(
+                pom_file_path=pom_file_path,
+                output_path=effective_pom_path,
+                settings_file=settings_file
+            )
+            mvn_mock.assert_any_call(
+                'help:effective-pom',
+                f'-f={pom_file_path}',
+                f'-Doutput={effective_pom_path}',
+                '-s', settings_file,
+                '-Daether.syncContext.named.factory=file-lock',
+                '-Daether.syncContext.named.nameMapper=file-gav'
+            )
+
     def test_fail(self, mvn_mock):
         pom_file_path = 'input/pom.xml'
         effective_pom_path = '/tmp/output/effective-pom.xml'
@@ -1101,7 +1184,12 @@ class TestMavenUtils_get_effective_pom(BaseTestCase):
     def test_does_call_once(self, mock_write_effective_pom):
         with TempDirectory() as temp_dir:
             # set up mock
-            def mock_write_effective_pom_side_effect(pom_file_path, output_path, profiles):
+            def mock_write_effective_pom_side_effect(
+                pom_file_path,
+                output_path,
+                profiles,
+                maven_command
+            ):
                 Path(output_path).touch()
             mock_write_effective_pom.side_effect = mock_write_effective_pom_side_effect
 
@@ -1118,13 +1206,19 @@ class TestMavenUtils_get_effective_pom(BaseTestCase):
             mock_write_effective_pom.assert_called_once_with(
                 pom_file_path='mock-pom.xml',
                 output_path=expected_effective_pom,
-                profiles=None
+                profiles=None,
+                maven_command='mvn'
             )
 
     def test_does_call_twice(self, mock_write_effective_pom):
         with TempDirectory() as temp_dir:
             # set up mock
-            def mock_write_effective_pom_side_effect(pom_file_path, output_path, profiles):
+            def mock_write_effective_pom_side_effect(
+                pom_file_path,
+                output_path,
+                profiles,
+                maven_command
+            ):
                 Path(output_path).touch()
             mock_write_effective_pom.side_effect = mock_write_effective_pom_side_effect
 
@@ -1141,7 +1235,8 @@ class TestMavenUtils_get_effective_pom(BaseTestCase):
             mock_write_effective_pom.assert_called_once_with(
                 pom_file_path='mock-pom.xml',
                 output_path=expected_effective_pom,
-                profiles=None
+                profiles=None,
+                maven_command='mvn'
             )
 
             # run test (second call)
@@ -1157,6 +1252,238 @@ class TestMavenUtils_get_effective_pom(BaseTestCase):
             self.assertEqual(effective_pom, expected_effective_pom)
             mock_write_effective_pom.assert_not_called()
 
+    def test_cache_dir_path(self, mock_write_effective_pom):
+        with TempDirectory() as temp_dir:
+            # set up mock
+            def mock_write_effective_pom_side_effect(
+                pom_file_path,
+                output_path,
+                profiles,
+                settings_file,
+                maven_command
+            ):
+                Path(output_path).touch()
+            mock_write_effective_pom.side_effect = mock_write_effective_pom_side_effect
+            temp_dir.write('pom.xml', b'<project></project>')
+            temp_dir.write('settings.xml', b'<settings></settings>')
+            pom_file_path = os.path.join(temp_dir.path, 'pom.xml')
+            settings_file_path = os.path.join(temp_dir.path, 'settings.xml')
+            cache_dir_path = os.path.join(temp_dir.path, 'cache')
+
+            # run test (first call)
+            effective_pom = get_effective_pom(
+                work_dir_path=os.path.join(temp_dir.path, 'work-dir-1'),
+                pom_file=pom_file_path,
+                profiles=None,
+                settings_file=settings_file_path,
+                cache_dir_path=cache_dir_path
+            )
+
+            # validate
+            expected_effective_pom = os.path.join(
+                cache_dir_path,
+                'effective-pom-' + get_effective_pom_cache_key(
+                    pom_file=pom_file_path,
+                    settings_file=settings_file_path
+                ) + '.xml'
+            )
+            self.assertEqual(effective_pom, expected_effective_pom)
+            self.assertTrue(os.path.exists(expected_effective_pom))
+            self.assertEqual(os.listdir(cache_dir_path), [os.path.basename(expected_effective_pom)])
+            mock_write_effective_pom.assert_called_once_with(
+                pom_file_path=pom_file_path,
+                output_path=f"{expected_effective_pom}.{os.getpid()}.tmp",
+                profiles=None,
+                settings_file=settings_file_path,
+                maven_command='mvn'
+            )
+
+            # run test (second call from a different work dir)
+            mock_write_effective_pom.reset_mock()
+            effective_pom = get_effective_pom(
+                work_dir_path=os.path.join(temp_dir.path, 'work-dir-2'),
+                pom_file=pom_file_path,
+                profiles=None,
+                settings_file=settings_file_path,
+                cache_dir_path=cache_dir_path
+            )
+            self.assertEqual(effective_pom, expected_effective_pom)
+            mock_write_effective_pom.assert_not_called()
+
+    def test_cache_dir_path_write_error(self, mock_write_effective_pom):
+        with TempDirectory() as temp_dir:
+            # set up mock
+            def mock_write_effective_pom_side_effect(
+                pom_file_path,
+                output_path,
+                profiles,
+                settings_file,
+                maven_command
+            ):
+                Path(output_path).touch()
+                raise StepRunnerException('mock error')
+            mock_write_effective_pom.side_effect = mock_write_effective_pom_side_effect
+            temp_dir.write('pom.xml', b'<project></project>')
+            cache_dir_path = os.path.join(temp_dir.path, 'cache')
+
+            # run test
+            with self.assertRaisesRegex(StepRunnerException, 'mock error'):
+                get_effective_pom(
+                    work_dir_path=temp_dir.path,
+                    pom_file=os.path.join(temp_dir.path, 'pom.xml'),
+                    profiles=None,
+                    cache_dir_path=cache_dir_path
+                )
+
+            # validate
+            self.assertEqual(os.listdir(cache_dir_path), [])
+
+class TestMavenUtils_get_pom_files(BaseTestCase):
+    def test_no_related_poms(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('pom.xml', b'<project></project>')
+
+            self.assertEqual(
+                get_pom_files(os.path.join(temp_dir.path, 'pom.xml')),
+                [os.path.join(temp_dir.path, 'pom.xml')]
+            )
+
+    def test_parent_and_modules(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write(
+                'pom.xml',
+                b'<project xmlns="http://maven.apache.org/POM/4.0.0">'
+                b'<modules><module>app</module><module>lib/lib-pom.xml</module></modules>'
+                b'<profiles><profile><modules><module>extra</module></modules></profile></profiles>'
+                b'</project>'
+            )
+            temp_dir.write(
+                'app/pom.xml',
+                b'<project xmlns="http://maven.apache.org/POM/4.0.0">'
+                b'<parent><artifactId>root</artifactId></parent>'
+                b'</project>'
+            )
+            temp_dir.write(
+                'lib/lib-pom.xml',
+                b'<project><parent><relativePath/></parent></project>'
+            )
+            temp_dir.write('extra/pom.xml', b'not xml')
+
+            self.assertEqual(
+                get_pom_files(os.path.join(temp_dir.path, 'app', 'pom.xml')),
+                [
+                    os.path.join(temp_dir.path, 'app', 'pom.xml'),
+                    os.path.join(temp_dir.path, 'pom.xml'),
+                    os.path.join(temp_dir.path, 'lib', 'lib-pom.xml'),
+                    os.path.join(temp_dir.path, 'extra', 'pom.xml')
+                ]
+            )
+
+    def test_missing_parent(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write(
+                'app/pom.xml',
+                b'<project><parent><relativePath>../does-not-exist.xml</relativePath></parent>'
+                b'</project>'
+            )
+
+            self.assertEqual(
+                get_pom_files(os.path.join(temp_dir.path, 'app', 'pom.xml')),
+                [os.path.join(temp_dir.path, 'app', 'pom.xml')]
+            )
+
+class TestMavenUtils_get_effective_pom_cache_key(BaseTestCase):
+    def test_changes_with_inputs(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('pom.xml', b'<project><modules><module>app</module></modules></project>')
+            temp_dir.write('app/pom.xml', b'<project><version>1</version></project>')
+            temp_dir.write('settings.xml', b'<settings></settings>')
+            pom_file_path = os.path.join(temp_dir.path, 'pom.xml')
+            settings_file_path = os.path.join(temp_dir.path, 'settings.xml')
+
+            cache_key = get_effective_pom_cache_key(pom_file_path)
+            self.assertEqual(cache_key, get_effective_pom_cache_key(pom_file_path, profiles=[]))
+
+            cache_keys = {
+                cache_key,
+                get_effective_pom_cache_key(pom_file_path, profiles='mock-profile1'),
+                get_effective_pom_cache_key(pom_file_path, settings_file=settings_file_path)
+            }
+
+            temp_dir.write('app/pom.xml', b'<project><version>2</version></project>')
+            cache_keys.add(get_effective_pom_cache_key(pom_file_path))
+
+            self.assertEqual(len(cache_keys), 4)
+            self.assertEqual(
+                get_effective_pom_cache_key(pom_file_path, profiles='mock-profile1'),
+                get_effective_pom_cache_key(pom_file_path, profiles=['mock-profile1'])
+            )
+
+class TestMavenUtils_get_effective_pom_dependencies_hash(BaseTestCase):
+    EFFECTIVE_POM = """<projects>
+      <project xmlns="http://maven.apache.org/POM/4.0.0">
+        <dependencies>
+          <dependency>
+            <groupId>com.example</groupId>
+            <artifactId>mock-dependency-a</artifactId>
+            <version>{version}</version>
+          </dependency>
+          <dependency>
+            <groupId>com.example</groupId>
+            <artifactId>mock-dependency-b</artifactId>
+            <version>1.0.0</version>
+            <exclusions>
+              <exclusion><groupId>*</groupId></exclusion>
+            </exclusions>
+          </dependency>
+        </dependencies>
+        <build>
+          <plugins>
+            <plugin>
+              <artifactId>maven-surefire-plugin</artifactId>
+              <version>2.22.2</version>
+            </plugin>
+          </plugins>
+        </build>
+      </project>
+    </projects>"""
+
+    def __get_hash(self, temp_dir, file_name, effective_pom):
+        temp_dir.write(file_name, effective_pom.encode('utf-8'))
+        return get_effective_pom_dependencies_hash(os.path.join(temp_dir.path, file_name))
+
+    def test_same_dependencies_same_hash(self):
+        with TempDirectory() as temp_dir:
+            effective_pom = self.EFFECTIVE_POM.format(version='1.0.0')
+            reordered_effective_pom = effective_pom.replace(
+                'mock-dependency-a', 'mock-dependency-tmp'
+            ).replace(
+                'mock-dependency-b', 'mock-dependency-a'
+            ).replace(
+                'mock-dependency-tmp', 'mock-dependency-b'
+            )
+
+            self.assertEqual(
+                self.__get_hash(temp_dir, 'a.xml', effective_pom),
+                self.__get_hash(temp_dir, 'b.xml', reordered_effective_pom)
+            )
+
+    def test_different_dependencies_different_hash(self):
+        with TempDirectory() as temp_dir:
+            self.assertNotEqual(
+                self.__get_hash(temp_dir, 'a.xml', self.EFFECTIVE_POM.format(version='1.0.0')),
+                self.__get_hash(temp_dir, 'b.xml', self.EFFECTIVE_POM.format(version='1.0.1'))
+            )
+
+    def test_different_plugins_different_hash(self):
+        with TempDirectory() as temp_dir:
+            effective_pom = self.EFFECTIVE_POM.format(version='1.0.0')
+            self.assertNotEqual(
+                self.__get_hash(temp_dir, 'a.xml', effective_pom),
+                self.__get_hash(temp_dir, 'b.xml', effective_pom.replace('2.22.2', '3.0.0'))
+            )
+
+
 class TestMavenUtils_get_maven_plugin_xml_element_path(BaseTestCase):
     def test_given_plugin_name(self):
         actual_xml_element_path = get_maven_plugin_xml_element_path('maven-surefire-plugin')
@@ -1422,374 +1749,417 @@ class TestMavenUtils_run_maven(BaseTestCase):
                     _err=Any(StringIO)
                 )
 
-@patch('ploigos_step_runner.utils.maven.get_xml_element_text_by_path')
-@patch('ploigos_step_runner.utils.maven.get_xml_element_by_path')
-@patch('ploigos_step_runner.utils.maven.get_maven_plugin_xml_element_path')
-@patch('ploigos_step_runner.utils.maven.get_effective_pom')
-class TestMavenUtils_get_plugin_configuration_values(BaseTestCase):
-    def test_no_profiles_no_phases(
-        self,
-        mock_get_effective_pom,
-        mock_get_maven_plugin_xml_element_path,
-        mock_get_xml_element_by_path,
-        mock_get_xml_element_text_by_path
-    ):
-        # set up mocks
-        mock_get_xml_element_text_by_path.return_value = ['mock-config-value-1']
+    @patch('sh.mvn', create=True)
+    def test_success_output_capture(self, mvn_mock):
+        def mvn_side_effect(*_args, **kwargs):
+            for index in range(1000):
+                kwargs['_out'](f"\x1b[1mline {index}\x1b[m\n")
 
-        # run test
-        actual_values = get_plugin_configuration_values(
-            plugin_name='mock-maven-plugin',
-            configuration_key='mockAwesomeConfig',
-            work_dir_path='/mock/work_dir',
-            pom_file='mock-pom.xml',
-            profiles=None,
-            phases_and_goals=None
-        )
+        mvn_mock.side_effect = mvn_side_effect
 
-        # validate
-        self.assertEqual(actual_values, ['mock-config-value-1'])
-        mock_get_xml_element_text_by_path.assert_called_once()
-        mock_get_effective_pom.assert_called_once_with(
-            work_dir_path='/mock/work_dir',
-            pom_file='mock-pom.xml',
-            profiles=None
-        )
+        with TempDirectory() as temp_dir:
+            mvn_output_file_path = os.path.join(temp_dir.path, 'maven_output.txt')
+            consumed_lines = []
 
-    def test_with_profile_no_phases(
-        self,
-        mock_get_effective_pom,
-        mock_get_maven_plugin_xml_element_path,
-        mock_get_xml_element_by_path,
-        mock_get_xml_element_text_by_path
-    ):
-        # set up mocks
-        mock_get_xml_element_text_by_path.return_value = ['mock-config-value-1']
+            with redirect_stdout(StringIO()):
+                maven_output = run_maven(
+                    mvn_output_file_path=mvn_output_file_path,
+                    settings_file='/fake/settings.xml',
+                    pom_file='/fake/pom.xml',
+                    phases_and_goals='fake',
+                    output_capture_size=50,
+                    output_line_consumer=consumed_lines.append
+                )
 
-        # run test
-        actual_values = get_plugin_configuration_values(
-            plugin_name='mock-maven-plugin',
-            configuration_key='mockAwesomeConfig',
-            work_dir_path='/mock/work_dir',
-            pom_file='mock-pom.xml',
-            profiles=['mock-profile'],
-            phases_and_goals=None
-        )
+            self.assertTrue(maven_output.endswith('line 998\nline 999'))
+            self.assertNotIn('line 900', maven_output)
+            self.assertEqual(len(consumed_lines), 1000)
+            self.assertEqual(consumed_lines[0], 'line 0')
 
-        # validate
-        self.assertEqual(actual_values, ['mock-config-value-1'])
-        mock_get_xml_element_text_by_path.assert_called_once()
-        mock_get_effective_pom.assert_called_once_with(
-            work_dir_path='/mock/work_dir',
-            pom_file='mock-pom.xml',
-            profiles=['mock-profile']
-        )
+            with open(mvn_output_file_path, encoding='utf-8') as mvn_output_file:
+                self.assertEqual(len(mvn_output_file.readlines()), 1000)
+
+    @patch('ploigos_step_runner.utils.maven.shutil.which', return_value='/usr/bin/mvnd')
+    @patch('sh.mvnd', create=True)
+    @patch('ploigos_step_runner.utils.maven.create_sh_redirect_to_multiple_streams_fn_callback')
+    @patch("builtins.open", new_callable=mock_open)
+    def test_success_maven_daemon_with_threads(self, mock_open, redirect_mock, mvnd_mock, which_mock):
+        with TempDirectory() as temp_dir:
+            mvn_output_file_path = os.path.join(temp_dir.path, 'maven_output.txt')
+
+            run_maven(
+                mvn_output_file_path=mvn_output_file_path,
+                settings_file='/fake/settings.xml',
+                pom_file='/fake/pom.xml',
+                phases_and_goals='fake',
+                maven_command='mvnd',
+                threads='1C'
+            )
+
+            mvnd_mock.assert_called_once_with(
+                'fake',
+                '-f', '/fake/pom.xml',
+                '-s', '/fake/settings.xml',
+                '--no-transfer-progress',
+                '-T', '1C',
+                _out=Any(StringIO),
+                _err=Any(StringIO)
+            )
+            which_mock.assert_called_once_with('mvnd')
 
-    def test_with_no_profiles_one_phase_with_one_matching_config(
+    @patch(
+        'ploigos_step_runner.utils.maven.get_local_repository_locking_arguments',
+        return_value=MAVEN_LOCAL_REPOSITORY_LOCKING_ARGUMENTS
+    )
+    @patch('sh.mvn', create=True)
+    @patch('ploigos_step_runner.utils.maven.create_sh_redirect_to_multiple_streams_fn_callback')
+    @patch("builtins.open", new_callable=mock_open)
+    def test_success_with_local_repository(
         self,
-        mock_get_effective_pom,
-        mock_get_maven_plugin_xml_element_path,
-        mock_get_xml_element_by_path,
-        mock_get_xml_element_text_by_path
+        mock_open,
+        redirect_mock,
+        mvn_mock,
+        locking_arguments_mock
     ):
-        mock_phases_with_values = ['mock-test-phase']
-
-        # set up mocks
-        def mock_get_xml_element_text_by_path_side_effect(
-            xml_file_path,
-            xpath,
-            default_namespace=None,
-            xml_namespace_dict=None,
-            find_all=False
-        ):
-            for mock_phase in mock_phases_with_values:
-                if f'[mvn:phase="{mock_phase}"]' in xpath:
-                    return [f'{mock_phase}-mock-config-value']
+        with TempDirectory() as temp_dir:
+            mvn_output_file_path = os.path.join(temp_dir.path, 'maven_output.txt')
 
-        mock_get_xml_element_text_by_path.side_effect = mock_get_xml_element_text_by_path_side_effect
+            run_maven(
+                mvn_output_file_path=mvn_output_file_path,
+                settings_file='/fake/settings.xml',
+                pom_file='/fake/pom.xml',
+                phases_and_goals='fake',
+                additional_arguments=['-Dfake.arg=True']
+            )
 
-        # run test
-        actual_values = get_plugin_configuration_values(
-            plugin_name='mock-maven-plugin',
-            configuration_key='mockAwesomeConfig',
-            work_dir_path='/mock/work_dir',
-            pom_file='mock-pom.xml',
-            profiles=None,
-            phases_and_goals=['mock-test-phase']
-        )
+            locking_arguments_mock.assert_called_once_with('/fake/settings.xml')
+            mvn_mock.assert_called_once_with(
+                'fake',
+                '-f', '/fake/pom.xml',
+                '-s', '/fake/settings.xml',
+                '--no-transfer-progress',
+                '-Daether.syncContext.named.factory=file-lock',
+                '-Daether.syncContext.named.nameMapper=file-gav',
+                '-Dfake.arg=True',
+                _out=Any(StringIO),
+                _err=Any(StringIO)
+            )
 
-        # validate
-        self.assertEqual(actual_values, ['mock-test-phase-mock-config-value'])
-        self.assertEqual(mock_get_xml_element_text_by_path.call_count, 2)
-        mock_get_effective_pom.assert_called_once_with(
-            work_dir_path='/mock/work_dir',
-            pom_file='mock-pom.xml',
-            profiles=None
+class TestMavenUtils_get_local_repository_locking_arguments(BaseTestCase):
+    def test_no_settings_file(self):
+        self.assertEqual(get_local_repository_locking_arguments(None), [])
+
+    def test_settings_file_does_not_exist(self):
+        self.assertEqual(get_local_repository_locking_arguments('/does/not/exist.xml'), [])
+
+    def test_settings_file_not_xml(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('settings.xml', b'not xml')
+
+            self.assertEqual(
+                get_local_repository_locking_arguments(os.path.join(temp_dir.path, 'settings.xml')),
+                []
+            )
+
+    def test_no_local_repository(self):
+        with TempDirectory() as temp_dir:
+            settings_file = generate_maven_settings(temp_dir.path, None, None, None)
+
+            self.assertEqual(get_local_repository_locking_arguments(settings_file), [])
+
+    def test_local_repository(self):
+        with TempDirectory() as temp_dir:
+            settings_file = generate_maven_settings(
+                temp_dir.path,
+                None,
+                None,
+                None,
+                local_repository=os.path.join(temp_dir.path, 'repository')
+            )
+
+            self.assertEqual(
+                get_local_repository_locking_arguments(settings_file),
+                [
+                    '-Daether.syncContext.named.factory=file-lock',
+                    '-Daether.syncContext.named.nameMapper=file-gav'
+                ]
+            )
+
+    def test_local_repository_namespaced_settings(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write(
+                'settings.xml',
+                b'<settings xmlns="http://maven.apache.org/SETTINGS/1.0.0">'
+                b'<localRepository>/mock/repository</localRepository>'
+                b'</settings>'
+            )
+
+            self.assertEqual(
+                get_local_repository_locking_arguments(os.path.join(temp_dir.path, 'settings.xml')),
+                MAVEN_LOCAL_REPOSITORY_LOCKING_ARGUMENTS
+            )
+
+
+@patch('ploigos_step_runner.utils.maven.shutil.which')
+class TestMavenUtils_resolve_maven_command(BaseTestCase):
+    def test_mvn(self, which_mock):
+        self.assertEqual(resolve_maven_command('mvn'), 'mvn')
+        which_mock.assert_not_called()
+
+    def test_none(self, which_mock):
+        with patch('sys.stdout', new_callable=StringIO) as stdout_mock:
+            self.assertEqual(resolve_maven_command(None), 'mvn')
+
+        which_mock.assert_not_called()
+        self.assertEqual(stdout_mock.getvalue(), '')
+
+    def test_empty(self, which_mock):
+        with patch('sys.stdout', new_callable=StringIO) as stdout_mock:
+            self.assertEqual(resolve_maven_command(''), 'mvn')
+
+        which_mock.assert_not_called()
+        self.assertEqual(stdout_mock.getvalue(), '')
+
+    def test_given_command_found(self, which_mock):
+        which_mock.return_value = '/usr/bin/mvnd'
+
+        self.assertEqual(resolve_maven_command('mvnd'), 'mvnd')
+
+    def test_given_command_not_found(self, which_mock):
+        which_mock.return_value = None
+
+        with patch('sys.stdout', new_callable=StringIO) as stdout_mock:
+            self.assertEqual(resolve_maven_command('mvnd'), 'mvn')
+
+        self.assertRegex(
+            stdout_mock.getvalue(),
+            r'WARNING: Given maven command \(mvnd\) not found on path, falling back to mvn.'
         )
 
-    def test_with_no_profiles_one_phase_with_multiple_matching_config(
+    def test_auto_maven_daemon_found(self, which_mock):
+        which_mock.side_effect = lambda command: f'/usr/bin/{command}'
+
+        self.assertEqual(resolve_maven_command('auto'), 'mvnd')
+
+    def test_auto_only_mvn_found(self, which_mock):
+        which_mock.side_effect = lambda command: '/usr/bin/mvn' if command == 'mvn' else None
+
+        self.assertEqual(resolve_maven_command('auto'), 'mvn')
+
+    def test_auto_none_found(self, which_mock):
+        which_mock.return_value = None
+
+        self.assertEqual(resolve_maven_command('auto'), 'mvn')
+
+
+@patch('ploigos_step_runner.utils.maven.get_effective_pom')
+class TestMavenUtils_get_plugin_configuration_values(BaseTestCase):
+    MOCK_EFFECTIVE_POM = b"""<?xml version="1.0"?>
+<project xmlns="http://maven.apache.org/POM/4.0.0">
+  <properties>
+    <mock.dir>mock-dir</mock.dir>
+  </properties>
+  <build>
+    <directory>/mock/target</directory>
+    <plugins>
+      <plugin>
+        <artifactId>mock-maven-plugin</artifactId>
+        <configuration>
+          <mockAwesomeConfig>
+            ${project.build.directory}/mock-config-value-1
+          </mockAwesomeConfig>
+        </configuration>
+        <executions>
+          <execution>
+            <id>phase-1</id>
+            <phase>mock-test-phase-1</phase>
+            <configuration>
+              <mockAwesomeConfig>mock-test-phase-1-mock-config-value-1</mockAwesomeConfig>
+              <mockAwesomeConfig>mock-test-phase-1-mock-config-value-2</mockAwesomeConfig>
+            </configuration>
+          </execution>
+          <execution>
+            <id>phase-2</id>
+            <phase>mock-test-phase-2</phase>
+            <configuration>
+              <mockAwesomeConfig>${mock.dir}/mock-test-phase-2-mock-config-value</mockAwesomeConfig>
+            </configuration>
+          </execution>
+          <execution>
+            <id>phase-3</id>
+            <phase>mock-test-phase-3</phase>
+            <configuration>
+              <otherConfig>mock-other-value</otherConfig>
+            </configuration>
+          </execution>
+          <execution>
+            <id>goal</id>
+            <goals>
+              <goal>mock-test-goal</goal>
+            </goals>
+            <configuration>
+              <mockAwesomeConfig>mock-test-goal-mock-config-value</mockAwesomeConfig>
+            </configuration>
+          </execution>
+        </executions>
+      </plugin>
+    </plugins>
+  </build>
+</project>
+"""
+
+    def __get_plugin_configuration_values(
         self,
         mock_get_effective_pom,
-        mock_get_maven_plugin_xml_element_path,
-        mock_get_xml_element_by_path,
-        mock_get_xml_element_text_by_path
+        profiles=None,
+        phases_and_goals=None,
+        require_phase_execution_config=False
     ):
-        mock_phases_with_values = ['mock-test-phase']
-
-        # set up mocks
-        def mock_get_xml_element_text_by_path_side_effect(
-            xml_file_path,
-            xpath,
-            default_namespace=None,
-            xml_namespace_dict=None,
-            find_all=False
-        ):
-            for mock_phase in mock_phases_with_values:
-                if f'[mvn:phase="{mock_phase}"]' in xpath:
-                    return [f'{mock_phase}-mock-config-value-1', f'{mock_phase}-mock-config-value-2']
+        with TempDirectory() as temp_dir:
+            temp_dir.write('effective-pom.xml', self.MOCK_EFFECTIVE_POM)
+            mock_get_effective_pom.return_value = os.path.join(temp_dir.path, 'effective-pom.xml')
 
-        mock_get_xml_element_text_by_path.side_effect = mock_get_xml_element_text_by_path_side_effect
+            actual_values = get_plugin_configuration_values(
+                plugin_name='mock-maven-plugin',
+                configuration_key='mockAwesomeConfig',
+                work_dir_path='/mock/work_dir',
+                pom_file='mock-pom.xml',
+                profiles=profiles,
+                phases_and_goals=phases_and_goals,
+                require_phase_execution_config=require_phase_execution_config
+            )
 
-        # run test
-        actual_values = get_plugin_configuration_values(
-            plugin_name='mock-maven-plugin',
-            configuration_key='mockAwesomeConfig',
+        mock_get_effective_pom.assert_called_once_with(
             work_dir_path='/mock/work_dir',
             pom_file='mock-pom.xml',
-            profiles=None,
-            phases_and_goals=['mock-test-phase']
+            profiles=profiles,
+            settings_file=None,
+            cache_dir_path=None,
+            maven_command='mvn'
         )
+        return actual_values
 
-        # validate
-        self.assertEqual(
-            actual_values,
-            ['mock-test-phase-mock-config-value-1', 'mock-test-phase-mock-config-value-2']
-        )
-        self.assertEqual(mock_get_xml_element_text_by_path.call_count, 2)
-        mock_get_effective_pom.assert_called_once_with(
-            work_dir_path='/mock/work_dir',
-            pom_file='mock-pom.xml',
-            profiles=None
+    def test_no_profiles_no_phases(self, mock_get_effective_pom):
+        actual_values = self.__get_plugin_configuration_values(mock_get_effective_pom)
+
+        self.assertEqual(actual_values, ['/mock/target/mock-config-value-1'])
+
+    def test_with_profile_no_phases(self, mock_get_effective_pom):
+        actual_values = self.__get_plugin_configuration_values(
+            mock_get_effective_pom,
+            profiles=['mock-profile']
         )
 
-    def test_with_no_profiles_multiple_phases_each_with_one_matching_config(
-        self,
-        mock_get_effective_pom,
-        mock_get_maven_plugin_xml_element_path,
-        mock_get_xml_element_by_path,
-        mock_get_xml_element_text_by_path
-    ):
-        mock_phases_with_values = ['mock-test-phase-1', 'mock-test-phase-2']
-
-        # set up mocks
-        def mock_get_xml_element_text_by_path_side_effect(
-            xml_file_path,
-            xpath,
-            default_namespace=None,
-            xml_namespace_dict=None,
-            find_all=False
-        ):
-            for mock_phase in mock_phases_with_values:
-                if f'[mvn:phase="{mock_phase}"]' in xpath:
-                    return [f'{mock_phase}-mock-config-value']
+        self.assertEqual(actual_values, ['/mock/target/mock-config-value-1'])
 
-        mock_get_xml_element_text_by_path.side_effect = mock_get_xml_element_text_by_path_side_effect
+    def test_with_no_profiles_one_phase_with_one_matching_config(self, mock_get_effective_pom):
+        actual_values = self.__get_plugin_configuration_values(
+            mock_get_effective_pom,
+            phases_and_goals=['mock-test-phase-2']
+        )
 
-        # run test
-        actual_values = get_plugin_configuration_values(
-            plugin_name='mock-maven-plugin',
-            configuration_key='mockAwesomeConfig',
-            work_dir_path='/mock/work_dir',
-            pom_file='mock-pom.xml',
-            profiles=None,
-            phases_and_goals=['mock-test-phase-1', 'mock-test-phase-2']
+        self.assertEqual(actual_values, ['mock-dir/mock-test-phase-2-mock-config-value'])
+
+    def test_with_no_profiles_one_phase_with_multiple_matching_config(self, mock_get_effective_pom):
+        actual_values = self.__get_plugin_configuration_values(
+            mock_get_effective_pom,
+            phases_and_goals=['mock-test-phase-1']
         )
 
-        # validate
         self.assertEqual(
             actual_values,
-            ['mock-test-phase-1-mock-config-value', 'mock-test-phase-2-mock-config-value']
-        )
-        self.assertEqual(mock_get_xml_element_text_by_path.call_count, 4)
-        mock_get_effective_pom.assert_called_once_with(
-            work_dir_path='/mock/work_dir',
-            pom_file='mock-pom.xml',
-            profiles=None
+            ['mock-test-phase-1-mock-config-value-1', 'mock-test-phase-1-mock-config-value-2']
         )
 
-    def test_with_no_profiles_multiple_phases_each_with_multiple_matching_config(
+    def test_with_no_profiles_multiple_phases_each_with_matching_config(
         self,
-        mock_get_effective_pom,
-        mock_get_maven_plugin_xml_element_path,
-        mock_get_xml_element_by_path,
-        mock_get_xml_element_text_by_path
+        mock_get_effective_pom
     ):
-        mock_phases_with_values = ['mock-test-phase-1', 'mock-test-phase-2']
-
-        # set up mocks
-        def mock_get_xml_element_text_by_path_side_effect(
-            xml_file_path,
-            xpath,
-            default_namespace=None,
-            xml_namespace_dict=None,
-            find_all=False
-        ):
-            for mock_phase in mock_phases_with_values:
-                if f'[mvn:phase="{mock_phase}"]' in xpath:
-                    return [f'{mock_phase}-mock-config-value-1', f'{mock_phase}-mock-config-value-2']
-
-        mock_get_xml_element_text_by_path.side_effect = mock_get_xml_element_text_by_path_side_effect
-
-        # run test
-        actual_values = get_plugin_configuration_values(
-            plugin_name='mock-maven-plugin',
-            configuration_key='mockAwesomeConfig',
-            work_dir_path='/mock/work_dir',
-            pom_file='mock-pom.xml',
-            profiles=None,
+        actual_values = self.__get_plugin_configuration_values(
+            mock_get_effective_pom,
             phases_and_goals=['mock-test-phase-1', 'mock-test-phase-2']
         )
 
-        # validate
         self.assertEqual(
             actual_values,
             [
+                'mock-dir/mock-test-phase-2-mock-config-value',
                 'mock-test-phase-1-mock-config-value-1',
-                'mock-test-phase-1-mock-config-value-2',
-                'mock-test-phase-2-mock-config-value-1',
-                'mock-test-phase-2-mock-config-value-2'
+                'mock-test-phase-1-mock-config-value-2'
             ]
         )
-        self.assertEqual(mock_get_xml_element_text_by_path.call_count, 4)
-        mock_get_effective_pom.assert_called_once_with(
-            work_dir_path='/mock/work_dir',
-            pom_file='mock-pom.xml',
-            profiles=None
+
+    def test_with_no_profiles_phase_no_matching_config(self, mock_get_effective_pom):
+        actual_values = self.__get_plugin_configuration_values(
+            mock_get_effective_pom,
+            phases_and_goals=['mock-test-phase-3', 'mock-test-phase-4']
         )
 
-    def test_with_no_profiles_multiple_phases_no_matching_config(
+        self.assertEqual(actual_values, ['/mock/target/mock-config-value-1'])
+
+    def test_with_no_profiles_phase_no_matching_config_require_phase_execution_config(
         self,
-        mock_get_effective_pom,
-        mock_get_maven_plugin_xml_element_path,
-        mock_get_xml_element_by_path,
-        mock_get_xml_element_text_by_path
+        mock_get_effective_pom
     ):
-        # set up mocks
-        mock_phases_without_values = ['mock-test-phase-1', 'mock-test-phase-2']
-        def mock_get_xml_element_text_by_path_side_effect(
-            xml_file_path,
-            xpath,
-            default_namespace=None,
-            xml_namespace_dict=None,
-            find_all=False
-        ):
-            for mock_phase in mock_phases_without_values:
-                if f'[mvn:phase="{mock_phase}"]' in xpath:
-                    return []
-
-            return ['mock-default-value']
+        actual_values = self.__get_plugin_configuration_values(
+            mock_get_effective_pom,
+            phases_and_goals=['mock-test-phase-3', 'mock-test-phase-4'],
+            require_phase_execution_config=True
+        )
 
-        mock_get_xml_element_text_by_path.side_effect = mock_get_xml_element_text_by_path_side_effect
+        self.assertEqual(actual_values, [])
 
-        # run test
-        actual_values = get_plugin_configuration_values(
-            plugin_name='mock-maven-plugin',
-            configuration_key='mockAwesomeConfig',
-            work_dir_path='/mock/work_dir',
-            pom_file='mock-pom.xml',
-            profiles=None,
-            phases_and_goals=['mock-test-phase-1', 'mock-test-phase-2']
+    def test_with_no_profiles_one_goal_with_one_matching_config(self, mock_get_effective_pom):
+        actual_values = self.__get_plugin_configuration_values(
+            mock_get_effective_pom,
+            phases_and_goals=['mock-test-goal']
         )
 
-        # validate
-        self.assertEqual(
-            actual_values,
-            ['mock-default-value']
-        )
-        self.assertEqual(mock_get_xml_element_text_by_path.call_count, 4)
-        mock_get_effective_pom.assert_called_once_with(
-            work_dir_path='/mock/work_dir',
-            pom_file='mock-pom.xml',
-            profiles=None
-        )
+        self.assertEqual(actual_values, ['mock-test-goal-mock-config-value'])
 
-    def test_plugin_not_found(
-        self,
-        mock_get_effective_pom,
-        mock_get_maven_plugin_xml_element_path,
-        mock_get_xml_element_by_path,
-        mock_get_xml_element_text_by_path
-    ):
-        # set up mocks
-        mock_get_xml_element_by_path.return_value = None
+    def test_plugin_not_declared_in_pom(self, mock_get_effective_pom):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('pom.xml', b'<project><artifactId>mock-app</artifactId></project>')
+            temp_dir.write('effective-pom.xml', self.MOCK_EFFECTIVE_POM)
+            pom_file = os.path.join(temp_dir.path, 'pom.xml')
+            mock_get_effective_pom.return_value = os.path.join(temp_dir.path, 'effective-pom.xml')
 
-        # run test
-        with self.assertRaisesRegex(
-            RuntimeError,
-            r"Expected maven plugin \(mock-maven-plugin\) not found in "
-            r" effective pom for given pom \(mock-pom.xml\)."
-        ):
-            get_plugin_configuration_values(
+            actual_values = get_plugin_configuration_values(
                 plugin_name='mock-maven-plugin',
                 configuration_key='mockAwesomeConfig',
                 work_dir_path='/mock/work_dir',
-                pom_file='mock-pom.xml',
-                profiles=None,
-                phases_and_goals=['mock-test-phase-1', 'mock-test-phase-2']
+                pom_file=pom_file
             )
 
-        # validate
-        mock_get_effective_pom.assert_called_once_with(
-            work_dir_path='/mock/work_dir',
-            pom_file='mock-pom.xml',
-            profiles=None
-        )
-        mock_get_xml_element_text_by_path.assert_not_called()
-
-    def test_with_no_profiles_one_goal_with_one_matching_config(
-        self,
-        mock_get_effective_pom,
-        mock_get_maven_plugin_xml_element_path,
-        mock_get_xml_element_by_path,
-        mock_get_xml_element_text_by_path
-    ):
-        mock_goals_with_values = ['mock-test-goal']
-
-        # set up mocks
-        def mock_get_xml_element_text_by_path_side_effect(
-            xml_file_path,
-            xpath,
-            default_namespace=None,
-            xml_namespace_dict=None,
-            find_all=False
-        ):
-            for mock_goal in mock_goals_with_values:
-                if f'[mvn:goal="{mock_goal}"]' in xpath:
-                    return [f'{mock_goal}-mock-config-value']
+            self.assertEqual(actual_values, ['/mock/target/mock-config-value-1'])
+            mock_get_effective_pom.assert_called_once_with(
+                work_dir_path='/mock/work_dir',
+                pom_file=pom_file,
+                profiles=None,
+                settings_file=None,
+                cache_dir_path=None,
+                maven_command='mvn'
+            )
 
-        mock_get_xml_element_text_by_path.side_effect = mock_get_xml_element_text_by_path_side_effect
+    def test_plugin_not_found(self, mock_get_effective_pom):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('effective-pom.xml', b'<project><build><plugins/></build></project>')
+            mock_get_effective_pom.return_value = os.path.join(temp_dir.path, 'effective-pom.xml')
 
-        # run test
-        actual_values = get_plugin_configuration_values(
-            plugin_name='mock-maven-plugin',
-            configuration_key='mockAwesomeConfig',
-            work_dir_path='/mock/work_dir',
-            pom_file='mock-pom.xml',
-            profiles=None,
-            phases_and_goals=['mock-test-goal']
-        )
+            with self.assertRaisesRegex(
+                RuntimeError,
+                r"Expected maven plugin \(mock-maven-plugin\) not found in "
+                r"\s+effective pom for given pom \(mock-pom.xml\)."
+            ):
+                get_plugin_configuration_values(
+                    plugin_name='mock-maven-plugin',
+                    configuration_key='mockAwesomeConfig',
+                    work_dir_path='/mock/work_dir',
+                    pom_file='mock-pom.xml',
+                    profiles=None,
+                    phases_and_goals=['mock-test-phase-1', 'mock-test-phase-2']
+                )
 
-        # validate
-        self.assertEqual(actual_values, ['mock-test-goal-mock-config-value'])
-        self.assertEqual(mock_get_xml_element_text_by_path.call_count, 2)
-        mock_get_effective_pom.assert_called_once_with(
-            work_dir_path='/mock/work_dir',
-            pom_file='mock-pom.xml',
-            profiles=None
-        )
-# Integration Test with XML, primarly for testing xpaths
-# NOTE: isn't full integration test because mocking the effective pom so don't have to have
-#       maven installed.
 @patch('ploigos_step_runner.utils.maven.get_effective_pom')
 class TestMavenUtils_get_plugin_configuration_values_IT_XML(BaseTestCase):
 
@@ -1858,8 +2228,9 @@ class TestMavenUtils_get_plugin_configuration_values_IT_XML(BaseTestCase):
             # validate
             self.assertEqual(
                 actual_values,
-                ['${project.build.directory}/surefire-reports-unit-test']
+                [self.__get_test_file_path('target/surefire-reports-unit-test')]
             )
+            get_effective_pom_mock.assert_not_called()
 
     def test_no_profiles_no_phases_with_config_failsafe(self, get_effective_pom_mock):
         # setup
@@ -1880,7 +2251,7 @@ class TestMavenUtils_get_plugin_configuration_values_IT_XML(BaseTestCase):
             # validate
             self.assertEqual(
                 actual_values,
-                ['${project.build.directory}/failsafe-reports-integration-test']
+                [self.__get_test_file_path('target/failsafe-reports-integration-test')]
             )
 
     def test_no_profiles_surefire_both_UT_and_IT_via_phase_get_UT_config(self, get_effective_pom_mock):
@@ -1902,7 +2273,7 @@ class TestMavenUtils_get_plugin_configuration_values_IT_XML(BaseTestCase):
             # validate
             self.assertEqual(
                 actual_values,
-                ['${project.build.directory}/surefire-reports-unit-test']
+                [self.__get_test_file_path('target/surefire-reports-unit-test')]
             )
 
     def test_no_profiles_surefire_both_UT_and_IT_via_phase_get_IT_config(self, get_effective_pom_mock):
@@ -1924,7 +2295,7 @@ class TestMavenUtils_get_plugin_configuration_values_IT_XML(BaseTestCase):
             # validate
             self.assertEqual(
                 actual_values,
-                ['${project.build.directory}/surefire-reports-uat']
+                [self.__get_test_file_path('target/surefire-reports-uat')]
             )
 
     def test_failsafe_with_default_and_goal_execution_config_specify_no_goal(self, get_effective_pom_mock):
@@ -1946,7 +2317,7 @@ class TestMavenUtils_get_plugin_configuration_values_IT_XML(BaseTestCase):
             # validate
             self.assertEqual(
                 actual_values,
-                ['${project.build.directory}/failsafe-reports-default']
+                [self.__get_test_file_path('target/failsafe-reports-default')]
             )
 
     def test_failsafe_with_default_and_goal_execution_config_specify_goal(self, get_effective_pom_mock):
@@ -1968,7 +2339,7 @@ class TestMavenUtils_get_plugin_configuration_values_IT_XML(BaseTestCase):
             # validate
             self.assertEqual(
                 actual_values,
-                ['${project.build.directory}/failsafe-reports-execution']
+                [self.__get_test_file_path('target/failsafe-reports-execution')]
             )
 
 # Integration Test with XML and Maven
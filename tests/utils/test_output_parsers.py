@@ -0,0 +1,155 @@
+"""Test for output_parsers.py
+
+Test for the utility for parsing tool output as it is written.
+"""
+import re
+
+from ploigos_step_runner.utils.output_parsers import (BlockRegexOutputParser,
+                                                      LineRegexOutputParser,
+                                                      OutputParser,
+                                                      TailOutputParser)
+from tests.helpers.base_test_case import BaseTestCase
+
+
+class TestOutputParser(BaseTestCase):
+    def test_parse_line_not_implemented(self):
+        with self.assertRaises(TypeError):
+            OutputParser() # pylint: disable=abstract-class-instantiated
+
+    def test_line_consumer_strips_ansi_and_carriage_returns(self):
+        consumed_lines = []
+        parser = TailOutputParser(line_consumer=consumed_lines.append)
+
+        self.assertEqual(parser.write('\x1b[1;34mline\r 1\x1b[m\r\nli'), 21)
+        parser.write(b'ne 2\nline 3')
+        self.assertEqual(consumed_lines, ['line 1', 'line 2'])
+
+        parser.close()
+        self.assertEqual(consumed_lines, ['line 1', 'line 2', 'line 3'])
+        self.assertTrue(parser.closed)
+
+    def test_no_stripping(self):
+        consumed_lines = []
+        parser = TailOutputParser(
+            strip_ansi_escapes=False,
+            strip_carriage_returns=False,
+            line_consumer=consumed_lines.append
+        )
+
+        parser.write('\x1b[1mli\rne 1\x1b[m\r\n')
+        parser.close()
+        self.assertEqual(consumed_lines, ['\x1b[1mli\rne 1\x1b[m'])
+
+    def test_close_twice(self):
+        consumed_lines = []
+        parser = TailOutputParser(line_consumer=consumed_lines.append)
+
+        parser.write('line 1')
+        parser.close()
+        parser.close()
+        self.assertEqual(consumed_lines, ['line 1'])
+
+
+class TestTailOutputParser(BaseTestCase):
+    def test_under_max_size(self):
+        parser = TailOutputParser(max_size=100)
+        parser.write('line 1\nline 2\n')
+        parser.close()
+
+        self.assertEqual(parser.getvalue(), 'line 1\nline 2\n')
+
+    def test_over_max_size(self):
+        parser = TailOutputParser(max_size=10)
+        for index in range(100):
+            parser.write(f"line {index}\n")
+        parser.close()
+
+        self.assertEqual(parser.getvalue(), 'e 98\nline 99\n'[-10:])
+
+    def test_single_line_over_max_size(self):
+        parser = TailOutputParser(max_size=4)
+        parser.write('0123456789')
+        parser.close()
+
+        self.assertEqual(parser.getvalue(), '789\n')
+
+
+class TestLineRegexOutputParser(BaseTestCase):
+    def test_results(self):
+        parser = LineRegexOutputParser(
+            pattern=re.compile(r'^(?P<name>\w+): (?P<value>true|false)$')
+        )
+        parser.write('a: true\nnot a match\n\x1b[1mb\x1b[m: false\r\nc: tr')
+        parser.write('ue')
+        parser.close()
+
+        self.assertEqual(
+            parser.results,
+            [
+                {'name': 'a', 'value': 'true'},
+                {'name': 'b', 'value': 'false'},
+                {'name': 'c', 'value': 'true'}
+            ]
+        )
+
+
+class TestBlockRegexOutputParser(BaseTestCase):
+    PATTERN = re.compile(
+        r'(?P<block>Title.+?Result\s+(?P<result>[^\n]+))\n',
+        re.DOTALL
+    )
+
+    def __create_parser(self, **kwargs):
+        return BlockRegexOutputParser(
+            pattern=self.PATTERN,
+            block_start_pattern=re.compile(r'Title'),
+            block_end_pattern=re.compile(r'Result\s'),
+            **kwargs
+        )
+
+    def test_results(self):
+        parser = self.__create_parser()
+        parser.write(
+            'header\n'
+            '  Title\r\tfoo\n'
+            'Rule\r\tfoo-rule\n'
+            'Result\r\tpass\n'
+            '\n'
+            'Title\tbar\n'
+            'Result\tfail'
+        )
+        parser.close()
+
+        self.assertEqual(
+            parser.results,
+            [
+                {'block': 'Title\tfoo\nRule\tfoo-rule\nResult\tpass', 'result': 'pass'},
+                {'block': 'Title\tbar\nResult\tfail', 'result': 'fail'}
+            ]
+        )
+
+    def test_end_line_without_match_keeps_block(self):
+        parser = self.__create_parser()
+        parser.write('Title\tfoo\nResult\n\tpass\nTitle\tbar\nResult\tfail\n')
+        parser.close()
+
+        self.assertEqual(
+            [result['result'] for result in parser.results],
+            ['pass', 'fail']
+        )
+
+    def test_block_over_max_size_dropped(self):
+        parser = self.__create_parser(max_block_size=20)
+        parser.write(
+            'Title\tfoo\n'
+            'Rule\tthis rule is longer then the max block size\n'
+            'Result\tpass\n'
+            'Title\tbar\n'
+            'Result\tfail\n'
+        )
+        parser.close()
+
+        self.assertEqual(
+            parser.results,
+            [{'block': 'Title\tbar\nResult\tfail', 'result': 'fail'}]
+        )
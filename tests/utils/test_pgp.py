@@ -47,8 +47,7 @@ class TestImportPGPKey(BaseTestCase):
             '--import-options=import-show',
             _in=pgp_private_key,
             _out=Any(IOBase),
-            _err_to_out=True,
-            _tee='out'
+            _err_to_out=True
         )
 
     @patch('sh.gpg', create=True)
@@ -80,8 +79,7 @@ class TestImportPGPKey(BaseTestCase):
             '--import-options=import-show',
             _in=pgp_private_key,
             _out=Any(IOBase),
-            _err_to_out=True,
-            _tee='out'
+            _err_to_out=True
         )
 
     @patch('sh.gpg', create=True)
@@ -107,8 +105,7 @@ class TestImportPGPKey(BaseTestCase):
             '--import-options=import-show',
             _in=pgp_private_key,
             _out=Any(IOBase),
-            _err_to_out=True,
-            _tee='out'
+            _err_to_out=True
         )
 
 class TestDetachSignWithPGPKey(BaseTestCase):
@@ -0,0 +1,188 @@
+"""Test for pom.py
+
+Test for the in memory model of a Maven POM.
+"""
+import os
+from xml.etree import ElementTree
+
+from ploigos_step_runner.utils.pom import MavenPom, get_local_name
+from testfixtures import TempDirectory
+from tests.helpers.base_test_case import BaseTestCase
+
+MOCK_POM = b"""<?xml version="1.0"?>
+<project xmlns="http://maven.apache.org/POM/4.0.0">
+  <groupId>com.example</groupId>
+  <artifactId>mock-app</artifactId>
+  <version>${revision}</version>
+  <properties>
+    <revision>1.0.0</revision>
+    <reports.dir>${project.build.directory}/reports</reports.dir>
+    <surefire.reports.dir>${reports.dir}/surefire</surefire.reports.dir>
+  </properties>
+  <build>
+    <directory>/mock/target</directory>
+    <plugins>
+      <plugin>
+        <groupId>org.apache.maven.plugins</groupId>
+        <artifactId>maven-surefire-plugin</artifactId>
+        <version>3.0.0</version>
+        <configuration>
+          <reportsDirectory>
+            ${surefire.reports.dir}
+          </reportsDirectory>
+          <systemPropertyVariables>
+            <mock.property>${project.artifactId}</mock.property>
+          </systemPropertyVariables>
+          <unknown>${not.a.property}</unknown>
+        </configuration>
+        <executions>
+          <execution>
+            <id>integration-test</id>
+            <phase>integration-test</phase>
+            <goals>
+              <goal>test</goal>
+            </goals>
+            <configuration>
+              <includes>
+                <include>**/*IT.java</include>
+                <include>**/*IntegrationTest.java</include>
+              </includes>
+            </configuration>
+          </execution>
+          <execution>
+            <id>report</id>
+            <goals>
+              <goal>report</goal>
+              <goal>test</goal>
+            </goals>
+          </execution>
+        </executions>
+      </plugin>
+    </plugins>
+  </build>
+</project>
+"""
+
+
+class TestMavenPom_load(BaseTestCase):
+    def test_file_does_not_exist(self):
+        with self.assertRaisesRegex(
+            ValueError,
+            r'Given xml file does not exist: /does/not/exist/pom.xml'
+        ):
+            MavenPom.load('/does/not/exist/pom.xml')
+
+    def test_cached_until_file_changes(self):
+        with TempDirectory() as temp_dir:
+            pom_file_path = os.path.join(temp_dir.path, 'pom.xml')
+            temp_dir.write('pom.xml', MOCK_POM)
+
+            pom = MavenPom.load(pom_file_path)
+            self.assertIs(MavenPom.load(pom_file_path), pom)
+
+            temp_dir.write('pom.xml', b'<project><artifactId>changed</artifactId></project>')
+            changed_pom = MavenPom.load(pom_file_path)
+            self.assertIsNot(changed_pom, pom)
+            self.assertEqual(changed_pom.properties, {'project.artifactId': 'changed'})
+
+
+class TestMavenPom(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.pom = MavenPom(ElementTree.fromstring(MOCK_POM))
+
+    def test_namespace(self):
+        self.assertEqual(self.pom.namespace, 'http://maven.apache.org/POM/4.0.0')
+
+    def test_properties(self):
+        self.assertEqual(
+            self.pom.properties,
+            {
+                'project.groupId': 'com.example',
+                'project.artifactId': 'mock-app',
+                'project.version': '1.0.0',
+                'project.build.directory': '/mock/target',
+                'revision': '1.0.0',
+                'reports.dir': '/mock/target/reports',
+                'surefire.reports.dir': '/mock/target/reports/surefire'
+            }
+        )
+
+    def test_resolve_properties(self):
+        self.assertEqual(
+            self.pom.resolve_properties('${project.version}-${unknown}-${revision}'),
+            '1.0.0-${unknown}-1.0.0'
+        )
+
+    def test_resolve_properties_self_reference(self):
+        pom = MavenPom(ElementTree.fromstring(
+            '<project><properties><a>x${a}</a></properties></project>'
+        ))
+
+        self.assertTrue(pom.properties['a'].startswith('xxx'))
+        self.assertTrue(pom.properties['a'].endswith('${a}'))
+
+    def test_get_plugin(self):
+        plugin = self.pom.get_plugin('maven-surefire-plugin')
+
+        self.assertEqual(plugin.group_id, 'org.apache.maven.plugins')
+        self.assertEqual(plugin.artifact_id, 'maven-surefire-plugin')
+        self.assertEqual(plugin.version, '3.0.0')
+        self.assertEqual(list(self.pom.plugins), ['maven-surefire-plugin'])
+        self.assertIsNone(self.pom.get_plugin('does-not-exist'))
+
+    def test_plugin_configuration(self):
+        self.assertEqual(
+            self.pom.get_plugin('maven-surefire-plugin').configuration,
+            {
+                'reportsDirectory': ['/mock/target/reports/surefire'],
+                'systemPropertyVariables/mock.property': ['mock-app'],
+                'unknown': ['${not.a.property}']
+            }
+        )
+
+    def test_get_executions(self):
+        plugin = self.pom.get_plugin('maven-surefire-plugin')
+
+        integration_test_executions = plugin.get_executions_by_phase('integration-test')
+        self.assertEqual(len(integration_test_executions), 1)
+        self.assertEqual(integration_test_executions[0].execution_id, 'integration-test')
+        self.assertEqual(integration_test_executions[0].goals, ['test'])
+        self.assertEqual(
+            integration_test_executions[0].configuration,
+            {'includes/include': ['**/*IT.java', '**/*IntegrationTest.java']}
+        )
+
+        self.assertEqual(
+            [execution.execution_id for execution in plugin.get_executions_by_goal('test')],
+            ['integration-test', 'report']
+        )
+        report_execution = plugin.get_executions_by_goal('report')[0]
+        self.assertIsNone(report_execution.phase)
+        self.assertEqual(report_execution.configuration, {})
+
+        self.assertEqual(plugin.get_executions_by_phase('does-not-exist'), [])
+        self.assertEqual(plugin.get_executions_by_goal('does-not-exist'), [])
+        self.assertEqual(len(plugin.executions), 2)
+
+    def test_find(self):
+        self.assertEqual(self.pom.find('./mvn:build/mvn:directory').text, '/mock/target')
+        self.assertEqual(len(self.pom.find('.//mvn:include', find_all=True)), 2)
+        self.assertIsNone(self.pom.find('./mvn:does-not-exist'))
+
+    def test_find_not_namespaced(self):
+        pom = MavenPom(ElementTree.fromstring(
+            '<project><build><directory>target</directory></build></project>'
+        ))
+
+        self.assertEqual(pom.namespace, '')
+        self.assertEqual(pom.find('./mvn:build/mvn:directory').text, 'target')
+        self.assertEqual(pom.root.tag, 'project')
+
+
+class TestGetLocalName(BaseTestCase):
+    def test_namespaced(self):
+        self.assertEqual(get_local_name(ElementTree.Element('{mock-namespace}foo')), 'foo')
+
+    def test_not_namespaced(self):
+        self.assertEqual(get_local_name(ElementTree.Element('foo')), 'foo')
@@ -0,0 +1,350 @@
+"""Test for pom_resolver.py
+
+Test for resolving Maven POMs in process.
+"""
+import os
+from unittest.mock import patch
+
+from ploigos_step_runner.utils.pom_resolver import (MavenPomResolver,
+                                                    UnresolvablePomError)
+from testfixtures import TempDirectory
+from tests.helpers.base_test_case import BaseTestCase
+
+PARENT_POM = b"""<?xml version="1.0"?>
+<project>
+  <groupId>com.example</groupId>
+  <artifactId>mock-parent</artifactId>
+  <version>1.0.0</version>
+  <packaging>pom</packaging>
+  <modules>
+    <module>app</module>
+  </modules>
+  <properties>
+    <surefire.version>2.22.2</surefire.version>
+    <reports.name>parent-reports</reports.name>
+  </properties>
+  <build>
+    <pluginManagement>
+      <plugins>
+        <plugin>
+          <artifactId>maven-surefire-plugin</artifactId>
+          <version>${surefire.version}</version>
+          <configuration>
+            <reportsDirectory>${project.build.directory}/${reports.name}</reportsDirectory>
+            <includes>
+              <include>**/*Test.java</include>
+            </includes>
+          </configuration>
+        </plugin>
+      </plugins>
+    </pluginManagement>
+    <plugins>
+      <plugin>
+        <groupId>org.apache.maven.plugins</groupId>
+        <artifactId>maven-enforcer-plugin</artifactId>
+        <inherited>false</inherited>
+      </plugin>
+      <plugin>
+        <artifactId>maven-failsafe-plugin</artifactId>
+        <configuration>
+          <excludes>
+            <exclude>**/*Parent.java</exclude>
+          </excludes>
+          <systemPropertyVariables>
+            <parent.property>parent</parent.property>
+          </systemPropertyVariables>
+        </configuration>
+      </plugin>
+    </plugins>
+  </build>
+</project>
+"""
+
+APP_POM = b"""<?xml version="1.0"?>
+<project xmlns="http://maven.apache.org/POM/4.0.0">
+  <parent>
+    <groupId>com.example</groupId>
+    <artifactId>mock-parent</artifactId>
+    <version>1.0.0</version>
+  </parent>
+  <artifactId>mock-app</artifactId>
+  <properties>
+    <reports.name>app-reports</reports.name>
+  </properties>
+  <build>
+    <plugins>
+      <plugin>
+        <groupId>org.apache.maven.plugins</groupId>
+        <artifactId>maven-surefire-plugin</artifactId>
+        <configuration>
+          <includes combine.children="append">
+            <include>**/*IT.java</include>
+          </includes>
+        </configuration>
+      </plugin>
+      <plugin>
+        <artifactId>maven-failsafe-plugin</artifactId>
+        <configuration>
+          <excludes combine.self="override"/>
+          <systemPropertyVariables>
+            <app.property>app</app.property>
+          </systemPropertyVariables>
+        </configuration>
+      </plugin>
+    </plugins>
+  </build>
+  <profiles>
+    <profile>
+      <id>default-profile</id>
+      <activation>
+        <activeByDefault>true</activeByDefault>
+      </activation>
+      <properties>
+        <mock.profile>default-profile</mock.profile>
+      </properties>
+    </profile>
+    <profile>
+      <id>mock-profile</id>
+      <properties>
+        <mock.profile>mock-profile</mock.profile>
+      </properties>
+      <build>
+        <directory>${project.basedir}/mock-profile-target</directory>
+      </build>
+    </profile>
+  </profiles>
+</project>
+"""
+
+
+class TestMavenPomResolver(BaseTestCase):
+    def __write_project(self, temp_dir):
+        temp_dir.write('pom.xml', PARENT_POM)
+        temp_dir.write('app/pom.xml', APP_POM)
+        return os.path.join(temp_dir.path, 'app', 'pom.xml')
+
+    def test_resolve_no_parent(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('pom.xml', b'''<project>
+                <groupId>com.example</groupId>
+                <artifactId>mock-app</artifactId>
+                <version>${revision}</version>
+                <properties>
+                    <revision>42.1</revision>
+                </properties>
+            </project>''')
+
+            pom = MavenPomResolver().resolve(os.path.join(temp_dir.path, 'pom.xml'))
+
+            self.assertEqual(pom.properties['project.version'], '42.1')
+            self.assertEqual(pom.find('./mvn:version').text, '42.1')
+            self.assertEqual(
+                pom.properties['project.build.directory'],
+                os.path.join(temp_dir.path, 'target')
+            )
+            self.assertEqual(
+                pom.properties['project.build.finalName'],
+                'mock-app-42.1'
+            )
+
+    def test_resolve_parent_by_relative_path(self):
+        with TempDirectory() as temp_dir:
+            pom = MavenPomResolver().resolve(self.__write_project(temp_dir))
+
+            self.assertEqual(pom.namespace, '')
+            self.assertEqual(pom.properties['project.groupId'], 'com.example')
+            self.assertEqual(pom.properties['project.artifactId'], 'mock-app')
+            self.assertEqual(pom.properties['project.version'], '1.0.0')
+            self.assertEqual(pom.properties['project.parent.artifactId'], 'mock-parent')
+            self.assertIsNone(pom.find('./mvn:packaging'))
+            self.assertIsNone(pom.find('./mvn:modules'))
+            self.assertIsNone(pom.get_plugin('maven-enforcer-plugin'))
+
+            surefire = pom.get_plugin('maven-surefire-plugin')
+            self.assertEqual(surefire.version, '2.22.2')
+            self.assertEqual(
+                surefire.configuration,
+                {
+                    'includes/include': ['**/*Test.java', '**/*IT.java'],
+                    'reportsDirectory': [os.path.join(temp_dir.path, 'app', 'target', 'app-reports')]
+                }
+            )
+
+            failsafe = pom.get_plugin('maven-failsafe-plugin')
+            self.assertEqual(
+                failsafe.configuration,
+                {
+                    'systemPropertyVariables/app.property': ['app'],
+                    'systemPropertyVariables/parent.property': ['parent']
+                }
+            )
+
+    def test_resolve_parent_from_local_repository(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write(
+                'repository/com/example/mock-parent/1.0.0/mock-parent-1.0.0.pom',
+                PARENT_POM
+            )
+            temp_dir.write('app/pom.xml', APP_POM)
+
+            pom = MavenPomResolver(
+                local_repository_path=os.path.join(temp_dir.path, 'repository')
+            ).resolve(os.path.join(temp_dir.path, 'app', 'pom.xml'))
+
+            self.assertEqual(pom.properties['project.version'], '1.0.0')
+            self.assertEqual(pom.get_plugin('maven-surefire-plugin').version, '2.22.2')
+
+    def test_resolve_parent_at_relative_path_not_matching(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('pom.xml', b'''<project>
+                <groupId>com.example</groupId>
+                <artifactId>some-other-project</artifactId>
+                <version>1.0.0</version>
+            </project>''')
+            temp_dir.write('app/pom.xml', APP_POM)
+
+            with self.assertRaisesRegex(
+                UnresolvablePomError,
+                r'Parent \(com.example:mock-parent:1.0.0\) of pom \(.*app/pom.xml\) not found'
+                r' by relative path or in local maven repository \(/does/not/exist\).'
+            ):
+                MavenPomResolver(local_repository_path='/does/not/exist').resolve(
+                    os.path.join(temp_dir.path, 'app', 'pom.xml')
+                )
+
+    def test_resolve_parent_cycle(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('pom.xml', b'''<project>
+                <parent>
+                    <groupId>com.example</groupId>
+                    <artifactId>mock-app</artifactId>
+                    <version>1.0.0</version>
+                    <relativePath>pom.xml</relativePath>
+                </parent>
+                <artifactId>mock-app</artifactId>
+            </project>''')
+
+            with self.assertRaisesRegex(UnresolvablePomError, r'form a cycle'):
+                MavenPomResolver().resolve(os.path.join(temp_dir.path, 'pom.xml'))
+
+    def test_resolve_pom_does_not_exist(self):
+        with self.assertRaisesRegex(
+            UnresolvablePomError,
+            r'Error parsing pom \(/does/not/exist/pom.xml\)'
+        ):
+            MavenPomResolver().resolve('/does/not/exist/pom.xml')
+
+    def test_resolve_active_by_default_profile(self):
+        with TempDirectory() as temp_dir:
+            pom = MavenPomResolver().resolve(self.__write_project(temp_dir))
+
+            self.assertEqual(pom.properties['mock.profile'], 'default-profile')
+
+    def test_resolve_profile_by_id(self):
+        with TempDirectory() as temp_dir:
+            pom = MavenPomResolver().resolve(self.__write_project(temp_dir), 'mock-profile')
+
+            self.assertEqual(pom.properties['mock.profile'], 'mock-profile')
+            self.assertEqual(
+                pom.get_plugin('maven-surefire-plugin').configuration['reportsDirectory'],
+                [os.path.join(temp_dir.path, 'app', 'mock-profile-target', 'app-reports')]
+            )
+
+    def test_resolve_profile_deactivated(self):
+        with TempDirectory() as temp_dir:
+            pom = MavenPomResolver().resolve(
+                self.__write_project(temp_dir),
+                ['!default-profile']
+            )
+
+            self.assertNotIn('mock.profile', pom.properties)
+
+    @patch.dict(os.environ, {'MOCK_ENV': 'mock-value'})
+    def test_resolve_profile_activated_by_property(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('pom.xml', b'''<project>
+                <artifactId>mock-app</artifactId>
+                <profiles>
+                    <profile>
+                        <id>env-set</id>
+                        <activation>
+                            <property><name>env.MOCK_ENV</name></property>
+                        </activation>
+                        <properties><env-set>true</env-set></properties>
+                    </profile>
+                    <profile>
+                        <id>env-value</id>
+                        <activation>
+                            <property><name>env.MOCK_ENV</name><value>mock-value</value></property>
+                        </activation>
+                        <properties><env-value>true</env-value></properties>
+                    </profile>
+                    <profile>
+                        <id>env-not-value</id>
+                        <activation>
+                            <property><name>env.MOCK_ENV</name><value>!mock-value</value></property>
+                        </activation>
+                        <properties><env-not-value>true</env-not-value></properties>
+                    </profile>
+                    <profile>
+                        <id>system-property-not-set</id>
+                        <activation>
+                            <property><name>!skipMock</name></property>
+                        </activation>
+                        <properties><system-property-not-set>true</system-property-not-set></properties>
+                    </profile>
+                </profiles>
+            </project>''')
+
+            pom = MavenPomResolver().resolve(os.path.join(temp_dir.path, 'pom.xml'))
+
+            self.assertEqual(pom.properties.get('env-set'), 'true')
+            self.assertEqual(pom.properties.get('env-value'), 'true')
+            self.assertIsNone(pom.properties.get('env-not-value'))
+            self.assertEqual(pom.properties.get('system-property-not-set'), 'true')
+            self.assertEqual(pom.properties['project.artifactId'], 'mock-app')
+
+    def test_resolve_profile_activated_by_jdk(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('pom.xml', b'''<project>
+                <artifactId>mock-app</artifactId>
+                <profiles>
+                    <profile>
+                        <id>java-11</id>
+                        <activation><jdk>11</jdk></activation>
+                    </profile>
+                </profiles>
+            </project>''')
+
+            with self.assertRaisesRegex(
+                UnresolvablePomError,
+                r'Can not determine if profile \(java-11\) of pom \(.*pom.xml\)'
+                r' is activated by its jdk condition.'
+            ):
+                MavenPomResolver().resolve(os.path.join(temp_dir.path, 'pom.xml'))
+
+    def test_resolve_profile_activated_by_jdk_given_by_id(self):
+        with TempDirectory() as temp_dir:
+            temp_dir.write('pom.xml', b'''<project>
+                <artifactId>mock-app</artifactId>
+                <profiles>
+                    <profile>
+                        <id>java-11</id>
+                        <activation><jdk>11</jdk></activation>
+                        <properties><java.version>11</java.version></properties>
+                    </profile>
+                </profiles>
+            </project>''')
+
+            pom = MavenPomResolver().resolve(
+                os.path.join(temp_dir.path, 'pom.xml'),
+                ['java-11']
+            )
+
+            self.assertEqual(pom.properties['java.version'], '11')
+
+    def test_local_repository_path_default(self):
+        self.assertEqual(
+            MavenPomResolver().local_repository_path,
+            os.path.join(os.path.expanduser('~'), '.m2', 'repository')
+        )
@@ -122,6 +122,23 @@ class TestXMLUtils_get_xml_element_if_present(BaseTestCase):
 
             self.assertEqual('value1', actual_value)
 
+    def test_gets_fully_parsed_root_element(self):
+        """Test getting the root xml element of a file bigger than the parser reads at once."""
+        with TempDirectory() as temp_dir:
+            file = b'<baseelement version="1.0">' + \
+                b'<child>my-value</child>' * 4096 + \
+                b'<lastchild>my-last-value</lastchild></baseelement>'
+            self.assertGreater(len(file), 64 * 1024)
+            temp_dir.write('file.xml', file)
+            file_path = path.join(temp_dir.path, 'file.xml')
+
+            actual_element = get_xml_element_if_present(file_path, 'baseelement')
+
+            self.assertEqual('baseelement', actual_element.tag)
+            self.assertEqual('1.0', actual_element.attrib['version'])
+            self.assertEqual(len(actual_element), 4097)
+            self.assertEqual('my-last-value', actual_element.find('lastchild').text)
+
 class TestXMLUtils_get_xml_element_by_path(BaseTestCase):
     def test_none_existent_file(self):
         """Test get xml element by xpath but file does not exist."""
@@ -465,3 +482,140 @@ class TestXMLUtils_get_xml_element_text_by_path(BaseTestCase):
             xml_namespace_dict=None,
             find_all=True
         )
+
+class TestXMLUtils_parse_xml_file(BaseTestCase):
+    def test_file_does_not_exist(self):
+        with self.assertRaisesRegex(
+            ValueError,
+            r"Given xml file does not exist: /does/not/exist.xml"
+        ):
+            parse_xml_file('/does/not/exist.xml')
+
+    def test_parsed_once_until_file_changes(self):
+        with TempDirectory() as temp_dir:
+            xml_file_path = temp_dir.write('mock.xml', b'<root><child>1</child></root>')
+
+            xml_root = parse_xml_file(xml_file_path)
+            self.assertIs(parse_xml_file(xml_file_path), xml_root)
+            self.assertEqual(
+                get_xml_element_text_by_path(xml_file_path, './child'),
+                '1'
+            )
+
+            temp_dir.write('mock.xml', b'<root><child>2</child><child>3</child></root>')
+            changed_xml_root = parse_xml_file(xml_file_path)
+            self.assertIsNot(changed_xml_root, xml_root)
+            self.assertEqual(
+                get_xml_element_text_by_path(xml_file_path, './child', find_all=True),
+                ['2', '3']
+            )
+
+
+class TestXMLUtils_XmlDocumentCache(BaseTestCase):
+    def test_least_recently_used_evicted_over_max_bytes(self):
+        with TempDirectory() as temp_dir:
+            xml_file_path_a = temp_dir.write('a.xml', b'<root>aaaa</root>')
+            xml_file_path_b = temp_dir.write('b.xml', b'<root>bbbb</root>')
+            xml_file_path_c = temp_dir.write('c.xml', b'<root>cccc</root>')
+            xml_document_cache = XmlDocumentCache(max_bytes=40)
+
+            xml_root_a = xml_document_cache.parse(xml_file_path_a)
+            xml_root_b = xml_document_cache.parse(xml_file_path_b)
+            self.assertEqual(xml_document_cache.cached_bytes, 34)
+
+            # use a so b is least recently used
+            self.assertIs(xml_document_cache.parse(xml_file_path_a), xml_root_a)
+            xml_document_cache.parse(xml_file_path_c)
+
+            self.assertEqual(xml_document_cache.cached_bytes, 34)
+            self.assertIs(xml_document_cache.parse(xml_file_path_a), xml_root_a)
+            self.assertIsNot(xml_document_cache.parse(xml_file_path_b), xml_root_b)
+
+    def test_changed_file_replaces_cached_document(self):
+        with TempDirectory() as temp_dir:
+            xml_file_path = temp_dir.write('a.xml', b'<root>aaaa</root>')
+            xml_document_cache = XmlDocumentCache(max_bytes=100)
+
+            xml_document_cache.parse(xml_file_path)
+            temp_dir.write('a.xml', b'<root>aaaaaa</root>')
+            self.assertEqual(xml_document_cache.parse(xml_file_path).text, 'aaaaaa')
+
+            self.assertEqual(xml_document_cache.cached_bytes, 19)
+
+    def test_file_bigger_than_max_bytes_not_cached(self):
+        with TempDirectory() as temp_dir:
+            xml_file_path = temp_dir.write('a.xml', b'<root>aaaa</root>')
+            xml_document_cache = XmlDocumentCache(max_bytes=10)
+
+            xml_root = xml_document_cache.parse(xml_file_path)
+
+            self.assertEqual(xml_root.text, 'aaaa')
+            self.assertIsNot(xml_document_cache.parse(xml_file_path), xml_root)
+            self.assertEqual(xml_document_cache.cached_bytes, 0)
+
+    def test_clear(self):
+        with TempDirectory() as temp_dir:
+            xml_file_path = temp_dir.write('a.xml', b'<root>aaaa</root>')
+            xml_document_cache = XmlDocumentCache(max_bytes=100)
+
+            xml_root = xml_document_cache.parse(xml_file_path)
+            xml_document_cache.clear()
+
+            self.assertEqual(xml_document_cache.cached_bytes, 0)
+            self.assertIsNot(xml_document_cache.parse(xml_file_path), xml_root)
+
+
+class TestXMLUtils_get_xml_root_element(BaseTestCase):
+    def test_root_element_attributes(self):
+        with TempDirectory() as temp_dir:
+            xml_file_path = temp_dir.write(
+                'mock.xml',
+                b'<?xml version="1.0"?>\n<testsuite tests="42"><testcase name="mock"/></testsuite>'
+            )
+
+            xml_root = get_xml_root_element(xml_file_path)
+
+            self.assertEqual(xml_root.tag, 'testsuite')
+            self.assertEqual(xml_root.attrib, {'tests': '42'})
+
+    def test_root_element_without_text_or_children(self):
+        with TempDirectory() as temp_dir:
+            xml_file_path = temp_dir.write(
+                'mock.xml',
+                b'<testsuite tests="42">mock text' +
+                b'<testcase name="mock"/>' * 4096 +
+                b'</testsuite>'
+            )
+
+            xml_root = get_xml_root_element(xml_file_path)
+
+            self.assertEqual(xml_root.tag, 'testsuite')
+            self.assertEqual(xml_root.attrib, {'tests': '42'})
+            self.assertIsNone(xml_root.text)
+            self.assertEqual(len(xml_root), 0)
+
+    @patch('ploigos_step_runner.utils.xml.ElementTree.parse')
+    def test_rest_of_file_not_read(self, mock_parse):
+        with TempDirectory() as temp_dir:
+            xml_file_path = temp_dir.write(
+                'mock.xml',
+                b'<testsuite tests="42"><testcase name="mock"><not valid xml'
+            )
+
+            xml_root = get_xml_root_element(xml_file_path)
+
+            self.assertEqual(xml_root.attrib, {'tests': '42'})
+            mock_parse.assert_not_called()
+
+    def test_not_xml(self):
+        with TempDirectory() as temp_dir:
+            xml_file_path = temp_dir.write('mock.xml', b'not xml')
+
+            self.assertIsNone(get_xml_root_element(xml_file_path))
+
+    def test_file_does_not_exist(self):
+        with self.assertRaisesRegex(
+            ValueError,
+            r"Given xml file does not exist: /does/not/exist.xml"
+        ):
+            get_xml_root_element('/does/not/exist.xml')